@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Benchmarks
+                                 A QGIS plugin
+ Performance benchmarks for the conversion engine on synthetic ODK exports.
+ Run with ``python -m benchmarks --help`` from the plugin directory; they
+ need openpyxl and Shapely but not QGIS.
+ ***************************************************************************/
+"""
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Benchmark runner
+                                 A QGIS plugin
+ Usage (from the plugin directory):
+
+   python -m benchmarks --rows 1000 10000 --widths 20 200 -o bench.json
+   python -m benchmarks --rows 1000 --compare bench.json
+
+ Results are written as JSON; --compare exits with status 1 when a stage
+ got slower than the baseline by more than the tolerance.
+ ***************************************************************************/
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+
+from . import stages, synthetic
+
+SCHEMA_VERSION = 1
+
+
+def _versions():
+    versions = {'python': platform.python_version()}
+    for module in ('openpyxl', 'shapely'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return versions
+
+
+def run(rows, widths, formats, vertices, repeat, seed, cache_dir, engine_label):
+    """Runs the benchmark matrix and returns the JSON-serialisable report."""
+    results = []
+    for fmt in formats:
+        for row_count in rows:
+            for width in widths:
+                file_path = synthetic.dataset(cache_dir, fmt, row_count, width, vertices, seed)
+                dataset = {'format': fmt, 'rows': row_count, 'width': width,
+                           'vertices': vertices, 'seed': seed}
+                print(f"benchmarking {os.path.basename(file_path)}", file=sys.stderr)
+                if fmt == 'xlsx':
+                    stage_results = stages.bench_xlsx(file_path, 'data', repeat)
+                else:
+                    stage_results = stages.bench_csv(file_path, repeat)
+                for result in stage_results:
+                    results.append(dict(dataset=dataset, **result))
+    return {
+        'schema': SCHEMA_VERSION,
+        'meta': {
+            'engine': engine_label,
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'versions': _versions(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def _key(result):
+    dataset = result['dataset']
+    return (dataset['format'], dataset['rows'], dataset['width'],
+            dataset['vertices'], dataset['seed'], result['stage'])
+
+
+def compare(report, baseline, tolerance):
+    """Returns (key, baseline best, current best) for every regressed stage."""
+    previous = {_key(result): result['best_s'] for result in baseline['results']}
+    regressions = []
+    for result in report['results']:
+        before = previous.get(_key(result))
+        if before and result['best_s'] > before * (1 + tolerance):
+            regressions.append((_key(result), before, result['best_s']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark the ODK to WKT conversion engine.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--widths', type=int, nargs='+', default=[20])
+    parser.add_argument('--formats', nargs='+', choices=['xlsx', 'csv'], default=['xlsx'])
+    parser.add_argument('--vertices', default='lognormal:2.5,0.8',
+                        help='fixed:N, uniform:MIN,MAX or lognormal:MU,SIGMA[,MAX]')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engine', default='openpyxl', help='label stored with the results')
+    parser.add_argument('--cache-dir', default=os.path.join(tempfile.gettempdir(), 'odkwkt_bench'))
+    parser.add_argument('-o', '--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed slowdown before a stage counts as regressed')
+    args = parser.parse_args(argv)
+
+    report = run(args.rows, args.widths, args.formats, args.vertices,
+                 args.repeat, args.seed, args.cache_dir, args.engine)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before:.4f}s -> {after:.4f}s", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Benchmarked stages
+                                 A QGIS plugin
+ One benchmark per conversion stage plus the full conversion path.
+ ***************************************************************************/
+"""
+
+import csv
+import importlib.util
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from odkwkt import engine
+from odkwkt.aoi import AreaOfInterest
+from odkwkt.cells import CELL_KEYS, cell_key_column
+from odkwkt.duplicates import find_duplicates
+from odkwkt.geojson import DEFAULT_GEOJSON_PRECISION
+from odkwkt.joins import ReferenceLayer
+from odkwkt.measures import MEASURES, measure_column
+from odkwkt.ordering import bbox_centres, curve_order
+from odkwkt.readers import OpenpyxlReader, ZipXmlReader
+from odkwkt.simplify import simplify_column
+from odkwkt.validity import validate_geometries
+from .synthetic import GEO_COLUMNS
+
+
+def _timed(function, repeat):
+    """Runs function repeat times; returns (wall times, last result)."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def _record(stage, times, rows, vertices):
+    best = min(times)
+    return {
+        'stage': stage,
+        'wall_s': times,
+        'best_s': best,
+        'median_s': statistics.median(times),
+        'rows': rows,
+        'vertices': vertices,
+        'rows_per_s': rows / best if best else None,
+    }
+
+
+def _geo_specs(headers):
+    return [engine.ColumnSpec(column, f"{column}_wkt", kind)
+            for column, kind in GEO_COLUMNS.items() if column in headers]
+
+
+def _csv_values(file_path, spec):
+    with open(file_path, newline='', encoding='utf-8') as handle:
+        reader = csv.reader(handle)
+        index = next(reader).index(spec.source)
+        return [(row_index, row[index]) for row_index, row in enumerate(reader, start=2) if row[index]]
+
+
+def bench_xlsx(file_path, sheet_name, repeat=3):
+    """Benchmarks every stage, and the full conversion, on an .xlsx dataset."""
+    results = []
+
+    times, workbook = _timed(lambda: engine.load_source(file_path), repeat)
+    sheet = workbook[sheet_name]
+    results.append(_record('load', times, sheet.max_row - 1, 0))
+
+    times, headers = _timed(lambda: engine.read_headers(sheet), repeat)
+    results.append(_record('header_probe', times, 1, 0))
+
+    specs = _geo_specs(headers)
+    values = {}
+    times, _ = _timed(lambda: values.update(
+        (spec, list(engine.iter_column(sheet, headers.index(spec.source)))) for spec in specs), repeat)
+    rows = sum(len(column) for column in values.values())
+    results.append(_record('read', times, rows, 0))
+
+    results.extend(_bench_geometry_stages(specs, values, repeat))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        times, _ = _timed(lambda: workbook.save(os.path.join(work_dir, 'save.xlsx')), repeat)
+    results.append(_record('save', times, sheet.max_row - 1, 0))
+    workbook.close()
+
+    def full():
+        with tempfile.TemporaryDirectory() as work_dir:
+            target = os.path.join(work_dir, os.path.basename(file_path))
+            shutil.copyfile(file_path, target)
+            return engine.convert_workbook(target, sheet_name, specs)
+
+    times, result = _timed(full, repeat)
+    results.append(_record('convert_workbook', times, sum(result.converted.values()), 0))
+
+    def full_openpyxl():
+        with tempfile.TemporaryDirectory() as work_dir:
+            target = os.path.join(work_dir, os.path.basename(file_path))
+            shutil.copyfile(file_path, target)
+            return engine.convert_workbook(target, sheet_name, specs, engine.ConversionOptions(writer='openpyxl'))
+
+    times, result = _timed(full_openpyxl, repeat)
+    results.append(_record('convert_workbook_openpyxl', times, sum(result.converted.values()), 0))
+
+    def to_new_file():
+        with tempfile.TemporaryDirectory() as work_dir:
+            options = engine.ConversionOptions(output_path=os.path.join(work_dir, 'out.xlsx'))
+            return engine.convert_workbook(file_path, sheet_name, specs, options)
+
+    times, result = _timed(to_new_file, repeat)
+    results.append(_record('convert_workbook_output', times, sum(result.converted.values()), 0))
+
+    outputs = [('sidecar', 'out.csv')]
+    if importlib.util.find_spec('pyarrow') is not None:
+        outputs.append(('sidecar_parquet', 'out.sidecar.parquet'))
+        outputs.append(('geoparquet', 'out.parquet'))
+    for stage, name in outputs:
+        def to_file():
+            with tempfile.TemporaryDirectory() as work_dir:
+                options = engine.ConversionOptions(output_path=os.path.join(work_dir, name))
+                return engine.convert_workbook(file_path, sheet_name, specs, options)
+
+        times, result = _timed(to_file, repeat)
+        results.append(_record(f'convert_workbook_{stage}', times, sum(result.converted.values()), 0))
+
+    results.extend(_bench_readers(file_path, sheet_name, headers, specs, repeat))
+    return results
+
+
+def _bench_readers(file_path, sheet_name, headers, specs, repeat):
+    """Benchmarks streaming the ODK columns through each reader."""
+    results = []
+    columns = [headers.index(spec.source) for spec in specs]
+    for name, reader_class in (('openpyxl', OpenpyxlReader), ('zipxml', ZipXmlReader)):
+        def stream():
+            reader = reader_class(file_path)
+            try:
+                return sum(1 for _ in reader.iter_rows(sheet_name, min_row=2, columns=columns))
+            finally:
+                reader.close()
+
+        times, rows = _timed(stream, repeat)
+        results.append(_record(f'read_{name}', times, rows, 0))
+    return results
+
+
+def bench_csv(file_path, repeat=3):
+    """Benchmarks the load, header probe and geometry stages on a CSV dataset."""
+    results = []
+
+    def load():
+        with open(file_path, newline='', encoding='utf-8') as handle:
+            return list(csv.reader(handle))
+
+    times, table = _timed(load, repeat)
+    results.append(_record('load', times, len(table) - 1, 0))
+
+    def header_probe():
+        with open(file_path, newline='', encoding='utf-8') as handle:
+            return next(csv.reader(handle))
+
+    times, headers = _timed(header_probe, repeat)
+    results.append(_record('header_probe', times, 1, 0))
+
+    specs = _geo_specs(headers)
+    values = {spec: _csv_values(file_path, spec) for spec in specs}
+    results.extend(_bench_geometry_stages(specs, values, repeat))
+    return results
+
+
+def _bench_geometry_stages(specs, values, repeat):
+    results = []
+    rows = sum(len(column) for column in values.values())
+
+    parsed = {}
+    times, _ = _timed(lambda: parsed.update(
+        (spec, engine.parse_column(values[spec])) for spec in specs), repeat)
+    vertices = sum(column.vertices for column in parsed.values())
+    results.append(_record('parse', times, rows, vertices))
+
+    times, _ = _timed(lambda: [measure_column(parsed[spec], spec.kind, MEASURES) for spec in specs], repeat)
+    results.append(_record('measure', times, rows, vertices))
+
+    times, _ = _timed(lambda: [cell_key_column(parsed[spec], spec.kind, CELL_KEYS) for spec in specs], repeat)
+    results.append(_record('cell_keys', times, rows, vertices))
+
+    aoi = _central_area([column.xy() for column in parsed.values() if len(column)])
+    times, _ = _timed(lambda: [aoi.select(parsed[spec], spec.kind) for spec in specs], repeat)
+    results.append(_record('aoi', times, rows, vertices))
+
+    geometries = {}
+    times, _ = _timed(lambda: geometries.update(
+        (spec, engine.build_geometries(parsed[spec], spec.kind)) for spec in specs), repeat)
+    results.append(_record('geometry_build', times, rows, vertices))
+
+    times, _ = _timed(lambda: [validate_geometries(geometries[spec], spec.kind, errors=[]) for spec in specs], repeat)
+    results.append(_record('validate', times, rows, vertices))
+
+    times, _ = _timed(lambda: [find_duplicates(geometries[spec], spec.kind) for spec in specs], repeat)
+    results.append(_record('duplicates', times, rows, vertices))
+
+    times, _ = _timed(lambda: [simplify_column(geometries[spec], spec.kind, (1e-4, 1e-3)) for spec in specs],
+                      repeat)
+    results.append(_record('simplify', times, rows, vertices))
+
+    times, _ = _timed(lambda: [_curve_sorted(geometries[spec]) for spec in specs], repeat)
+    results.append(_record('order', times, rows, vertices))
+
+    reference = _grid_layer([geometry for spec in specs for _, geometry in geometries[spec]])
+    times, _ = _timed(lambda: [reference.join_first(geometries[spec]) for spec in specs], repeat)
+    results.append(_record('join', times, rows, vertices))
+
+    times, _ = _timed(lambda: [engine.serialize(geometries[spec]) for spec in specs], repeat)
+    results.append(_record('serialize', times, rows, vertices))
+
+    for encoding in ('wkb_hex', 'ewkb_hex', 'geojson'):
+        encoded = [engine.ColumnSpec(spec.source, spec.target, spec.kind, encoding) for spec in specs]
+        times, _ = _timed(lambda: [engine.encode(parsed[spec], geometries[spec], encoded_spec,
+                                                 DEFAULT_GEOJSON_PRECISION)
+                                   for spec, encoded_spec in zip(specs, encoded)], repeat)
+        results.append(_record(f'serialize_{encoding}', times, rows, vertices))
+    return results
+
+
+def _grid_layer(geometries, cells=100):
+    """Returns a reference layer of cells x cells squares covering the geometries."""
+    import shapely
+
+    min_x, min_y, max_x, max_y = shapely.total_bounds(geometries)
+    width, height = (max_x - min_x) / cells, (max_y - min_y) / cells
+    squares = [shapely.box(min_x + column * width, min_y + row * height,
+                           min_x + (column + 1) * width, min_y + (row + 1) * height)
+               for row in range(cells) for column in range(cells)]
+    return ReferenceLayer(squares, {'cell': int}, [(index,) for index in range(len(squares))])
+
+
+def _curve_sorted(geometries):
+    """Returns the row numbers of (row_index, geometry) pairs along the Hilbert curve of their centres."""
+    centres = bbox_centres(geometries)
+    order = curve_order([x for _, (x, _) in centres], [y for _, (_, y) in centres])
+    return [centres[index][0] for index in order.tolist()]
+
+
+def _central_area(coordinates, share=0.1):
+    """Returns an area of interest covering the central share of the extent of the coordinates."""
+    import numpy
+    from shapely import box
+
+    low = numpy.min([xy.min(axis=0) for xy in coordinates], axis=0)
+    high = numpy.max([xy.max(axis=0) for xy in coordinates], axis=0)
+    margin = (high - low) * (1 - share ** 0.5) / 2
+    return AreaOfInterest(box(*(low + margin), *(high - margin)))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Synthetic ODK exports
+                                 A QGIS plugin
+ Generates reproducible ODK-like workbooks and CSVs for the benchmarks.
+ ***************************************************************************/
+"""
+
+import csv
+import math
+import os
+import random
+
+# Column name -> ODK geometry kind, named like the MAHSA forms
+GEO_COLUMNS = {
+    'site_location': 'point',
+    'site_extent_line': 'trace',
+    'site_extent_polygon': 'shape',
+}
+
+# Minimum number of distinct vertices per ODK kind
+MIN_VERTICES = {'point': 1, 'trace': 2, 'shape': 3}
+
+# Area the synthetic sites are scattered over (lat, lon)
+LAT_RANGE = (15.0, 38.0)
+LON_RANGE = (25.0, 60.0)
+
+
+def parse_distribution(spec):
+    """Parses a vertex-count distribution spec into a callable taking a Random.
+
+    Supported specs are ``fixed:N``, ``uniform:MIN,MAX`` and
+    ``lognormal:MU,SIGMA[,MAX]`` (the latter mimics field data, where most
+    shapes are small and a few walked boundaries are very long).
+    """
+    name, _, args = spec.partition(':')
+    values = [float(arg) for arg in args.split(',') if arg]
+    if name == 'fixed' and len(values) == 1:
+        count = int(values[0])
+        return lambda rng: count
+    if name == 'uniform' and len(values) == 2:
+        low, high = int(values[0]), int(values[1])
+        return lambda rng: rng.randint(low, high)
+    if name == 'lognormal' and len(values) in (2, 3):
+        mu, sigma = values[0], values[1]
+        cap = int(values[2]) if len(values) == 3 else 5000
+        return lambda rng: min(cap, int(rng.lognormvariate(mu, sigma)))
+    raise ValueError(f"Invalid vertex distribution: {spec}")
+
+
+def odk_coordinate(rng, lat, lon):
+    """Formats one ODK "lat lon altitude accuracy" coordinate."""
+    return f"{lat:.7f} {lon:.7f} {rng.uniform(0, 900):.1f} {rng.uniform(2, 15):.1f}"
+
+
+def odk_geometry(rng, kind, vertices):
+    """Returns a synthetic ODK geopoint, geotrace or geoshape value."""
+    lat = rng.uniform(*LAT_RANGE)
+    lon = rng.uniform(*LON_RANGE)
+    if kind == 'point':
+        return odk_coordinate(rng, lat, lon)
+
+    count = max(MIN_VERTICES[kind], vertices)
+    if kind == 'trace':
+        # Random walk of roughly 10 m steps
+        points = []
+        for _ in range(count):
+            points.append(odk_coordinate(rng, lat, lon))
+            lat += rng.uniform(-1e-4, 1e-4)
+            lon += rng.uniform(-1e-4, 1e-4)
+        return ';'.join(points)
+
+    # Star-shaped ring around the site, closed like ODK geoshapes
+    radius = rng.uniform(2e-4, 2e-3)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+    points = []
+    for angle in angles:
+        scale = radius * rng.uniform(0.6, 1.0)
+        points.append(odk_coordinate(rng, lat + scale * math.sin(angle), lon + scale * math.cos(angle)))
+    points.append(points[0])
+    return ';'.join(points)
+
+
+def attribute_value(rng, index, row):
+    """Returns a plausible survey attribute for the index-th attribute column."""
+    flavour = index % 4
+    if flavour == 0:
+        return f"answer {rng.randint(0, 50)}"
+    if flavour == 1:
+        return rng.randint(0, 10000)
+    if flavour == 2:
+        return round(rng.uniform(0, 100), 3)
+    return f"2024-{1 + row % 12:02d}-{1 + row % 28:02d}T10:{row % 60:02d}:00.000Z"
+
+
+def generate_rows(rows, width=20, vertices='lognormal:2.5,0.8', empty_ratio=0.1, seed=0):
+    """Yields the header followed by rows of a synthetic ODK export.
+
+    :param rows: Number of submissions (data rows).
+    :type rows: int
+
+    :param width: Number of non-geometry attribute columns.
+    :type width: int
+
+    :param vertices: Vertex-count distribution, see parse_distribution.
+    :type vertices: str
+
+    :param empty_ratio: Share of geometry cells left empty.
+    :type empty_ratio: float
+
+    :param seed: Seed of the random generator; equal inputs give equal files.
+    :type seed: int
+    """
+    rng = random.Random(seed)
+    distribution = parse_distribution(vertices)
+    attributes = [f"attr_{index:03d}" for index in range(width)]
+    # Spread the geo columns among the attributes, as in real exports
+    header = ['KEY'] + attributes
+    for offset, column in enumerate(GEO_COLUMNS):
+        header.insert(min(len(header), 1 + (offset + 1) * width // 4), column)
+    yield header
+
+    for row in range(rows):
+        values = {'KEY': f"uuid:{seed:04d}-{row:010d}"}
+        for index, column in enumerate(attributes):
+            values[column] = attribute_value(rng, index, row)
+        for column, kind in GEO_COLUMNS.items():
+            if rng.random() < empty_ratio:
+                values[column] = None
+            else:
+                values[column] = odk_geometry(rng, kind, distribution(rng))
+        yield [values[column] for column in header]
+
+
+def write_xlsx(file_path, rows, sheet_name='data', **kwargs):
+    """Writes a synthetic export as a single-sheet workbook."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    for row in generate_rows(rows, **kwargs):
+        sheet.append(row)
+    workbook.save(file_path)
+
+
+def write_csv(file_path, rows, **kwargs):
+    """Writes a synthetic export as an ODK Central style CSV."""
+    with open(file_path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        for row in generate_rows(rows, **kwargs):
+            writer.writerow(['' if value is None else value for value in row])
+
+
+def dataset(cache_dir, fmt, rows, width=20, vertices='lognormal:2.5,0.8', seed=0):
+    """Returns the path of a cached synthetic dataset, generating it if needed."""
+    name = f"odk_{rows}r_{width}w_{vertices.replace(':', '-').replace(',', '_')}_s{seed}.{fmt}"
+    file_path = os.path.join(cache_dir, name)
+    if not os.path.exists(file_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        writer = write_xlsx if fmt == 'xlsx' else write_csv
+        partial = file_path + '.part'
+        writer(partial, rows, width=width, vertices=vertices, seed=seed)
+        os.replace(partial, file_path)
+    return file_path
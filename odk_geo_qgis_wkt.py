@@ -25,10 +25,6 @@ from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
 
-# Initialize Qt resources from file resources.py
-from .resources import *
-# Import the code for the dialog
-from .odk_geo_qgis_wkt_dialog import ODKGeo_QgisWktDialog
 import os.path
 
 
@@ -160,7 +156,9 @@ class ODKGeo_QgisWkt:
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
-        icon_path = ':/plugins/odk_geo_qgis_wkt/icon.png'
+        # The icon is read from the plugin directory, so the Qt resources are
+        # only registered once the tool is opened (see run)
+        icon_path = os.path.join(self.plugin_dir, 'icon.png')
         self.add_action(
             icon_path,
             text=self.tr(u'ODK Geo to QGIS WKT'),
@@ -187,6 +185,10 @@ class ODKGeo_QgisWkt:
         # Only create GUI ONCE in callback, so that it will only load when the plugin is started
         if self.first_start == True:
             self.first_start = False
+            # Imported here so that openpyxl, Shapely, the .ui file and the Qt
+            # resources are only loaded once the tool is opened, not on every QGIS start
+            from . import resources  # noqa: F401 pylint: disable=unused-import
+            from .odk_geo_qgis_wkt_dialog import ODKGeo_QgisWktDialog
             self.dlg = ODKGeo_QgisWktDialog()
 
         # show the dialog
@@ -9,16 +9,34 @@
 """
 
 import os
-import gc
-from openpyxl import load_workbook
-from qgis.PyQt import uic
+from qgis.core import Qgis, QgsMessageLog
 from qgis.PyQt import QtWidgets
+from qgis.PyQt.QtCore import QSettings
 from qgis.PyQt.QtWidgets import QMessageBox
-from shapely.geometry import Point, LineString, Polygon
 
-# Load UI file
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'odk_geo_qgis_wkt_dialog_base.ui'))
+try:
+    from .odkwkt import (
+        CELL_KEYS, MEASURES, ORDERED_SUFFIXES, ORDERS, OUTPUT_SUFFIXES, ColumnSpec, ConversionOptions,
+        StageTimer, convert_workbook, flip_coordinates, open_reader)
+except ImportError:
+    # Imported as a top-level module, e.g. by the test suite
+    from odkwkt import (
+        CELL_KEYS, MEASURES, ORDERED_SUFFIXES, ORDERS, OUTPUT_SUFFIXES, ColumnSpec, ConversionOptions,
+        StageTimer, convert_workbook, flip_coordinates, open_reader)
+
+LOG_TAG = 'ODK Geo to QGIS WKT'
+ERROR_COLUMN = 'QGIS WKT Errors'
+VALIDITY_COLUMN = 'QGIS WKT Repairs'
+
+# Use the UI module precompiled by the build (make compile / pb_tool compile)
+# and only fall back to parsing the .ui file when it is missing
+try:
+    from .odk_geo_qgis_wkt_dialog_base import Ui_ODKGeo_QgisWktDialogBase as FORM_CLASS
+except ImportError:
+    from qgis.PyQt import uic
+
+    FORM_CLASS, _ = uic.loadUiType(os.path.join(
+        os.path.dirname(__file__), 'odk_geo_qgis_wkt_dialog_base.ui'))
 
 class ODKGeo_QgisWktDialog(QtWidgets.QDialog, FORM_CLASS):
     def __init__(self, parent=None):
@@ -48,13 +66,21 @@ class ODKGeo_QgisWktDialog(QtWidgets.QDialog, FORM_CLASS):
             return
 
         try:
-            workbook = load_workbook(file_path, read_only=False)  # Open in normal mode for writing
+            # Only the sheet names and header rows are needed, so the workbook is streamed
+            # (see odkwkt.readers) rather than loaded as an editable model, and closed again
+            reader = open_reader(file_path)
+            try:
+                sheet_headers = {
+                    name: [value for value in next(reader.iter_rows(name, min_row=1), ()) if value]
+                    for name in reader.sheetnames}
+            finally:
+                reader.close()
+            self.sheet_headers = sheet_headers
             self.sheetDropdown.clear()
-            self.sheetDropdown.addItems(workbook.sheetnames)
-            self.workbook = workbook
+            self.sheetDropdown.addItems(list(sheet_headers))
 
             # Auto-select the first sheet and load columns immediately
-            if workbook.sheetnames:
+            if sheet_headers:
                 self.sheetDropdown.setCurrentIndex(0)  # Select first sheet
                 self.load_columns()  # Populate columns automatically
 
@@ -64,13 +90,12 @@ class ODKGeo_QgisWktDialog(QtWidgets.QDialog, FORM_CLASS):
     def load_columns(self):
         """Loads column headers from the selected sheet into dropdowns and auto-selects specific columns if enabled."""
         selected_sheet = self.sheetDropdown.currentText()
-        if not selected_sheet or not hasattr(self, 'workbook'):
+        if not selected_sheet or not hasattr(self, 'sheet_headers'):
             return
 
         try:
-            # Get the headers from the first row
-            sheet = self.workbook[selected_sheet]
-            headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1)) if cell.value]
+            # Headers from the first row, read by load_sheets
+            headers = self.sheet_headers[selected_sheet]
 
             # Populate dropdowns with column names
             self.traceColumnDropdown.clear()
@@ -138,65 +163,121 @@ class ODKGeo_QgisWktDialog(QtWidgets.QDialog, FORM_CLASS):
         if not user_poly_column_name:  # If empty, use default
             user_poly_column_name = "QGIS Poly WKT"
 
-        if not selected_sheet or not hasattr(self, 'workbook'):
+        if not selected_sheet or not hasattr(self, 'sheet_headers'):
             QMessageBox.warning(self, "Error", "No sheet selected or workbook not loaded.")
             return
 
+        columns = []
+        if trace_column:
+            columns.append(ColumnSpec(trace_column, user_trace_column_name, 'trace'))
+        if polygon_column:
+            columns.append(ColumnSpec(polygon_column, user_poly_column_name, 'shape'))
+
         file_path = self.xlsFileWidget.filePath()
+        # Optional new output file; the input is left untouched
+        output_path = ''
+        if hasattr(self, 'outputFileWidget'):
+            output_path = self.outputFileWidget.filePath().strip()
+            # .csv, .gpkg and .sidecar.parquet files only receive the key and WKT columns, any other
+            # .parquet is GeoParquet, .geojsonl newline-delimited GeoJSON
+            if output_path and not output_path.lower().endswith(OUTPUT_SUFFIXES):
+                output_path += '.xlsx'
+        settings = QSettings()
+        # Measure columns, e.g. 'length,area' ('odk_geo_qgis_wkt/measures'); unknown names are ignored
+        measures = str(settings.value('odk_geo_qgis_wkt/measures', '')).split(',')
+        # Spatial key columns, e.g. 'geohash,grid' ('odk_geo_qgis_wkt/cell_keys'); unknown names are ignored
+        cell_keys = str(settings.value('odk_geo_qgis_wkt/cell_keys', '')).split(',')
+        # Simplified copies for regional scales, e.g. '0.0001,0.001' ('odk_geo_qgis_wkt/simplify', in
+        # output coordinate units); entries that are not positive numbers are ignored
+        simplify = []
+        for tolerance in str(settings.value('odk_geo_qgis_wkt/simplify', '')).split(','):
+            try:
+                simplify.append(float(tolerance))
+            except ValueError:
+                continue
+        # Spatial order of .csv, .gpkg, .sidecar.parquet and GeoJSON rows ('odk_geo_qgis_wkt/order', hilbert or zorder)
+        order = settings.value('odk_geo_qgis_wkt/order', '') or None
+        if order not in ORDERS or not output_path.lower().endswith(ORDERED_SUFFIXES):
+            order = None
         try:
-            # Open workbook for editing
-            workbook = load_workbook(file_path)
-            sheet = workbook[selected_sheet]
-
-            # Get existing headers and determine column positions
-            headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-            existing_columns = {header: idx + 1 for idx, header in enumerate(headers) if header}
-
-            # Determine column index for user-defined trace column
-            trace_col_idx = existing_columns.get(user_trace_column_name, len(headers) + 1)
-
-            
-            # Determine column index for user-defined trace column
-            poly_col_idx = existing_columns.get(user_poly_column_name, len(headers) + 2)
-
-            # Add WKT column headers if it doesn’t exist
-            if user_trace_column_name not in existing_columns:
-                sheet.cell(row=1, column=trace_col_idx, value=user_trace_column_name)
-
-            # Add WKT column headers if it doesn’t exist
-            if user_poly_column_name not in existing_columns:
-                sheet.cell(row=1, column=poly_col_idx, value=user_poly_column_name)
-
-            # Iterate over rows and convert trace coordinates
-            for row_index, row in enumerate(sheet.iter_rows(min_row=2, max_row=sheet.max_row), start=2):
-                if trace_column and row[headers.index(trace_column)].value:
-                    trace = [self.flip_coordinates(coord) for coord in row[headers.index(trace_column)].value.split(';')]
-                    sheet.cell(row=row_index, column=trace_col_idx, value=LineString(trace).wkt)
-
-            # Iterate over rows and convert trace coordinates
-            for row_index, row in enumerate(sheet.iter_rows(min_row=2, max_row=sheet.max_row), start=2):
-                if polygon_column and row[headers.index(polygon_column)].value:
-                    poly = [self.flip_coordinates(coord) for coord in row[headers.index(polygon_column)].value.split(';')]
-                    sheet.cell(row=row_index, column=poly_col_idx, value=Polygon(poly).wkt)
-
-            # Save changes and clean up
-            workbook.save(file_path)
-            workbook.close()
-            del workbook
-            gc.collect()  # Free memory
-
-            QMessageBox.information(self, "Success", f"Coordinates converted and saved to input .xlsx file!")
+            options = ConversionOptions(
+                output_path=output_path or None,
+                # Opt-in profiling, set 'odk_geo_qgis_wkt/profile' to cprofile or tracemalloc
+                # in the advanced settings editor; the profile is saved next to the output file
+                profile=settings.value('odk_geo_qgis_wkt/profile', '') or None,
+                # Opt-in journal of converted chunks ('odk_geo_qgis_wkt/checkpoint_rows', e.g. 10000),
+                # so a crash does not lose the whole run
+                checkpoint_rows=int(settings.value('odk_geo_qgis_wkt/checkpoint_rows', 0)) or None,
+                # Opt-in worker threads ('odk_geo_qgis_wkt/threads', e.g. 3); the conversion still runs
+                # from the dialog, so QGIS waits for it either way
+                threads=max(0, int(settings.value('odk_geo_qgis_wkt/threads', 0))),
+                # Optional memory budget in MiB ('odk_geo_qgis_wkt/memory_budget'), for large
+                # exports on low-memory machines; the conversion gets slower instead of failing
+                memory_budget=float(settings.value('odk_geo_qgis_wkt/memory_budget', 0)) or None,
+                # Opt-in repair of self-intersecting or collapsed shapes ('odk_geo_qgis_wkt/validate')
+                validate=settings.value('odk_geo_qgis_wkt/validate', False, type=bool),
+                validity_column=VALIDITY_COLUMN,
+                # Deliver in a projected CRS ('odk_geo_qgis_wkt/target_crs', e.g. EPSG:32633), needs pyproj
+                target_crs=settings.value('odk_geo_qgis_wkt/target_crs', '') or None,
+                measures=tuple(name.strip() for name in measures if name.strip() in MEASURES),
+                cell_keys=tuple(name.strip() for name in cell_keys if name.strip() in CELL_KEYS),
+                simplify=tuple(tolerance for tolerance in simplify if tolerance > 0),
+                # Project area ('odk_geo_qgis_wkt/aoi_layer', a .gpkg or .shp); rows outside it are left out
+                aoi_layer=settings.value('odk_geo_qgis_wkt/aoi_layer', '') or None,
+                # Reference polygons ('odk_geo_qgis_wkt/join_layer', a .gpkg or .shp) whose attributes are added
+                join_layer=settings.value('odk_geo_qgis_wkt/join_layer', '') or None,
+                # Opt-in search for sites submitted twice ('odk_geo_qgis_wkt/duplicates'), reported next to the output
+                duplicates=settings.value('odk_geo_qgis_wkt/duplicates', False, type=bool),
+                order=order,
+            )
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", f"Invalid conversion settings: {e}")
+            return
+        if options.duplicates:
+            options.duplicate_report = os.path.splitext(output_path or file_path)[0] + '_wkt_duplicates.csv'
+        if hasattr(self, 'tolerantCheckbox') and self.tolerantCheckbox.isChecked():
+            options.tolerant = True
+            options.error_column = ERROR_COLUMN
+            options.error_report = os.path.splitext(output_path or file_path)[0] + '_wkt_errors.csv'
+        timer = StageTimer()
+        try:
+            result = convert_workbook(file_path, selected_sheet, columns, options, timer)
+            saved_to = output_path if output_path else "input .xlsx file"
+            if result.resumed_chunks:
+                QgsMessageLog.logMessage(
+                    f"Resumed {result.resumed_chunks} chunk(s) of an interrupted conversion", LOG_TAG, Qgis.Info)
+            self.log_timings(timer)
+            for reason, count in result.repair_summary().items():
+                QgsMessageLog.logMessage(f"Repaired {count} geometries: {reason}", LOG_TAG, Qgis.Info)
+            for duplicate in result.duplicates:
+                QgsMessageLog.logMessage(str(duplicate), LOG_TAG, Qgis.Warning)
+            if result.duplicates:
+                QgsMessageLog.logMessage(
+                    f"{len(result.duplicates)} possible duplicate(s) listed in {options.duplicate_report}",
+                    LOG_TAG, Qgis.Warning)
+            if result.errors:
+                for error in result.errors:
+                    QgsMessageLog.logMessage(str(error), LOG_TAG, Qgis.Warning)
+                QMessageBox.warning(
+                    self, "Converted with errors",
+                    f"Coordinates converted and saved to {saved_to}, but {len(result.errors)} "
+                    f"cell(s) could not be converted. They are listed in the '{ERROR_COLUMN}' column "
+                    f"and in {options.error_report}.")
+                return
+            QMessageBox.information(self, "Success", f"Coordinates converted and saved to {saved_to}!")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to convert coordinates: {e}")
 
 
+    def log_timings(self, timer):
+        """Writes the per-stage timings of a conversion to the QGIS message log."""
+        for line in timer.report():
+            QgsMessageLog.logMessage(line, LOG_TAG, Qgis.Info)
+
     def flip_coordinates(self, coordinate):
         """
         Flips ODK coordinates from (latitude, longitude) to (longitude, latitude).
         Expects coordinates in "lat lon" format.
         """
-        coords = coordinate.split()
-        if len(coords) >= 2:
-            return float(coords[1]), float(coords[0])  # Swap lat and lon
-        raise ValueError(f"Invalid coordinate format: {coordinate}")
\ No newline at end of file
+        return flip_coordinates(coordinate)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ odkwkt
+                                 A QGIS plugin
+ QGIS-independent engine behind the ODK Geo to QGIS WKT dialog.
+ ***************************************************************************/
+"""
+
+from .cells import CELL_KEYS
+from .coords import CoordinateBatch, CoordinateError, flip_coordinates, parse_coordinates
+from .engine import (
+    DEFAULT_POLY_RESULT_COLUMN,
+    DEFAULT_TRACE_RESULT_COLUMN,
+    ORDERED_SUFFIXES,
+    OUTPUT_SUFFIXES,
+    ColumnSpec,
+    ConversionOptions,
+    ConversionResult,
+    convert_workbook,
+)
+from .duplicates import Duplicate, find_duplicates, write_duplicate_report
+from .encodings import ENCODINGS
+from .errors import RowError, read_error_rows, write_error_report
+from .instrument import StageTimer, profiled
+from .joins import ReferenceLayer
+from .measures import MEASURES
+from .ordering import ORDERS
+from .readers import open_reader
+from .sidecar import SIDECAR_FORMATS
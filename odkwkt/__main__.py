@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Entry point for ``python -m odkwkt``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
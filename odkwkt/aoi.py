@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Area of interest
+                                 A QGIS plugin
+ Leaves the rows outside a project area out of the conversion, right after
+ parsing, so that they are never transformed, built, serialized or
+ written. The area is a bounding box and/or the polygons of a layer, in
+ WGS 84 longitude/latitude.
+
+ Cells are tested in up to three steps, each only on what the previous one
+ could not settle:
+
+ 1. their bounding box against that of the area, on the flat coordinate
+    array of the chunk;
+ 2. their vertices against the prepared area polygon (a vertex inside
+    settles the cell);
+ 3. their geometry against the prepared area polygon, for the few cells
+    crossing the area with no vertex inside it.
+ ***************************************************************************/
+"""
+
+import threading
+
+from .crs import WGS84_CRS
+from .joins import ReferenceLayer
+
+
+class AreaOfInterest:
+    """Area the converted rows must intersect.
+
+    :param polygon: Shapely (multi)polygon in WGS 84 longitude/latitude.
+    """
+
+    def __init__(self, polygon):
+        import shapely
+
+        self.polygon = polygon
+        self.bounds = polygon.bounds
+        shapely.prepare(polygon)
+        # GEOS builds the index of a prepared polygon on first use, which is not thread-safe
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_options(cls, bbox=None, layer=None):
+        """Returns the area within a (min_lon, min_lat, max_lon, max_lat) box and the polygons of a layer.
+
+        :param layer: A .gpkg or .shp polygon layer (see joins.ReferenceLayer),
+            reprojected to WGS 84 if needed.
+        """
+        import shapely
+
+        area = shapely.box(*bbox) if bbox is not None else None
+        if layer:
+            polygons = shapely.union_all(ReferenceLayer.open(layer, (), WGS84_CRS).polygons)
+            area = polygons if area is None else shapely.intersection(area, polygons)
+        if area is None:
+            raise ValueError("An area of interest needs a bounding box or a layer")
+        return cls(area)
+
+    def select(self, parsed, kind):
+        """Returns a batch of the cells of a CoordinateBatch that intersect the area.
+
+        Cells that cannot form a geometry of the kind are kept if their
+        bounding box meets the area, so geometry building reports them.
+        """
+        if not len(parsed):
+            return parsed
+        import numpy
+        import shapely
+
+        xy = parsed.xy()
+        offsets = numpy.frombuffer(parsed.offsets, dtype=parsed.offsets.typecode)
+        starts = offsets[:-1]
+        counts = numpy.diff(offsets) if kind != 'point' else numpy.ones(len(starts), dtype=offsets.dtype)
+        x, y = (xy[:, 0], xy[:, 1]) if kind != 'point' else (xy[starts, 0], xy[starts, 1])
+        vertex_starts = starts if kind != 'point' else numpy.arange(len(starts))
+
+        min_x, min_y, max_x, max_y = self.bounds
+        near = ((numpy.minimum.reduceat(x, vertex_starts) <= max_x)
+                & (numpy.maximum.reduceat(x, vertex_starts) >= min_x)
+                & (numpy.minimum.reduceat(y, vertex_starts) <= max_y)
+                & (numpy.maximum.reduceat(y, vertex_starts) >= min_y))
+
+        cells = numpy.repeat(numpy.arange(len(starts)), counts)
+        candidates = numpy.flatnonzero(near[cells])
+        with self._lock:
+            hits = shapely.intersects_xy(self.polygon, x[candidates], y[candidates])
+        inside = numpy.zeros(len(starts), dtype=bool)
+        inside[cells[candidates[hits]]] = True
+
+        if kind != 'point':
+            for cell in numpy.flatnonzero(near & ~inside).tolist():
+                inside[cell] = self._crosses(xy[offsets[cell]:offsets[cell + 1]], kind)
+        if inside.all():
+            return parsed
+        rows = numpy.frombuffer(parsed.rows, dtype=parsed.rows.typecode)
+        return parsed.select(set(rows[inside].tolist()))
+
+    def _crosses(self, coords, kind):
+        """Whether a cell with no vertex in the area still intersects it."""
+        import shapely
+
+        try:
+            geometry = shapely.LineString(coords) if kind == 'trace' else shapely.Polygon(coords)
+        except Exception:
+            return True
+        with self._lock:
+            return bool(shapely.intersects(self.polygon, geometry))
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Memory budget
+                                 A QGIS plugin
+ Keeps a conversion within a configured amount of memory, trading speed
+ for it where needed:
+
+ * chunks are cut by their estimated size as well as their row count, so a
+   chunk of huge shapes does not hold thousands of them at once;
+ * a shared strings table larger than its share of the budget is spilled
+   to a memory-mapped temporary file and decoded on lookup;
+ * the full openpyxl model of an in-place conversion (about 50 times the
+   file size) is only loaded if it fits, else the sheet XML is rewritten.
+ ***************************************************************************/
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+
+MIB = 1024 * 1024
+
+# openpyxl's documentation puts its memory use at about 50 times the file size
+OPENPYXL_MODEL_FACTOR = 50
+
+# Cell text of a chunk is held alongside its parsed coordinates, geometries
+# and results, which together take a few times as much
+CHUNK_EXPANSION = 8
+
+# Part of the budget the shared strings table may take in memory
+SHARED_STRINGS_SHARE = 4
+
+# Size of an empty str object, every cell also takes a list slot
+_STR_OVERHEAD = 49
+_SLOT = 8
+
+
+class MemoryBudget:
+    """Memory a conversion may use, in MiB."""
+
+    def __init__(self, megabytes):
+        if megabytes <= 0:
+            raise ValueError(f"Invalid memory budget: {megabytes}")
+        self.bytes = int(megabytes * MIB)
+
+    @property
+    def chunk_bytes(self):
+        """Estimated size (see row_bytes) of the rows of one chunk."""
+        return self.bytes // CHUNK_EXPANSION
+
+    @property
+    def shared_strings_bytes(self):
+        """Size of the shared strings above which they are spilled to disk."""
+        return self.bytes // SHARED_STRINGS_SHARE
+
+    def fits_openpyxl_model(self, file_path):
+        """Returns whether the full openpyxl model of the workbook fits the budget."""
+        return os.path.getsize(file_path) * OPENPYXL_MODEL_FACTOR <= self.bytes
+
+
+def row_bytes(row):
+    """Estimates the memory taken by the values of a row."""
+    size = _SLOT * len(row)
+    for value in row:
+        if isinstance(value, str):
+            size += _STR_OVERHEAD + len(value)
+    return size
+
+
+class SpilledStrings:
+    """A read-only list of strings kept in a memory-mapped temporary file.
+
+    Strings are appended while the file is built; the first lookup maps it.
+    Only the offsets (8 bytes per string) stay in memory.
+    """
+
+    def __init__(self, strings=()):
+        self.handle = tempfile.TemporaryFile()
+        self.offsets = array('q', [0])
+        self.map = None
+        self.extend(strings)
+
+    def append(self, text):
+        data = text.encode('utf-8')
+        self.handle.write(data)
+        self.offsets.append(self.offsets[-1] + len(data))
+
+    def extend(self, strings):
+        for text in strings:
+            self.append(text)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if self.map is None:
+            self.handle.flush()
+            if not self.offsets[-1]:
+                return ''
+            self.map = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if index < 0:
+            index += len(self)
+        return self.map[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.handle.close()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Spatial key columns
+                                 A QGIS plugin
+ Computes cell key columns of a whole column chunk at once, with NumPy on
+ the flat coordinate array of its CoordinateBatch, so that dashboards can
+ aggregate and join submissions by cell with a plain equality instead of
+ parsing the WKT again:
+
+ * geohash  base 32 geohash of the anchor point, on the WGS 84
+            longitude/latitude (before any reprojection)
+ * grid     'column_row' of the square of a fixed grid holding the anchor
+            point, in the output coordinates; the grid starts at the origin,
+            so the same point always gets the same cell
+
+ The anchor point of a cell is its planar centroid or the centre of its
+ bounding box (a point is its own anchor). Anchors that are not finite
+ (e.g. centroids that overflow) get an empty key.
+ ***************************************************************************/
+"""
+
+from .measures import _centroids
+
+CELL_KEYS = ('geohash', 'grid')
+
+# Column each key adds, after the result column name
+CELL_KEY_FIELDS = {'geohash': 'geohash', 'grid': 'grid_cell'}
+
+CELL_ANCHORS = ('centroid', 'bbox')
+
+# Measured on the parsed longitude/latitude, before any reprojection
+GEOGRAPHIC_CELL_KEYS = ('geohash',)
+
+# 7 characters: cells of about 150 x 150 m
+DEFAULT_GEOHASH_PRECISION = 7
+# Longest geohash whose bits fit a 64 bit integer
+MAX_GEOHASH_PRECISION = 12
+
+# Grid square side in degrees (about 1 km), or in metres for a projected target CRS
+DEFAULT_GRID_SIZE = 0.01
+DEFAULT_PROJECTED_GRID_SIZE = 1000.0
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def cell_key_fields(keys, anchor='centroid', precision=DEFAULT_GEOHASH_PRECISION):
+    """Returns the (key, field) pairs that the cell keys add to a column, checking the settings."""
+    unknown = set(keys) - set(CELL_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown cell key: {', '.join(sorted(unknown))}")
+    if anchor not in CELL_ANCHORS:
+        raise ValueError(f"Unknown cell anchor: {anchor}")
+    if not 1 <= precision <= MAX_GEOHASH_PRECISION:
+        raise ValueError(f"Geohash precision must be between 1 and {MAX_GEOHASH_PRECISION}")
+    return [(key, CELL_KEY_FIELDS[key]) for key in CELL_KEYS if key in keys]
+
+
+def cell_key_column(parsed, kind, keys, anchor='centroid', precision=DEFAULT_GEOHASH_PRECISION,
+                    grid_size=DEFAULT_GRID_SIZE):
+    """Computes the cell keys of every cell of a CoordinateBatch; returns {field: [(row_index, key), ...]}.
+
+    :param grid_size: Side of the grid squares, in the units of the coordinates.
+    """
+    fields = cell_key_fields(keys, anchor, precision)
+    if not fields or not len(parsed):
+        return {}
+    import numpy
+
+    x, y = anchor_points(numpy, parsed, kind, anchor)
+    values = {}
+    if 'geohash' in keys:
+        values['geohash'] = geohashes(x, y, precision)
+    if 'grid' in keys:
+        values['grid_cell'] = grid_cells(x, y, grid_size)
+    rows = parsed.rows.tolist()
+    return {name: [(row, key or None) for row, key in zip(rows, column.tolist())] for name, column in values.items()}
+
+
+def anchor_points(numpy, parsed, kind, anchor='centroid'):
+    """Returns the x and y arrays of the anchor point of each cell of a CoordinateBatch."""
+    xy = parsed.xy().astype(numpy.float64)
+    offsets = numpy.frombuffer(parsed.offsets, dtype=parsed.offsets.typecode)
+    starts, ends = offsets[:-1], offsets[1:]
+    if kind == 'point':
+        return xy[starts, 0], xy[starts, 1]
+    if anchor == 'bbox':
+        x = (numpy.minimum.reduceat(xy[:, 0], starts) + numpy.maximum.reduceat(xy[:, 0], starts)) / 2
+        y = (numpy.minimum.reduceat(xy[:, 1], starts) + numpy.maximum.reduceat(xy[:, 1], starts)) / 2
+        return x, y
+    return _centroids(numpy, xy, starts, ends, kind == 'shape')
+
+
+def geohashes(lon, lat, precision=DEFAULT_GEOHASH_PRECISION):
+    """Returns the geohashes of longitude/latitude arrays as a NumPy string array, '' for non-finite points."""
+    import numpy
+
+    lon = numpy.asarray(lon, dtype=numpy.float64)
+    lat = numpy.asarray(lat, dtype=numpy.float64)
+    finite = numpy.isfinite(lon) & numpy.isfinite(lat)
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_cells = _bisections(numpy, numpy.where(finite, lon, 0.0), -180.0, 180.0, lon_bits)
+    lat_cells = _bisections(numpy, numpy.where(finite, lat, 0.0), -90.0, 90.0, lat_bits)
+    # Interleave the bits, longitude first, most significant first
+    codes = numpy.zeros(len(lon_cells), dtype=numpy.int64)
+    for bit in range(bits):
+        if bit % 2 == 0:
+            value = (lon_cells >> (lon_bits - 1 - bit // 2)) & 1
+        else:
+            value = (lat_cells >> (lat_bits - 1 - bit // 2)) & 1
+        codes = (codes << 1) | value
+    shifts = numpy.arange(precision - 1, -1, -1, dtype=numpy.int64) * 5
+    digits = (codes[:, None] >> shifts) & 31
+    characters = numpy.array(list(GEOHASH_ALPHABET))[digits]
+    hashes = numpy.ascontiguousarray(characters).view(f'<U{precision}').ravel()
+    hashes[~finite] = ''
+    return hashes
+
+
+def _bisections(numpy, values, low, high, bits):
+    """Returns the index of the 2 ** bits equal intervals of [low, high] holding each value."""
+    cells = 1 << bits
+    scaled = numpy.floor((numpy.asarray(values, dtype=numpy.float64) - low) / (high - low) * cells)
+    return numpy.clip(scaled, 0, cells - 1).astype(numpy.int64)
+
+
+def grid_cells(x, y, size=DEFAULT_GRID_SIZE):
+    """Returns the 'column_row' ids of the grid squares of a side holding each point, as a NumPy string array.
+
+    Non-finite points, and points too far out for 64 bit square numbers, get ''.
+    """
+    import numpy
+
+    with numpy.errstate(over='ignore'):
+        columns = numpy.floor(numpy.asarray(x, dtype=numpy.float64) / size)
+        rows = numpy.floor(numpy.asarray(y, dtype=numpy.float64) / size)
+    # False for NaN as well
+    valid = (numpy.abs(columns) < 2.0 ** 62) & (numpy.abs(rows) < 2.0 ** 62)
+    columns = numpy.where(valid, columns, 0).astype(numpy.int64)
+    rows = numpy.where(valid, rows, 0).astype(numpy.int64)
+    cells = numpy.char.add(numpy.char.add(columns.astype(str), '_'), rows.astype(str))
+    cells[~valid] = ''
+    return cells
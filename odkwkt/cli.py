@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ odkwkt command line
+                                 A QGIS plugin
+ Usage (from the plugin directory):
+
+   python -m odkwkt export.xlsx --sheet data \\
+       --trace site_extent_line --polygon site_extent_polygon
+
+ Per-stage timings are printed to stderr, and can also be written as JSON
+ with --timings-json; --profile wraps the run in cProfile or tracemalloc.
+ ***************************************************************************/
+"""
+
+import argparse
+import json
+import sys
+
+from .engine import (
+    DEFAULT_POLY_RESULT_COLUMN,
+    DEFAULT_TRACE_RESULT_COLUMN,
+    ColumnSpec,
+    ConversionOptions,
+    convert_workbook,
+)
+from .cells import CELL_ANCHORS, CELL_KEYS, DEFAULT_GEOHASH_PRECISION
+from .duplicates import DEFAULT_OVERLAP
+from .encodings import ENCODINGS
+from .errors import read_error_rows
+from .instrument import PROFILERS, StageTimer
+from .measures import MEASURES
+from .ordering import ORDERS
+from .outputs import WRITERS
+from .readers import READERS
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m odkwkt',
+        description='Convert ODK geo columns of an .xlsx sheet to (flipped) WKT columns.')
+    parser.add_argument('file', help='.xlsx file, converted in place unless --output is given')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='write a new .xlsx file instead, leaving the input untouched; a .csv, .gpkg or '
+                             '.sidecar.parquet FILE only receives the key and WKT columns, any other .parquet '
+                             'FILE is GeoParquet, '
+                             'a .geojsonl/.geojsons/.ndjson FILE newline-delimited GeoJSON')
+    parser.add_argument('--key', metavar='COLUMN',
+                        help='key column of .csv/.gpkg/.sidecar.parquet outputs and id of GeoJSON features '
+                             '(default: KEY, else the row number)')
+    parser.add_argument('--properties', nargs='+', metavar='COLUMN',
+                        help='columns written as GeoJSON feature properties (default: all but the ODK columns)')
+    parser.add_argument('--precision', type=int, metavar='DECIMALS',
+                        help='decimals of GeoJSON coordinates (default: 6 for GeoJSON files, else all)')
+    parser.add_argument('--sheet', required=True, help='name of the sheet to convert')
+    parser.add_argument('--point', help='ODK geopoint column')
+    parser.add_argument('--point-result', default='QGIS Point WKT', help='name of the point WKT column')
+    parser.add_argument('--trace', help='ODK geotrace (line) column')
+    parser.add_argument('--trace-result', default=DEFAULT_TRACE_RESULT_COLUMN,
+                        help='name of the line WKT column')
+    parser.add_argument('--polygon', help='ODK geoshape (polygon) column')
+    parser.add_argument('--poly-result', default=DEFAULT_POLY_RESULT_COLUMN,
+                        help='name of the polygon WKT column')
+    for name in ('point', 'trace', 'poly'):
+        parser.add_argument(f'--{name}-encoding', choices=ENCODINGS, default='wkt',
+                            help=f'encoding of the {name} result column (default: wkt; '
+                                 f'ewkb_hex carries SRID 4326, or that of --target-crs)')
+    parser.add_argument('--target-crs', metavar='CRS',
+                        help='reproject the coordinates from WGS 84 to CRS, e.g. EPSG:32633 (needs pyproj)')
+    parser.add_argument('--validate', action='store_true',
+                        help='repair invalid lines and polygons with make_valid and orient polygon rings '
+                             'counter-clockwise')
+    parser.add_argument('--validity-column',
+                        help='with --validate, column receiving why the geometries of a row were repaired')
+    parser.add_argument('--measures', nargs='+', choices=MEASURES, default=(), metavar='MEASURE',
+                        help=f"add measure columns after the result columns ({', '.join(MEASURES)}); "
+                             'length, area and perimeter are geodesic, in metres')
+    parser.add_argument('--cell-keys', nargs='+', choices=CELL_KEYS, default=(), metavar='KEY',
+                        help=f"add spatial key columns after the result columns ({', '.join(CELL_KEYS)})")
+    parser.add_argument('--cell-anchor', choices=CELL_ANCHORS, default='centroid',
+                        help='point the cell keys are computed for (default: centroid)')
+    parser.add_argument('--geohash-precision', type=int, default=DEFAULT_GEOHASH_PRECISION, metavar='N',
+                        help=f'characters of the geohash column (default: {DEFAULT_GEOHASH_PRECISION})')
+    parser.add_argument('--grid-size', type=float, metavar='SIZE',
+                        help='side of the grid cells in output coordinate units (default: 0.01 degrees, '
+                             'or 1000 units of a projected --target-crs)')
+    parser.add_argument('--simplify', nargs='+', type=float, default=(), metavar='TOLERANCE',
+                        help='add traces and shapes simplified at each TOLERANCE, in output coordinate units, '
+                             'after the result columns')
+    parser.add_argument('--aoi-bbox', nargs=4, type=float,
+                        metavar=('MIN_LON', 'MIN_LAT', 'MAX_LON', 'MAX_LAT'),
+                        help='only convert the cells intersecting this box')
+    parser.add_argument('--aoi', metavar='LAYER',
+                        help='only convert the cells intersecting the polygons of a .gpkg or .shp LAYER')
+    parser.add_argument('--join', metavar='LAYER',
+                        help='add the attributes of the polygon of a .gpkg or .shp LAYER each geometry falls in')
+    parser.add_argument('--join-attributes', nargs='+', metavar='ATTRIBUTE',
+                        help='with --join, the attributes to add (default: all)')
+    parser.add_argument('--duplicates', action='store_true',
+                        help='report rows recording the same site twice once all rows are converted')
+    parser.add_argument('--duplicate-report', metavar='CSV',
+                        help='with --duplicates, write row/duplicate_of/column/test/value of every duplicate to CSV')
+    parser.add_argument('--overlap', type=float, default=DEFAULT_OVERLAP, metavar='RATIO',
+                        help=f'intersection over union from which shapes are duplicates (default: {DEFAULT_OVERLAP})')
+    parser.add_argument('--duplicate-distance', type=float, metavar='DISTANCE',
+                        help='distance within which traces and centroids are duplicates, in output '
+                             'coordinate units (default: about 1 m)')
+    parser.add_argument('--order', choices=ORDERS,
+                        help='write the rows of .csv, .gpkg, .sidecar.parquet and GeoJSON outputs along a '
+                             'Hilbert or Z-order curve through their bounding box centres, keeping the row number in '
+                             'a row column')
+    parser.add_argument('--threads', type=int, default=0, metavar='N',
+                        help='convert on N worker threads while reading and writing alongside (default: 0, '
+                             'one stage after the other)')
+    parser.add_argument('--memory-budget', type=float, metavar='MB',
+                        help='stay within about MB MiB of memory, converting more slowly if needed')
+    parser.add_argument('--float32', action='store_true',
+                        help='hold parsed coordinates as 32 bit floats: half the memory, about 1 m precision')
+    parser.add_argument('--tolerant', action='store_true',
+                        help='skip cells that cannot be converted instead of aborting')
+    parser.add_argument('--error-column', help='with --tolerant, column receiving the errors of each row')
+    parser.add_argument('--error-report', metavar='CSV',
+                        help='with --tolerant, write row/column/token/reason of every error to CSV')
+    parser.add_argument('--rows-from', metavar='CSV',
+                        help='only convert the rows listed in a previous error report')
+    parser.add_argument('--checkpoint', type=int, metavar='ROWS',
+                        help='journal every ROWS converted rows so an interrupted run can resume')
+    parser.add_argument('--reader', choices=READERS, default='auto',
+                        help='with --output, how the input is read (default: zipxml for large files)')
+    parser.add_argument('--writer', choices=WRITERS, default='auto',
+                        help='xmlappend rewrites only the converted sheet (default), '
+                             'openpyxl saves the whole workbook with openpyxl')
+    parser.add_argument('--timings-json', metavar='PATH',
+                        help="write per-stage timings as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help='profile the run; the profile is saved next to the file')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print timings to stderr')
+    return parser
+
+
+def column_specs(args):
+    """Returns the ColumnSpecs selected on the command line."""
+    columns = []
+    if args.point:
+        columns.append(ColumnSpec(args.point, args.point_result, 'point', args.point_encoding))
+    if args.trace:
+        columns.append(ColumnSpec(args.trace, args.trace_result, 'trace', args.trace_encoding))
+    if args.polygon:
+        columns.append(ColumnSpec(args.polygon, args.poly_result, 'shape', args.poly_encoding))
+    return columns
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    columns = column_specs(args)
+    if not columns:
+        parser.error('select at least one of --point, --trace or --polygon')
+
+    try:
+        options = ConversionOptions(
+            output_path=args.output,
+            tolerant=args.tolerant,
+            error_column=args.error_column,
+            error_report=args.error_report,
+            profile=args.profile,
+            checkpoint_rows=args.checkpoint,
+            reader=args.reader,
+            writer=args.writer,
+            key_column=args.key,
+            properties=tuple(args.properties) if args.properties else None,
+            precision=args.precision,
+            single_precision=args.float32,
+            memory_budget=args.memory_budget,
+            threads=args.threads,
+            validate=args.validate,
+            validity_column=args.validity_column,
+            target_crs=args.target_crs,
+            measures=tuple(args.measures),
+            cell_keys=tuple(args.cell_keys),
+            cell_anchor=args.cell_anchor,
+            geohash_precision=args.geohash_precision,
+            grid_size=args.grid_size,
+            simplify=tuple(args.simplify),
+            aoi_bbox=tuple(args.aoi_bbox) if args.aoi_bbox else None,
+            aoi_layer=args.aoi,
+            join_layer=args.join,
+            join_attributes=tuple(args.join_attributes) if args.join_attributes else None,
+            duplicates=args.duplicates,
+            duplicate_report=args.duplicate_report,
+            duplicate_overlap=args.overlap,
+            duplicate_distance=args.duplicate_distance,
+            order=args.order,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    timer = StageTimer()
+    try:
+        if args.rows_from:
+            options.rows = frozenset(read_error_rows(args.rows_from))
+        result = convert_workbook(args.file, args.sheet, columns, options, timer)
+    except Exception as e:
+        print(f"Failed to convert coordinates: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        if result.resumed_chunks:
+            print(f"resumed {result.resumed_chunks} chunk(s) from the journal", file=sys.stderr)
+        for target, count in result.converted.items():
+            print(f"{target}: {count} geometries", file=sys.stderr)
+        for error in result.errors:
+            print(error, file=sys.stderr)
+        for reason, count in result.repair_summary().items():
+            print(f"repaired {count} geometries: {reason}", file=sys.stderr)
+        for duplicate in result.duplicates:
+            print(duplicate, file=sys.stderr)
+        for line in timer.report():
+            print(line, file=sys.stderr)
+
+    if args.timings_json:
+        timings = timer.as_dict()
+        timings['converted'] = result.converted
+        timings['errors'] = len(result.errors)
+        timings['repairs'] = result.repair_summary()
+        timings['duplicates'] = len(result.duplicates)
+        if args.timings_json == '-':
+            json.dump(timings, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.timings_json, 'w', encoding='utf-8') as handle:
+                json.dump(timings, handle, indent=2)
+    return 2 if result.errors else 0
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ODK coordinate parsing
+                                 A QGIS plugin
+ Turns ODK geopoint/geotrace/geoshape strings into (lon, lat) tuples.
+ ***************************************************************************/
+"""
+
+import math
+from array import array
+
+
+class CoordinateError(ValueError):
+    """An ODK coordinate that cannot be parsed; token holds the offending text."""
+
+    def __init__(self, token, reason=None):
+        super().__init__(f"Invalid coordinate format: {token}")
+        self.token = token
+        self.reason = reason or str(self)
+
+
+def flip_coordinates(coordinate):
+    """
+    Flips ODK coordinates from (latitude, longitude) to (longitude, latitude).
+    Expects coordinates in "lat lon" format; altitude and accuracy are ignored.
+    """
+    coords = coordinate.split()
+    if len(coords) >= 2:
+        try:
+            lon, lat = float(coords[1]), float(coords[0])  # Swap lat and lon
+        except ValueError as e:
+            raise CoordinateError(coordinate, str(e)) from None
+        # float() also reads nan and inf, which no output format can hold
+        if not (math.isfinite(lon) and math.isfinite(lat)):
+            raise CoordinateError(coordinate, "coordinates must be finite numbers")
+        return lon, lat
+    raise CoordinateError(coordinate, "expected 'latitude longitude'")
+
+
+def parse_coordinates(value):
+    """Parses a ';' separated ODK geo value into a list of (lon, lat) tuples."""
+    return [flip_coordinates(coord) for coord in value.split(';')]
+
+
+class CoordinateBatch:
+    """The (lon, lat) coordinates of many cells, stored in one flat array.
+
+    values holds the longitude and latitude of every vertex back to back in
+    an array('d'), or array('f') with single_precision (about 1 m at the
+    antimeridian), offsets the index of the first vertex of each cell plus
+    the total, and rows the row index of each cell. That is 16 (or 8) bytes
+    per vertex instead of about 100 for lists of float tuples.
+
+    Iterating yields (row_index, coordinates) pairs like parse_column used
+    to, the coordinates being a NumPy (n, 2) view into values.
+    """
+
+    def __init__(self, single_precision=False):
+        self.values = array('f' if single_precision else 'd')
+        self.offsets = array('q', [0])
+        self.rows = array('q')
+
+    @classmethod
+    def from_pairs(cls, pairs, single_precision=False):
+        """Returns a batch of (row_index, [(lon, lat), ...]) pairs."""
+        batch = cls(single_precision)
+        for row_index, coords in pairs:
+            for coordinate in coords:
+                batch.values.extend(coordinate)
+            batch._close_cell(row_index)
+        return batch
+
+    def append(self, row_index, value):
+        """Parses a ';' separated ODK geo value into the batch.
+
+        Raises CoordinateError like parse_coordinates, leaving the batch as
+        it was.
+        """
+        size = len(self.values)
+        try:
+            for coordinate in value.split(';'):
+                self.values.extend(flip_coordinates(coordinate))
+        except Exception:
+            del self.values[size:]
+            raise
+        self._close_cell(row_index)
+
+    def _close_cell(self, row_index):
+        self.rows.append(row_index)
+        self.offsets.append(len(self.values) // 2)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def vertices(self):
+        return self.offsets[-1]
+
+    def xy(self):
+        """Returns all vertices as a NumPy (n, 2) array sharing the batch memory."""
+        import numpy
+
+        return numpy.frombuffer(self.values, dtype=self.values.typecode).reshape(-1, 2)
+
+    def __iter__(self):
+        if not self.rows:
+            return
+        xy = self.xy()
+        offsets = self.offsets
+        for position, row_index in enumerate(self.rows):
+            yield row_index, xy[offsets[position]:offsets[position + 1]]
+
+    def select(self, row_indexes):
+        """Returns a new batch with only the cells of the given rows."""
+        batch = CoordinateBatch(self.values.typecode == 'f')
+        offsets = self.offsets
+        for position, row_index in enumerate(self.rows):
+            if row_index in row_indexes:
+                batch.values.extend(self.values[offsets[position] * 2:offsets[position + 1] * 2])
+                batch._close_cell(row_index)
+        return batch
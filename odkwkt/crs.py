@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Target coordinate reference system
+                                 A QGIS plugin
+ Reprojects parsed ODK coordinates (longitude/latitude on WGS 84) to the
+ CRS the results are delivered in, e.g. the national UTM zone, while the
+ rows are converted, so no second reprojection pass is needed in QGIS.
+
+ The coordinates of a whole column chunk are transformed at once, in
+ place in their CoordinateBatch, with pyproj's vectorized Transformer.
+ Needs pyproj.
+ ***************************************************************************/
+"""
+
+from .encodings import WGS84_SRID
+from .errors import RowError
+
+WGS84_CRS = f'EPSG:{WGS84_SRID}'
+
+
+class CoordinateTransform:
+    """Transforms WGS 84 longitude/latitude to a target CRS.
+
+    :param target_crs: Anything pyproj accepts, e.g. 'EPSG:32633', a PROJ
+        string or WKT.
+    """
+
+    def __init__(self, target_crs):
+        try:
+            import pyproj
+        except ImportError as e:
+            raise ImportError("Reprojecting needs pyproj") from e
+
+        self.crs = pyproj.CRS.from_user_input(target_crs)
+        # EWKB and GeoPackage outputs refer to the CRS by its EPSG code, if it has one
+        self.srid = self.crs.to_epsg() or 0
+        # Axis order stays x/y (easting/northing, or longitude/latitude)
+        self.transformer = pyproj.Transformer.from_crs(WGS84_CRS, self.crs, always_xy=True)
+
+    @property
+    def name(self):
+        return self.crs.name
+
+    @property
+    def wkt(self):
+        """OGC WKT 1 definition, as GeoPackage 1.2 expects it."""
+        return self.crs.to_wkt('WKT1_GDAL')
+
+    def projjson(self):
+        """PROJJSON definition, as GeoParquet expects it."""
+        return self.crs.to_json_dict()
+
+    def apply(self, parsed, column=None):
+        """Transforms a CoordinateBatch in place; returns (batch, errors).
+
+        errors holds a RowError per cell with a vertex the CRS cannot
+        represent (PROJ returns infinity); those cells are left out of the
+        returned batch.
+        """
+        import numpy
+
+        if not len(parsed):
+            return parsed, []
+        xy = parsed.xy()
+        x, y = self.transformer.transform(xy[:, 0], xy[:, 1])
+        outside = numpy.flatnonzero(~(numpy.isfinite(x) & numpy.isfinite(y)))
+        errors = []
+        if len(outside):
+            offsets = numpy.frombuffer(parsed.offsets, dtype=parsed.offsets.typecode)
+            vertex_cells = numpy.searchsorted(offsets, outside, side='right') - 1
+            cells, first = numpy.unique(vertex_cells, return_index=True)
+            for cell, vertex in zip(cells.tolist(), outside[first].tolist()):
+                lon, lat = xy[vertex].tolist()
+                errors.append(RowError(parsed.rows[cell], column, f'{lat} {lon}', f"outside {self.name}"))
+        xy[:, 0] = x
+        xy[:, 1] = y
+        if errors:
+            parsed = parsed.select(set(parsed.rows).difference(error.row for error in errors))
+        return parsed, errors
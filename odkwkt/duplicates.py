@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Duplicate submissions
+                                 A QGIS plugin
+ Finds rows of a converted column that record the same site twice, once
+ all rows are converted. Candidate pairs come from an STRtree over the
+ geometries (and one over their centroids), so only neighbours are
+ compared instead of every pair of rows:
+
+ * identical   same coordinates, once normalized (ring start, direction)
+ * overlap     shapes whose intersection over union reaches a threshold
+ * hausdorff   traces within a Hausdorff distance of each other
+ * centroid    centroids (or points) within that distance
+
+ Needs Shapely 2.
+ ***************************************************************************/
+"""
+
+import csv
+from dataclasses import dataclass, astuple
+
+DUPLICATE_TESTS = ('identical', 'overlap', 'hausdorff', 'centroid')
+
+# Intersection over union from which two shapes are the same site
+DEFAULT_OVERLAP = 0.9
+
+# Distance in degrees (about 1 m) within which traces and centroids are the same
+DEFAULT_DUPLICATE_DISTANCE = 1e-5
+
+DUPLICATE_REPORT_FIELDS = ('row', 'duplicate_of', 'column', 'test', 'value')
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """A row that looks like a second submission of an earlier row.
+
+    value is the intersection over union (overlap) or the distance
+    (hausdorff, centroid) that matched; None for identical rows.
+    """
+    row: int
+    duplicate_of: int
+    column: str
+    test: str
+    value: float = None
+
+    def __str__(self):
+        value = f" {self.value:g}" if self.value is not None else ''
+        return (f"Row {self.row}, column '{self.column}': duplicate of row {self.duplicate_of} "
+                f"({self.test}{value})")
+
+
+def find_duplicates(geometries, kind, column=None, overlap=DEFAULT_OVERLAP,
+                    distance=DEFAULT_DUPLICATE_DISTANCE):
+    """Returns a Duplicate per pair of rows recording the same site, the later row being the duplicate.
+
+    A pair is reported once, for the first test it passes in
+    DUPLICATE_TESTS order.
+
+    :param geometries: (row_index, geometry) pairs of one column.
+    :param kind: ODK geometry kind of the column; overlap only applies to
+        shapes, hausdorff to traces.
+    :param distance: In the units of the coordinates.
+    """
+    if len(geometries) < 2:
+        return []
+    import numpy
+    import shapely
+
+    geometries = sorted(geometries, key=lambda pair: pair[0])
+    rows = [row_index for row_index, _ in geometries]
+    array = numpy.empty(len(geometries), dtype=object)
+    array[:] = [geometry for _, geometry in geometries]
+
+    found = {}
+    first = {}
+    for index, key in enumerate(shapely.to_wkb(shapely.normalize(array)).tolist()):
+        earlier = first.setdefault(key, index)
+        if earlier != index:
+            found[(index, earlier)] = ('identical', None)
+
+    if kind == 'shape':
+        later, earlier = _candidates(shapely.STRtree(array), array, predicate='intersects')
+        # GEOS cannot intersect invalid shapes, which are compared as make_valid repairs them
+        involved = numpy.unique(numpy.concatenate([later, earlier]))
+        invalid = involved[~shapely.is_valid(array[involved])]
+        if len(invalid):
+            array = array.copy()
+            array[invalid] = shapely.make_valid(array[invalid])
+        shared = shapely.area(shapely.intersection(array[later], array[earlier]))
+        areas = shapely.area(array)
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            ratios = shared / (areas[later] + areas[earlier] - shared)
+        _add_pairs(found, numpy, 'overlap', later, earlier, ratios, ratios >= overlap)
+    elif kind == 'trace':
+        later, earlier = _candidates(shapely.STRtree(array), array, predicate='dwithin', distance=distance)
+        distances = shapely.hausdorff_distance(array[later], array[earlier])
+        _add_pairs(found, numpy, 'hausdorff', later, earlier, distances, distances <= distance)
+
+    centroids = shapely.centroid(array)
+    later, earlier = _candidates(shapely.STRtree(centroids), centroids, predicate='dwithin', distance=distance)
+    distances = shapely.distance(centroids[later], centroids[earlier])
+    _add_pairs(found, numpy, 'centroid', later, earlier, distances, distances <= distance)
+
+    return [Duplicate(rows[index], rows[earlier], column, test, value)
+            for (index, earlier), (test, value) in sorted(found.items())]
+
+
+def _candidates(tree, array, **query):
+    """Returns the (later, earlier) index arrays of the pairs an STRtree query yields."""
+    later, earlier = tree.query(array, **query)
+    keep = later > earlier
+    return later[keep], earlier[keep]
+
+
+def _add_pairs(found, numpy, test, later, earlier, values, matched):
+    """Records the matched pairs that no earlier test has found."""
+    for index, other, value in zip(later[matched].tolist(), earlier[matched].tolist(),
+                                   numpy.asarray(values)[matched].tolist()):
+        found.setdefault((index, other), (test, value))
+
+
+def write_duplicate_report(file_path, duplicates):
+    """Writes the duplicates as a CSV report with row, duplicate_of, column, test and value."""
+    with open(file_path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(DUPLICATE_REPORT_FIELDS)
+        writer.writerows(astuple(duplicate) for duplicate in duplicates)
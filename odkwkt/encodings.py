@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Result column encodings
+                                 A QGIS plugin
+ How converted geometries are written into their result column:
+
+ * wkt       Well-Known Text, e.g. LINESTRING (20 10, 20.5 10.5)
+ * wkb_hex   little endian Well-Known Binary as hex text
+ * ewkb_hex  PostGIS extended WKB as hex text, carrying SRID 4326 (or that
+             of the target CRS, see crs)
+ * geojson   GeoJSON geometry object, coordinates optionally rounded
+
+ Binary outputs (GeoParquet, GeoPackage) take the WKB bytes themselves, the
+ internal wkb encoding, instead of hex text.
+
+ WKB is packed straight from the parsed coordinates of a whole column chunk
+ at once, without going through Shapely; it keeps the full double precision
+ and loads into PostGIS (ST_GeomFromEWKB / a geometry cast) or GDAL without
+ any text parsing. GeoJSON is formatted from the same coordinates.
+ Geometries that no longer match their parsed coordinates (repaired or
+ reoriented, see validity) are encoded by Shapely instead.
+ ***************************************************************************/
+"""
+
+import json
+import struct
+import sys
+from array import array
+
+from .coords import CoordinateBatch
+
+ENCODINGS = ('wkt', 'wkb_hex', 'ewkb_hex', 'geojson')
+# Not cell values, for outputs that store the bytes (see engine)
+BINARY_ENCODINGS = ('wkb',)
+
+# Coordinates are longitude/latitude on WGS 84
+WGS84_SRID = 4326
+
+WKB_TYPES = {'point': 1, 'trace': 2, 'shape': 3}
+GEOJSON_TYPES = {'point': 'Point', 'trace': 'LineString', 'shape': 'Polygon'}
+
+# EWKB type flag telling an SRID follows the type
+_EWKB_SRID = 0x20000000
+
+# Shapely's geometry type ids
+_GEOMETRY_TYPE_NAMES = {
+    0: 'Point', 1: 'LineString', 2: 'LinearRing', 3: 'Polygon', 4: 'MultiPoint',
+    5: 'MultiLineString', 6: 'MultiPolygon', 7: 'GeometryCollection',
+}
+
+
+def encode_column(parsed, kind, encoding, precision=None, srid=WGS84_SRID):
+    """Encodes parsed coordinates into (row_index, text) pairs, or (row_index, bytes) for wkb.
+
+    :param parsed: A CoordinateBatch (see parse_column), or (row_index,
+        [(lon, lat), ...]) pairs. The coordinates must already have passed
+        geometry building (see build_geometries), which rejects what cannot
+        form a geometry of the kind. Points use their first coordinate and
+        unclosed polygon rings are closed, like Shapely does.
+    :param precision: GeoJSON only, number of decimals coordinates are
+        rounded to; None keeps them as parsed.
+    :param srid: EWKB only, SRID of the coordinates.
+    """
+    if encoding not in ENCODINGS + BINARY_ENCODINGS or encoding == 'wkt':
+        raise ValueError(f"Not a coordinate encoding: {encoding}")
+    if not isinstance(parsed, CoordinateBatch):
+        parsed = CoordinateBatch.from_pairs(parsed)
+    if encoding == 'geojson':
+        return _geojson_column(parsed, kind, precision)
+    if encoding == 'ewkb_hex':
+        header = struct.pack('<BIi', 1, WKB_TYPES[kind] | _EWKB_SRID, srid)
+    else:
+        header = struct.pack('<BI', 1, WKB_TYPES[kind])
+
+    # WKB doubles are the batch's own bytes, unless it is single precision
+    values = parsed.values
+    if values.typecode != 'd' or sys.byteorder == 'big':
+        values = array('d', values)
+        if sys.byteorder == 'big':
+            values.byteswap()
+    data = memoryview(values).cast('B')
+
+    binary = encoding in BINARY_ENCODINGS
+    results = []
+    offsets = parsed.offsets
+    for position, row_index in enumerate(parsed.rows):
+        start, end = offsets[position], offsets[position + 1]
+        if kind == 'point':
+            wkb = header + data[start * 16:start * 16 + 16]
+        elif kind == 'trace':
+            wkb = header + struct.pack('<I', end - start) + data[start * 16:end * 16]
+        elif _closed(parsed.values, start, end):
+            wkb = header + struct.pack('<II', 1, end - start) + data[start * 16:end * 16]
+        else:
+            wkb = (header + struct.pack('<II', 1, end - start + 1) + data[start * 16:end * 16]
+                   + data[start * 16:start * 16 + 16])
+        results.append((row_index, wkb if binary else wkb.hex().upper()))
+    return results
+
+
+def _closed(values, start, end):
+    """Returns whether the vertices start to end of a flat array form a closed ring."""
+    return values[start * 2] == values[end * 2 - 2] and values[start * 2 + 1] == values[end * 2 - 1]
+
+
+def _geojson_column(parsed, kind, precision):
+    prefix = '{"type":"%s","coordinates":' % GEOJSON_TYPES[kind]
+    # One printf-style template per vertex count formats a whole geometry at once
+    position = '[%r,%r]'
+    templates = {}
+
+    results = []
+    values = parsed.values
+    if precision is not None:
+        import numpy
+
+        # Rounded up front and written with repr, which unlike %.Nf adds no trailing zeros
+        values = numpy.round(parsed.xy().astype(numpy.float64).ravel(), int(precision)).tolist()
+    offsets = parsed.offsets
+    for index, row_index in enumerate(parsed.rows):
+        start, end = offsets[index], offsets[index + 1]
+        if kind == 'point':
+            end = start + 1
+        coordinates = tuple(values[start * 2:end * 2])
+        if kind == 'shape' and not _closed(values, start, end):
+            coordinates += coordinates[:2]
+        count = len(coordinates) // 2
+        template = templates.get(count)
+        if template is None:
+            template = templates[count] = ','.join([position] * count)
+        text = template % coordinates
+        if kind == 'trace':
+            text = '[' + text + ']'
+        elif kind == 'shape':
+            text = '[[' + text + ']]'
+        results.append((row_index, prefix + text + '}'))
+    return results
+
+
+def encode_geometries(geometries, encoding, precision=None, srid=WGS84_SRID):
+    """Encodes (row_index, geometry) pairs with Shapely's vectorized writers.
+
+    Unlike encode_column, this handles any geometry type, e.g. the
+    MultiPolygons make_valid turns bow ties into.
+
+    :param precision: GeoJSON only, number of decimals coordinates are
+        rounded to; None keeps them as they are.
+    :param srid: EWKB only, SRID of the coordinates.
+    """
+    if encoding not in ENCODINGS + BINARY_ENCODINGS or encoding == 'wkt':
+        raise ValueError(f"Not a coordinate encoding: {encoding}")
+    if not geometries:
+        return []
+    import numpy
+    import shapely
+
+    array = numpy.empty(len(geometries), dtype=object)
+    array[:] = [geometry for _, geometry in geometries]
+    if encoding == 'geojson':
+        if precision is not None:
+            array = shapely.transform(array, lambda coords: numpy.round(coords, int(precision)))
+        texts = shapely.to_geojson(array)
+    elif encoding == 'ewkb_hex':
+        texts = shapely.to_wkb(shapely.set_srid(array, srid), hex=True, output_dimension=2,
+                               byte_order=1, include_srid=True)
+    else:
+        texts = shapely.to_wkb(array, hex=encoding not in BINARY_ENCODINGS, output_dimension=2, byte_order=1)
+    return list(zip([row_index for row_index, _ in geometries], texts.tolist()))
+
+
+def load_geometry(value, encoding):
+    """Returns the Shapely geometry of a result value written with an encoding."""
+    if encoding == 'wkt':
+        from shapely import wkt
+
+        return wkt.loads(value)
+    if encoding == 'geojson':
+        from shapely.geometry import shape
+
+        return shape(json.loads(value))
+    from shapely import wkb
+
+    return wkb.loads(value, hex=encoding not in BINARY_ENCODINGS)
+
+
+def wkb_extents(values):
+    """Returns the bounds and geometry type names of WKB values, parsed at once by Shapely.
+
+    :param values: WKB bytes, None for rows without a geometry.
+    :returns: An (n, 4) array of min x, min y, max x, max y (NaN for None)
+        and the set of the geometry type names present.
+    """
+    import numpy
+    import shapely
+
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    geometries = shapely.from_wkb(array)
+    type_ids = numpy.unique(shapely.get_type_id(geometries[~shapely.is_missing(geometries)]))
+    return shapely.bounds(geometries), {_GEOMETRY_TYPE_NAMES[type_id] for type_id in type_ids.tolist()}
+
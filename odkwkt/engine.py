@@ -0,0 +1,842 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ODK to WKT conversion engine
+                                 A QGIS plugin
+ Converts ODK geo columns of an .xlsx sheet into (flipped) WKT columns.
+
+ The conversion is split into stages (load, header probe, read, parse, aoi,
+ transform, measure, cell keys, geometry build, validate, join, simplify,
+ serialize, write, duplicates, save) which are exposed individually so that they can
+ be benchmarked, timed and reused outside of the QGIS dialog.
+
+ openpyxl and Shapely are imported by the stages that need them, so that
+ importing this package costs nothing at QGIS start-up.
+ ***************************************************************************/
+"""
+
+import gc
+import os
+from dataclasses import dataclass, field, replace
+
+from .aoi import AreaOfInterest
+from .budget import MemoryBudget, row_bytes
+from .cells import (DEFAULT_GEOHASH_PRECISION, DEFAULT_GRID_SIZE, DEFAULT_PROJECTED_GRID_SIZE,
+                    GEOGRAPHIC_CELL_KEYS, cell_key_column, cell_key_fields)
+from .coords import CoordinateBatch
+from .crs import WGS84_CRS, CoordinateTransform
+from .duplicates import DEFAULT_DUPLICATE_DISTANCE, DEFAULT_OVERLAP, find_duplicates, write_duplicate_report
+from .encodings import BINARY_ENCODINGS, ENCODINGS, WGS84_SRID, encode_column, encode_geometries, load_geometry
+from .errors import RowError, error_cells, write_error_report
+from .instrument import StageTimer, profiled
+from .joins import ReferenceLayer
+from .journal import Journal, fingerprint, journal_path
+from .measures import GEODESIC_MEASURES, measure_column, measure_fields
+from .ordering import CENTRE_INDEX, CENTRE_RESULT, ORDERS, bbox_centres
+from .outputs import WRITERS, ColumnAppendOutput, InPlaceOutput, WriteOnlyOutput
+from .pipeline import pipelined
+from .geojson import DEFAULT_GEOJSON_PRECISION, GEOJSON_SUFFIXES, GeoJSONOutput, geojson_output
+from .geoparquet import GEOPARQUET_SUFFIX, GeoParquetOutput
+from .readers import open_reader
+from .sidecar import SIDECAR_FORMATS, SidecarOutput, sidecar_format
+from .simplify import simplified_fields, simplify_column
+from .validity import validate_geometries
+
+DEFAULT_TRACE_RESULT_COLUMN = "QGIS Trace WKT"
+DEFAULT_POLY_RESULT_COLUMN = "QGIS Poly WKT"
+
+# ODK geometry types: geopoint, geotrace (line) and geoshape (polygon)
+GEOMETRY_KINDS = ('point', 'trace', 'shape')
+
+# Rows read, converted and written at a time
+DEFAULT_CHUNK_ROWS = 10000
+
+# Extensions of the files convert_workbook can write
+OUTPUT_SUFFIXES = ('.xlsx',) + tuple(SIDECAR_FORMATS) + (GEOPARQUET_SUFFIX,) + GEOJSON_SUFFIXES
+
+# Extensions of the outputs whose rows can be ordered along a curve (see ConversionOptions.order)
+ORDERED_SUFFIXES = tuple(SIDECAR_FORMATS) + GEOJSON_SUFFIXES
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """One ODK geo column to convert and the column receiving its geometry.
+
+    The result is written as WKT unless encoding asks for hex WKB or EWKB,
+    or GeoJSON (see encodings.ENCODINGS).
+    """
+    source: str
+    target: str
+    kind: str = 'trace'
+    encoding: str = 'wkt'
+
+    def __post_init__(self):
+        if self.kind not in GEOMETRY_KINDS:
+            raise ValueError(f"Unknown geometry kind: {self.kind}")
+        if self.encoding not in ENCODINGS + BINARY_ENCODINGS:
+            raise ValueError(f"Unknown encoding: {self.encoding}")
+
+
+def load_source(file_path, read_only=False):
+    """Opens the workbook; read_only must be False if it is saved again."""
+    from openpyxl import load_workbook
+
+    return load_workbook(file_path, read_only=read_only)
+
+
+def read_headers(sheet):
+    """Returns the values of the first row of the sheet."""
+    return [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
+
+
+def iter_column(sheet, column_index, min_row=2, max_row=None, rows=None):
+    """Yields (row_index, value) for the non-empty cells of a 0-based column.
+
+    If rows is given, only those row numbers are yielded.
+    """
+    max_row = sheet.max_row if max_row is None else min(max_row, sheet.max_row)
+    if rows is not None:
+        if not rows:
+            return
+        min_row, max_row = max(min_row, min(rows)), min(max_row, max(rows))
+    cells = sheet.iter_rows(min_row=min_row, max_row=max_row,
+                            min_col=column_index + 1, max_col=column_index + 1)
+    for row_index, row in enumerate(cells, start=min_row):
+        value = row[0].value if row else None
+        if value and (rows is None or row_index in rows):
+            yield row_index, value
+
+
+def parse_column(values, column=None, errors=None, single_precision=False):
+    """Parses (row_index, value) pairs into a CoordinateBatch.
+
+    A cell that cannot be parsed raises ValueError naming its row, unless an
+    errors list is given, in which case a RowError is appended and the cell
+    skipped.
+
+    :param single_precision: Store the coordinates as 32 bit floats.
+    """
+    parsed = CoordinateBatch(single_precision)
+    for row_index, value in values:
+        try:
+            parsed.append(row_index, value)
+        except (ValueError, AttributeError, TypeError) as e:
+            _row_failed(RowError.from_exception(row_index, column, value, e), errors, e)
+    return parsed
+
+
+def geometry_builder(kind):
+    """Returns the callable building a Shapely geometry of an ODK kind from (lon, lat) tuples."""
+    from shapely.geometry import Point, LineString, Polygon
+
+    if kind == 'point':
+        return lambda coords: Point(coords[0])
+    return LineString if kind == 'trace' else Polygon
+
+
+def build_geometries(parsed, kind, column=None, errors=None):
+    """Builds Shapely geometries of the given ODK kind from parsed coordinates.
+
+    :param parsed: A CoordinateBatch, whose coordinates Shapely reads
+        straight from its buffer, or (row_index, coordinates) pairs.
+
+    Geometries Shapely refuses (e.g. a polygon with fewer than 4 coordinates)
+    are handled like parse_column handles unparsable cells.
+    """
+    builder = geometry_builder(kind)
+    geometries = []
+    for row_index, coords in parsed:
+        try:
+            geometries.append((row_index, builder(coords)))
+        except Exception as e:
+            if hasattr(coords, 'tolist'):
+                coords = [tuple(coordinate) for coordinate in coords.tolist()]
+            _row_failed(RowError.from_exception(row_index, column, coords, e), errors, e)
+    return geometries
+
+
+def _row_failed(error, errors, exception):
+    if errors is None:
+        raise ValueError(str(error)) from exception
+    errors.append(error)
+
+
+def serialize(geometries):
+    """Serializes (row_index, geometry) pairs into (row_index, wkt) pairs."""
+    return [(row_index, geometry.wkt) for row_index, geometry in geometries]
+
+
+def encode(parsed, geometries, spec, precision=None, srid=WGS84_SRID):
+    """Returns the (row_index, value) pairs of a column in the encoding of its spec.
+
+    WKB and GeoJSON are encoded from the parsed coordinates of the rows whose
+    geometry could be built, WKT is serialized from the geometries.
+
+    :param parsed: Parsed coordinates, or None if the geometries no longer
+        match them (see validity.validate_geometries), which then encodes
+        the geometries themselves.
+    :param precision: Decimals GeoJSON coordinates are rounded to.
+    :param srid: SRID EWKB values carry.
+    """
+    if spec.encoding == 'wkt':
+        return serialize(geometries)
+    if parsed is None:
+        return encode_geometries(geometries, spec.encoding, precision, srid)
+    if len(geometries) < len(parsed):
+        built = {row_index for row_index, _ in geometries}
+        parsed = parsed.select(built) if isinstance(parsed, CoordinateBatch) else [
+            pair for pair in parsed if pair[0] in built]
+    return encode_column(parsed, spec.kind, spec.encoding, precision, srid)
+
+
+def write_column(sheet, column_index, results):
+    """Writes (row_index, value) pairs into a 1-based sheet column."""
+    for row_index, value in results:
+        # Assigned rather than passed to cell(), which ignores None
+        sheet.cell(row=row_index, column=column_index).value = value
+
+
+def iter_chunks(rows, chunk_rows, min_row=2, max_bytes=None):
+    """Yields (start_row, rows) chunks of up to chunk_rows rows.
+
+    :param rows: Row values from min_row down, e.g. a reader's iter_rows().
+        They are consumed once from top to bottom, which is what keeps
+        streaming readers fast.
+    :param max_bytes: Also end a chunk once the estimated size of its rows
+        (see budget.row_bytes) reaches this.
+    """
+    chunk = []
+    start = min_row
+    size = 0
+    for row in rows:
+        chunk.append(row)
+        if max_bytes is not None:
+            size += row_bytes(row)
+        if len(chunk) == chunk_rows or (max_bytes is not None and size >= max_bytes):
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield start, chunk
+
+
+def save(workbook, file_path):
+    """Saves and closes the workbook."""
+    workbook.save(file_path)
+    workbook.close()
+
+
+@dataclass
+class ConversionOptions:
+    """Optional behaviour of convert_workbook.
+
+    :param output_path: Write the result to this new file instead of back
+        into the input: an .xlsx workbook, a sidecar file holding only the
+        key and result columns (.csv, .gpkg or .sidecar.parquet), a GeoParquet file of all
+        columns with WKB geometries (.parquet, needs pyarrow), or
+        newline-delimited GeoJSON (.geojsonl, .geojsons or .ndjson, see
+        geojson.GeoJSONOutput), for which all columns are encoded as GeoJSON.
+    :param tolerant: Record cells that cannot be converted as RowErrors and
+        keep going, instead of aborting the whole conversion.
+    :param error_column: In tolerant mode, name of a column receiving the
+        errors of each failed row.
+    :param error_report: In tolerant mode, path of a CSV report listing the
+        row, column, offending token and reason of every error.
+    :param rows: Only convert these row numbers, e.g. the rows of a previous
+        error report (see read_error_rows).
+    :param profile: Optional profiler ('cprofile' or 'tracemalloc') wrapping
+        the run; the profile is saved next to the output file.
+    :param checkpoint_rows: Convert in chunks of this many rows and journal
+        each finished chunk next to the output file, so that an interrupted
+        run resumes from the last completed chunk. The journal is removed
+        once the output is saved.
+    :param reader: How the input is read: 'openpyxl' (read-only mode),
+        'zipxml' (the sheet XML is parsed straight from the zip, see
+        readers.ZipXmlReader) or 'auto', which uses zipxml for large inputs.
+        In-place conversions with the openpyxl writer always load the full
+        openpyxl model, which they save again.
+    :param key_column: For sidecar outputs (output_path ending in .csv,
+        .gpkg or .sidecar.parquet, see sidecar.SidecarOutput), the column joining
+        the results back to the sheet, for GeoJSON the feature id. Defaults
+        to the ODK KEY column if the sheet has one, else the row number.
+    :param properties: Columns written as GeoJSON feature properties;
+        defaults to all but the ODK and result columns.
+    :param precision: Decimals GeoJSON coordinates are rounded to; GeoJSON
+        outputs default to DEFAULT_GEOJSON_PRECISION, geojson encoded
+        columns to full precision.
+    :param memory_budget: Memory in MiB the conversion should stay within
+        (see budget.MemoryBudget): chunks are also cut by size, large
+        shared strings tables are spilled to disk, and in-place conversions
+        with the openpyxl writer rewrite the sheet XML instead when the
+        openpyxl model would not fit.
+    :param target_crs: Reproject the coordinates from WGS 84 to this CRS
+        (e.g. 'EPSG:32633', see crs.CoordinateTransform, needs pyproj)
+        right after parsing. Cells outside the CRS fail like malformed ones.
+    :param validate: Check the built lines and polygons for validity in bulk
+        (see validity.validate_geometries): invalid ones are repaired with
+        make_valid and polygon rings oriented counter-clockwise. Geometries
+        that collapse when repaired fail their row like malformed cells.
+    :param validity_column: With validate, name of a column receiving the
+        reason and location of each repaired geometry of a row.
+    :param measures: Derived measures added as numeric columns after each
+        result column it applies to, named '<result column> <field>' (see
+        measures.MEASURES): geodesic length, area and perimeter in metres,
+        the vertex count, and the bounding box and centroid in the output
+        coordinates. They describe the captured coordinates, also of
+        geometries the validate option repaired.
+    :param cell_keys: Spatial key columns added after each result column,
+        named '<result column> <field>' (see cells.CELL_KEYS): the geohash
+        and the fixed grid cell of the anchor point of each geometry, for
+        plain equality joins and aggregations downstream.
+    :param cell_anchor: Point the cell keys are computed for: 'centroid' or
+        'bbox' (the centre of the bounding box).
+    :param geohash_precision: Characters of the geohash column, 1 to 12.
+    :param grid_size: Side of the grid squares in the units of the output
+        coordinates; defaults to DEFAULT_GRID_SIZE degrees, or 1000 units of
+        a projected target CRS.
+    :param simplify: Tolerances, in the units of the output coordinates, at
+        which simplified copies of the traces and shapes are added after
+        each result column, named '<result column> simplified_<tolerance>'
+        and encoded like it (see simplify.simplify_column), for drawing at
+        regional scales.
+    :param aoi_bbox: Only convert the cells intersecting this (min_lon,
+        min_lat, max_lon, max_lat) box; the others are left out right after
+        parsing, like empty cells (see aoi.AreaOfInterest).
+    :param aoi_layer: Only convert the cells intersecting the polygons of
+        this .gpkg or .shp layer (and aoi_bbox, if both are given).
+    :param join_layer: Reference polygon layer (.gpkg or .shp, see
+        joins.ReferenceLayer) whose attributes are added after each result
+        column, named '<result column> <attribute>', for the polygon each
+        converted geometry falls in.
+    :param join_attributes: Attributes of the join layer to add; defaults
+        to all.
+    :param duplicates: Once all rows are converted, look for rows recording
+        the same site twice (see duplicates.find_duplicates), per ODK
+        column. The geometries of all rows are kept until then.
+    :param duplicate_report: With duplicates, path of a CSV report listing
+        each duplicate row, the row it duplicates, the column and the test
+        that matched.
+    :param duplicate_overlap: Intersection over union from which two shapes
+        are duplicates.
+    :param duplicate_distance: Hausdorff distance of traces and distance of
+        centroids within which rows are duplicates, in the units of the
+        output coordinates; defaults to about 1 m (DEFAULT_DUPLICATE_DISTANCE
+        degrees, or 1 unit of a projected target CRS).
+    :param order: Write the rows of .csv, .gpkg and GeoJSON outputs along a
+        'hilbert' or 'zorder' curve through the bounding box centres of
+        their geometries (see ordering.ORDERS) instead of in sheet order,
+        which is spatially random; the row number is kept in a row column.
+        The rows are held on disk until the last one is converted.
+    :param threads: Convert chunks on this many worker threads, while a
+        reader thread reads ahead and the results are written in order
+        (see pipeline.pipelined). 0 reads, converts and writes one chunk
+        after the other.
+    :param single_precision: Hold parsed coordinates as 32 bit instead of
+        64 bit floats, which halves their memory at the cost of precision
+        (about 1 m at the antimeridian, less closer to Greenwich).
+    :param writer: How the output is written: 'xmlappend' copies the .xlsx
+        zip and only rewrites the XML of the converted sheet (see
+        outputs.ColumnAppendOutput), 'openpyxl' saves the workbook with
+        openpyxl (in place, or as a new write-only workbook with cell values
+        only). 'auto' uses xmlappend.
+    """
+    output_path: str = None
+    tolerant: bool = False
+    error_column: str = None
+    error_report: str = None
+    rows: frozenset = None
+    profile: str = None
+    checkpoint_rows: int = None
+    reader: str = 'auto'
+    writer: str = 'auto'
+    key_column: str = None
+    properties: tuple = None
+    precision: int = None
+    single_precision: bool = False
+    memory_budget: float = None
+    threads: int = 0
+    validate: bool = False
+    validity_column: str = None
+    target_crs: str = None
+    measures: tuple = ()
+    cell_keys: tuple = ()
+    cell_anchor: str = 'centroid'
+    geohash_precision: int = DEFAULT_GEOHASH_PRECISION
+    grid_size: float = None
+    simplify: tuple = ()
+    aoi_bbox: tuple = None
+    aoi_layer: str = None
+    join_layer: str = None
+    join_attributes: tuple = None
+    duplicates: bool = False
+    duplicate_report: str = None
+    duplicate_overlap: float = DEFAULT_OVERLAP
+    duplicate_distance: float = None
+    order: str = None
+
+    def __post_init__(self):
+        measure_fields(None, self.measures)
+        cell_key_fields(self.cell_keys, self.cell_anchor, self.geohash_precision)
+        simplified_fields(None, self.simplify)
+        if self.order is not None and self.order not in ORDERS:
+            raise ValueError(f"Unknown order: {self.order}")
+        if self.target_crs and geojson_output(self.output_path):
+            raise ValueError("GeoJSON output is longitude/latitude on WGS 84 (RFC 7946), it takes no target CRS")
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of convert_workbook.
+
+    repairs holds a RowError per geometry the validate option repaired,
+    whose reason is the validity reason and token the location of the
+    problem; repair_summary counts them per reason. duplicates holds the
+    Duplicates the duplicates option found.
+    """
+    converted: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+    repairs: list = field(default_factory=list)
+    duplicates: list = field(default_factory=list)
+    resumed_chunks: int = 0
+
+    def repair_summary(self):
+        """Returns the number of repaired geometries per validity reason."""
+        summary = {}
+        for repair in self.repairs:
+            summary[repair.reason] = summary.get(repair.reason, 0) + 1
+        return summary
+
+
+def convert_workbook(file_path, sheet_name, columns, options=None, timer=None):
+    """Converts the given columns of a sheet to WKT and saves the workbook.
+
+    The workbook is always saved to a temporary file in the target directory
+    first and then renamed into place.
+
+    :param file_path: Path of the .xlsx file, which is overwritten unless
+        options.output_path is set.
+    :type file_path: str
+
+    :param sheet_name: Name of the sheet holding the ODK columns.
+    :type sheet_name: str
+
+    :param columns: Columns to convert. Result columns that do not exist yet
+        are appended after the last header, in the given order.
+    :type columns: list of ColumnSpec
+
+    :param options: Optional behaviour, defaults to a strict conversion.
+    :type options: ConversionOptions
+
+    :param timer: Receives the per-stage timings; a new one is used if None.
+    :type timer: StageTimer
+
+    :returns: Number of converted cells per result column and, in tolerant
+        mode, the errors of the skipped cells.
+    :rtype: ConversionResult
+    """
+    options = options if options is not None else ConversionOptions()
+    timer = timer if timer is not None else StageTimer()
+    output_path = options.output_path or file_path
+    in_place = os.path.abspath(output_path) == os.path.abspath(file_path)
+    geojson = geojson_output(options.output_path)
+    if geojson:
+        columns = [replace(spec, encoding='geojson') for spec in columns]
+        if options.precision is None:
+            options = replace(options, precision=DEFAULT_GEOJSON_PRECISION)
+    elif _binary_output(options.output_path):
+        # Stored as WKB bytes packed from the parsed coordinates, not as text parsed again
+        columns = [replace(spec, encoding='wkb') for spec in columns]
+
+    journal = None
+    if options.checkpoint_rows:
+        journal = Journal.open(journal_path(output_path),
+                               fingerprint(file_path, sheet_name, columns, options))
+    output = None
+    saved = False
+    try:
+        # The output is released only after the profiler has stopped, so
+        # tracemalloc snapshots still include the loaded workbook model
+        with profiled(options.profile, output_path):
+            with timer.stage('load'):
+                if options.writer not in WRITERS:
+                    raise ValueError(f"Unknown writer: {options.writer}")
+                sidecar = sidecar_format(options.output_path) is not None
+                # .sidecar.parquet is the compact sidecar, any other .parquet the full GeoParquet export
+                geoparquet = not sidecar and (options.output_path or '').lower().endswith(GEOPARQUET_SUFFIX)
+                openpyxl_writer = options.writer == 'openpyxl' and not (sidecar or geoparquet or geojson)
+                if options.order and not (sidecar or geojson):
+                    raise ValueError("Ordering rows along a curve needs a .csv, .gpkg, .sidecar.parquet or GeoJSON output")
+                budget = MemoryBudget(options.memory_budget) if options.memory_budget else None
+                transform = CoordinateTransform(options.target_crs) if options.target_crs else None
+                aoi = None
+                if options.aoi_bbox is not None or options.aoi_layer:
+                    aoi = AreaOfInterest.from_options(options.aoi_bbox, options.aoi_layer)
+                reference = None
+                if options.join_layer:
+                    reference = ReferenceLayer.open(options.join_layer, options.join_attributes,
+                                                    options.target_crs or WGS84_CRS)
+                if openpyxl_writer and in_place and budget is not None \
+                        and not budget.fits_openpyxl_model(file_path):
+                    openpyxl_writer = False
+                reader = open_reader(file_path, options.reader, editable=in_place and openpyxl_writer,
+                                     budget=budget)
+                if sheet_name not in reader.sheetnames:
+                    reader.close()
+                    raise KeyError(f"Sheet '{sheet_name}' not found")
+                notes = _note_columns(columns, options, reference)
+                if geojson:
+                    output = GeoJSONOutput(reader, output_path, columns, options.properties,
+                                           options.key_column, notes, options.order)
+                elif geoparquet:
+                    output = GeoParquetOutput(reader, output_path, columns, transform)
+                elif sidecar:
+                    output = SidecarOutput(reader, output_path, columns, options.key_column, notes, transform,
+                                           options.order, options.validate)
+                elif not openpyxl_writer:
+                    output = ColumnAppendOutput(reader, file_path, sheet_name, output_path)
+                elif in_place:
+                    output = InPlaceOutput(reader.workbook, reader.workbook[sheet_name], output_path)
+                else:
+                    output = WriteOnlyOutput(reader, sheet_name, output_path)
+            result = _convert_sheet(reader, sheet_name, output, columns, options, timer, journal, transform,
+                                    reference, aoi)
+            with timer.stage('save') as stats:
+                output.close()
+                stats.rows = sum(result.converted.values())
+            saved = True
+    finally:
+        if output is not None and not saved:
+            output.abort()
+        del output
+        gc.collect()  # Free memory
+        if journal is not None:
+            # Only a successful save makes the journal obsolete
+            journal.close(remove=saved)
+
+    if options.error_report:
+        write_error_report(options.error_report, result.errors)
+    if options.duplicates and options.duplicate_report:
+        write_duplicate_report(options.duplicate_report, result.duplicates)
+    return result
+
+
+def _convert_sheet(reader, sheet_name, output, columns, options, timer, journal=None, transform=None,
+                   reference=None, aoi=None):
+    rows = frozenset(options.rows) if options.rows is not None else None
+    result = ConversionResult()
+    errors = result.errors if options.tolerant else None
+
+    # Get existing headers and determine column positions
+    with timer.stage('header_probe'):
+        headers = list(next(reader.iter_rows(sheet_name, min_row=1), ()))
+    existing_columns = {header: idx + 1 for idx, header in enumerate(headers) if header}
+
+    plan = []
+    added = {}
+    for position, spec in enumerate(columns, start=1):
+        if spec.source not in headers:
+            raise KeyError(f"Column '{spec.source}' not found in sheet '{sheet_name}'")
+        target_index = _target_column(existing_columns, added, spec.target, len(headers) + position)
+        plan.append((spec, headers.index(spec.source), target_index))
+        result.converted[spec.target] = 0
+    error_index = None
+    clear_errors = False
+    if options.tolerant and options.error_column:
+        # Stale errors of a previous run only need clearing if the column exists
+        clear_errors = options.error_column in existing_columns
+        error_index = _target_column(existing_columns, added, options.error_column,
+                                     len(headers) + len(columns) + 1)
+    validity_index = None
+    clear_validity = False
+    if options.validate and options.validity_column:
+        clear_validity = options.validity_column in existing_columns
+        validity_index = _target_column(existing_columns, added, options.validity_column,
+                                        max([len(headers) + len(columns), *added]) + 1)
+    derived_indexes = []
+    for _, name, _ in _derived_columns(columns, options, reference):
+        derived_indexes.append((name, _target_column(existing_columns, added, name,
+                                                     max([len(headers) + len(columns), *added]) + 1)))
+    output.write_header(headers, added)
+    # Geometries of the first result column of each ODK column, for the duplicate search
+    collected = {}
+    if options.duplicates:
+        for spec, _, _ in plan:
+            collected.setdefault(spec.source, (spec, []))
+
+    # Without full rows only the ODK columns, and those the output asks for, are read
+    read_columns = None
+    if not output.needs_full_rows:
+        read_columns = sorted({source_index for _, source_index, _ in plan} | set(output.extra_columns))
+
+    chunk_rows = options.checkpoint_rows or DEFAULT_CHUNK_ROWS
+    max_bytes = MemoryBudget(options.memory_budget).chunk_bytes if options.memory_budget else None
+    chunks = iter_chunks(reader.iter_rows(sheet_name, min_row=2, columns=read_columns), chunk_rows,
+                         max_bytes=max_bytes)
+
+    def convert(start, chunk, chunk_timer):
+        """Returns (results per target, errors, repairs, geometries per source, resumed) of a chunk."""
+        completed = journal.completed(start) if journal is not None else None
+        if completed is not None:
+            # Converted before an interruption, only write it back
+            return completed + (None, True)
+        chunk_results = {}
+        chunk_errors = [] if errors is not None else None
+        chunk_repairs = []
+        chunk_geometries = {}
+        # Bounding box centre of the first converted column of each row, for the order
+        centres = {} if options.order else None
+        for spec, source_index, _ in plan:
+            values = _chunk_values(chunk, start, source_index, rows)
+            geometries = None
+            if collected.get(spec.source, (None,))[0] is spec:
+                geometries = chunk_geometries[spec.source] = []
+            elif centres is not None:
+                geometries = []
+            chunk_results[spec.target], derived = _convert_values(values, spec, chunk_errors, chunk_repairs,
+                                                                  chunk_timer, options, transform, geometries,
+                                                                  reference, aoi)
+            chunk_results.update(derived)
+            if centres is not None:
+                for row_index, centre in bbox_centres(geometries):
+                    centres.setdefault(row_index, centre)
+        if centres is not None:
+            chunk_results[CENTRE_RESULT] = sorted(centres.items())
+        return chunk_results, chunk_errors, chunk_repairs, chunk_geometries, False
+
+    # The editable openpyxl sheet is read and written at once, so it is not shared between threads
+    if options.threads and not isinstance(output, InPlaceOutput):
+        converted = pipelined(chunks, convert, options.threads, timer)
+    else:
+        converted = _converted_chunks(chunks, convert, timer)
+    for start, chunk, (chunk_results, chunk_errors, chunk_repairs, chunk_geometries, resumed) in converted:
+        if resumed:
+            result.resumed_chunks += 1
+        elif journal is not None:
+            with timer.stage('checkpoint') as stats:
+                journal.record(start, start + len(chunk) - 1, chunk_results, chunk_errors or [],
+                               chunk_repairs)
+                stats.rows += len(chunk)
+
+        with timer.stage('write') as stats:
+            writes = {}
+            for spec, _, target_index in plan:
+                writes[target_index] = chunk_results[spec.target]
+                result.converted[spec.target] += len(chunk_results[spec.target])
+            for name, index in derived_indexes:
+                writes[index] = chunk_results.get(name, [])
+            if options.order:
+                writes[CENTRE_INDEX] = chunk_results[CENTRE_RESULT]
+            if error_index is not None:
+                writes[error_index] = _error_writes(chunk_errors, start, len(chunk), rows, clear_errors)
+            if validity_index is not None:
+                writes[validity_index] = _error_writes(chunk_repairs, start, len(chunk), rows, clear_validity)
+            output.write_chunk(start, chunk, writes)
+            stats.rows += len(chunk)
+        if errors is not None:
+            errors.extend(chunk_errors)
+        result.repairs.extend(chunk_repairs)
+        for source, (spec, geometries) in collected.items():
+            if chunk_geometries is not None:
+                geometries.extend(chunk_geometries[source])
+            else:
+                # Journaled chunks only kept their results
+                geometries.extend((row_index, load_geometry(value, spec.encoding))
+                                  for row_index, value in chunk_results[spec.target])
+
+    if collected:
+        distance = options.duplicate_distance
+        if distance is None:
+            projected = transform is not None and not transform.crs.is_geographic
+            distance = 1.0 if projected else DEFAULT_DUPLICATE_DISTANCE
+        with timer.stage('duplicates') as stats:
+            for source, (spec, geometries) in collected.items():
+                result.duplicates.extend(find_duplicates(geometries, spec.kind, source,
+                                                         options.duplicate_overlap, distance))
+                stats.rows += len(geometries)
+        collected.clear()
+    return result
+
+
+def _converted_chunks(chunks, convert, timer):
+    """Yields (start, chunk, convert(start, chunk, timer)), reading and converting one chunk at a time."""
+    while True:
+        with timer.stage('read') as stats:
+            start, chunk = next(chunks, (None, None))
+            if chunk is not None:
+                stats.rows += len(chunk)
+        if chunk is None:
+            return
+        yield start, chunk, convert(start, chunk, timer)
+
+
+def _chunk_values(chunk, start, position, rows):
+    """Returns the (row_index, value) pairs of the non-empty cells at a row position."""
+    return [(row_index, row[position]) for row_index, row in enumerate(chunk, start=start)
+            if position < len(row) and row[position] and (rows is None or row_index in rows)]
+
+
+def _convert_values(values, spec, errors, repairs, timer, options, transform=None, collected=None,
+                    reference=None, aoi=None):
+    """Converts (row_index, value) pairs of one column.
+
+    Returns the (row_index, result) pairs and, with options.measures,
+    options.cell_keys, options.simplify or a reference layer, the
+    (row_index, value) pairs of each measure, cell key, simplified and join
+    column of the converted rows.
+    With options.validate, the geometries repaired on the way are added to repairs.
+
+    :param transform: Optional CoordinateTransform applied to the parsed coordinates.
+    :param collected: Optional list receiving the (row_index, geometry) pairs built.
+    :param reference: Optional ReferenceLayer joined to the geometries.
+    :param aoi: Optional AreaOfInterest the cells must intersect.
+    """
+    with timer.stage('parse') as stats:
+        parsed = parse_column(values, spec.source, errors, options.single_precision)
+        vertices = parsed.vertices
+        stats.rows += len(parsed)
+        stats.vertices += vertices
+    if aoi is not None:
+        with timer.stage('aoi') as stats:
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+            parsed = aoi.select(parsed, spec.kind)
+            vertices = parsed.vertices
+    derived = {}
+    geodesic = [measure for measure in options.measures if measure in GEODESIC_MEASURES]
+    planar = [measure for measure in options.measures if measure not in GEODESIC_MEASURES]
+    geographic_keys = [key for key in options.cell_keys if key in GEOGRAPHIC_CELL_KEYS]
+    planar_keys = [key for key in options.cell_keys if key not in GEOGRAPHIC_CELL_KEYS]
+    if geodesic:
+        # Geodesic measures need the longitude/latitude, before any reprojection
+        with timer.stage('measure') as stats:
+            derived.update(measure_column(parsed, spec.kind, geodesic))
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+    if geographic_keys:
+        with timer.stage('cell_keys') as stats:
+            derived.update(cell_key_column(parsed, spec.kind, geographic_keys, options.cell_anchor,
+                                           options.geohash_precision))
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+    if transform is not None:
+        with timer.stage('transform') as stats:
+            parsed, outside = transform.apply(parsed, spec.source)
+            for error in outside:
+                _row_failed(error, errors, None)
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+            vertices = parsed.vertices
+    if planar:
+        with timer.stage('measure') as stats:
+            derived.update(measure_column(parsed, spec.kind, planar))
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+    if planar_keys:
+        grid_size = options.grid_size
+        if grid_size is None:
+            projected = transform is not None and not transform.crs.is_geographic
+            grid_size = DEFAULT_PROJECTED_GRID_SIZE if projected else DEFAULT_GRID_SIZE
+        with timer.stage('cell_keys') as stats:
+            derived.update(cell_key_column(parsed, spec.kind, planar_keys, options.cell_anchor,
+                                           options.geohash_precision, grid_size))
+            stats.rows += len(parsed)
+            stats.vertices += vertices
+    with timer.stage('build') as stats:
+        geometries = build_geometries(parsed, spec.kind, spec.source, errors)
+        stats.rows += len(geometries)
+        stats.vertices += vertices
+    if options.validate and spec.kind != 'point':
+        with timer.stage('validate') as stats:
+            geometries, repaired = validate_geometries(geometries, spec.kind, spec.source, errors)
+            repairs.extend(repaired)
+            stats.rows += len(geometries)
+            stats.vertices += vertices
+        # Repaired and reoriented shapes no longer match their parsed coordinates
+        if repaired or spec.kind == 'shape':
+            parsed = None
+    if collected is not None:
+        collected.extend(geometries)
+    if reference is not None:
+        with timer.stage('join') as stats:
+            derived.update(reference.join_first(geometries))
+            stats.rows += len(geometries)
+            stats.vertices += vertices
+    srid = transform.srid if transform is not None else WGS84_SRID
+    if options.simplify and spec.kind != 'point':
+        with timer.stage('simplify') as stats:
+            # Simplified geometries are further text columns, also in binary outputs
+            encoding = 'wkt' if spec.encoding in BINARY_ENCODINGS else spec.encoding
+            derived.update(simplify_column(geometries, spec.kind, options.simplify, encoding,
+                                           options.precision, srid))
+            stats.rows += len(geometries)
+            stats.vertices += vertices
+    with timer.stage('serialize') as stats:
+        results = encode(parsed, geometries, spec, options.precision, srid)
+        stats.rows += len(results)
+    return results, _derived_values(derived, spec, results)
+
+
+def _derived_values(derived, spec, results):
+    """Names the derived columns of a result column and keeps the rows that got a result."""
+    columns = {}
+    converted = None
+    for name, pairs in derived.items():
+        if len(pairs) != len(results):
+            converted = converted if converted is not None else {row_index for row_index, _ in results}
+            pairs = [pair for pair in pairs if pair[0] in converted]
+        columns[f'{spec.target} {name}'] = pairs
+    return columns
+
+
+def _derived_columns(columns, options, reference=None):
+    """Returns (spec, column name, value type) of the derived columns added after the results."""
+    derived = []
+    for spec in columns:
+        for _, name in measure_fields(spec.kind, options.measures):
+            derived.append((spec, f'{spec.target} {name}', int if name == 'vertices' else float))
+        for _, name in cell_key_fields(options.cell_keys, options.cell_anchor, options.geohash_precision):
+            derived.append((spec, f'{spec.target} {name}', str))
+        for _, name in simplified_fields(spec.kind, options.simplify):
+            derived.append((spec, f'{spec.target} {name}', str))
+        if reference is not None:
+            derived.extend((spec, f'{spec.target} {name}', kind) for name, kind in reference.fields.items())
+    return derived
+
+
+def _binary_output(output_path):
+    """Returns whether an output stores the geometries as WKB bytes (GeoParquet, GeoPackage)."""
+    path = (output_path or '').lower()
+    if sidecar_format(path) is not None:
+        return sidecar_format(path) == 'gpkg'
+    return path.endswith(GEOPARQUET_SUFFIX)
+
+
+def _note_columns(columns, options, reference=None):
+    """Returns the further result columns, mapped to the type of their values, for sidecar outputs."""
+    notes = {}
+    if options.tolerant and options.error_column:
+        notes[options.error_column] = str
+    if options.validate and options.validity_column:
+        notes[options.validity_column] = str
+    for _, column, kind in _derived_columns(columns, options, reference):
+        notes[column] = kind
+    return notes
+
+
+def _error_writes(chunk_errors, start, count, rows, clear):
+    """Returns the error column cells of a chunk, clearing stale errors if asked to."""
+    cells = dict(error_cells(chunk_errors))
+    if clear:
+        for row_index in range(start, start + count):
+            if row_index not in cells and (rows is None or row_index in rows):
+                cells[row_index] = None
+    return sorted(cells.items())
+
+
+def _target_column(existing_columns, added, name, default_index):
+    """Returns the 1-based index of a result column, registering its header if new."""
+    if name in existing_columns:
+        return existing_columns[name]
+    added[default_index] = name
+    return default_index
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Per-row conversion errors
+                                 A QGIS plugin
+ Collects the rows a tolerant conversion had to skip, and reads/writes the
+ sidecar report used to re-run only those rows.
+ ***************************************************************************/
+"""
+
+import csv
+from dataclasses import dataclass, astuple
+
+REPORT_FIELDS = ('row', 'column', 'token', 'reason')
+
+
+@dataclass(frozen=True)
+class RowError:
+    """A cell that could not be converted."""
+    row: int
+    column: str
+    token: str
+    reason: str
+
+    def __str__(self):
+        return f"Row {self.row}, column '{self.column}': {self.reason} ({self.token!r})"
+
+    @classmethod
+    def from_exception(cls, row, column, value, error):
+        """Builds the error of a cell from the exception its conversion raised."""
+        token = getattr(error, 'token', value)
+        reason = getattr(error, 'reason', None) or str(error) or type(error).__name__
+        return cls(row, column, str(token), reason)
+
+
+def error_cells(errors):
+    """Groups errors by row into the text of an error column."""
+    cells = {}
+    for error in errors:
+        text = f"{error.column}: {error.reason} ({error.token!r})"
+        cells[error.row] = f"{cells[error.row]}; {text}" if error.row in cells else text
+    return sorted(cells.items())
+
+
+def write_error_report(file_path, errors):
+    """Writes the errors as a CSV report with row, column, token and reason."""
+    with open(file_path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(REPORT_FIELDS)
+        writer.writerows(astuple(error) for error in errors)
+
+
+def read_error_rows(file_path):
+    """Returns the set of row numbers listed in an error report."""
+    with open(file_path, newline='', encoding='utf-8') as handle:
+        return {int(record['row']) for record in csv.DictReader(handle)}
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Newline-delimited GeoJSON output
+                                 A QGIS plugin
+ Streams one GeoJSON Feature per converted submission, one per line
+ (GeoJSONSeq / NDJSON), which web maps and ogr2ogr read without a
+ FeatureCollection ever being held in memory. Geometries come straight from
+ the result columns, which are encoded as GeoJSON from the parsed
+ coordinates (see encodings). The features can also be written along a
+ space-filling curve (see ordering), once all are known.
+ ***************************************************************************/
+"""
+
+import datetime
+import json
+import os
+
+from .ordering import CENTRE_INDEX, SpatialSpool
+from .outputs import _discard, _replace, _temp_path
+from .sidecar import ODK_KEY_COLUMN, ROW_KEY_COLUMN
+
+GEOJSON_SUFFIXES = ('.geojsonl', '.geojsons', '.ndjson')
+
+# Decimals kept by default, about 10 cm on the ground (RFC 7946, section 11.2)
+DEFAULT_GEOJSON_PRECISION = 6
+
+
+def geojson_output(output_path):
+    """Returns whether an output path is a newline-delimited GeoJSON file."""
+    return bool(output_path) and os.path.splitext(output_path)[1].lower() in GEOJSON_SUFFIXES
+
+
+class GeoJSONOutput:
+    """Writes a Feature line for every row with a converted geometry or an error.
+
+    The feature id is the key column (the ODK KEY column by default) or the
+    row number. A row with several converted columns gets a
+    GeometryCollection of them.
+
+    :param properties: Sheet columns written as feature properties; None for
+        all columns but the ODK, key and result columns, which makes the
+        whole row be read.
+    :param notes: Further result columns (errors, repairs, measures) added
+        to the properties of their rows.
+    :param order: Write the features along a 'hilbert' or 'zorder' curve
+        through the centres in the CENTRE_INDEX results (see
+        ordering.ORDERS) instead of in sheet order. A row property keeps
+        the row number if the feature id is a key column.
+    """
+
+    def __init__(self, reader, output_path, columns, properties=None, key_column=None, notes=(), order=None):
+        self.reader = reader
+        self.output_path = output_path
+        self.columns = columns
+        self.properties = properties
+        self.key_column = key_column
+        self.notes = list(notes)
+        self.order = order
+        self.needs_full_rows = properties is None
+        self.extra_columns = ()
+        self.temp_path = None
+        self.handle = None
+        self.spool = None
+
+    def write_header(self, headers, added):
+        names = {index: name for index, name in enumerate(headers, start=1) if name}
+        names.update(added)
+        positions = {name: index for index, name in names.items()}
+        self.geometry_indexes = [positions[spec.target] for spec in self.columns]
+        self.note_indexes = [(name, positions[name]) for name in self.notes]
+
+        key = self.key_column
+        if key is None and ODK_KEY_COLUMN in headers:
+            key = ODK_KEY_COLUMN
+        if key is not None and key not in headers:
+            raise KeyError(f"Key column '{key}' not found")
+        self.key_index = headers.index(key) if key is not None else None
+
+        if self.properties is None:
+            skipped = {spec.source for spec in self.columns} | {spec.target for spec in self.columns}
+            skipped.update(self.notes)
+            # Already the feature id
+            skipped.add(key)
+            properties = [name for name in headers if name and name not in skipped]
+        else:
+            properties = list(self.properties)
+            for name in properties:
+                if name not in headers:
+                    raise KeyError(f"Property column '{name}' not found")
+        self.property_indexes = [(str(name), headers.index(name)) for name in properties]
+        extra = {index for _, index in self.property_indexes}
+        if self.key_index is not None:
+            extra.add(self.key_index)
+        self.extra_columns = tuple(sorted(extra))
+
+        self.temp_path = _temp_path(self.output_path)
+        self.handle = open(self.temp_path, 'w', encoding='utf-8', newline='\n')
+        if self.order:
+            self.spool = SpatialSpool(self.temp_path + '.spool', self.order)
+
+    def write_chunk(self, start, rows, results):
+        geometries = {}
+        for index in self.geometry_indexes:
+            for row_index, value in results.get(index, ()):
+                if value is not None:
+                    geometries.setdefault(row_index, []).append(value)
+        notes = {}
+        for name, index in self.note_indexes:
+            for row_index, value in results.get(index, ()):
+                if value is not None:
+                    notes.setdefault(row_index, {})[name] = value
+
+        row_indexes = sorted(geometries.keys() | notes.keys())
+        lines = []
+        for row_index in row_indexes:
+            row = rows[row_index - start]
+            if self.key_index is None:
+                feature_id = row_index
+            else:
+                feature_id = _cell(row, self.key_index)
+                feature_id = json.dumps(str(feature_id)) if feature_id is not None else row_index
+            found = geometries.get(row_index)
+            if not found:
+                geometry = 'null'
+            elif len(found) == 1:
+                geometry = found[0]
+            else:
+                geometry = '{"type":"GeometryCollection","geometries":[' + ','.join(found) + ']}'
+            properties = {name: _cell(row, index) for name, index in self.property_indexes}
+            properties.update(notes.get(row_index, ()))
+            if self.spool is not None and self.key_index is not None:
+                properties[ROW_KEY_COLUMN] = row_index
+            # Compact like the geometries, which are formatted without spaces
+            properties = json.dumps(properties, ensure_ascii=False, separators=(',', ':'), default=_json_value)
+            lines.append(f'{{"type":"Feature","id":{feature_id},"geometry":{geometry},"properties":{properties}}}\n')
+        if self.spool is None:
+            self.handle.writelines(lines)
+        else:
+            centres = dict(results.get(CENTRE_INDEX, ()))
+            self.spool.add([(centres.get(row_index), line) for row_index, line in zip(row_indexes, lines)])
+
+    def close(self):
+        try:
+            if self.spool is not None:
+                self.handle.writelines(self.spool)
+        finally:
+            if self.spool is not None:
+                self.spool.close()
+            self.handle.close()
+        self.reader.close()
+        _replace(self.temp_path, self.output_path)
+
+    def abort(self):
+        if self.spool is not None:
+            self.spool.close()
+        if self.handle is not None:
+            self.handle.close()
+        self.reader.close()
+        if self.temp_path is not None:
+            _discard(self.temp_path)
+
+
+def _cell(row, index):
+    return row[index] if index < len(row) else None
+
+
+def _json_value(value):
+    """Serializes the cell values json does not know: dates and times as ISO 8601."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ GeoParquet output
+                                 A QGIS plugin
+ Streams the converted sheet to a GeoParquet 1.0 file: every sheet column
+ as a typed attribute, each converted column as a WKB geometry column
+ (OGC:CRS84, i.e. longitude/latitude, unless reprojected to a target CRS),
+ one row group per converted chunk.
+ Needs pyarrow.
+ ***************************************************************************/
+"""
+
+import base64
+import datetime
+import json
+
+from .encodings import wkb_extents
+from .outputs import _discard, _replace, _temp_path
+from .readers import column_letters
+
+GEOPARQUET_SUFFIX = '.parquet'
+GEOPARQUET_VERSION = '1.0.0'
+
+# Row number of each submission in the sheet
+ROW_COLUMN = 'row'
+
+GEOMETRY_TYPES = {'point': 'Point', 'trace': 'LineString', 'shape': 'Polygon'}
+
+
+class GeoParquetOutput:
+    """Writes all rows of the converted sheet, with WKB geometries, to GeoParquet.
+
+    Attribute types are inferred from the first chunk. A later value that
+    does not fit widens the type of its column (integers to floats, anything
+    else to text), rewriting the row groups already written.
+    """
+
+    needs_full_rows = True
+    extra_columns = ()
+
+    def __init__(self, reader, output_path, columns, transform=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            reader.close()
+            raise ImportError("Writing GeoParquet needs pyarrow") from e
+
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.reader = reader
+        self.output_path = output_path
+        self.columns = columns
+        self.transform = transform
+        self.temp_path = None
+        self.writer = None
+        self.schema = None
+
+    def write_header(self, headers, added):
+        names = {index: name for index, name in enumerate(headers, start=1)}
+        names.update(added)
+        specs = {spec.target: spec for spec in self.columns}
+
+        used = {ROW_COLUMN}
+        self.fields = []
+        self.geometries = {}
+        for index in sorted(names):
+            name = _unique_name(names[index] or f'column_{column_letters(index - 1)}', used)
+            if names[index] in specs:
+                spec = specs[names[index]]
+                self.geometries[name] = {'kind': spec.kind, 'bbox': None, 'types': set()}
+            self.fields.append((index - 1, name))
+
+    def _open(self, chunk, results):
+        """Infers the attribute types from the first chunk and opens the Parquet writer."""
+        pa = self.pa
+        self.types = []
+        for position, name in self.fields:
+            if name in self.geometries:
+                self.types.append(pa.binary())
+            elif position + 1 in results:
+                # Result columns that are no geometry hold error text or measures
+                self.types.append(_infer_type(pa, [value for _, value in results[position + 1]]))
+            else:
+                self.types.append(_infer_type(pa, [row[position] for row in chunk if position < len(row)]))
+        self._start()
+
+    def _start(self):
+        """Opens the Parquet writer on a new temporary file, with the current attribute types."""
+        pa = self.pa
+        self.schema = pa.schema([pa.field(ROW_COLUMN, pa.int64())] + [
+            pa.field(name, arrow_type) for (_, name), arrow_type in zip(self.fields, self.types)])
+        if not hasattr(self.pq.ParquetWriter, 'add_key_value_metadata'):
+            # Older pyarrow: the metadata has to be known up front, without bounding boxes
+            self.schema = self.schema.with_metadata({b'geo': json.dumps(self._geo_metadata())})
+        if self.temp_path is None:
+            self.temp_path = _temp_path(self.output_path)
+        self.writer = self.pq.ParquetWriter(self.temp_path, self.schema)
+
+    def _widen(self, types):
+        """Rewrites the row groups written so far with wider attribute types.
+
+        The types only ever widen (integers to floats, anything to text), and
+        each column at most twice, so this happens a few times per file at most.
+        """
+        pa = self.pa
+        self.writer.close()
+        written = self.pq.ParquetFile(self.temp_path)
+        previous, self.temp_path = self.temp_path, None
+        changed = {name for (_, name), old, new in zip(self.fields, self.types, types) if old != new}
+        self.types = types
+        try:
+            self._start()
+            for index in range(written.num_row_groups):
+                table = written.read_row_group(index)
+                arrays = [table.column(field.name) if field.name not in changed else pa.array(
+                    [_coerce(value, field.type, pa) for value in table.column(field.name).to_pylist()],
+                    type=field.type) for field in self.schema]
+                self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        finally:
+            written.close()
+            _discard(previous)
+
+    def write_chunk(self, start, rows, results):
+        if self.writer is None:
+            self._open(rows, results)
+        by_column = {index - 1: dict(pairs) for index, pairs in results.items()}
+        arrays = [list(range(start, start + len(rows)))]
+        types = []
+        for (position, name), arrow_type in zip(self.fields, self.types):
+            if name in self.geometries:
+                # Only this run's results, not stale values of a previous run; the
+                # engine hands over WKB bytes (see encodings.BINARY_ENCODINGS)
+                values = [None] * len(rows)
+                for row_index, value in by_column.get(position, {}).items():
+                    values[row_index - start] = value or None
+                self._extend(self.geometries[name], values)
+            else:
+                values = [row[position] if position < len(row) else None for row in rows]
+                for row_index, value in by_column.get(position, {}).items():
+                    values[row_index - start] = value
+                arrow_type, values = _convert(self.pa, arrow_type, values)
+            types.append(arrow_type)
+            arrays.append(values)
+        if types != self.types:
+            self._widen(types)
+        # One row group per chunk keeps memory bounded
+        self.writer.write_table(self.pa.Table.from_arrays(
+            [self.pa.array(values, type=field.type) for values, field in zip(arrays, self.schema)],
+            schema=self.schema))
+
+    @staticmethod
+    def _extend(geometry, values):
+        """Adds the types and bounding box of a chunk of WKB values to the metadata of a geometry column."""
+        if not any(value is not None for value in values):
+            return
+        import numpy
+
+        bounds, types = wkb_extents(values)
+        geometry['types'].update(types)
+        geometry['bbox'] = _union(geometry['bbox'], (
+            numpy.nanmin(bounds[:, 0]), numpy.nanmin(bounds[:, 1]),
+            numpy.nanmax(bounds[:, 2]), numpy.nanmax(bounds[:, 3])))
+
+    def _geo_metadata(self):
+        columns = {}
+        for name, geometry in self.geometries.items():
+            column = {
+                'encoding': 'WKB',
+                'geometry_types': sorted(geometry['types']) or [GEOMETRY_TYPES[geometry['kind']]],
+            }
+            if geometry['bbox'] is not None:
+                column['bbox'] = list(geometry['bbox'])
+            if self.transform is not None:
+                column['crs'] = self.transform.projjson()
+            columns[name] = column
+        return {
+            'version': GEOPARQUET_VERSION,
+            'primary_column': next(iter(self.geometries), None),
+            'columns': columns,
+        }
+
+    def close(self):
+        if self.writer is None:
+            # No data rows: write an empty table
+            self._open([], {})
+        if hasattr(self.writer, 'add_key_value_metadata'):
+            geo = json.dumps(self._geo_metadata())
+            # Readers take the schema metadata from the serialized Arrow
+            # schema, which is replaced by one including the final metadata
+            schema = self.schema.with_metadata({'geo': geo}).serialize()
+            self.writer.add_key_value_metadata({
+                'geo': geo, 'ARROW:schema': base64.b64encode(schema.to_pybytes()).decode('ascii')})
+        self.writer.close()
+        self.reader.close()
+        _replace(self.temp_path, self.output_path)
+
+    def abort(self):
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except Exception:
+                pass
+        self.reader.close()
+        if self.temp_path is not None:
+            _discard(self.temp_path)
+
+
+def _unique_name(name, used):
+    name = str(name)
+    candidate = name
+    suffix = 2
+    while candidate in used:
+        candidate = f'{name}_{suffix}'
+        suffix += 1
+    used.add(candidate)
+    return candidate
+
+
+def _infer_type(pa, values):
+    """Returns the Arrow type fitting all non-empty values, falling back to text."""
+    types = {type(value) for value in values if value is not None and value != ''}
+    if not types:
+        return pa.string()
+    if types == {bool}:
+        return pa.bool_()
+    if any(isinstance(value, int) and not -2 ** 63 <= value < 2 ** 63 for value in values):
+        # Beyond int64, and a float would round it
+        return pa.string()
+    if types == {int}:
+        return pa.int64()
+    if types <= {int, float}:
+        return pa.float64()
+    if types == {datetime.datetime}:
+        return pa.timestamp('us')
+    if types == {datetime.date}:
+        return pa.date32()
+    if types == {datetime.time}:
+        return pa.time64('us')
+    return pa.string()
+
+
+def _convert(pa, arrow_type, values):
+    """Converts cell values to an Arrow type, widened until they all fit; returns (type, values)."""
+    converted = []
+    for value in values:
+        cell = _coerce(value, arrow_type, pa)
+        if cell is None and value is not None and value != '':
+            if pa.types.is_integer(arrow_type) and isinstance(value, float):
+                return _convert(pa, pa.float64(), values)
+            return _convert(pa, pa.string(), values)
+        converted.append(cell)
+    return arrow_type, converted
+
+
+def _coerce(value, arrow_type, pa):
+    """Converts a cell value to an Arrow type; None if it cannot be done losslessly."""
+    if value is None or value == '':
+        return None
+    if pa.types.is_string(arrow_type):
+        return value if isinstance(value, str) else str(value)
+    if pa.types.is_boolean(arrow_type):
+        return value if isinstance(value, bool) else None
+    if pa.types.is_integer(arrow_type):
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, int) and not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63:
+            return value
+        return None
+    if pa.types.is_floating(arrow_type):
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    if pa.types.is_timestamp(arrow_type):
+        return value if isinstance(value, datetime.datetime) else None
+    if pa.types.is_date(arrow_type):
+        return value if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime) else None
+    if pa.types.is_time(arrow_type):
+        return value if isinstance(value, datetime.time) else None
+    return None
+
+
+def _union(bbox, bounds):
+    bounds = tuple(float(bound) for bound in bounds)
+    if bbox is None:
+        return bounds
+    return (min(bbox[0], bounds[0]), min(bbox[1], bounds[1]),
+            max(bbox[2], bounds[2]), max(bbox[3], bounds[3]))
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Pipeline instrumentation
+                                 A QGIS plugin
+ Per-stage wall/CPU timing with row and vertex counts, and opt-in
+ cProfile/tracemalloc wrappers for offline analysis of slow conversions.
+ ***************************************************************************/
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+
+PROFILERS = ('cprofile', 'tracemalloc')
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements of one pipeline stage."""
+    name: str
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rows: int = 0
+    vertices: int = 0
+
+
+class StageTimer:
+    """Records wall time, CPU time and row/vertex counts per pipeline stage.
+
+    Stages are timed with ``with timer.stage('parse') as stats:``; the yielded
+    StageStats can be used to add the rows and vertices handled by the stage.
+    Entering the same stage again accumulates into the same record.
+
+    CPU time is that of the calling thread. A timer is not shared between
+    threads: each one times into its own and they are merged afterwards.
+    Stages of merged timers overlap, so the sum of the stage wall times can
+    exceed the elapsed time, from the start of the first stage to the end of
+    the last one, which is recorded separately.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.started = None
+        self.finished = None
+
+    @contextmanager
+    def stage(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        if self.started is None:
+            self.started = wall
+        try:
+            yield stats
+        finally:
+            self.finished = time.perf_counter()
+            stats.wall_s += self.finished - wall
+            stats.cpu_s += time.thread_time() - cpu
+            stats.calls += 1
+
+    def merge(self, other):
+        """Adds the measurements of another timer, e.g. of a worker thread."""
+        if other.started is not None:
+            self.started = other.started if self.started is None else min(self.started, other.started)
+            self.finished = other.finished if self.finished is None else max(self.finished, other.finished)
+        for name, theirs in other.stages.items():
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name)
+            stats.calls += theirs.calls
+            stats.wall_s += theirs.wall_s
+            stats.cpu_s += theirs.cpu_s
+            stats.rows += theirs.rows
+            stats.vertices += theirs.vertices
+
+    def as_dict(self):
+        """Returns the measurements as a JSON-serialisable dict.
+
+        total_wall_s sums the stage wall times; elapsed_wall_s is the real
+        end-to-end time.
+        """
+        stages = [asdict(stats) for stats in self.stages.values()]
+        return {
+            'stages': stages,
+            'elapsed_wall_s': self.elapsed(),
+            'total_wall_s': sum(stats['wall_s'] for stats in stages),
+            'total_cpu_s': sum(stats['cpu_s'] for stats in stages),
+        }
+
+    def elapsed(self):
+        """Returns the wall time from the start of the first stage to the end of the last one."""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def report(self):
+        """Returns one human readable line per stage."""
+        lines = []
+        for stats in self.stages.values():
+            line = f"{stats.name:<14} wall {stats.wall_s:9.3f}s  cpu {stats.cpu_s:9.3f}s"
+            if stats.rows:
+                line += f"  rows {stats.rows}"
+            if stats.vertices:
+                line += f"  vertices {stats.vertices}"
+            lines.append(line)
+        return lines
+
+
+@contextmanager
+def profiled(profiler, output_path):
+    """Runs the enclosed block under cProfile or tracemalloc.
+
+    The profile is saved next to output_path, as ``<output_path>.prof``
+    (readable with pstats/snakeviz) or ``<output_path>.tracemalloc``
+    (readable with tracemalloc.Snapshot.load). Yields the path of the profile,
+    or None when profiler is empty.
+    """
+    if not profiler:
+        yield None
+        return
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler: {profiler}")
+
+    if profiler == 'cprofile':
+        import cProfile
+
+        profile_path = output_path + '.prof'
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield profile_path
+        finally:
+            profile.disable()
+            profile.dump_stats(profile_path)
+    else:
+        import tracemalloc
+
+        profile_path = output_path + '.tracemalloc'
+        tracemalloc.start(25)
+        try:
+            yield profile_path
+        finally:
+            tracemalloc.take_snapshot().dump(profile_path)
+            tracemalloc.stop()
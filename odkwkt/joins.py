@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Reference layer joins
+                                 A QGIS plugin
+ Tags converted geometries with the attributes of the reference polygon
+ (admin region, protected area, ...) they fall in, while the rows are
+ converted, instead of a separate "Join attributes by location" run.
+ Where polygons overlap, a geometry takes the first one in layer order,
+ like that algorithm's "take attributes of the first matching feature only".
+
+ The reference layer is read once, from a GeoPackage (sqlite3) or an ESRI
+ shapefile (.shp and .dbf, read directly), reprojected to the output
+ coordinates if needed and indexed in an STRtree of prepared polygons.
+ Each chunk is then joined with one bounding box query and one vectorized
+ point-in-polygon test. Needs Shapely 2; layers in another CRS than the
+ output need pyproj.
+ ***************************************************************************/
+"""
+
+import os
+import sqlite3
+import struct
+import threading
+
+from .sidecar import _quote
+
+REFERENCE_FORMATS = ('.gpkg', '.shp')
+
+# Python types of GeoPackage and dBASE attribute columns; anything else is text
+_GPKG_TYPES = {'INTEGER': int, 'INT': int, 'MEDIUMINT': int, 'SMALLINT': int, 'TINYINT': int,
+               'REAL': float, 'DOUBLE': float, 'FLOAT': float}
+
+# GeoPackage geometry header envelope sizes by envelope indicator
+_ENVELOPE_SIZES = {0: 0, 1: 32, 2: 48, 3: 48, 4: 64}
+
+_SHP_POLYGONS = (5, 15, 25)
+
+
+class ReferenceLayer:
+    """Polygons of a reference layer and their attributes, indexed for joins.
+
+    :param polygons: Shapely (multi)polygons, in the output coordinates.
+    :param fields: Attribute names, mapped to the type of their values.
+    :param records: Attribute values, a tuple per polygon in fields order.
+    """
+
+    def __init__(self, polygons, fields, records):
+        import numpy
+        import shapely
+
+        self.fields = dict(fields)
+        self.records = list(records)
+        self.polygons = numpy.empty(len(polygons), dtype=object)
+        self.polygons[:] = list(polygons)
+        self.tree = shapely.STRtree(self.polygons)
+        shapely.prepare(self.polygons)
+        # GEOS builds the indexes of prepared polygons on first use, which is not thread-safe
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, file_path, attributes=None, crs=None, layer=None):
+        """Reads a reference layer.
+
+        :param attributes: Attributes to join; None for all.
+        :param crs: CRS of the output coordinates (anything pyproj accepts);
+            the polygons are reprojected to it if the layer has another one.
+        :param layer: GeoPackage table; defaults to the first polygon layer.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.gpkg':
+            polygons, fields, records, layer_crs = _read_geopackage(file_path, layer)
+        elif extension == '.shp':
+            polygons, fields, records, layer_crs = _read_shapefile(file_path)
+        else:
+            raise ValueError(f"Reference layers must be one of {', '.join(REFERENCE_FORMATS)}: {file_path}")
+        if attributes is not None:
+            missing = [name for name in attributes if name not in fields]
+            if missing:
+                raise KeyError(f"Attribute '{missing[0]}' not found in {file_path}")
+            positions = [list(fields).index(name) for name in attributes]
+            fields = {name: fields[name] for name in attributes}
+            records = [tuple(record[position] for position in positions) for record in records]
+        keep = [index for index, polygon in enumerate(polygons) if polygon is not None]
+        polygons = _reprojected([polygons[index] for index in keep], layer_crs, crs)
+        return cls(polygons, fields, [records[index] for index in keep])
+
+    def __len__(self):
+        return len(self.records)
+
+    def join_first(self, geometries):
+        """Returns {attribute: [(row_index, value), ...]} of the first polygon each geometry falls in.
+
+        A geometry falls in the polygons holding its point on surface (the
+        point itself, a point on a trace, a point inside a shape); only the
+        first of them in layer order is joined, one value per result cell.
+        Geometries outside all polygons and empty attributes are left out.
+        """
+        if not geometries or not len(self.records):
+            return {}
+        import numpy
+        import shapely
+
+        array = numpy.empty(len(geometries), dtype=object)
+        array[:] = [geometry for _, geometry in geometries]
+        points = shapely.point_on_surface(array)
+        candidates, polygons = self.tree.query(points)
+        with self._lock:
+            inside = shapely.intersects(self.polygons[polygons], points[candidates])
+        candidates, polygons = candidates[inside], polygons[inside]
+        # First polygon (in layer order) per geometry
+        order = numpy.lexsort((polygons, candidates))
+        candidates, polygons = candidates[order], polygons[order]
+        _, first = numpy.unique(candidates, return_index=True)
+        joined = {name: [] for name in self.fields}
+        for candidate, polygon in zip(candidates[first].tolist(), polygons[first].tolist()):
+            row_index = geometries[candidate][0]
+            for name, value in zip(self.fields, self.records[polygon]):
+                if value is not None and value != '':
+                    joined[name].append((row_index, value))
+        return joined
+
+
+def _reprojected(polygons, layer_crs, crs):
+    """Returns the polygons in the output CRS."""
+    if layer_crs is None or crs is None or layer_crs == crs:
+        return polygons
+    try:
+        import pyproj
+    except ImportError as e:
+        raise ImportError(f"Joining a reference layer in another CRS ({layer_crs}) needs pyproj") from e
+    import numpy
+    import shapely
+
+    source = pyproj.CRS.from_user_input(layer_crs)
+    target = pyproj.CRS.from_user_input(crs)
+    if source.equals(target, ignore_axis_order=True):
+        return polygons
+    transformer = pyproj.Transformer.from_crs(source, target, always_xy=True)
+    array = numpy.empty(len(polygons), dtype=object)
+    array[:] = polygons
+    array = shapely.transform(array, lambda coords: numpy.column_stack(
+        transformer.transform(coords[:, 0], coords[:, 1])))
+    return array.tolist()
+
+
+def _read_geopackage(file_path, layer=None):
+    """Returns (polygons, fields, records, crs) of a GeoPackage polygon layer."""
+    import shapely
+
+    connection = sqlite3.connect(f'file:{file_path}?mode=ro', uri=True)
+    try:
+        layers = connection.execute(
+            'SELECT table_name, column_name, geometry_type_name, srs_id FROM gpkg_geometry_columns').fetchall()
+        layers = [entry for entry in layers if layer is None or entry[0] == layer]
+        polygon_layers = [entry for entry in layers if 'POLYGON' in entry[2].upper()
+                          or entry[2].upper() == 'GEOMETRY']
+        if not polygon_layers:
+            raise ValueError(f"No polygon layer '{layer}' in {file_path}" if layer is not None
+                             else f"No polygon layer in {file_path}")
+        table, geometry_column, _, srs_id = polygon_layers[0]
+        crs = _gpkg_crs(connection, srs_id)
+        columns = connection.execute(f'PRAGMA table_info({_quote(table)})').fetchall()
+        fields = {name: _GPKG_TYPES.get(declared.split('(')[0].upper(), str)
+                  for _, name, declared, _, _, primary_key in columns
+                  if name != geometry_column and not primary_key}
+        selected = ', '.join(_quote(name) for name in [geometry_column, *fields])
+        polygons, records = [], []
+        for blob, *values in connection.execute(f'SELECT {selected} FROM {_quote(table)}'):
+            polygons.append(shapely.from_wkb(_gpkg_wkb(blob)) if blob else None)
+            # BLOB attributes are joined as hex text, which cells, CSV and the journal hold
+            records.append(tuple(value.hex().upper() if isinstance(value, bytes) else value for value in values))
+    finally:
+        connection.close()
+    return polygons, fields, records, crs
+
+
+def _gpkg_crs(connection, srs_id):
+    """Returns the CRS of a GeoPackage srs_id, as 'EPSG:<code>' or WKT; None if undefined."""
+    if srs_id is None or srs_id <= 0:
+        return None
+    entry = connection.execute(
+        'SELECT organization, organization_coordsys_id, definition FROM gpkg_spatial_ref_sys WHERE srs_id = ?',
+        (srs_id,)).fetchone()
+    if entry is None:
+        return None
+    organization, code, definition = entry
+    if organization and organization.upper() == 'EPSG':
+        return f'EPSG:{code}'
+    return definition if definition and definition != 'undefined' else None
+
+
+def _gpkg_wkb(blob):
+    """Strips the GeoPackage header off a geometry blob, returning its WKB."""
+    if bytes(blob[:2]) != b'GP':
+        raise ValueError("Not a GeoPackage geometry")
+    envelope = (blob[3] >> 1) & 0b111
+    return bytes(blob[8 + _ENVELOPE_SIZES[envelope]:])
+
+
+def _read_shapefile(file_path):
+    """Returns (polygons, fields, records, crs) of a polygon shapefile and its .dbf."""
+    import numpy
+    import shapely
+
+    base = os.path.splitext(file_path)[0]
+    with open(file_path, 'rb') as handle:
+        data = handle.read()
+    shape_type, = struct.unpack_from('<i', data, 32)
+    if shape_type not in _SHP_POLYGONS:
+        raise ValueError(f"Not a polygon shapefile: {file_path}")
+    polygons = []
+    offset = 100
+    while offset + 8 <= len(data):
+        _, words = struct.unpack_from('>2i', data, offset)
+        content = offset + 8
+        offset = content + 2 * words
+        record_type, = struct.unpack_from('<i', data, content)
+        if record_type not in _SHP_POLYGONS:
+            polygons.append(None)
+            continue
+        part_count, point_count = struct.unpack_from('<2i', data, content + 36)
+        parts = list(struct.unpack_from(f'<{part_count}i', data, content + 44)) + [point_count]
+        xy = numpy.frombuffer(data, dtype='<f8', count=2 * point_count,
+                              offset=content + 44 + 4 * part_count).reshape(-1, 2)
+        polygons.append(_shapefile_polygon(shapely, [xy[start:end] for start, end in zip(parts, parts[1:])]))
+
+    fields, records, deleted = _read_dbf(base + '.dbf', _shapefile_encoding(base))
+    for index in deleted:
+        if index < len(polygons):
+            polygons[index] = None
+    crs = None
+    if os.path.exists(base + '.prj'):
+        with open(base + '.prj', encoding='utf-8', errors='replace') as handle:
+            crs = _prj_crs(handle.read().strip())
+    return polygons, fields, records, crs
+
+
+def _shapefile_polygon(shapely, rings):
+    """Assembles the rings of a shapefile record: clockwise shells, counter-clockwise holes."""
+    rings = [ring for ring in rings if len(ring) >= 4]
+    if not rings:
+        return None
+    # Twice the signed area, positive for counter-clockwise rings
+    areas = [float((ring[:-1, 0] * ring[1:, 1] - ring[1:, 0] * ring[:-1, 1]).sum()) for ring in rings]
+    shells = [ring for ring, area in zip(rings, areas) if area <= 0] or rings
+    holes = [ring for ring, area in zip(rings, areas) if area > 0] if len(shells) < len(rings) else []
+    polygons = [shapely.Polygon(shell) for shell in shells]
+    shell_holes = [[] for _ in shells]
+    for hole in holes:
+        point = shapely.Point(hole[0])
+        owner = next((index for index, polygon in enumerate(polygons) if polygon.covers(point)), 0)
+        shell_holes[owner].append(hole)
+    polygons = [shapely.Polygon(shell, holes) for shell, holes in zip(shells, shell_holes)]
+    return polygons[0] if len(polygons) == 1 else shapely.MultiPolygon(polygons)
+
+
+def _shapefile_encoding(base):
+    """Returns the encoding named by the .cpg file of a shapefile, else UTF-8."""
+    if os.path.exists(base + '.cpg'):
+        with open(base + '.cpg', encoding='ascii', errors='replace') as handle:
+            name = handle.read().strip()
+        return name or 'utf-8'
+    return 'utf-8'
+
+
+def _read_dbf(file_path, encoding):
+    """Returns (fields, records, deleted) of a dBASE table.
+
+    Deleted records keep their place, so records stay aligned with the
+    shapes of the .shp; deleted holds their indexes.
+    """
+    with open(file_path, 'rb') as handle:
+        data = handle.read()
+    count, header_size, record_size = struct.unpack_from('<IHH', data, 4)
+    layout = []
+    position = 32
+    while data[position] != 0x0D:
+        name = data[position:position + 11].split(b'\0')[0].decode(encoding, errors='replace')
+        kind = chr(data[position + 11])
+        length, decimals = data[position + 16], data[position + 17]
+        layout.append((name, kind, length, decimals))
+        position += 32
+    fields = {name: int if kind == 'N' and not decimals else float if kind in 'NF' else str
+              for name, kind, _, decimals in layout}
+    records = []
+    deleted = []
+    for start in range(header_size, header_size + count * record_size, record_size):
+        if data[start] == 0x2A:  # '*' deletion flag
+            deleted.append(len(records))
+        offset = start + 1
+        record = []
+        for name, kind, length, _ in layout:
+            text = data[offset:offset + length].decode(encoding, errors='replace').strip()
+            offset += length
+            record.append(_dbf_value(text, fields[name]))
+        records.append(tuple(record))
+    return fields, records, deleted
+
+
+def _dbf_value(text, kind):
+    if not text or (kind is not str and text.strip('*') == ''):
+        return None
+    if kind is str:
+        return text
+    try:
+        return kind(text)
+    except ValueError:
+        return None
+
+
+def _prj_crs(wkt):
+    """Returns the CRS of a .prj file, 'EPSG:4326' for plain WGS 84 so no pyproj is needed for it."""
+    if not wkt:
+        return None
+    if wkt.startswith('GEOGCS[') and ('"GCS_WGS_1984"' in wkt or '"WGS 84"' in wkt):
+        return 'EPSG:4326'
+    return wkt
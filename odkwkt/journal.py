@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Conversion journal
+                                 A QGIS plugin
+ Checkpoints converted row chunks to a JSON lines file next to the output,
+ so that an interrupted conversion can resume from the last completed chunk.
+ ***************************************************************************/
+"""
+
+import json
+import os
+
+from .errors import RowError
+
+JOURNAL_VERSION = 2
+JOURNAL_SUFFIX = '.odkwkt-journal'
+
+
+def journal_path(output_path):
+    """Returns the path of the journal belonging to an output file."""
+    return output_path + JOURNAL_SUFFIX
+
+
+def fingerprint(file_path, sheet_name, columns, options):
+    """Identifies a conversion; a journal is only resumed for the same one."""
+    stat = os.stat(file_path)
+    return {
+        'version': JOURNAL_VERSION,
+        'source': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sheet': sheet_name,
+        'columns': [[spec.source, spec.target, spec.kind, spec.encoding] for spec in columns],
+        'checkpoint_rows': options.checkpoint_rows,
+        'tolerant': options.tolerant,
+        'precision': options.precision,
+        'single_precision': options.single_precision,
+        'memory_budget': options.memory_budget,
+        'validate': options.validate,
+        'target_crs': options.target_crs,
+        'measures': sorted(options.measures),
+        'cell_keys': sorted(options.cell_keys),
+        'cell_anchor': options.cell_anchor,
+        'geohash_precision': options.geohash_precision,
+        'grid_size': options.grid_size,
+        'simplify': sorted(options.simplify),
+        'aoi_bbox': list(options.aoi_bbox) if options.aoi_bbox is not None else None,
+        'aoi_layer': os.path.abspath(options.aoi_layer) if options.aoi_layer else None,
+        'join_layer': os.path.abspath(options.join_layer) if options.join_layer else None,
+        'join_attributes': list(options.join_attributes) if options.join_attributes is not None else None,
+        'order': options.order,
+        'rows': sorted(options.rows) if options.rows is not None else None,
+    }
+
+
+class Journal:
+    """Append-only record of the chunks of a conversion that are done.
+
+    The first line holds the fingerprint of the conversion, each further line
+    one chunk: its row range, the values written per result column (WKB
+    bytes as hex text, their columns listed under binary), in tolerant mode
+    its errors, and the geometries validation repaired. A torn
+    last line (crash while writing) is ignored and that chunk converted
+    again.
+    """
+
+    def __init__(self, file_path, header):
+        self.file_path = file_path
+        self.header = header
+        self.chunks = {}
+        self._handle = None
+
+    @classmethod
+    def open(cls, file_path, header):
+        """Opens the journal, keeping its chunks if it belongs to the same conversion."""
+        journal = cls(file_path, header)
+        valid_size = journal._load() if os.path.exists(file_path) else 0
+        if journal.chunks:
+            # Drop a torn last line before appending to the journal
+            journal._handle = open(file_path, 'r+', encoding='utf-8')
+            journal._handle.truncate(valid_size)
+            journal._handle.seek(valid_size)
+        else:
+            journal._handle = open(file_path, 'w', encoding='utf-8')
+            journal._write(header)
+        return journal
+
+    def _load(self):
+        """Reads the chunks of a matching journal; returns the size of its valid part."""
+        valid_size = 0
+        with open(self.file_path, 'rb') as handle:
+            for number, line in enumerate(handle):
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if number == 0:
+                    if entry != self.header:
+                        return 0
+                else:
+                    self.chunks[entry['start']] = entry
+                valid_size += len(line)
+        return valid_size
+
+    def _write(self, entry):
+        self._handle.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def completed(self, start):
+        """Returns (results, errors, repairs) of a journaled chunk, or None."""
+        entry = self.chunks.get(start)
+        if entry is None:
+            return None
+        errors = [RowError(*error) for error in entry['errors']]
+        repairs = [RowError(*repair) for repair in entry['repairs']]
+        results = dict(entry['results'])
+        for name in entry.get('binary', ()):
+            results[name] = [[row, bytes.fromhex(value) if value is not None else None]
+                             for row, value in results[name]]
+        return results, errors, repairs
+
+    def record(self, start, end, results, errors, repairs=()):
+        """Checkpoints a finished chunk; results maps result columns to (row, value) pairs."""
+        binary = sorted(name for name, pairs in results.items()
+                        if any(isinstance(value, bytes) for _, value in pairs))
+        if binary:
+            results = dict(results)
+            for name in binary:
+                results[name] = [[row, value.hex() if isinstance(value, bytes) else value]
+                                 for row, value in results[name]]
+        entry = {
+            'start': start,
+            'end': end,
+            'results': results,
+            'binary': binary,
+            'errors': [[error.row, error.column, error.token, error.reason] for error in errors],
+            'repairs': [[repair.row, repair.column, repair.token, repair.reason] for repair in repairs],
+        }
+        self._write(entry)
+        self.chunks[start] = entry
+
+    def close(self, remove=False):
+        """Closes the journal, deleting it once the output is safely written."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if remove and os.path.exists(self.file_path):
+            os.remove(self.file_path)
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Derived measures
+                                 A QGIS plugin
+ Computes measure columns (length, area, perimeter, vertex count, bounding
+ box, centroid) of a whole column chunk at once, with NumPy on the flat
+ coordinate array of its CoordinateBatch, so that nobody has to parse the
+ WKT again in the field calculator.
+
+ Lengths, areas and perimeters are geodesic, on the WGS 84 ellipsoid:
+
+ * segments are measured with the meridional and prime vertical radii of
+   curvature at their midpoint; the relative error against the exact
+   geodesic distance grows with the square of the segment length, about
+   1e-9 at 1 km and 1e-7 at 10 km;
+ * areas are taken in a Lambert azimuthal equal-area projection of the
+   authalic sphere centred on each polygon, within a relative 1e-6 of the
+   ellipsoidal area for polygons of up to about 10 km across.
+
+ Both are checked against pyproj.Geod('WGS84') to a relative 1e-6 for
+ features of up to about 10 km across (see the tests).
+
+ Bounding boxes and centroids are planar, in the output coordinates.
+ ***************************************************************************/
+"""
+
+import math
+
+MEASURES = ('length', 'area', 'perimeter', 'vertices', 'bbox', 'centroid')
+
+# Columns each measure adds, after the result column name
+MEASURE_FIELDS = {
+    'length': ('length_m',),
+    'area': ('area_m2',),
+    'perimeter': ('perimeter_m',),
+    'vertices': ('vertices',),
+    'bbox': ('xmin', 'ymin', 'xmax', 'ymax'),
+    'centroid': ('centroid_x', 'centroid_y'),
+}
+
+# ODK geometry kinds each measure applies to
+MEASURE_KINDS = {
+    'length': ('trace',),
+    'area': ('shape',),
+    'perimeter': ('shape',),
+    'vertices': ('point', 'trace', 'shape'),
+    'bbox': ('trace', 'shape'),
+    'centroid': ('point', 'trace', 'shape'),
+}
+
+# Measured on the parsed longitude/latitude, before any reprojection
+GEODESIC_MEASURES = ('length', 'area', 'perimeter')
+
+# WGS 84 ellipsoid
+_A = 6378137.0
+_F = 1 / 298.257223563
+_E2 = _F * (2 - _F)
+_E = math.sqrt(_E2)
+
+
+def measure_fields(kind, measures):
+    """Returns the (measure, field) pairs that the measures add to a column of an ODK kind."""
+    unknown = set(measures) - set(MEASURES)
+    if unknown:
+        raise ValueError(f"Unknown measure: {', '.join(sorted(unknown))}")
+    return [(measure, name) for measure in MEASURES
+            if measure in measures and kind in MEASURE_KINDS[measure] for name in MEASURE_FIELDS[measure]]
+
+
+def measure_column(parsed, kind, measures):
+    """Measures every cell of a CoordinateBatch; returns {field: [(row_index, value), ...]}.
+
+    :param measures: Measures to compute; those that do not apply to the
+        kind are ignored.
+    """
+    wanted = {measure for measure, _ in measure_fields(kind, measures)}
+    if not wanted or not len(parsed):
+        return {}
+    import numpy
+
+    xy = parsed.xy().astype(numpy.float64)
+    offsets = numpy.frombuffer(parsed.offsets, dtype=parsed.offsets.typecode)
+    starts, ends = offsets[:-1], offsets[1:]
+    if kind == 'point':
+        ends = starts + 1
+    values = {}
+    if 'vertices' in wanted:
+        values['vertices'] = ends - starts
+    if 'length' in wanted:
+        values['length_m'] = _geodesic_lengths(numpy, xy, starts, ends, closed=False)
+    if 'perimeter' in wanted:
+        values['perimeter_m'] = _geodesic_lengths(numpy, xy, starts, ends, closed=True)
+    if 'area' in wanted:
+        values['area_m2'] = _geodesic_areas(numpy, xy, starts, ends)
+    if 'bbox' in wanted:
+        values['xmin'] = numpy.minimum.reduceat(xy[:, 0], starts)
+        values['ymin'] = numpy.minimum.reduceat(xy[:, 1], starts)
+        values['xmax'] = numpy.maximum.reduceat(xy[:, 0], starts)
+        values['ymax'] = numpy.maximum.reduceat(xy[:, 1], starts)
+    if 'centroid' in wanted:
+        if kind == 'point':
+            values['centroid_x'], values['centroid_y'] = xy[starts, 0], xy[starts, 1]
+        else:
+            values['centroid_x'], values['centroid_y'] = _centroids(numpy, xy, starts, ends, kind == 'shape')
+    rows = parsed.rows.tolist()
+    # Measures that overflow (e.g. lengths between coordinates near the float limit) are left empty
+    return {name: list(zip(rows, [value if math.isfinite(value) else None for value in column.tolist()]))
+            for name, column in values.items()}
+
+
+def _next_vertices(numpy, count, starts, ends):
+    """Returns the index of the vertex following each vertex, the last of a cell wrapping to its first."""
+    following = numpy.arange(1, count + 1)
+    following[ends - 1] = starts
+    return following
+
+
+def _geodesic_lengths(numpy, xy, starts, ends, closed):
+    """Returns the length in metres of the segments of each cell, with the closing one if closed."""
+    lon, lat = numpy.radians(xy[:, 0]), numpy.radians(xy[:, 1])
+    following = _next_vertices(numpy, len(xy), starts, ends)
+    lengths = _distances(numpy, lon, lat, lon[following], lat[following])
+    if not closed:
+        lengths[ends - 1] = 0.0
+    return numpy.add.reduceat(lengths, starts)
+
+
+def _distances(numpy, lon1, lat1, lon2, lat2):
+    """Ellipsoidal distances in metres, from the radii of curvature at the segment midpoints."""
+    middle = (lat1 + lat2) / 2
+    sine = numpy.sin(middle)
+    w = numpy.sqrt(1 - _E2 * sine * sine)
+    meridional = _A * (1 - _E2) / w ** 3
+    prime_vertical = _A / w
+    dlon = (lon2 - lon1 + math.pi) % (2 * math.pi) - math.pi
+    # Latitudes far outside +-90 degrees overflow to infinity, which measure_column leaves empty
+    with numpy.errstate(over='ignore'):
+        return numpy.hypot(meridional * (lat2 - lat1), prime_vertical * numpy.cos(middle) * dlon)
+
+
+def _authalic(numpy, sine):
+    """Returns q(phi) for sin(phi); q / q(90 degrees) is the sine of the authalic latitude."""
+    logarithm = numpy.log((1 - _E * sine) / (1 + _E * sine))
+    return (1 - _E2) * (sine / (1 - _E2 * sine * sine) - logarithm / (2 * _E))
+
+
+def _geodesic_areas(numpy, xy, starts, ends):
+    """Returns the area in square metres of each ring, in an equal-area projection centred on it."""
+    polar = _authalic(numpy, 1.0)
+    radius = _A * math.sqrt(polar / 2)
+    counts = ends - starts
+    cell = numpy.repeat(numpy.arange(len(starts)), counts)
+
+    lon = numpy.radians(xy[:, 0])
+    sin_xi = _authalic(numpy, numpy.sin(numpy.radians(xy[:, 1]))) / polar
+    cos_xi = numpy.sqrt(1 - sin_xi * sin_xi)
+    # Centre on the mean vertex, taking longitudes relative to the first so the antimeridian does no harm
+    dlon = (lon - lon[starts][cell] + math.pi) % (2 * math.pi) - math.pi
+    dlon -= (numpy.add.reduceat(dlon, starts) / counts)[cell]
+    sin_0 = (numpy.add.reduceat(sin_xi, starts) / counts)[cell]
+    cos_0 = numpy.sqrt(1 - sin_0 * sin_0)
+
+    cos_dlon = numpy.cos(dlon)
+    scale = numpy.sqrt(2 / (1 + sin_0 * sin_xi + cos_0 * cos_xi * cos_dlon))
+    x = scale * cos_xi * numpy.sin(dlon)
+    y = scale * (cos_0 * sin_xi - sin_0 * cos_xi * cos_dlon)
+    following = _next_vertices(numpy, len(xy), starts, ends)
+    return numpy.abs(numpy.add.reduceat(x * y[following] - x[following] * y, starts)) / 2 * radius * radius
+
+
+def _centroids(numpy, xy, starts, ends, polygon):
+    """Returns the planar centroids (x, y) of lines (length weighted) or polygon rings (area weighted).
+
+    Degenerate cells (no length or area) get the mean of their vertices,
+    cells spanning nearly the whole float range a non-finite centroid.
+    """
+    counts = ends - starts
+    cell = numpy.repeat(numpy.arange(len(starts)), counts)
+    # Relative to the first vertex, so large projected coordinates keep their precision
+    origin = xy[starts]
+    with numpy.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        local = xy - origin[cell]
+        following = _next_vertices(numpy, len(xy), starts, ends)
+        x, y = local[:, 0], local[:, 1]
+        if polygon:
+            weights = x * y[following] - x[following] * y
+            factor = 3.0
+        else:
+            weights = numpy.hypot(x[following] - x, y[following] - y)
+            weights[ends - 1] = 0.0
+            factor = 2.0
+        total = numpy.add.reduceat(weights, starts)
+        mean = numpy.add.reduceat(local, starts) / counts[:, None]
+        centre_x = numpy.add.reduceat((x + x[following]) * weights, starts) / (factor * total)
+        centre_y = numpy.add.reduceat((y + y[following]) * weights, starts) / (factor * total)
+    degenerate = total == 0
+    centre_x[degenerate] = mean[degenerate, 0]
+    centre_y[degenerate] = mean[degenerate, 1]
+    return origin[:, 0] + centre_x, origin[:, 1] + centre_y
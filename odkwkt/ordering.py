@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Spatial ordering
+                                 A QGIS plugin
+ Writes the features of CSV, GeoPackage and GeoJSON outputs along a
+ Hilbert or Z-order curve through the bounding box centres of their
+ geometries, instead of in submission order, so that features close in
+ space are close in the file (faster rendering, R-tree builds and tiling).
+
+ The curve is laid over the extent of all features, which is only known
+ once the last row is converted: the features are held in SQLite on disk,
+ their curve keys computed with NumPy at the end and the features read
+ back in key order.
+ ***************************************************************************/
+"""
+
+import math
+import os
+import sqlite3
+from array import array
+
+ORDERS = ('hilbert', 'zorder')
+
+# Name of the bounding box centres of each row in the results of a chunk; never a column name
+CENTRE_RESULT = ''
+# Index of the centres in the results written to an output; columns are numbered from 1
+CENTRE_INDEX = 0
+
+# Cells of the curve per axis: 2 ** CURVE_BITS
+CURVE_BITS = 16
+
+
+def bbox_centres(geometries):
+    """Returns the (row_index, (x, y)) bounding box centres of (row_index, geometry) pairs."""
+    if not geometries:
+        return []
+    import shapely
+
+    bounds = shapely.bounds([geometry for _, geometry in geometries])
+    x = ((bounds[:, 0] + bounds[:, 2]) / 2).tolist()
+    y = ((bounds[:, 1] + bounds[:, 3]) / 2).tolist()
+    return [(row_index, centre) for (row_index, _), centre in zip(geometries, zip(x, y))]
+
+
+def curve_keys(x, y, bounds, order='hilbert', bits=CURVE_BITS):
+    """Returns the Hilbert or Z-order keys of points in an extent, as a NumPy int64 array.
+
+    :param bounds: (min_x, min_y, max_x, max_y) the curve is laid over.
+    """
+    import numpy
+
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order: {order}")
+    min_x, min_y, max_x, max_y = bounds
+    cells = (1 << bits) - 1
+    x = _cells(numpy, x, min_x, max_x, cells)
+    y = _cells(numpy, y, min_y, max_y, cells)
+    if order == 'zorder':
+        return _spread(x) | (_spread(y) << 1)
+    return _hilbert(numpy, x, y, bits)
+
+
+def curve_order(x, y, order='hilbert'):
+    """Returns the indexes of points sorted by their curve key over the extent of them all.
+
+    Points with a NaN coordinate (no geometry) come last, in their order.
+    """
+    import numpy
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+    located = numpy.flatnonzero(~(numpy.isnan(x) | numpy.isnan(y)))
+    missing = numpy.flatnonzero(numpy.isnan(x) | numpy.isnan(y))
+    if not len(located):
+        return missing
+    bounds = (x[located].min(), y[located].min(), x[located].max(), y[located].max())
+    keys = curve_keys(x[located], y[located], bounds, order)
+    return numpy.concatenate([located[numpy.argsort(keys, kind='stable')], missing])
+
+
+def _cells(numpy, values, low, high, cells):
+    """Scales coordinates to integer cells 0..cells."""
+    values = numpy.asarray(values, dtype=numpy.float64)
+    span = high - low
+    if not span > 0:
+        return numpy.zeros(len(values), dtype=numpy.int64)
+    return numpy.clip(((values - low) / span * cells).astype(numpy.int64), 0, cells)
+
+
+def _spread(values):
+    """Spreads the low 16 bits of each value to the even bits."""
+    values = values & 0xFFFF
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    return (values | (values << 1)) & 0x55555555
+
+
+def _hilbert(numpy, x, y, bits):
+    """Hilbert curve distances of integer cells, one bit level of all points at a time."""
+    size = 1 << bits
+    x, y = x.copy(), y.copy()
+    keys = numpy.zeros(len(x), dtype=numpy.int64)
+    level = size >> 1
+    while level:
+        right = (x & level) > 0
+        up = (y & level) > 0
+        keys += level * level * ((3 * right) ^ up)
+        # Rotate the quadrant so the curve continues through the next level
+        rotate = ~up
+        flip = rotate & right
+        x[flip] = size - 1 - x[flip]
+        y[flip] = size - 1 - y[flip]
+        x[rotate], y[rotate] = y[rotate], x[rotate].copy()
+        level >>= 1
+    return keys
+
+
+def rank_table(connection, x, y, order='hilbert'):
+    """Creates the temporary table curve_order (rank, id) of 1-based ids sorted along the curve.
+
+    :param x: Centre of the feature with id i + 1 at index i, NaN without one.
+    """
+    connection.execute('DROP TABLE IF EXISTS temp.curve_order')
+    connection.execute('CREATE TEMP TABLE curve_order (rank INTEGER PRIMARY KEY, id INTEGER)')
+    connection.executemany('INSERT INTO temp.curve_order (id) VALUES (?)',
+                           ((index + 1,) for index in curve_order(x, y, order).tolist()))
+
+
+class SpatialSpool:
+    """Features held in a SQLite file on disk until all are known, then read back along the curve."""
+
+    def __init__(self, file_path, order='hilbert'):
+        if order not in ORDERS:
+            raise ValueError(f"Unknown order: {order}")
+        self.file_path = file_path
+        self.order = order
+        self.x = array('d')
+        self.y = array('d')
+        self.connection = sqlite3.connect(file_path)
+        self.connection.execute('PRAGMA journal_mode = OFF')
+        self.connection.execute('PRAGMA synchronous = OFF')
+        self.connection.execute('CREATE TABLE spool (id INTEGER PRIMARY KEY, feature)')
+
+    def add(self, features):
+        """Adds (centre, feature) pairs; centre is an (x, y) pair or None, feature any SQLite value."""
+        for centre, _ in features:
+            self.x.append(centre[0] if centre is not None else math.nan)
+            self.y.append(centre[1] if centre is not None else math.nan)
+        self.connection.executemany('INSERT INTO spool (feature) VALUES (?)',
+                                    ((feature,) for _, feature in features))
+
+    def __iter__(self):
+        """Yields the features in curve order."""
+        rank_table(self.connection, self.x, self.y, self.order)
+        query = 'SELECT feature FROM temp.curve_order JOIN spool ON spool.id = curve_order.id ORDER BY rank'
+        for feature, in self.connection.execute(query):
+            yield feature
+
+    def close(self):
+        self.connection.close()
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Conversion outputs
+                                 A QGIS plugin
+ Where converted chunks are written: back into the loaded workbook, into a
+ new write-only workbook, or appended to the sheet XML of a copy of the
+ .xlsx zip. Either way the file is written to a temporary file in the target
+ directory and renamed into place, so an interrupted save never leaves a
+ truncated .xlsx behind.
+ ***************************************************************************/
+"""
+
+import math
+import os
+import re
+import shutil
+import stat
+import tempfile
+import zipfile
+from collections import deque
+from contextlib import contextmanager
+from xml.sax.saxutils import escape
+
+from .readers import column_index, column_letters, workbook_sheets
+
+WRITERS = ('auto', 'openpyxl', 'xmlappend')
+
+
+@contextmanager
+def atomic_output(output_path):
+    """Yields a temporary path next to output_path, renamed over it on success."""
+    temp_path = _temp_path(output_path)
+    try:
+        yield temp_path
+        _replace(temp_path, output_path)
+    except BaseException:
+        _discard(temp_path)
+        raise
+
+
+def _temp_path(output_path):
+    """Creates an empty temporary file in the directory of output_path."""
+    directory = os.path.dirname(os.path.abspath(output_path))
+    handle, temp_path = tempfile.mkstemp(
+        prefix='.' + os.path.basename(output_path) + '.', suffix='.tmp', dir=directory)
+    os.close(handle)
+    return temp_path
+
+
+def _replace(temp_path, output_path):
+    _copy_mode(output_path, temp_path)
+    os.replace(temp_path, output_path)
+
+
+def _discard(temp_path):
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+
+def _copy_mode(output_path, temp_path):
+    """Gives the temporary file the permissions the output would have had."""
+    if os.path.exists(output_path):
+        mode = stat.S_IMODE(os.stat(output_path).st_mode)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(temp_path, mode)
+
+
+class InPlaceOutput:
+    """Writes results into the cells of the loaded (editable) workbook."""
+
+    # Only the ODK columns have to be read from the sheet
+    needs_full_rows = False
+    extra_columns = ()
+
+    def __init__(self, workbook, sheet, output_path):
+        self.workbook = workbook
+        self.sheet = sheet
+        self.output_path = output_path
+
+    def write_header(self, headers, added):
+        """Adds the headers of new result columns; added maps 1-based indexes to names."""
+        for index, name in added.items():
+            self.sheet.cell(row=1, column=index, value=name)
+
+    def write_chunk(self, start, rows, results):
+        """Writes the (row_index, value) pairs of results, keyed by 1-based column."""
+        for index, pairs in results.items():
+            for row_index, value in pairs:
+                # Assigned rather than passed to cell(), which ignores None
+                self.sheet.cell(row=row_index, column=index).value = value
+
+    def close(self):
+        with atomic_output(self.output_path) as temp_path:
+            self.workbook.save(temp_path)
+        self.workbook.close()
+
+    def abort(self):
+        self.workbook.close()
+
+
+class WriteOnlyOutput:
+    """Streams the converted sheet, and copies of the others, into a new workbook.
+
+    The source is read through a reader (see readers.open_reader) and never
+    modified. Only cell values are copied; styles, merged cells and other
+    formatting are not.
+    """
+
+    needs_full_rows = True
+    extra_columns = ()
+
+    def __init__(self, reader, sheet_name, output_path):
+        from openpyxl import Workbook
+
+        self.reader = reader
+        self.output_path = output_path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = None
+        self._others = []
+        self._width = 0
+        for name in reader.sheetnames:
+            copy = self.workbook.create_sheet(name)
+            if name == sheet_name:
+                self.sheet = copy
+            else:
+                self._others.append((name, copy))
+
+    def write_header(self, headers, added):
+        row = list(headers)
+        for index, name in added.items():
+            row.extend([None] * (index - len(row)))
+            row[index - 1] = name
+        self._width = len(row)
+        self.sheet.append(row)
+
+    def write_chunk(self, start, rows, results):
+        columns = [(index - 1, dict(pairs)) for index, pairs in results.items()]
+        for row_index, row in enumerate(rows, start=start):
+            row = list(row)
+            if len(row) < self._width:
+                row.extend([None] * (self._width - len(row)))
+            for position, values in columns:
+                if row_index in values:
+                    row[position] = values[row_index]
+            self.sheet.append(row)
+
+    def close(self):
+        for name, copy in self._others:
+            for row in self.reader.iter_rows(name):
+                copy.append(row)
+        with atomic_output(self.output_path) as temp_path:
+            self.workbook.save(temp_path)
+        self.reader.close()
+
+    def abort(self):
+        self.reader.close()
+
+
+class ColumnAppendOutput:
+    """Writes results into the sheet XML of a copy of the .xlsx zip.
+
+    Every other part of the workbook (other sheets, styles, shared strings,
+    charts, ...) is copied unchanged, so nothing openpyxl does not support is
+    lost. The converted sheet is stream-rewritten as chunks arrive: rows
+    without results pass through as is, result cells are inserted (or
+    replaced) as inline strings. Save time therefore depends on the size of
+    that one sheet only.
+    """
+
+    needs_full_rows = False
+    extra_columns = ()
+
+    def __init__(self, reader, file_path, sheet_name, output_path):
+        self.reader = reader
+        self.output_path = output_path
+        self.source = zipfile.ZipFile(file_path)
+        self.temp_path = _temp_path(output_path)
+        try:
+            self.target = zipfile.ZipFile(self.temp_path, 'w', zipfile.ZIP_DEFLATED)
+            sheet_part = workbook_sheets(self.source)[0][sheet_name]
+            members = self.source.infolist()
+            position = next(i for i, info in enumerate(members) if info.filename == sheet_part)
+            # Parts are written in their original order around the sheet
+            for info in members[:position]:
+                self._copy(info)
+            self._remaining = members[position + 1:]
+            sheet_info = members[position]
+            self._rewriter = _SheetRewriter(
+                self.source.open(sheet_info),
+                self.target.open(_copy_info(sheet_info), 'w', force_zip64=True))
+        except BaseException:
+            self.abort()
+            raise
+
+    def _copy(self, info):
+        with self.source.open(info) as source, self.target.open(
+                _copy_info(info), 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+    def write_header(self, headers, added):
+        self._rewriter.extend_columns(max(added, default=0))
+        self._rewriter.write(1, {1: dict(added)})
+
+    def write_chunk(self, start, rows, results):
+        writes = {}
+        for index, pairs in results.items():
+            for row_index, value in pairs:
+                writes.setdefault(row_index, {})[index] = value
+        self._rewriter.write(start + len(rows) - 1, writes)
+
+    def close(self):
+        self._rewriter.close()
+        for info in self._remaining:
+            self._copy(info)
+        self.target.close()
+        self.source.close()
+        self.reader.close()
+        _replace(self.temp_path, self.output_path)
+
+    def abort(self):
+        rewriter = getattr(self, '_rewriter', None)
+        # The open sheet entry has to be closed before its zip
+        handles = [rewriter.target if rewriter else None, getattr(self, 'target', None),
+                   getattr(self, 'source', None), self.reader]
+        for handle in handles:
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        if hasattr(self, 'temp_path'):
+            _discard(self.temp_path)
+
+
+def _copy_info(info):
+    """Returns a fresh ZipInfo with the name, date, compression and attributes of info."""
+    copy = zipfile.ZipInfo(info.filename, info.date_time)
+    copy.compress_type = info.compress_type
+    copy.external_attr = info.external_attr
+    copy.create_system = info.create_system
+    return copy
+
+
+_ROW_START = re.compile(rb'<((?:\w+:)?)row\b([^>]*?)(/?)>')
+_ROW_NUMBER = re.compile(rb'\sr="(\d+)"')
+_ROW_SPANS = re.compile(rb'\sspans="[^"]*"')
+_CELL = re.compile(rb'<(?:\w+:)?c\b([^>]*?)(?:/>|>.*?</(?:\w+:)?c>)', re.DOTALL)
+_CELL_COLUMN = re.compile(rb'\sr="([A-Z]+)\d*"')
+_CELL_STYLE = re.compile(rb'\ss="\d+"')
+_SHEET_DATA = re.compile(rb'<((?:\w+:)?)sheetData\b[^>]*?(/?)>')
+_SHEET_DATA_END = re.compile(rb'</(?:\w+:)?sheetData>')
+_DIMENSION = re.compile(rb'(<(?:\w+:)?dimension\b[^>]*?\sref=")([^"]*)(")')
+
+
+class _SheetRewriter:
+    """Copies a worksheet XML stream, merging cell values into its rows.
+
+    Works on the raw bytes: only rows receiving values are taken apart, all
+    other content is copied verbatim, a block at a time.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.buffer = b''
+        # Everything before pos has been scanned, everything before flushed written
+        self.pos = 0
+        self.flushed = 0
+        self.prefix = b''
+        self.prolog = True
+        self.max_column = 0
+        self.last_row = 0
+        self.pending = {}
+        # Pending row numbers in order; rows already written are skipped lazily
+        self.order = deque()
+        # Output is compressed a block at a time rather than row by row
+        self.output = []
+        self.output_size = 0
+
+    def extend_columns(self, max_column):
+        """Makes the sheet dimension cover columns up to max_column (1-based)."""
+        self.max_column = max(self.max_column, max_column)
+
+    def _emit(self, data):
+        self.output.append(data)
+        self.output_size += len(data)
+        if self.output_size >= self.BLOCK_SIZE:
+            self._drain()
+
+    def _drain(self):
+        if self.output:
+            self.target.write(b''.join(self.output))
+            self.output = []
+            self.output_size = 0
+
+    def _fill(self):
+        """Reads the next block, dropping the part of the buffer already scanned."""
+        self._flush(self.pos)
+        data = self.source.read(self.BLOCK_SIZE)
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = self.flushed = 0
+        return bool(data)
+
+    def _flush(self, end):
+        if end > self.flushed:
+            self._emit(self.buffer[self.flushed:end])
+            self.flushed = end
+
+    def _write_prolog(self):
+        """Copies everything up to the rows, updating the dimension."""
+        while not _SHEET_DATA.search(self.buffer):
+            if not self._fill():
+                raise ValueError('Worksheet has no sheetData')
+        match = _SHEET_DATA.search(self.buffer)
+        self._emit(_DIMENSION.sub(self._dimension, self.buffer[:match.start()]))
+        self.prefix = match.group(1)
+        self.prolog = False
+        if match.group(2):
+            # Empty <sheetData/>: open it, the end tag follows the new rows
+            self._emit(b'<' + self.prefix + b'sheetData>')
+            self.buffer = b'</' + self.prefix + b'sheetData>' + self.buffer[match.end():]
+            self.pos = self.flushed = 0
+        else:
+            self.pos = self.flushed = match.start()
+            self._flush(match.end())
+            self.pos = match.end()
+
+    def _dimension(self, match):
+        last = match.group(2).split(b':')[-1]
+        letters = re.match(rb'[A-Z]*', last).group(0)
+        if self.max_column <= column_index(letters.decode()) + 1:
+            return match.group(0)
+        first = match.group(2).split(b':')[0]
+        rows = last[len(letters):] or b'1'
+        end = column_letters(self.max_column - 1).encode() + rows
+        return match.group(1) + first + b':' + end + match.group(3)
+
+    def write(self, upto, writes):
+        """Copies the rows up to row number upto, merging writes ({row: {column: value}})."""
+        self.pending.update(writes)
+        self.order = deque(sorted(self.pending))
+        if self.prolog:
+            self._write_prolog()
+        while True:
+            row = self._next_row()
+            if row is None:
+                break
+            start, end, number = row
+            if number > upto:
+                break
+            if self.order and self.order[0] < number:
+                self._flush(start)
+                self._write_new_rows(number)
+            if self.order and self.order[0] == number:
+                self.order.popleft()
+            values = self.pending.pop(number, None)
+            if values:
+                self._flush(start)
+                self._emit(_merge_row(self.buffer[start:end], number, values))
+                self.flushed = end
+            self.pos = end
+            self.last_row = number
+
+    def _next_row(self):
+        """Returns (start, end, number) of the next complete row in the buffer, or None."""
+        while True:
+            match = _ROW_START.search(self.buffer, self.pos)
+            if match is not None:
+                # Rows precede the end of sheetData
+                if _SHEET_DATA_END.search(self.buffer, self.pos, match.start()):
+                    return None
+                if match.group(3):
+                    end = match.end()
+                else:
+                    close = self.buffer.find(b'</' + match.group(1) + b'row>', match.end())
+                    end = close + len(match.group(1)) + 6 if close >= 0 else -1
+                if end >= 0:
+                    number = _ROW_NUMBER.search(match.group(2))
+                    number = int(number.group(1)) if number else self.last_row + 1
+                    return match.start(), end, number
+            elif _SHEET_DATA_END.search(self.buffer, self.pos):
+                return None
+            if not self._fill():
+                return None
+
+    def _write_new_rows(self, before):
+        """Writes pending rows that do not exist in the sheet yet, up to row before."""
+        while self.order and self.order[0] < before:
+            number = self.order.popleft()
+            values = self.pending.pop(number, None)
+            if values and any(value is not None for value in values.values()):
+                row = b'<' + self.prefix + b'row r="' + str(number).encode() + b'"></' + self.prefix + b'row>'
+                self._emit(_merge_row(row, number, values))
+
+    def close(self):
+        """Copies the rest of the sheet, appending rows still pending."""
+        self.write(float('inf'), {})
+        self._flush(self.pos)
+        self._write_new_rows(float('inf'))
+        while True:
+            self.pos = len(self.buffer)
+            if not self._fill():
+                break
+        self._drain()
+        self.target.close()
+        self.source.close()
+
+
+def _merge_row(data, number, values):
+    """Returns the XML of a row with values ({1-based column: value}) set; None removes a cell."""
+    start = _ROW_START.match(data)
+    prefix = start.group(1)
+    body = b'' if start.group(3) else data[start.end():data.rindex(b'</')]
+    # Spans are an optional hint that no longer holds once cells are added
+    attributes = _ROW_SPANS.sub(b'', start.group(2))
+
+    last = body.rfind(b'<' + prefix + b'c ')
+    reference = _CELL_COLUMN.search(body, last, body.find(b'>', last)) if last >= 0 else None
+    if last < 0 or (reference and column_index(reference.group(1).decode()) + 1 < min(values)):
+        # Usual case: every value lies after the last cell, which stays as is
+        row = [b'<', prefix, b'row', attributes, b'>', body]
+        row.extend(_value_cell(prefix, column_letters(index - 1) + str(number), values[index], b'')
+                   for index in sorted(values) if values[index] is not None)
+        row.extend([b'</', prefix, b'row>'])
+        return b''.join(row)
+
+    cells = {}
+    tail = []
+    position = 0
+    column = -1
+    for match in _CELL.finditer(body):
+        tail.append(body[position:match.start()])
+        position = match.end()
+        reference = _CELL_COLUMN.search(match.group(1))
+        column = column_index(reference.group(1).decode()) if reference else column + 1
+        cells[column + 1] = match.group(0)
+    tail.append(body[position:])
+
+    for index, value in values.items():
+        existing = cells.pop(index, None)
+        if value is None:
+            continue
+        style = _CELL_STYLE.search(existing) if existing else None
+        cells[index] = _value_cell(prefix, column_letters(index - 1) + str(number),
+                                    value, style.group(0) if style else b'')
+
+    row = [b'<', prefix, b'row', attributes, b'>']
+    row.extend(cells[index] for index in sorted(cells))
+    row.extend([b''.join(tail).strip(), b'</', prefix, b'row>'])
+    return b''.join(row)
+
+
+def _value_cell(prefix, reference, value, style):
+    """Returns a number cell for numbers (measures), else an inline string cell.
+
+    NaN and infinite numbers, which SpreadsheetML cannot hold, give an empty cell.
+    """
+    p = prefix.decode()
+    if isinstance(value, float) and not math.isfinite(value):
+        return f'<{p}c r="{reference}"{style.decode()}/>'.encode('utf-8')
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<{p}c r="{reference}"{style.decode()}><{p}v>{value!r}</{p}v></{p}c>'.encode('utf-8')
+    text = escape(str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return (f'<{p}c r="{reference}"{style.decode()} t="inlineStr">'
+            f'<{p}is><{p}t{space}>{text}</{p}t></{p}is></{p}c>').encode('utf-8')
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Threaded conversion pipeline
+                                 A QGIS plugin
+ Overlaps the stages of a conversion: a reader thread streams row chunks
+ into a bounded queue, a pool of worker threads converts them, and the
+ calling thread writes the results in order. zlib (de)compression and most
+ Shapely/GEOS work release the GIL, so reading, converting and writing run
+ side by side and a run takes about as long as its slowest stage.
+
+ At most 'workers' chunks wait in the queue and twice as many are being
+ converted, which caps memory at a few chunks.
+ ***************************************************************************/
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .instrument import StageTimer
+
+# Seconds between checks whether the consumer has gone away
+_POLL_S = 0.1
+
+
+class _Done:
+    """End of the chunks, carrying the timing of the last (empty) read."""
+
+    def __init__(self, read_timer):
+        self.read_timer = read_timer
+
+
+class _Failed:
+    """An exception raised while reading, re-raised by the consumer."""
+
+    def __init__(self, error, read_timer):
+        self.error = error
+        self.read_timer = read_timer
+
+
+def pipelined(chunks, convert, workers, timer):
+    """Yields (start, chunk, convert(start, chunk, timer)) in order, like converting one by one.
+
+    :param chunks: (start, rows) chunks, consumed on a reader thread.
+    :param convert: Called on a worker thread with a StageTimer of its own,
+        which is merged into timer when the chunk is yielded.
+    :param workers: Number of conversion threads.
+    :param timer: Receives the 'read' stage and the conversion stages.
+    """
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    stop = threading.Event()
+    ready = queue.Queue(maxsize=workers)
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=_POLL_S)
+                return
+            except queue.Full:
+                pass
+
+    def read():
+        while not stop.is_set():
+            read_timer = StageTimer()
+            try:
+                with read_timer.stage('read') as stats:
+                    item = next(chunks, None)
+                    if item is not None:
+                        stats.rows += len(item[1])
+            except BaseException as e:
+                put(_Failed(e, read_timer))
+                return
+            if item is None:
+                put(_Done(read_timer))
+                return
+            put((item, read_timer))
+
+    reader = threading.Thread(target=read, name='odkwkt-reader', daemon=True)
+    executor = ThreadPoolExecutor(workers, thread_name_prefix='odkwkt-convert')
+    pending = deque()
+    done = False
+    try:
+        reader.start()
+        while True:
+            # Keep the workers busy, but only wait for the reader when idle
+            while not done and len(pending) < 2 * workers:
+                try:
+                    item = ready.get(block=not pending)
+                except queue.Empty:
+                    break
+                if isinstance(item, _Done):
+                    timer.merge(item.read_timer)
+                    done = True
+                elif isinstance(item, _Failed):
+                    timer.merge(item.read_timer)
+                    raise item.error
+                else:
+                    (start, chunk), read_timer = item
+                    chunk_timer = StageTimer()
+                    pending.append((start, chunk, read_timer, chunk_timer,
+                                    executor.submit(convert, start, chunk, chunk_timer)))
+            if not pending:
+                break
+            start, chunk, read_timer, chunk_timer, future = pending.popleft()
+            converted = future.result()
+            timer.merge(read_timer)
+            timer.merge(chunk_timer)
+            yield start, chunk, converted
+    finally:
+        stop.set()
+        for *_, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        reader.join()
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Sidecar outputs
+                                 A QGIS plugin
+ Writes only a join key (the ODK KEY column or the row number) and the
+ converted columns to a compact file, instead of rewriting the workbook:
+
+ * .csv   key and result text columns (WKT or hex WKB)
+ * .gpkg  one GeoPackage layer per converted column (EPSG:4326, or the
+          target CRS)
+ * .sidecar.parquet
+          key and result columns, one row group per chunk (needs pyarrow);
+          a plain .parquet output is the full GeoParquet export instead
+
+ All can be written along a space-filling curve (see ordering).
+ ***************************************************************************/
+"""
+
+import csv
+import json
+import math
+import os
+import sqlite3
+import struct
+from array import array
+
+from .encodings import WGS84_SRID, wkb_extents
+from .ordering import CENTRE_INDEX, CENTRE_RESULT, SpatialSpool, rank_table
+from .outputs import _discard, _replace, _temp_path
+
+SIDECAR_FORMATS = {'.csv': 'csv', '.gpkg': 'gpkg', '.sidecar.parquet': 'parquet'}
+
+# Key column used by ODK Central / Briefcase exports
+ODK_KEY_COLUMN = 'KEY'
+ROW_KEY_COLUMN = 'row'
+
+GPKG_GEOMETRY_TYPES = {'point': 'POINT', 'trace': 'LINESTRING', 'shape': 'POLYGON'}
+# Declared for validated traces and shapes, which repairs can turn into multi geometries or collections
+GPKG_VALIDATED_TYPE = 'GEOMETRY'
+
+# GeoPackage attribute types of the further result columns
+GPKG_ATTRIBUTE_TYPES = {str: 'TEXT', float: 'REAL', int: 'INTEGER'}
+
+# Parquet attribute types of the further result columns
+PARQUET_ATTRIBUTE_TYPES = {str: 'string', float: 'float64', int: 'int64'}
+
+# Records read back from the spool and written as one Parquet row group
+PARQUET_SPOOL_ROWS = 10000
+
+# srs_id of a target CRS without an EPSG code, numbered like GDAL does
+USER_SRS_ID = 100000
+
+WGS84_DEFINITION = (
+    'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,'
+    'AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,'
+    'AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],'
+    'AXIS["Latitude",NORTH],AXIS["Longitude",EAST],AUTHORITY["EPSG","4326"]]')
+
+
+def sidecar_format(output_path):
+    """Returns the sidecar format of an output path ('csv', 'gpkg' or 'parquet'), or None."""
+    if not output_path:
+        return None
+    for suffix, name in SIDECAR_FORMATS.items():
+        if output_path.lower().endswith(suffix):
+            return name
+    return None
+
+
+class SidecarOutput:
+    """Streams the key and result columns of converted rows to a CSV, GeoPackage or Parquet file.
+
+    Rows without any result are left out. The source workbook is only read.
+
+    :param notes: Further result columns written alongside the geometries
+        (errors, repairs, measures), mapped to the type of their values.
+    :param order: Write the rows along a 'hilbert' or 'zorder' curve (see
+        ordering.ORDERS) instead of in sheet order: CSV and Parquet rows
+        through the centres in the CENTRE_INDEX results, each GeoPackage
+        layer through the centres of its own geometries. A row column keeps the row
+        number if the key is another column.
+    :param validated: The traces and shapes were validated (see validity),
+        so repairs may have turned them into other geometry types; their
+        GeoPackage layers then declare GEOMETRY.
+    """
+
+    needs_full_rows = False
+
+    def __init__(self, reader, output_path, columns, key_column=None, notes=None, transform=None, order=None,
+                 validated=False):
+        self.reader = reader
+        self.output_path = output_path
+        self.columns = columns
+        self.key_column = key_column
+        self.transform = transform
+        self.notes = dict(notes or {})
+        self.order = order
+        self.validated = validated
+        self.format = sidecar_format(output_path)
+        if self.format is None:
+            raise ValueError(f"Unsupported sidecar format: {output_path}")
+        self.extra_columns = ()
+        self.temp_path = None
+        self.writer = None
+
+    def write_header(self, headers, added):
+        self.names = {index: name for index, name in enumerate(headers, start=1) if name}
+        self.names.update(added)
+
+        key = self.key_column
+        if key is None and ODK_KEY_COLUMN in headers:
+            key = ODK_KEY_COLUMN
+        if key is not None:
+            if key not in headers:
+                raise KeyError(f"Key column '{key}' not found")
+            self.key_index = headers.index(key)
+            self.extra_columns = (self.key_index,)
+        else:
+            self.key_index = None
+        self.row_column = ROW_KEY_COLUMN if self.order and key is not None and key != ROW_KEY_COLUMN else None
+        self.fields = [key or ROW_KEY_COLUMN] + ([self.row_column] if self.row_column else [])
+        self.fields += [spec.target for spec in self.columns] + list(self.notes)
+
+        self.temp_path = _temp_path(self.output_path)
+        if self.format == 'csv':
+            self.writer = _CsvWriter(self.temp_path, self.fields, self.order)
+        elif self.format == 'parquet':
+            geometries = [spec.target for spec in self.columns]
+            self.writer = _ParquetWriter(self.temp_path, self.fields, geometries, self.notes,
+                                         key_type='string' if key else 'int64', order=self.order)
+        else:
+            geometries = {spec.target: GPKG_VALIDATED_TYPE if self.validated and spec.kind != 'point'
+                          else GPKG_GEOMETRY_TYPES[spec.kind] for spec in self.columns}
+            self.writer = _GeoPackageWriter(self.temp_path, self.fields, geometries,
+                                            self.notes, key_type='TEXT' if key else 'INTEGER',
+                                            transform=self.transform, order=self.order)
+
+    def write_chunk(self, start, rows, results):
+        records = {}
+        for index, pairs in results.items():
+            if index == CENTRE_INDEX:
+                continue
+            name = self.names[index]
+            for row_index, value in pairs:
+                if value is not None:
+                    records.setdefault(row_index, {})[name] = value
+        if not records:
+            return
+        key = self.fields[0]
+        for row_index, record in records.items():
+            if self.key_index is None:
+                record[key] = row_index
+            else:
+                row = rows[row_index - start]
+                value = row[self.key_index] if self.key_index < len(row) else None
+                record[key] = str(value) if value is not None else None
+            if self.row_column is not None:
+                record[self.row_column] = row_index
+        if self.order:
+            for row_index, centre in results.get(CENTRE_INDEX, ()):
+                if row_index in records:
+                    records[row_index][CENTRE_RESULT] = centre
+        self.writer.write([records[row_index] for row_index in sorted(records)])
+
+    def close(self):
+        self.writer.close()
+        self.reader.close()
+        _replace(self.temp_path, self.output_path)
+
+    def abort(self):
+        if self.writer is not None:
+            try:
+                self.writer.discard()
+            except Exception:
+                pass
+        self.reader.close()
+        if self.temp_path is not None:
+            _discard(self.temp_path)
+
+
+class _CsvWriter:
+    """CSV writer; with an order the records are spooled and written at close."""
+
+    def __init__(self, file_path, fields, order=None):
+        self.fields = fields
+        self.handle = open(file_path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.handle)
+        self.writer.writerow(fields)
+        self.spool = SpatialSpool(file_path + '.spool', order) if order else None
+
+    def write(self, records):
+        if self.spool is None:
+            self.writer.writerows([record.get(field) for field in self.fields] for record in records)
+        else:
+            self.spool.add([(record.get(CENTRE_RESULT),
+                             json.dumps([record.get(field) for field in self.fields])) for record in records])
+
+    def close(self):
+        try:
+            if self.spool is not None:
+                self.writer.writerows(json.loads(values) for values in self.spool)
+        finally:
+            if self.spool is not None:
+                self.spool.close()
+            self.handle.close()
+
+    def discard(self):
+        if self.spool is not None:
+            self.spool.close()
+        self.handle.close()
+
+
+class _ParquetWriter:
+    """Parquet writer, one row group per chunk; with an order the records are spooled and written at close."""
+
+    def __init__(self, file_path, fields, geometries, notes, key_type, order=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("Writing Parquet needs pyarrow") from e
+
+        self.pa = pyarrow
+        self.fields = fields
+        # Key (and row) columns, geometry text, then the further result columns
+        types = {name: pyarrow.int64() for name in fields[1:] if name not in geometries and name not in notes}
+        types[fields[0]] = getattr(pyarrow, key_type)()
+        types.update((name, getattr(pyarrow, PARQUET_ATTRIBUTE_TYPES[kind])()) for name, kind in notes.items())
+        self.schema = pyarrow.schema([pyarrow.field(name, types.get(name, pyarrow.string())) for name in fields])
+        self.writer = pyarrow.parquet.ParquetWriter(file_path, self.schema)
+        self.spool = SpatialSpool(file_path + '.spool', order) if order else None
+
+    def write(self, records):
+        if self.spool is None:
+            self._write_rows([[record.get(field) for field in self.fields] for record in records])
+        else:
+            self.spool.add([(record.get(CENTRE_RESULT),
+                             json.dumps([record.get(field) for field in self.fields])) for record in records])
+
+    def _write_rows(self, rows):
+        columns = [self.pa.array(values, type=field.type) for values, field in zip(zip(*rows), self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+
+    def close(self):
+        try:
+            if self.spool is not None:
+                rows = []
+                for values in self.spool:
+                    rows.append(json.loads(values))
+                    if len(rows) == PARQUET_SPOOL_ROWS:
+                        self._write_rows(rows)
+                        rows = []
+                if rows:
+                    self._write_rows(rows)
+        finally:
+            if self.spool is not None:
+                self.spool.close()
+            self.writer.close()
+
+    def discard(self):
+        if self.spool is not None:
+            self.spool.close()
+        self.writer.close()
+
+
+class _GeoPackageWriter:
+    """Minimal GeoPackage 1.2 writer: one feature table per geometry column.
+
+    Geometries are in EPSG:4326, or in the target CRS of a CoordinateTransform,
+    and come as WKB bytes (see encodings.BINARY_ENCODINGS); geometries maps
+    each table to its geometry type name.
+    """
+
+    def __init__(self, file_path, fields, geometries, notes, key_type, transform=None, order=None):
+        # Key (and row) attributes come first, the further result columns after them
+        self.keys = [name for name in fields if name not in geometries and name not in notes]
+        self.geometries = geometries
+        self.notes = notes
+        self.transform = transform
+        self.order = order
+        self.srs_id = WGS84_SRID if transform is None else transform.srid or USER_SRS_ID
+        self.connection = sqlite3.connect(file_path)
+        # The file is renamed into place only once complete
+        self.connection.execute('PRAGMA journal_mode = OFF')
+        self.connection.execute('PRAGMA synchronous = OFF')
+        self.connection.execute('PRAGMA application_id = 1196444487')  # 'GPKG'
+        self.connection.execute('PRAGMA user_version = 10200')
+        self._create_metadata()
+        self.attributes = [f'{_quote(self.keys[0])} {key_type}']
+        self.attributes.extend(f'{_quote(name)} INTEGER' for name in self.keys[1:])
+        self.attributes.extend(f'{_quote(name)} {GPKG_ATTRIBUTE_TYPES[kind]}' for name, kind in notes.items())
+        self.bounds = {}
+        # Envelope centres of the features of each table, in fid order, for the order
+        self.centres = {}
+        for table, geometry_type in geometries.items():
+            self._create_table(table, geometry_type)
+            self.connection.execute(
+                "INSERT INTO gpkg_contents (table_name, data_type, identifier, srs_id) "
+                "VALUES (?, 'features', ?, ?)", (table, table, self.srs_id))
+            self.connection.execute(
+                "INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', ?, ?, 0, 0)",
+                (table, geometry_type, self.srs_id))
+            self.bounds[table] = None
+            self.centres[table] = (array('d'), array('d'))
+
+    def _create_table(self, table, geometry_type):
+        self.connection.execute(
+            f'CREATE TABLE {_quote(table)} (fid INTEGER PRIMARY KEY AUTOINCREMENT, '
+            f'{", ".join(self.attributes)}, geom {geometry_type})')
+
+    def _create_metadata(self):
+        self.connection.executescript('''
+            CREATE TABLE gpkg_spatial_ref_sys (
+                srs_name TEXT NOT NULL, srs_id INTEGER PRIMARY KEY, organization TEXT NOT NULL,
+                organization_coordsys_id INTEGER NOT NULL, definition TEXT NOT NULL, description TEXT);
+            CREATE TABLE gpkg_contents (
+                table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL,
+                identifier TEXT UNIQUE, description TEXT DEFAULT '',
+                last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+                min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE,
+                srs_id INTEGER REFERENCES gpkg_spatial_ref_sys(srs_id));
+            CREATE TABLE gpkg_geometry_columns (
+                table_name TEXT NOT NULL, column_name TEXT NOT NULL, geometry_type_name TEXT NOT NULL,
+                srs_id INTEGER NOT NULL, z TINYINT NOT NULL, m TINYINT NOT NULL,
+                CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name));
+        ''')
+        self.connection.executemany('INSERT INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, ?)', [
+            ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined', None),
+            ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined', None),
+            ('WGS 84 geodetic', 4326, 'EPSG', 4326, WGS84_DEFINITION, None),
+        ])
+        if self.srs_id != WGS84_SRID:
+            transform = self.transform
+            organization = 'EPSG' if transform.srid else 'NONE'
+            self.connection.execute('INSERT INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, ?)', (
+                transform.name, self.srs_id, organization, self.srs_id, transform.wkt, None))
+
+    def write(self, records):
+        for table in self.geometries:
+            rows = []
+            bounds = self.bounds[table]
+            centres_x, centres_y = self.centres[table]
+            values = [record.get(table) for record in records]
+            # One vectorized pass gives the envelopes of the chunk's WKB
+            envelopes = wkb_extents(values)[0].tolist() if any(value is not None for value in values) else None
+            for position, record in enumerate(records):
+                value = values[position]
+                notes = [record.get(name) for name in self.notes]
+                if value is None and all(note is None for note in notes):
+                    continue
+                blob = None
+                centre = (math.nan, math.nan)
+                if value is not None:
+                    envelope = envelopes[position]
+                    centre = ((envelope[0] + envelope[2]) / 2, (envelope[1] + envelope[3]) / 2)
+                    blob = _gpkg_blob(value, envelope, self.srs_id)
+                    bounds = envelope if bounds is None else (
+                        min(bounds[0], envelope[0]), min(bounds[1], envelope[1]),
+                        max(bounds[2], envelope[2]), max(bounds[3], envelope[3]))
+                rows.append([record.get(name) for name in self.keys] + notes + [blob])
+                if self.order:
+                    centres_x.append(centre[0])
+                    centres_y.append(centre[1])
+            self.bounds[table] = bounds
+            if rows:
+                names = [_quote(name) for name in self.keys + list(self.notes)] + ['geom']
+                self.connection.executemany(
+                    f'INSERT INTO {_quote(table)} ({", ".join(names)}) '
+                    f'VALUES ({", ".join("?" * len(names))})', rows)
+
+    def close(self):
+        for table, bounds in self.bounds.items():
+            if bounds is not None:
+                self.connection.execute(
+                    'UPDATE gpkg_contents SET min_x = ?, min_y = ?, max_x = ?, max_y = ? WHERE table_name = ?',
+                    (*bounds, table))
+            if self.order:
+                self._sort_table(table)
+        self.connection.commit()
+        self.connection.close()
+
+    def discard(self):
+        self.connection.close()
+
+    def _sort_table(self, table):
+        """Rewrites a feature table along the curve, renumbering the fids in that order."""
+        rank_table(self.connection, *self.centres[table], self.order)
+        sorted_table = table + '_sorted'
+        self._create_table(sorted_table, self.geometries[table])
+        names = ', '.join([_quote(name) for name in self.keys + list(self.notes)] + ['geom'])
+        self.connection.execute(
+            f'INSERT INTO {_quote(sorted_table)} ({names}) SELECT {names} FROM temp.curve_order '
+            f'JOIN {_quote(table)} ON {_quote(table)}.fid = curve_order.id ORDER BY rank')
+        self.connection.execute(f'DROP TABLE {_quote(table)}')
+        self.connection.execute(f'ALTER TABLE {_quote(sorted_table)} RENAME TO {_quote(table)}')
+
+
+def _gpkg_blob(wkb_bytes, bounds, srs_id=WGS84_SRID):
+    """Wraps little endian WKB in a GeoPackage geometry header with an XY envelope."""
+    min_x, min_y, max_x, max_y = bounds
+    # Flags: little endian (bit 0), envelope [minx, maxx, miny, maxy] (bits 1-3 = 1)
+    header = struct.pack('<2sBBi4d', b'GP', 0, 0b00000011, srs_id, min_x, max_x, min_y, max_y)
+    return header + wkb_bytes
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
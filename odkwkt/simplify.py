@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Simplified geometry columns
+                                 A QGIS plugin
+ Adds lighter copies of the converted traces and shapes, simplified at a
+ few tolerances, so that rule-based styles can draw the coarse ones at
+ regional scales (e.g. with a geom_from_wkt geometry generator) while the
+ full-resolution column stays for analysis.
+
+ Every tolerance runs on the whole NumPy array of geometries of a column
+ chunk with Shapely's vectorized simplify (Douglas-Peucker). Only the
+ shapes that this leaves invalid or empty are simplified again preserving
+ topology, which is about ten times slower. Each coarser tolerance
+ simplifies the previous result, so the vertices of a coarse geometry are a
+ subset of those of the finer ones, and the later passes only see what is
+ left.
+ ***************************************************************************/
+"""
+
+from .encodings import WGS84_SRID, encode_geometries
+
+# ODK geometry kinds with vertices to drop
+SIMPLIFIED_KINDS = ('trace', 'shape')
+
+
+def simplified_fields(kind, tolerances):
+    """Returns the (tolerance, field) pairs of the simplified columns of an ODK kind, finest first.
+
+    :param kind: ODK geometry kind; None checks the tolerances only.
+    """
+    fields = {}
+    for tolerance in sorted(set(tolerances)):
+        if not tolerance > 0:
+            raise ValueError(f"Simplification tolerance must be positive: {tolerance}")
+        name = f'simplified_{tolerance:g}'
+        if name in fields:
+            raise ValueError(f"Simplification tolerances {fields[name]} and {tolerance} both name a {name} column")
+        fields[name] = tolerance
+    if kind not in SIMPLIFIED_KINDS:
+        return []
+    return [(tolerance, name) for name, tolerance in fields.items()]
+
+
+def simplify_column(geometries, kind, tolerances, encoding='wkt', precision=None, srid=WGS84_SRID):
+    """Simplifies (row_index, geometry) pairs at each tolerance; returns {field: [(row_index, value), ...]}.
+
+    :param tolerances: In the units of the coordinates.
+    :param encoding: Encoding of the values, that of the result column (see
+        encodings.ENCODINGS).
+    :param precision: GeoJSON only, number of decimals coordinates are
+        rounded to.
+    :param srid: EWKB only, SRID of the coordinates.
+    """
+    fields = simplified_fields(kind, tolerances)
+    if not fields or not geometries:
+        return {}
+    import numpy
+    import shapely
+
+    rows = [row_index for row_index, _ in geometries]
+    simplified = numpy.empty(len(geometries), dtype=object)
+    simplified[:] = [geometry for _, geometry in geometries]
+    columns = {}
+    for tolerance, name in fields:
+        finer = simplified
+        simplified = shapely.simplify(finer, tolerance, preserve_topology=False)
+        if kind == 'shape':
+            broken = numpy.flatnonzero(~shapely.is_valid(simplified) | shapely.is_empty(simplified))
+            if len(broken):
+                simplified[broken] = shapely.simplify(finer[broken], tolerance, preserve_topology=True)
+        if encoding == 'wkt':
+            columns[name] = list(zip(rows, shapely.to_wkt(simplified, rounding_precision=-1).tolist()))
+        else:
+            columns[name] = encode_geometries(list(zip(rows, simplified.tolist())), encoding, precision, srid)
+    return columns
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ Geometry validity
+                                 A QGIS plugin
+ Checks the geometries of a column chunk for validity in bulk and repairs
+ the invalid ones. Geoshapes drawn in the field often cross themselves or
+ collapse to fewer than 3 distinct vertices.
+
+ Every step runs on a whole NumPy array of geometries with Shapely's
+ vectorized functions: is_valid first, so the common all-valid chunk costs
+ a single GEOS pass, then is_valid_reason and make_valid on the invalid
+ geometries only. Polygon rings are oriented like RFC 7946 asks (exterior
+ counter-clockwise, holes clockwise).
+ ***************************************************************************/
+"""
+
+from .errors import RowError
+
+# Lowest dimension of a repaired geometry; what collapses below it fails its row
+_DIMENSIONS = {'trace': 1, 'shape': 2}
+
+
+def validate_geometries(geometries, kind, column=None, errors=None):
+    """Repairs invalid (row_index, geometry) pairs; returns (geometries, repairs).
+
+    Invalid polygons are rebuilt with make_valid's 'structure' method, which
+    keeps them polygonal (a bow tie becomes a MultiPolygon), lines with its
+    'linework' method. Geometries that collapse to a lower dimension (a
+    shape with fewer than 3 distinct vertices, a trace standing still)
+    cannot be repaired: they raise ValueError naming their row, unless an
+    errors list is given, in which case a RowError is appended and the
+    geometry left out, like unparsable cells (see engine.parse_column).
+
+    :param kind: ODK geometry kind; points are returned as they are.
+    :param column: Source column named in the repairs and errors.
+    :returns: The repaired geometries and a RowError per repaired geometry,
+        holding the validity reason and, as its token, where it occurs.
+    """
+    if kind == 'point' or not geometries:
+        return geometries, []
+    import numpy
+    import shapely
+
+    rows = numpy.array([row_index for row_index, _ in geometries], dtype=numpy.int64)
+    array = numpy.empty(len(geometries), dtype=object)
+    array[:] = [geometry for _, geometry in geometries]
+    invalid = numpy.flatnonzero(~shapely.is_valid(array))
+    repairs = []
+    if len(invalid):
+        reasons = shapely.is_valid_reason(array[invalid])
+        array[invalid] = _make_valid(shapely, array[invalid], kind)
+        repaired = array[invalid]
+        collapsed = shapely.is_empty(repaired) | (shapely.get_dimensions(repaired) < _DIMENSIONS[kind])
+        for row_index, text, failed in zip(rows[invalid].tolist(), reasons.tolist(), collapsed.tolist()):
+            reason, _, location = text.partition('[')
+            if not failed:
+                repairs.append(RowError(row_index, column, location.rstrip(']'), reason))
+                continue
+            error = RowError(row_index, column, location.rstrip(']'), f"{reason}, collapses when repaired")
+            if errors is None:
+                raise ValueError(str(error))
+            errors.append(error)
+        collapsed = invalid[collapsed]
+        if len(collapsed):
+            rows = numpy.delete(rows, collapsed)
+            array = numpy.delete(array, collapsed)
+    if kind == 'shape':
+        array = _orient(shapely, array)
+    return list(zip(rows.tolist(), array.tolist())), repairs
+
+
+def _make_valid(shapely, array, kind):
+    if kind == 'shape':
+        try:
+            return shapely.make_valid(array, method='structure', keep_collapsed=False)
+        except TypeError:
+            pass  # Shapely < 2.1 only knows the linework method
+    return shapely.make_valid(array)
+
+
+def _orient(shapely, array):
+    if hasattr(shapely, 'orient_polygons'):
+        return shapely.orient_polygons(array, exterior_cw=False)
+    # GEOS normalizes exteriors clockwise and holes counter-clockwise
+    return shapely.reverse(shapely.normalize(array))
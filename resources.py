@@ -2,1443 +2,271 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.13)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x59\x40\
+\x00\x00\x0f\xf4\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x77\x78\x5c\xe5\x95\x3f\xf0\xef\xb9\xd3\
-\xd4\x9b\x25\xb9\x57\x8c\x89\x31\x36\x04\x0c\x18\x63\x6c\xcb\x40\
-\x4c\x33\x09\xbd\x83\x81\x85\x14\x42\x2a\xd9\xec\x26\x24\xeb\x24\
-\xbf\xcd\xa6\x6e\xc2\xa6\x40\x9c\x10\x4c\x0d\x60\x08\xdd\x06\x6c\
-\x23\x77\x4c\xaf\xa6\xb8\x20\xcb\xb2\xdc\x24\xab\x8f\xa4\xd1\xcc\
-\xdc\xf3\xfb\x43\x40\x30\xb8\x5b\xba\xe7\xce\xcc\xf7\xf3\x3c\x7a\
-\xc8\x13\x82\xce\x97\x48\x9e\xf7\xdc\xf7\xbe\x05\x20\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\xb2\x24\xd6\x01\x88\x7a\x83\x2e\xfb\x6a\x31\x34\x7a\
-\x28\x82\x81\x6c\xc4\x13\xb9\x70\xdd\x92\xee\xbf\x91\x2c\x03\xdc\
-\x10\x04\x61\xb8\xf1\x12\x68\xa0\x0d\x4e\x64\x2b\x72\x42\xaf\xca\
-\x84\x39\xab\x8c\x63\x13\x11\x79\x86\x0d\x00\xa5\x0c\x5d\xf9\xed\
-\x6c\xb8\xad\xe3\x91\x88\x1e\x8b\x64\xe7\x11\x1a\x6f\x1f\xa6\xc9\
-\x78\x89\x68\x67\x21\x92\xb1\x3c\x24\x3b\x73\x90\x68\x0b\xa3\x2b\
-\x1a\x84\x1b\xdb\xff\x02\xe1\x22\x17\xb9\x43\x6a\x25\x7f\xc8\xfd\
-\xc8\x1b\xf2\xdf\x32\xfe\x97\xcd\x3d\xff\x6f\x41\x44\xe4\x0f\x6c\
-\x00\xc8\x57\xb4\x72\x56\x16\x82\x1b\x4e\x45\xbc\xf5\x14\x24\xda\
-\x8f\x70\xe3\xd1\xc1\x88\xb7\x96\x49\x57\x73\x1e\x62\x8d\x41\x68\
-\xc2\x9b\x20\x59\x25\x49\x29\x3e\xe6\x51\xe4\x8f\xbb\x46\x26\xcc\
-\x6a\xf1\xa6\x28\x11\x91\x77\xd8\x00\x90\x19\xad\x9c\x39\x0c\x1a\
-\x3b\x03\xda\x39\x45\x63\xcd\x87\xa3\xab\x6e\x08\xa2\x9b\x0b\x90\
-\xec\xb2\x8e\xf6\x2f\xb9\x83\xba\xa4\xef\x09\x5f\x93\x49\x7f\xbf\
-\xdd\x3a\x0a\x11\x51\x4f\x62\x03\x40\x9e\xd0\xb5\x37\x46\xb0\xa5\
-\xf9\x02\xc4\x9a\xce\xd1\xce\x1d\xc7\xa2\x7d\xd3\x00\xc4\x1a\x02\
-\xd6\xb9\xf6\x89\x13\x86\x0c\x3a\xfd\xcf\x32\xf5\x9e\x1b\xac\xa3\
-\x10\x11\xf5\x14\x36\x00\xd4\x2b\xf4\xe5\x6f\xf5\x47\xdb\xf6\xab\
-\x35\xd6\x38\x1d\x9d\xdb\xc6\x22\x5a\x53\x84\x44\x67\xea\xfe\xbe\
-\x89\x03\x19\x78\xfa\x83\x32\xed\xfe\x8b\xac\xa3\x10\x11\xf5\x84\
-\xd4\xfd\x40\x26\xdf\xd1\x95\x57\x4f\x41\x5b\xdd\x37\xb5\x7d\xcb\
-\x14\xb4\x55\x95\xc0\x8d\x5b\x47\xea\x59\xe2\x40\x86\xce\xf8\x9d\
-\x4c\xbe\xe7\x3b\xd6\x51\x88\x88\x0e\x16\x1b\x00\x3a\x60\xba\xf4\
-\xc6\x32\xe8\x8e\x2f\x6b\x74\xeb\x45\x68\x5d\x3f\x3a\x65\xa6\xf4\
-\x0f\x46\x28\x47\x65\xf8\x79\x93\x65\xc2\x9f\x97\x5b\x47\x21\x22\
-\x3a\x18\x6c\x00\x68\xbf\xe8\xaa\x2f\x1f\x8a\xb6\xba\x9b\xb5\xbd\
-\xfa\x2c\x34\x7f\x50\xe2\xd9\xaa\x7c\x3f\x29\x19\x57\x2f\x67\x2e\
-\x2f\x17\x11\xb5\x8e\x42\x44\x74\xa0\xd8\x00\xd0\x5e\xe9\xf2\x59\
-\x03\xd0\xf5\xce\x0f\xb4\xad\xea\x7c\x34\xaf\xeb\x9b\x91\x83\xfe\
-\xa7\xc8\xd0\xf3\xbf\x27\x53\xee\xf8\x8d\x75\x0e\x22\xa2\x03\xc5\
-\x06\x80\x76\x49\x5f\xbd\xb1\x0c\x4d\x5b\x7f\xe2\xb6\xd5\x9c\x2b\
-\x2d\x6b\xfb\xc2\xf5\xd1\xd6\x3c\x3f\x28\x3a\xbc\xc1\x39\xfb\x85\
-\x3e\xd6\x31\x88\x88\x0e\x14\x1b\x00\xda\x89\xae\xf8\xb7\xf3\xdd\
-\xd6\x8d\xff\x21\x8d\x6f\x1d\x8d\x78\x1b\x7f\x3f\x76\x47\x04\x32\
-\xea\x92\x89\x72\xfc\x5f\x9e\xb7\x8e\x42\x44\x74\x20\x82\xd6\x01\
-\xc8\x9e\x2e\xfd\x41\x7f\xc4\xdf\xfd\x95\xb6\xac\x3b\x47\xd7\x3f\
-\x90\xcb\x51\x7f\x1f\xa8\x02\x2d\x75\xdf\x05\x70\xbe\x75\x14\x22\
-\xa2\x03\xc1\x06\x20\x83\x69\xe5\x95\x97\xbb\x1d\x35\x37\xeb\xa6\
-\xbf\x8d\x42\xa2\x83\xe3\xfe\x7e\xd2\xae\xba\xf1\xd6\x19\x88\x88\
-\x0e\x14\x1b\x80\x0c\xa3\x7a\x41\x00\x4b\x82\x3f\xd6\xa6\xf7\xbf\
-\xa1\x35\x8f\x14\x71\xd4\x3f\x08\x9d\x75\xfd\xac\x23\x10\x11\x1d\
-\x28\x36\x00\x19\x42\x97\x5f\x93\x8f\xce\xa6\xdf\xe8\xc3\x6f\x5e\
-\x85\xf6\xcd\x11\xeb\x3c\x69\x21\xde\x12\xb6\x8e\x40\x44\x74\xa0\
-\xd8\x00\xa4\x39\x7d\xe1\x86\x51\xda\x5c\x75\xab\x6e\x7a\x76\x2a\
-\xba\x9a\x1d\xeb\x3c\x69\x25\xd1\x29\xaa\x2a\x3c\x0f\x80\x88\x52\
-\x11\x1b\x80\x34\xa5\x2b\xbf\x36\x52\x9b\xd7\xdf\xe5\xae\x7d\xe0\
-\x04\x71\x63\xd6\x71\xd2\x93\x13\x50\x0e\xfe\x44\x94\xaa\xd8\x00\
-\xa4\x19\x7d\xf1\x3b\x83\xb5\x79\xdd\x9d\x5a\xfd\xf0\x54\xc4\xdb\
-\x85\xef\xf8\x7b\x51\x30\x3f\x09\xd4\x59\xa7\x20\x22\x3a\x20\x6c\
-\x00\xd2\x84\xbe\x71\x53\x39\xea\xd6\xfe\xcd\x5d\xff\xe0\x59\x12\
-\x6f\xe6\xb8\xef\x85\x48\x71\x93\x75\x04\x22\xa2\x03\xc5\x06\x20\
-\xc5\xe9\xcb\xdf\x2f\x44\xd3\xbb\xf7\xe8\x3b\xff\x38\x03\xf1\x16\
-\x87\x23\xbf\x77\xdc\x48\xe9\xbb\xd6\x19\x88\x88\x0e\x14\x1b\x80\
-\x14\xa6\x95\xe7\xff\x4c\x3f\x78\xe8\xfb\xe8\xdc\x1e\xb2\xce\x92\
-\x89\x02\x91\x92\x7b\xad\x33\x10\x11\x1d\x28\x36\x00\x29\x48\x97\
-\x7f\xf9\x5c\x6d\x78\xed\xaf\x5a\xf3\x4c\x89\x75\x96\x8c\x95\x5d\
-\x9e\xc0\xd4\xc3\xfe\x6a\x1d\x83\x88\xe8\x40\xb1\x01\x48\x21\xba\
-\xec\xba\x51\x6e\xeb\x9a\xb9\x5a\xf5\xc0\x38\x68\xd2\x3a\x4e\x46\
-\x93\xa2\xc3\x1f\x17\x99\xe5\x5a\xe7\x20\x22\x3a\x50\x6c\x00\x52\
-\x80\x56\xce\xca\x42\xe2\x8d\x07\xb4\xe6\x89\x19\x92\x88\xf2\x35\
-\xbf\xb5\x48\x49\x12\xe8\x7f\x8d\x75\x0c\x22\xa2\x83\xc1\x06\xc0\
-\xe7\x74\xe9\x95\xe7\x6b\xdd\x43\x73\x10\xad\xce\xb5\xce\x42\xdd\
-\xa4\x6c\xfc\x6d\x32\x6d\x76\xb3\x75\x0e\x22\xa2\x83\xc1\xa7\x49\
-\x9f\xd2\x55\xb3\x0a\xb4\xf5\xd5\xc7\xb1\x75\xd9\x14\x68\xc2\x3a\
-\x0e\x7d\x48\xf3\x47\xb4\x38\x5f\x3a\xa7\x98\xd3\xff\x44\x94\xea\
-\x38\x03\xe0\x43\xba\xf8\xb2\xaf\x69\xcd\x7d\xbf\x43\xc7\x16\x9e\
-\x35\xef\x27\x12\x80\xd3\xe7\x88\x6b\x39\xf8\x13\x51\x3a\xe0\x0c\
-\x80\x8f\xe8\xca\x1f\x0e\xd4\xb6\xd7\xe7\x63\xdb\xb2\xb1\x50\x9e\
-\x30\xeb\x37\x5a\x3e\xe1\x95\xc0\x69\x0b\x78\x05\x30\x11\xa5\x05\
-\xce\x00\xf8\x84\x2e\xbf\xfa\xeb\x5a\x7b\xff\xef\xd0\xb1\x9d\x3f\
-\x13\x3f\x0a\x17\xba\x4e\x64\xe8\x97\xac\x63\x10\x11\xf5\x14\x0e\
-\x36\xc6\x74\xe5\xb7\xb3\x93\xcd\xef\xce\xd7\xaa\x7f\x4e\x81\x72\
-\x66\xd9\xaf\xa4\xfc\xf8\x5b\xa5\xe2\x6f\x9b\xac\x73\x10\x11\xf5\
-\x14\x5e\x0f\x6b\x48\x97\x7d\xf5\x14\x77\xfb\x73\x75\x4e\xdd\x0a\
-\x0e\xfe\x3e\xa6\xf9\x23\x5a\x50\x31\xf6\x1b\xd6\x39\x88\x88\x7a\
-\x12\x67\x00\x8c\xe8\xc2\x73\xff\xa2\x35\x0f\x5d\x27\x89\x4e\xae\
-\xc3\xf0\x33\x2e\xfc\x23\xa2\x34\xc5\xc1\xc7\x63\xfa\xc2\xd7\x87\
-\x6b\xdd\xab\x2b\xd0\xf0\x56\x7f\xeb\x2c\xb4\x0f\xca\x26\xbc\xe2\
-\x9c\xce\x85\x7f\x44\x94\x7e\x38\x03\xe0\x21\x5d\x76\xdd\x39\xba\
-\xf1\xd9\x07\xd0\xb1\x85\x97\xf7\xa4\x82\x70\xa1\x2b\x59\x5c\xf8\
-\x47\x44\xe9\x89\x6b\x00\x3c\xa2\x8b\x2f\xfd\x5f\xad\x79\xec\x61\
-\x0e\xfe\xa9\x83\x0b\xff\x88\x28\x9d\xf1\x15\x40\x2f\xd3\x97\xaf\
-\xcf\xd1\xfa\x0d\x2b\xb1\x7d\xd5\x91\x00\xf7\xf6\x7f\x2c\x5c\xa4\
-\x9a\x37\x7c\xb3\x93\xd3\x77\xb9\xb6\x6f\x9e\x8c\x86\x37\xfd\xf5\
-\x4a\xa4\x60\x64\x93\x7c\xf1\xd5\x12\x11\xe1\x0f\x8d\x88\xd2\x12\
-\x5f\x01\xf4\x22\x5d\xf1\xb5\xa3\x74\xd3\xaa\x25\x68\x59\x5b\x60\
-\x9d\xc5\x9c\x13\x01\x0a\x46\xee\x90\xbc\x81\xcb\x11\xe8\x77\x1f\
-\x26\x4f\x79\xd8\x91\x0b\x93\xba\xfc\xaa\xb3\x51\xfb\xce\x45\xd6\
-\xf1\x76\x22\x41\x48\xe1\x91\x57\x73\xf0\x27\xa2\x74\xc6\x19\x80\
-\x5e\xa2\x4b\x66\x5e\xa3\x5b\x2b\x67\x23\xd6\x10\xb0\xce\x62\x26\
-\x5c\xa4\x9a\x3f\x72\x83\x93\x3f\xf0\x51\x04\x87\xfe\x56\x26\xfe\
-\x77\xed\x27\xff\xb6\xaa\x8a\xfb\xd8\xd1\x0d\xd2\xb2\xae\xc8\x2a\
-\xe2\x2e\x71\xe1\x1f\x11\x65\x00\xce\x00\xf4\x02\x7d\xee\xb2\x5f\
-\xe9\xa6\x27\xbf\x87\x64\xcc\x3a\x8a\xf7\xc2\x45\x8a\xa2\xc3\xde\
-\x93\x9c\xa1\x7f\x45\x72\xf0\xad\x4e\xc5\xac\xce\xdd\xfe\x6f\x9f\
-\x3b\xef\xff\x7c\x37\xf8\x47\x8a\x93\x92\x3f\xf8\x6c\xeb\x18\x44\
-\x44\xbd\x8d\x0d\x40\x0f\xd3\x45\xe7\x3c\xa0\xb5\x4f\x5d\x08\x4d\
-\x5a\x47\xf1\x4e\x20\x07\x28\xfe\xdc\x26\xc9\x1d\xf2\x10\x0a\x0e\
-\xf9\x89\x7c\x7e\x56\xd3\xde\xfe\x11\x5d\x7a\x7d\x7f\xdd\xf2\xf4\
-\x57\xbd\x88\xb7\x3f\xa4\xec\xd8\xdb\x64\xd2\xdf\x37\x5b\xe7\x20\
-\x22\xea\x6d\x6c\x00\x7a\x88\xae\x9e\x15\x76\x6b\x56\xbc\xa2\xb5\
-\x0b\x8f\xb0\xce\xe2\x99\x82\x91\x51\x29\x3c\x6c\x2e\x4a\xc7\xfe\
-\x87\x8c\xfd\xe1\xb6\xfd\xf9\x47\x35\xfa\xc1\xe3\x88\x35\xfa\xeb\
-\xf5\x48\xc1\xc8\x26\x54\x3c\x74\x23\xdf\x8c\x11\x51\x26\x60\x03\
-\xd0\x03\xf4\xe5\xef\x96\x6a\xd5\xc2\x37\xa4\xe1\x8d\x01\xd6\x59\
-\x7a\x9b\x06\x72\x20\xc5\x47\x7c\x20\x45\xa3\x7f\x29\x13\xff\x38\
-\x1b\x78\x0d\xc0\xfd\xfb\xf7\x3d\x96\x5f\x75\xb6\x56\x3d\xee\xaf\
-\x77\xec\x12\x80\x94\x1c\x7e\x1d\x17\xfe\x11\x51\xa6\xe0\xa3\xce\
-\x41\xd2\xa5\x5f\x1d\xa7\x3b\x96\x3d\x8f\xd6\xea\x1c\xeb\x2c\xbd\
-\x49\x73\x06\xc6\x9d\xe2\x23\x1e\x46\xee\xa8\x6f\xc9\x84\x9f\xef\
-\xd7\xd3\xfe\x4e\xdf\x47\x55\xf4\xb1\xa3\x1b\xe0\xb3\x77\xff\x5a\
-\x76\xfc\x2b\x81\xd3\x17\xfa\xab\x29\x21\x22\xea\x45\x9c\x01\x38\
-\x08\xba\xfc\xeb\xe3\x75\xeb\xc2\x15\x68\xaf\x0d\x5b\x67\xe9\x35\
-\x05\x23\xda\xa4\x78\xdc\xdf\x64\xf2\xa4\x7f\x17\xf9\x72\xfc\xa0\
-\xbf\x5f\xe5\x05\x7f\xf4\xdb\xe0\x8f\x70\xa1\xeb\x64\x0d\xe3\x89\
-\x7f\x44\x94\x51\x38\x03\x70\x80\x74\xc5\x57\xa6\x69\xed\xb3\xcf\
-\xa0\xb3\x2e\xfd\x9a\x28\x71\x80\xe2\x23\x6b\xa5\xe8\x73\x3f\x94\
-\x49\xb3\xef\xec\xa9\x6f\xab\x2f\x7f\xab\xbf\xae\x7b\xb8\x06\x5d\
-\x4d\xbe\x7a\xf7\x2f\x83\xbe\xf0\x27\x99\xf6\xf0\xd7\xad\x73\x10\
-\x11\x79\x29\xfd\x06\x2f\x0f\xe8\xd2\xab\xce\xd4\x4d\xf3\x1f\x4b\
-\xbb\x3d\xfe\x22\x40\xf1\xb8\x6d\x52\x38\xf6\x46\x39\xe9\xd6\xb9\
-\xc0\xd2\x1e\xfd\xf6\xc9\xfa\x77\x1f\x70\x7c\x36\xf8\x6b\xfe\x88\
-\x16\xa9\x18\xfb\x0d\xe0\x61\xeb\x28\x44\x44\x9e\x62\x03\xb0\x9f\
-\x74\xe5\xd5\x97\x68\xf5\x82\x7b\x10\x6f\x4e\x9f\x7b\x14\x44\xa0\
-\xc5\xe3\x36\x3b\x25\x63\xbf\x25\x13\x6f\x9d\x0b\x2c\xef\xf1\x12\
-\x5a\xf9\xb5\x7e\xba\x65\xee\xa4\x1e\xff\xc6\x07\x43\x82\x70\x8a\
-\x3e\x7f\x15\xaf\xfa\x25\xa2\x4c\xc4\x06\x60\x3f\xe8\xd2\xab\xff\
-\x4d\xab\x9f\x9e\x8d\x78\x5b\xfa\xbc\x3a\x29\x3a\xac\x49\x8a\x8f\
-\xfa\xa6\x73\xd2\xdf\xee\xea\x8d\x81\xff\x63\xf1\xea\x5f\x23\xd1\
-\xe9\xab\xff\xdf\xb4\xf4\x98\x57\x9c\x8a\x39\x8f\x5a\xe7\x20\x22\
-\xb2\xc0\x06\x60\x1f\xe9\xd2\xab\xff\x4d\x37\xcd\x9b\x8d\x44\xbb\
-\xaf\x06\xb1\x03\x96\x33\xb0\x4b\x4a\x8f\xfd\x2d\xa6\xdc\xf5\x43\
-\x2f\xb6\xbe\x69\xfb\xe6\xd3\x7a\xbb\xc6\x7e\x89\x14\x27\x9d\xfc\
-\x21\x3c\xf1\x8f\x88\x32\x56\x7a\x0c\x66\xbd\xac\x7b\xda\xff\xe9\
-\x7b\xd3\xe1\xc9\x5f\x43\x85\xea\xf4\x9d\x30\x17\x59\x83\x67\xca\
-\xc4\xdf\x75\x78\x52\x73\xde\xc8\x88\x36\x34\x76\xc2\xed\xf2\xa2\
-\xdc\x3e\xe1\xc2\x3f\x22\xca\x74\x9c\x01\xd8\x0b\x5d\xf6\xe5\x19\
-\x5a\xfd\xd4\x3d\x29\x3f\xf8\x8b\x40\x4b\x8f\x5b\xe3\x94\x8c\x9b\
-\x21\xc7\xff\xef\x1a\x4f\x6b\x87\x47\x9f\x0a\x77\xb1\xa7\x25\xf7\
-\x88\x27\xfe\x11\x11\xb1\x01\xd8\x13\x5d\xf2\xe5\xc9\xba\xf9\x99\
-\x47\x52\x7e\xc1\x5f\xde\xe0\x98\x94\x9d\xf0\x7d\xe7\xa4\xdb\x6f\
-\x01\x16\x7a\x5f\x3f\xd1\x79\xb8\xf7\x45\x77\x83\x27\xfe\x11\x11\
-\x01\x60\x03\xb0\x5b\xba\xe2\x9a\x13\xb4\x76\xc1\x22\xc4\x76\xf8\
-\x6a\xdb\xda\x7e\x71\xb2\x20\xfd\x26\x3f\x89\x9c\x21\x17\x7a\x35\
-\xdd\xbf\x4b\x89\x64\x89\x59\xed\x4f\xd1\xd2\xf1\xaf\x38\x93\xef\
-\x7d\xc8\x3a\x07\x11\x91\x35\x36\x00\xbb\xa0\x4b\xbf\x3a\xce\xdd\
-\xbc\x68\x89\xa4\xf2\x21\x3f\x85\xa3\x5a\xa4\xe4\xb8\xf3\xe4\xa4\
-\x5b\x0d\x1e\xf9\x3f\x25\x10\x0a\x59\x47\x00\xc0\x85\x7f\x44\x44\
-\x9f\x90\xba\x03\x5c\x2f\xd1\x37\x6e\x2a\xd7\xaa\x67\x57\x4a\xc7\
-\x16\x7f\x0c\x5a\xfb\x2b\x10\x86\x94\x9f\xb0\x10\xc5\x03\xce\x90\
-\xf1\xb7\x1e\xfc\xd1\xbd\x3d\x41\x93\x35\xd6\x11\x00\x5e\xf5\x4b\
-\x44\xf4\x49\x6c\x00\x3e\x41\x57\xcf\x0a\xeb\x07\xcf\xbc\x89\x96\
-\xaa\x5c\xeb\x2c\x07\xa4\xe0\xd0\x56\x29\x9b\x70\xbe\x9c\xf8\xe7\
-\x67\xad\xa3\xec\xa4\x7d\xf3\xf3\xd6\x11\xb8\xf0\x8f\x88\x68\x67\
-\x6c\x00\x3e\xc1\xad\x59\xf1\x8a\x34\xbe\xdd\xd7\x3a\xc7\x7e\x93\
-\x00\xd0\x6f\xd2\x72\x09\x8e\x3f\x55\x4e\x9c\xd5\x69\x1d\xe7\x33\
-\x76\xbc\xf3\x2a\x72\x4b\x14\x6e\xdc\x66\xf4\x95\x20\xa4\x64\xec\
-\x4c\x2e\xfc\x23\x22\xfa\x17\x3e\x0e\x7d\x48\x17\x5d\xf0\x88\xd6\
-\x3e\x9d\x72\x37\xc2\x69\xa4\x8f\xeb\xf4\x9f\xfa\x1f\x32\x79\xce\
-\xaf\xad\xb3\xec\x89\xfb\xc8\x11\xd5\x68\xad\x1e\x62\x52\xbb\xec\
-\xf8\x97\x83\xa7\x2f\x3c\xd6\xa2\x36\x11\x91\x5f\xa5\xf6\xf6\xb6\
-\x1e\xa2\x95\x17\xff\x42\x37\x3f\x9b\x7a\x83\x7f\xf1\xd8\x7a\xa7\
-\xff\x79\x63\xfd\x3e\xf8\x03\x80\x04\x0b\xee\xb7\xa8\xab\xe1\x62\
-\x37\x10\x1e\x99\x72\x3f\x5b\x22\xa2\xde\x96\xf1\x33\x00\xba\x64\
-\xe6\x35\xba\xe9\xc9\xdb\x91\x8c\x59\x47\xd9\x77\xe2\x00\xfd\xa6\
-\x2e\x92\x53\xc2\xd3\x45\xe6\x26\xad\xe3\xec\x0b\x7d\xec\xb0\x7c\
-\x6d\x6b\x68\x42\xb2\xd3\xd3\xa6\x93\x27\xfe\x11\x11\xed\x5a\x46\
-\xcf\x00\xe8\x92\x99\x63\x75\x6b\xe5\xec\x94\x1a\xfc\x43\x79\x2a\
-\x43\xbf\xf8\x33\xe7\xd4\xc7\x4e\x49\x95\xc1\x1f\x00\xe4\x8b\xef\
-\xb7\xa2\xf0\xb0\xc7\xbc\xac\xa9\xf9\x23\x5a\x50\x31\xf6\x1b\x5e\
-\xd6\x24\x22\x4a\x15\x19\xdb\x00\xe8\xcb\xd7\xe7\x68\xe3\x9b\xcb\
-\x11\x6b\x48\x9d\x83\x7e\x72\x07\xc5\x64\xf0\xd9\xd3\x65\xf2\x5d\
-\x3f\xb6\x8e\x72\x20\xc4\xd9\x3a\x53\x23\xc5\xde\x74\x5b\x4e\x18\
-\x4e\xe9\x91\x97\xf1\xaa\x5f\x22\xa2\x5d\xcb\xdc\x06\xa0\x7e\xc3\
-\x4a\xb4\xac\x2d\xb0\xce\xb1\xaf\xb4\x78\xdc\x56\x29\xb9\x68\x98\
-\x4c\xfa\xcb\x02\xeb\x2c\x07\x4a\xce\x58\xd7\xe2\xe4\x0f\xbb\x16\
-\xe8\xfd\x9e\x4b\xfa\x9e\xf0\xb0\x9c\x74\xd7\x93\xbd\x5e\x88\x88\
-\x28\x45\x65\x64\x03\xa0\x8b\x2f\xfa\x33\xb6\xaf\x3a\xd2\x3a\xc7\
-\x3e\x2b\x3f\xe1\x0d\x67\xc4\xa9\x43\xa5\x62\xd6\x56\xeb\x28\x07\
-\x4b\xce\x58\x7a\xaf\x94\x8c\xbd\xb5\x57\x8b\x94\x8c\x5b\x23\xa7\
-\x3e\x79\x7e\xaf\xd6\x20\x22\x4a\x71\x19\xb7\x08\x50\x97\x5d\x7b\
-\x81\x56\x3f\xfe\x20\x5c\xff\x6d\x97\xff\x0c\x71\x20\xfd\xa7\x3d\
-\x26\xa7\x3c\x92\x76\xab\xd8\xf5\xc9\x09\x77\x6b\xc3\xea\xcb\x7b\
-\xfc\xfb\x16\x1d\x5e\xe5\xe4\x67\x1f\x2e\x15\x8b\x53\xe0\x07\x4c\
-\x44\x64\x27\xa3\x66\x00\xf4\x85\xaf\x0f\xd7\xad\x4b\xee\x4d\x89\
-\xc1\x3f\x10\x81\x0c\x3e\xeb\x57\xe9\x38\xf8\x03\x80\x9c\xb5\xea\
-\x0a\x29\x3e\xf2\x27\x70\xc2\x3d\x74\x38\x8f\x00\xa5\xc7\x2c\x76\
-\xf2\xb3\x47\x71\xf0\x27\x22\xda\xbb\x8c\x99\x01\x50\x55\xd1\xa7\
-\x4e\xac\x45\xc3\x5b\xfd\xad\xb3\xec\x55\x28\x57\x65\xe0\x69\x5f\
-\x93\xc9\x73\x6e\xb3\x8e\xd2\xdb\xf4\xe1\x63\x8f\x55\x6d\x7d\x1c\
-\xed\xb5\xfd\x0e\xf8\x7b\x44\x4a\x3a\x9c\xa2\xc3\x6e\x94\xe9\xcf\
-\xde\xde\x93\xd9\x88\x88\xd2\x59\xe6\x34\x00\x8b\xce\xbb\x5b\x6b\
-\x9f\xed\xf1\x29\xe7\x1e\x17\x2e\x74\x65\xc8\xa9\x97\xcb\xc4\x3b\
-\xfe\x61\x1d\xc5\x4b\xfa\xe4\xc4\xaf\x69\xac\xe9\x66\x44\x6b\xf6\
-\xb9\x41\xd3\xdc\x41\x4d\x4e\xee\xc0\x7b\x50\xbd\xf0\x3b\xf2\x65\
-\xf8\xe3\xe2\x23\x22\xa2\x14\x91\x11\x0d\x80\x2e\xbf\xee\x74\xdd\
-\xf0\xc8\x3c\xb8\x3e\xdf\xef\x9f\xd5\x27\x29\x03\x4e\x9d\x21\x93\
-\xfe\x3a\xdf\x3a\x8a\x15\x7d\xe8\xc8\x31\xc8\xca\xff\x86\xc6\xdb\
-\x4f\x42\xa2\x79\x10\xe2\xd1\x6c\xa8\x3a\xea\x38\x2a\xe1\xfc\x56\
-\x84\x0a\xb6\x4a\x30\xef\x6d\x04\xe4\x17\x32\xbd\xf2\x15\xeb\xbc\
-\x44\x44\xa9\x2a\xed\x1b\x00\x7d\xe3\xa6\x5c\x5d\xff\xcc\x76\xb4\
-\x6d\xc8\xb1\xce\xb2\x47\xd9\xfd\xe3\x32\x68\x5a\x85\x9c\x70\xdb\
-\x0a\xeb\x28\x44\x44\x94\xfe\xd2\xfe\x36\xc0\xe4\xd6\xd5\x8b\x1c\
-\xbf\x0f\xfe\x59\x7d\x13\x32\xf8\xe4\xc9\x32\xe1\xd6\x55\xd6\x51\
-\x88\x88\x28\x33\xa4\xf5\x2e\x00\x5d\x3a\xf3\x5b\xce\xf6\x95\xc7\
-\x5b\xe7\xd8\xa3\x48\x49\x52\xfa\x9e\x7c\x32\x07\x7f\x22\x22\xf2\
-\x52\xda\xbe\x02\xd0\x15\x37\x0c\xd5\xda\xa7\xd6\xa3\x73\x87\x7f\
-\x8f\xfa\x8d\xf4\x49\xca\x90\xb3\x4e\x91\x13\xfe\xb8\xd8\x3a\x0a\
-\x11\x11\x65\x96\xb4\x9d\x01\xd0\x96\xf7\x9f\xf6\xf5\xe0\x1f\x2e\
-\x76\x65\xf0\x69\x67\x72\xf0\x27\x22\x22\x0b\x69\xb9\x06\x40\x97\
-\x5e\xf1\x2d\xad\x7e\xec\x73\xd6\x39\x76\x2b\x94\xa3\x32\xe8\xe4\
-\x4b\x65\xe2\x6d\xcf\x58\x47\xa1\xcc\xa3\x95\x53\x83\x08\x0c\x1f\
-\x05\x49\x1c\x02\x37\x3e\x04\x89\xf8\x60\x68\xbc\x3f\x5c\xe4\x00\
-\xf1\xdc\x64\x32\x51\x2c\x6e\x22\x4b\xe0\x46\x3e\xfc\x47\x44\xdd\
-\xae\x3c\xd3\xd0\x86\xc4\x09\xb7\x01\x50\x00\x50\x38\x31\x75\x82\
-\x9d\x81\x40\xb0\x11\x08\x45\x01\x27\x8a\x40\x60\x2b\x82\xa1\x1a\
-\x38\xa1\x8d\xd0\xe0\x7a\x24\xab\xd6\x48\xc5\xe2\x84\x71\x6c\xa2\
-\xbd\x4a\xbb\x57\x00\xba\xf2\xdb\x25\x5a\xfb\xe4\x56\x74\x6c\x0d\
-\x59\x67\xd9\x25\x27\x0c\x19\x7c\xc6\x4d\x32\xe5\xee\xdf\x5a\x47\
-\xa1\xf4\xa4\x95\x53\x83\x70\x86\x4e\x84\xdb\x31\x19\xf1\x8e\xcf\
-\xab\x1b\x1d\x8a\x44\x7b\x5f\x74\xb5\x15\x69\xac\x39\x47\xe2\xcd\
-\xce\x87\xe3\x19\xf5\x0a\x81\x86\x0a\x5d\x89\x14\xb6\x23\x9c\xd7\
-\xa4\x81\x9c\xed\x4e\x20\xa7\x1a\xc1\xbc\xd7\xe0\x84\x97\xa3\xac\
-\x63\x85\x8c\x99\xdb\x65\x9d\x92\x28\xed\x1a\x80\xc4\x33\xa7\xaf\
-\x72\xb6\x2d\xf7\xe7\xc2\x3f\x71\x20\x83\x4e\xbb\x45\x2a\x1e\xf8\
-\x96\x75\x14\x4a\x0f\xba\xe8\xda\xa1\x90\xe8\xb9\x48\xb6\x4c\x73\
-\x3b\x9b\xc6\x49\xac\xa1\x1c\x9d\xdb\xb3\xe0\xf2\x5c\x24\xdf\x72\
-\x42\x40\x56\x59\xa7\x46\x4a\xea\x9d\x48\xd1\x5b\x08\xe6\x2f\x86\
-\x66\x3f\x2c\x27\xdf\xb9\xde\x3a\x1a\x65\x96\xb4\x6a\x00\x74\xe5\
-\xd5\x97\xe8\xfa\x47\xef\x83\xfa\x73\xf6\x4d\x06\x9e\xfa\x88\x9c\
-\xfc\xcf\x73\xad\x73\x50\xea\xd2\x95\x57\x4f\x41\x5b\xd3\xe5\xda\
-\x55\x3f\x45\xa3\x9b\x87\x49\xac\x2e\xc4\xa7\xf9\x34\x11\x29\x8b\
-\x23\xb7\x7f\x8d\x84\xcb\x96\x21\x9c\x77\xaf\x4c\xbd\x27\x65\xaf\
-\xfe\xa6\xd4\x90\x36\x0d\x80\x56\xce\xca\xd2\xa6\x87\x76\xa0\xb5\
-\xda\x9f\x7b\xfe\xcb\x8e\x7f\xcb\x39\x7d\xe1\x38\xeb\x18\x94\x5a\
-\x74\xc5\x57\xca\xd1\x51\xff\x2d\x8d\xd5\x9d\x83\xb6\x0d\x87\x22\
-\xd6\xe0\xdf\x85\xad\xd4\xa3\x34\x54\xe4\xa2\x60\x68\x95\x13\xe9\
-\xf7\x28\x42\xf9\xb7\xc8\x94\x3b\x6a\xac\x33\x51\x7a\x49\x9f\x06\
-\x60\xc1\x39\x8f\xe9\x96\x85\x67\x5b\xe7\xd8\x15\x2d\xfc\x5c\xa3\
-\x53\x70\xe6\x00\xa9\x98\xc5\x5b\xea\x68\xaf\x74\xc9\x15\xc3\xd1\
-\xd5\xf2\x23\x37\xba\x69\x86\xb4\x6d\x28\x85\xcb\xd7\xc5\x19\x4f\
-\x82\x40\xfe\xb0\x46\xc9\x1d\xb0\x00\x91\xf2\x9f\xc8\xe4\x3b\xde\
-\xb1\x8e\x44\xa9\x2f\x2d\x1a\x00\x7d\xfe\x5b\xa3\xb5\xea\xfe\xd5\
-\x48\x44\xfd\xf7\xef\x93\xd5\x2f\x2e\x03\x4f\x1b\x2d\x27\xfe\x81\
-\xef\xf7\x68\xb7\x74\xde\x65\x05\x08\xb7\xff\x54\xdb\x6b\x2f\x42\
-\xcb\xba\x7e\x7c\x87\x4f\xbb\x25\x01\xa0\xe0\x90\x7a\xc9\x1e\xf2\
-\x28\x72\xfb\xfe\x50\x4e\xbc\x6d\xbb\x75\x24\x4a\x4d\xfe\x1b\x30\
-\x0f\x40\x72\xfe\xb4\x77\xa5\xee\x25\xff\x6d\xfb\x0b\x66\xab\xf4\
-\x3f\xe3\x5c\xa9\x98\xf3\xa8\x75\x14\xf2\x27\x5d\x3c\xf3\xd8\x64\
-\xc7\xd6\x5f\x3b\x4d\x6f\x9d\x84\x78\x4b\xda\x9e\xcb\x41\xbd\x24\
-\x98\xad\x28\x1c\xfd\x9e\xe4\x0d\xbc\x59\xa6\xdc\xf7\x4f\xeb\x38\
-\x94\x5a\x52\xbe\x01\xd0\xe5\xd7\x5c\xa8\x55\xff\x7c\x00\x9a\xb4\
-\x8e\xb2\x33\x11\xc8\xe0\xb3\x7e\x2e\x53\xef\xfb\xa1\x75\x14\xf2\
-\x1f\xad\xbc\xf8\x2b\xda\xba\x7e\x16\x9a\xdf\xef\x0b\xe5\x22\x3e\
-\xea\x01\x05\x23\x1b\xa5\xe0\xd0\x5f\xcb\xb4\x07\xff\xc7\x3a\x0a\
-\xa5\x86\x94\x6e\x00\x54\x55\xf4\xf1\xf1\x0d\x68\x5e\x53\x64\x9d\
-\xe5\xd3\xdc\xf2\x13\x5f\x0c\x9e\xf6\xb4\x3f\xb7\x23\x92\x19\xad\
-\xbc\xf0\x66\x6d\x5a\x73\x13\x5a\xd7\x17\x5a\x67\xa1\x34\x95\x37\
-\xb8\x5d\x8a\x47\xff\x19\xd8\xf1\x9f\x3c\x90\x88\xf6\x24\xb5\xa7\
-\x1c\x17\x5f\xfa\x6b\x3f\x0e\xfe\x28\x38\xb4\x25\x50\x30\x7a\xaa\
-\x75\x0c\xf2\x0f\x5d\x72\xd9\x55\xee\x23\x47\x35\x6a\xcd\xfc\x9f\
-\x71\xf0\xa7\x5e\xd5\x56\x93\xa3\x35\xcf\xde\xa4\xf5\x9b\xdb\x74\
-\xd1\x85\xb3\xac\xe3\x90\x7f\xa5\xec\x0c\x80\xbe\xfc\xfd\x42\xf7\
-\x83\x87\xea\xa5\x73\xbb\xbf\x8e\x33\x0e\x17\xb9\x32\xf4\xf4\x63\
-\xe5\x84\xd9\xaf\x5a\x47\x21\x7b\x5a\x79\xe5\x24\x8d\xae\xbb\x17\
-\x0d\x6f\x0f\xe1\x7e\x7d\xb2\xa0\x05\xa3\xea\x9d\x92\x51\xd7\xc9\
-\xe4\x7f\x70\x2d\x12\xed\x24\x75\x1b\x80\x85\x67\x3f\xa1\x9b\x2b\
-\xcf\xb2\xce\xb1\x13\x11\xc8\xd0\x2f\x7e\x5f\x26\xdf\xfd\x2b\xeb\
-\x28\x64\x4b\xab\x66\x66\x61\xdd\xf6\xb9\xee\xb6\x17\xcf\x12\x37\
-\x66\x1d\x87\x32\x9d\x04\xe1\x96\x8e\x5f\x15\x28\x1c\x72\xa6\x4c\
-\xbc\xbd\xc1\x3a\x0e\xf9\x43\x4a\x36\x00\xfa\xe2\xf7\xfa\xe9\xfa\
-\x7f\xd4\x22\xde\xec\xab\x57\x18\x5a\x3e\xf1\xd5\xc0\x69\xcf\x1c\
-\x63\x9d\x83\x6c\xe9\xe2\x4b\xaf\xd0\x1d\xaf\xfd\x05\xd1\x4d\xd9\
-\xd6\x59\x88\x76\x92\x55\x16\x97\xd2\xf1\x37\xcb\xb4\x07\xf9\x90\
-\x42\x29\xba\x06\xa0\xf1\x9d\xbb\xfd\x36\xf8\x23\xa7\x7f\xcc\xc9\
-\x1d\x71\x8a\x75\x0c\xb2\xa3\x3a\xcb\xd1\x67\xcf\xfa\xa7\xd6\xcc\
-\xbf\x8b\x83\x3f\xf9\x52\x67\x5d\x48\x37\x3d\xfd\xcb\xe4\x53\x15\
-\xaf\xeb\xbc\xcb\x0a\xac\xe3\x90\xad\x94\x9b\x01\xd0\x15\x37\x0c\
-\xd5\x8d\xff\xac\x42\xbc\xcd\x3f\xd9\x9d\x30\x64\xd8\x17\x2f\x92\
-\x49\x7f\x7f\xd0\x3a\x0a\xd9\xd0\xe7\xae\x3a\x46\x5b\xdf\x58\x80\
-\xe6\xf5\xc5\xd6\x59\x88\xf6\x85\xe6\x0e\xec\x70\x8a\x8f\x3e\x5f\
-\xa6\xdd\x37\xcf\x3a\x0b\xd9\xf0\xd7\x53\xf4\x3e\xd0\xb6\xf5\x77\
-\xfb\x6a\xf0\x07\x20\x7d\x27\xcd\xe3\xe0\x9f\xb9\x74\xf1\x65\xd7\
-\xe9\xb6\x45\x2f\x72\xf0\xa7\x54\x22\xd1\xda\x6c\xdd\xf2\xec\x93\
-\xba\xe8\xbc\x5f\x58\x67\x21\x1b\x29\xd5\x00\xe8\xca\xaf\x8d\x44\
-\xc3\xeb\x93\xac\x73\xec\x24\x77\x68\x14\xc5\x7d\xbf\x64\x1d\x83\
-\x6c\xe8\x73\x17\xfc\x45\x37\x3d\x3d\xdb\x77\xaf\xa4\x88\xf6\x45\
-\x32\x26\x5a\xbb\xe0\xfb\xee\x53\x15\x4b\x54\x67\xf1\x77\x38\xc3\
-\xa4\xd4\x0f\x3c\xd9\xb2\xfe\x1e\xc4\x7d\x74\xde\xbf\x04\x21\xfd\
-\x8e\xbb\x4a\xc6\xcf\xe6\xc1\xed\x19\x28\x31\xff\x0b\x2b\x74\xd3\
-\xd3\xd7\xf3\xb2\x1e\x4a\x6d\x0a\xec\x78\x79\xb2\xfb\xd4\x82\x75\
-\xfa\xc4\xf5\xfe\xbc\x4d\x95\x7a\x85\x7f\x06\xd3\xbd\xd0\x17\x6e\
-\x18\xe5\xae\x7d\xe0\x7d\x5f\x6d\xa9\xea\x7b\xd2\x0a\x67\xfa\x3c\
-\x7f\xcd\x48\x50\xaf\xd3\xca\xa9\x41\xb7\x03\xaf\x4b\xfd\x2b\x63\
-\xac\xb3\x10\xf5\x24\x2d\x1c\xbd\xcd\x29\x38\xfc\x73\x52\x31\xa7\
-\xc9\x3a\x0b\xf5\xbe\x94\x99\x01\xd0\xe6\xaa\x5b\x7d\x35\xf8\xe7\
-\xf4\xef\x92\x9c\xa1\x33\xac\x63\x90\xb7\x74\xf5\x05\x61\x8d\x76\
-\xad\xe5\xe0\x4f\xe9\x48\x9a\xdf\xed\xab\x2d\xaf\x7f\xa0\x4b\xaf\
-\xef\x6f\x9d\x85\x7a\x5f\x4a\x34\x00\x5a\xf9\xad\x22\x34\xbc\x35\
-\xd5\x3a\xc7\xbf\x08\xa4\xfc\xf8\xef\xcb\x49\xb7\x36\x5a\x27\x21\
-\xef\xa8\xce\x72\xdc\xaa\xad\xab\xd1\xf0\xd6\x30\xeb\x2c\x44\xbd\
-\xa6\x79\x7d\xb1\x36\xbe\xb8\x5a\x57\x5e\x5b\x62\x1d\x85\x7a\x57\
-\x4a\x34\x00\x70\xab\xff\x80\xae\x26\xff\x64\xed\x73\x64\xb5\x4c\
-\xbe\xfb\xf7\xd6\x31\xc8\x5b\xfa\xcc\xd2\x17\xa5\xe1\xf5\x91\xd6\
-\x39\x88\x7a\x5d\xf3\xfa\x62\xb7\xee\xad\x77\xb8\x26\x20\xbd\xf9\
-\x67\x50\xdd\x0d\xd5\x0b\x02\x6e\xe3\x3b\x17\x5a\xe7\xf8\x98\x13\
-\x81\x14\x1e\x76\xb1\x75\x0c\xf2\x56\xe2\xe9\xe9\x95\xd8\xfe\x12\
-\x4f\x79\xa4\x8c\x21\xcd\xef\xf6\x75\x65\xf5\xdb\xdc\x1d\x90\xbe\
-\xfc\xff\x83\x5d\x1c\x9a\x25\xed\x9b\xc3\xd6\x31\x3e\x56\x3e\xe1\
-\x39\x99\xf4\xb7\x55\xd6\x31\xc8\x3b\x5a\x79\xde\xaf\x9d\xed\xcf\
-\x4f\xb5\xce\x41\xe4\x35\x69\x78\x73\x38\x9e\x7d\xfe\x69\xeb\x1c\
-\xd4\x3b\x7c\xdf\x00\x68\xf3\x7b\x5f\xb7\xce\xf0\xb1\xac\xb2\x84\
-\x14\x0e\xf5\xcf\x6c\x04\xf5\x3a\x5d\x7c\xc9\x25\x6e\xed\x92\x9b\
-\x78\x93\x1f\x65\x2a\xdd\xf6\xfc\xa9\xba\xe8\x9c\xff\xb5\xce\x41\
-\x3d\xcf\xd7\x0d\x80\x56\x5e\x79\x39\x5a\xd6\x16\x59\xe7\xf8\x88\
-\xf4\x39\xe6\x4f\x72\xfc\x9f\x76\x58\xe7\x20\x6f\xe8\xa2\xab\x0e\
-\xd1\x6d\x2b\xef\xf6\xd5\xee\x13\x22\xcf\x29\x74\xdb\xf2\x6f\xe9\
-\x73\x97\x9e\x61\x9d\x84\x7a\x96\xaf\x1b\x00\xb7\xa3\xe6\x66\xeb\
-\x0c\x1f\xd1\xdc\x21\x1d\x98\x86\xef\x5a\xe7\x20\xef\x68\xdb\xbb\
-\xcb\x10\x6b\x08\x58\xe7\x20\x32\x97\xe8\x14\xdd\xf1\xca\xc3\x5a\
-\x39\xd3\x37\x0f\x64\x74\xf0\x7c\xdb\x00\xe8\xd2\x1f\xf4\x97\xa6\
-\xd5\xa3\xac\x73\x7c\xc4\x29\x3b\xea\x67\x22\x73\x93\xd6\x39\xc8\
-\x1b\xba\x60\xc6\xfd\x68\x7e\x97\x7b\xa1\x89\x3e\xd2\xb1\x39\x4b\
-\x63\x1b\x17\x5a\xc7\xa0\x9e\xe3\xdb\x06\x00\xf1\x77\x7f\x85\x44\
-\x87\x3f\x4e\x2a\x2c\x38\xb4\x49\x26\xdf\xfb\x3f\xd6\x31\xc8\x1b\
-\xfa\xdc\x65\x27\xeb\xb6\x95\x17\x59\xe7\x20\xf2\x9d\xed\x2f\x1f\
-\xa3\x95\x17\xde\x64\x1d\x83\x7a\x86\x6f\x1b\x00\x6d\x59\x7b\x8e\
-\x75\x86\x6e\x02\x29\x19\xfb\x03\xeb\x14\xe4\x0d\xd5\x59\x8e\xb6\
-\xbc\xf7\x20\xcf\xf7\x27\xda\x15\x85\xd6\xbd\xf4\x3f\xba\xe2\x2b\
-\xe5\xd6\x49\xe8\xe0\xf9\xb2\x01\xd0\x65\x57\x5d\x82\xd6\xea\x5c\
-\xeb\x1c\x00\x80\xc2\xd1\xdb\x65\xf2\x9d\xb7\x5a\xc7\x20\x8f\x2c\
-\x7a\xfd\xaf\x68\x59\xc3\x13\xd0\x88\x76\xa7\xb3\x3e\x98\x6c\x59\
-\xff\x98\x75\x0c\x3a\x78\x41\xeb\x00\xbb\xa2\xd1\x1a\xdf\x3c\x71\
-\x4b\xd1\x61\x3f\x06\x5e\xb0\x8e\x41\x1e\xd0\x25\x57\x0c\xd7\xcd\
-\x0b\xaf\xb6\xce\xe1\x09\x27\x02\x44\x0a\x81\x60\x1e\x10\xca\xff\
-\xf0\xaf\x1f\x7e\x05\x3f\x3c\xfc\x2d\x98\x83\x8f\xef\x0b\x73\x42\
-\x40\x20\x62\x16\xd7\x4c\x32\x06\xb8\x1f\x5e\xf6\xa9\x49\x20\xd9\
-\xd9\xfd\x9f\x13\xed\x40\xbc\x0d\x88\xb7\x76\xff\x35\xd1\x0a\x24\
-\xda\x80\xae\x66\x20\x99\xfe\xb3\x47\x4e\xfd\xcb\x13\x74\xe9\x25\
-\x5f\x92\xc9\xff\x78\xd4\x3a\x0b\x1d\x38\xdf\x35\x00\xfa\xea\x8d\
-\x65\xfa\xde\x5c\x7f\x5c\xb4\x52\x30\xaa\x59\xa6\xdc\xf5\x17\xeb\
-\x18\xe4\x0d\xb7\xbd\xf6\x21\x89\xb7\xf9\x63\xdd\x49\x4f\x70\xc2\
-\x40\xfe\x70\x20\x77\x30\x90\x5d\x0e\x64\xf5\x05\x72\xfa\x02\x59\
-\xe5\x40\x98\x8b\xb9\x7b\x4d\x57\x13\xd0\xb9\x1d\x68\xdf\x06\x74\
-\x6e\x03\x3a\xb6\x01\xd1\x5a\xa0\xb5\x0a\x48\x97\x2d\xa5\x9a\x80\
-\x36\xad\x99\x0d\x80\x0d\x40\x0a\xf3\x5d\x03\x80\xc6\x6d\x3f\x45\
-\x22\xea\x8b\x0f\x61\x29\x38\xec\x57\xc0\x2b\xd6\x31\xc8\x03\xba\
-\xf8\xca\x0a\xad\x79\xe2\x68\xeb\x1c\x07\x25\xbb\x1f\x50\x34\x1a\
-\x28\x18\x09\x14\x8c\x02\xf2\x87\x02\xe2\xbf\x3f\xe2\x69\x2f\x5c\
-\xd4\xfd\x55\xf0\xa9\x4d\x4c\x9a\x00\xda\x36\x02\x2d\x6b\x80\xe6\
-\xb5\x40\xf3\x1a\xa0\xbd\xd6\x26\x63\x4f\x68\x5a\x53\xa6\x95\x17\
-\x7e\x57\x2a\x1e\xfc\xad\x75\x14\x3a\x30\xbe\x18\x68\x3f\x29\xf9\
-\xf8\x84\xad\xd2\xb4\xba\xaf\x75\x0e\xe4\x0d\x6d\x97\x73\xde\xca\
-\x13\x11\x1e\x01\x97\x01\xdc\xc7\x27\x6e\x44\xd3\x5b\x83\xad\x73\
-\xec\x1f\x01\x0a\x0e\x01\xca\x8e\x07\x4a\x8f\x05\xf2\x86\x58\x07\
-\xa2\xfd\xd5\xb1\x05\xd8\xbe\x0a\xa8\x7b\xb1\xbb\x31\xd0\x14\xfb\
-\xb8\xc9\x1d\xd4\x2e\xe7\x5e\x94\x2f\x32\xcb\xb5\x8e\x42\xfb\xcf\
-\x57\x8f\x07\xfa\xfc\x57\x86\xe9\xfa\xb9\xf6\x83\x3f\x00\x29\x1c\
-\xfd\x57\x0e\xfe\x99\x41\x97\x5d\x31\x43\x37\x3c\x96\x3a\x83\x7f\
-\xa4\x0f\x30\xe8\x74\xa0\xff\x64\x20\x52\x6a\x9d\x86\x0e\x46\x76\
-\x7f\x60\xe8\x39\xdd\x5f\x5d\x8d\xc0\xb6\x95\x40\xcd\x93\xdd\xaf\
-\x0d\x52\x41\x74\x53\x0e\x9e\x7b\xeb\xbf\x01\xfc\xa7\x75\x14\xda\
-\x7f\xbe\x6a\x00\xd0\x51\xf7\x23\x5f\x6c\xbf\x8a\x94\x24\x91\x3d\
-\x88\xbf\xd0\x19\xc2\x6d\x5c\xff\x7f\x92\x0a\x4f\x5e\xf9\xc3\x81\
-\x81\xd3\x81\xfe\x53\xbb\xdf\xef\x53\x7a\x09\x17\x03\x83\xcf\x04\
-\x06\x9d\x01\xec\x78\x05\xa8\xfe\x27\xd0\xf4\x9e\x75\xaa\xbd\xd2\
-\xa6\x77\xbe\xa1\x3a\xeb\x87\x9c\x05\x48\x3d\xbe\x6a\x00\xb4\x75\
-\xe3\xd9\xd6\x19\x00\x40\x8a\xc6\x54\xca\xc4\xdf\x75\x58\xe7\xa0\
-\xde\xa7\xcb\x66\x4e\xd5\x0d\x8f\x0e\xb3\xce\xb1\x47\x79\x43\x80\
-\x91\x57\x01\x7d\x3e\x6f\x9d\x84\xbc\x20\x02\x94\x8e\xef\xfe\x6a\
-\x7a\x07\x58\x7b\x27\xd0\xb2\xd6\x3a\xd5\xee\x45\x37\xe5\x60\xf1\
-\x7b\xdf\x03\xf0\x4b\xeb\x28\xb4\x7f\x7c\x73\x0e\x80\xae\xfa\xf2\
-\xa1\x68\x59\x67\x3f\x9f\xe9\x84\x81\xc2\x43\xbe\x69\x1d\x83\xbc\
-\xa1\xad\xd5\xb7\x40\x7d\x7a\xc2\x73\x20\x0c\x1c\x7a\x0d\x70\xdc\
-\x6f\x39\xf8\x67\xaa\xa2\xc3\x81\x63\x7f\x01\x1c\x7e\x23\x10\xf4\
-\xc7\xd1\x28\xbb\xa2\x4d\xef\xff\xbb\x75\x06\xda\x7f\xbe\x69\x00\
-\xd0\x5a\xf7\x23\x68\xc2\x3a\x05\x50\x7c\xc4\x7a\x99\xf0\x87\x77\
-\xac\x63\x50\xef\xd3\xca\xaf\xf5\x43\xd3\xea\xb1\xd6\x39\x76\xa9\
-\x60\x04\x70\xfc\xef\x80\x21\x67\x01\xc2\xfb\x88\x32\x9b\x00\xfd\
-\x2b\x80\x09\xbf\x07\x4a\x8e\xb4\x0e\xb3\x6b\xad\xeb\x4b\x74\xd9\
-\xcc\x19\xd6\x31\x68\xff\xf8\xa6\x01\xd0\x8e\xea\x33\xad\x33\x00\
-\x80\xe4\x0d\xfd\xb9\x75\x06\xf2\x48\x7c\xe3\xef\x7c\x73\xdf\xc4\
-\x27\xf5\x9f\x06\x1c\xf3\xf3\xee\x05\x62\x44\x1f\x89\xf4\x01\x8e\
-\xfa\x11\x30\xec\x3c\xf8\x6f\x03\x97\xc2\x6d\xa9\xfe\xa9\x75\x0a\
-\xda\x3f\xbe\xf8\x2d\xd2\xca\x1b\x07\xe9\xa6\x7b\x6a\xcc\x67\x00\
-\x72\x06\xc4\x9c\xf3\xdf\xcf\xb2\x0d\x41\x5e\x71\xe7\x1e\xd6\x81\
-\x8e\xcd\xbe\xfa\x79\xeb\xf0\x8b\x20\x23\x78\x0f\x11\xed\xc5\x96\
-\xe7\x80\x77\xff\x0c\xa8\x8f\xd6\xdd\x05\x73\x55\xfa\x9f\x5d\x2e\
-\x15\xb3\xeb\xad\xa3\xd0\xbe\xf1\xc7\x0c\x80\x6e\xff\x86\xf9\xe0\
-\x0f\x40\x0a\x47\xf1\xaa\xcb\x0c\xa1\x4b\xae\xbc\xd4\x6f\x83\x3f\
-\x46\x5e\xc9\xc1\x9f\xf6\x4d\xff\x69\xc0\x11\xdf\x01\xc4\x1f\x1f\
-\xe1\x00\x80\x44\x54\x90\xa8\xfb\x99\x75\x0c\xda\x77\xbe\xf8\xed\
-\xd1\xce\x6d\xf6\xab\xff\x25\x00\x14\x0e\xbe\xd9\x3a\x06\x79\x43\
-\xdb\x6b\xbf\x6d\x9d\x61\x27\xc3\xce\x07\x86\x7e\xc9\x3a\x05\xa5\
-\x92\xf2\x89\xc0\xe7\xbe\x0a\x9f\x4c\xe4\x02\x00\xb4\x63\xe3\x79\
-\xd6\x19\x68\xdf\x99\x37\x00\xaa\x2a\x68\xad\x1a\x69\x9d\x03\x85\
-\x87\x6d\x93\xe3\xfe\xfc\xba\x75\x0c\xea\x7d\x5a\x39\x35\x88\xe6\
-\xb5\xfe\x59\x56\x5f\x7e\x3c\x70\xc8\x25\xd6\x29\x28\x15\x0d\x38\
-\x19\x18\x76\xae\x75\x8a\x7f\x69\x5e\x5f\xa6\x4b\xaf\x3e\xdc\x3a\
-\x06\xed\x1b\xf3\x06\x00\xcb\xae\x3a\x0f\xb1\x06\xf3\x65\xce\x92\
-\x37\xf8\x3e\xeb\x0c\xe4\x11\xed\x77\x23\xba\x1a\xcd\x7f\xe7\x00\
-\x00\x39\x03\x81\xc3\xbf\x09\x3f\x3d\xc5\x51\x8a\x19\x71\x89\x7f\
-\x76\x07\x68\x12\x88\xd5\xff\xd8\x3a\x06\xed\x1b\xfb\x06\xa0\xb3\
-\xf1\x1a\xeb\x08\xea\x44\x80\x82\x12\xae\xfe\xcf\x10\x6e\xc7\xb6\
-\x2b\xad\x33\x00\xe8\x7e\xed\x34\xe6\x9b\x40\xc0\x5f\x4b\x11\x28\
-\xc5\x88\x03\x1c\xfe\x75\xdf\x9c\x13\xa0\x6d\x9b\x4e\xb5\xce\x40\
-\xfb\xc6\xbc\x01\xd0\xf6\xda\x13\xac\x33\xa0\xf0\xb0\x1a\x19\xcf\
-\x95\xab\x99\x42\xa2\xd5\xfe\xb8\x6e\x7a\xc8\x8c\xee\x9b\xfb\x88\
-\x0e\x56\xa4\x0f\x30\xea\x6a\xeb\x14\xdd\xda\x36\x94\x68\xe5\xbf\
-\x0d\xb2\x8e\x41\x7b\x67\xda\x00\xe8\xf2\xaf\x0f\x40\x6b\x95\xf9\
-\xc5\xe4\x4e\xce\xc0\x07\xad\x33\x90\x37\x74\xd9\x15\x33\xd0\x59\
-\x17\xb2\xce\x81\x70\x31\x30\xec\x02\xeb\x14\x94\x4e\xfa\x57\x00\
-\x05\x87\x5a\xa7\xe8\xbe\xf6\x18\x8d\x3c\x4d\x35\x05\xd8\xce\x00\
-\x24\x1a\x66\x5a\x6f\xff\x53\x27\x02\x14\x16\xfd\xc2\x34\x04\x79\
-\xa7\xa3\xe1\x2b\xd6\x11\x00\x00\xc3\xcf\x07\x82\xd9\xd6\x29\x28\
-\xad\x48\xf7\x9d\x11\x3e\xa0\xd1\xed\x5f\xb4\xce\x40\x7b\x67\x3b\
-\x03\x10\x6b\x9c\x6e\x59\x1f\x00\xa4\xf0\xd0\x4d\x9c\xfe\xcf\x1c\
-\xda\xb1\xf5\x38\xeb\x0c\x08\x15\x00\xfd\x4f\xb6\x4e\x41\xe9\xa8\
-\xf8\x70\xa0\x60\x94\x75\x0a\x20\x5a\x3d\xc2\x3a\x02\xed\x9d\xed\
-\x0c\x40\xc7\x36\xf3\x73\xd8\x25\x67\xc0\x93\xd6\x19\xc8\x1b\x5a\
-\x35\x33\x0b\xd1\x8d\x7d\xcc\x73\x0c\x3a\xbd\xfb\xa2\x1f\xa2\xde\
-\x30\xd4\xfe\x58\x15\xc4\x1a\x03\xba\xf8\xca\x0a\xeb\x18\xb4\x67\
-\x66\x0d\x80\x56\xce\xca\x42\x7b\x8d\xed\xfb\x7f\x11\x20\x98\xff\
-\x67\xd3\x0c\xe4\x9d\xea\xf8\x15\x48\x74\xda\xee\xb7\x0b\x84\x21\
-\x83\x4e\x37\x8d\x40\x69\xae\x6c\x02\x90\xdd\xcf\x3a\x05\x90\x68\
-\xb9\xdc\x3a\x02\xed\x99\xdd\x0c\x40\x70\xfd\x05\xe6\x1f\xc6\x79\
-\x43\xa2\x32\x65\xce\x5b\xa6\x19\xc8\x3b\x9d\x0d\xf6\xa7\x94\x95\
-\x4f\x02\xc2\x05\xd6\x29\x28\x9d\x89\x03\x0c\x3a\xc3\x3a\x05\xdc\
-\x58\xfd\x14\xeb\x0c\xb4\x67\x76\x0d\x40\x67\xb3\xfd\xb9\xa7\x39\
-\x83\x5e\xb5\x8e\x40\xde\xd1\xd8\x8e\x71\xd6\x19\xd0\xd7\x7e\xd7\
-\x2b\x65\x80\xbe\x27\xc0\xfa\x70\x29\x89\x6e\x19\x62\x1a\x80\xf6\
-\xca\xac\x01\x70\x63\xf5\xe6\x8b\xb1\x24\xbb\xec\x6e\xeb\x0c\xe4\
-\xa1\xce\xad\xe5\xa6\xf5\x03\x39\xfe\x39\xb1\x8d\xd2\x5b\xa4\x8f\
-\xfd\x19\x13\x9d\x75\x21\x5d\x72\xc5\x70\xdb\x10\xb4\x27\x66\x0d\
-\x80\x44\x6b\x6d\x2f\x3b\x0f\x66\x2b\xfa\x17\xdd\x65\x9a\x81\x3c\
-\xa3\x4b\xaf\x1c\x87\x98\xf1\xf1\xbf\x65\xe3\x01\x09\x9a\x46\xa0\
-\x0c\x52\x3e\xc1\x38\x80\x02\xc9\xb8\xfd\x4c\x2f\xed\x96\x49\x03\
-\xa0\xab\x6e\x3c\xdc\xfc\xfc\xff\xdc\x21\xf5\x72\xe8\x1f\x62\xa6\
-\x19\xc8\x3b\xf1\x76\xfb\x53\x77\xca\x39\xfd\x4f\x1e\x32\x6f\x00\
-\x00\x24\x5b\xa6\x59\x47\xa0\xdd\xb3\x99\x01\xe8\xac\x3f\xd3\xa4\
-\xee\x27\x48\x56\xd9\x6b\xd6\x19\xc8\x43\xf1\x36\xdb\x4f\x43\x11\
-\xa0\xc4\x7c\xd7\x2b\x65\x92\xec\xfe\x40\xce\x00\xd3\x08\x1a\x6b\
-\x3a\xc2\x34\x00\xed\x91\x4d\x03\xd0\xd5\x7a\x92\x49\xdd\x4f\xca\
-\x2e\x79\xc4\x3a\x02\x79\xc7\xed\x6a\xb1\x7d\x21\x9a\x3b\xb8\x7b\
-\x0d\x00\x91\x97\x0a\x0f\xb3\xad\x1f\x6b\xec\x6b\x1b\x80\xf6\xc4\
-\xa4\x01\x70\xbb\x9a\x6d\xef\x8b\x76\xc2\x40\x2c\xf7\x1f\xa6\x19\
-\xc8\x53\x12\x6f\xb4\x5d\x00\x68\xfd\x41\x4c\x99\xc9\x7a\x21\x60\
-\xc7\xf6\x6c\xad\x9c\xca\x85\x2f\x3e\x65\xd2\x00\x48\xd7\x0e\xdb\
-\x05\x80\xb9\x83\x9b\xe5\xd4\xd9\xcd\xa6\x19\xc8\x33\xaa\xb3\x1c\
-\xed\xa8\xb3\x7d\xfc\xf6\xc3\xf1\xac\x94\x79\xac\x7f\xef\xdc\x2e\
-\x00\x43\x7c\xb0\x18\x81\x76\xc5\xf3\x06\xa0\xfb\x04\xc0\x6d\xb6\
-\x1f\xc6\xd9\xa5\xeb\x4c\xeb\x93\xb7\x56\x6c\x38\x4e\x5c\xe3\xf5\
-\x9e\x85\x6c\x00\xc8\x40\xfe\xd0\xee\x19\x4f\x53\x9d\x53\x8d\x03\
-\xd0\x6e\x78\x3f\x03\x10\xdc\x70\x6a\x77\x57\x68\x47\x42\x05\x2f\
-\x9a\x06\x20\x6f\x25\x3a\x6d\xcf\x9c\x08\x84\x81\x1c\x5e\x8f\x4e\
-\x06\x24\x08\xe4\x0d\xb5\xcd\x10\xef\xe4\xe1\x17\x3e\xe5\x7d\x03\
-\x10\x6f\x3b\xd5\xf3\x9a\x9f\x16\xce\x9b\x67\x1d\x81\x3c\x94\xe8\
-\x1a\x63\x5a\x3f\xbb\x5f\xf7\x2e\x00\x22\x0b\xb9\xb6\xcd\xa7\x26\
-\xa3\xc6\x1d\x08\xed\x8e\xf7\x0d\x40\x22\x6a\xfa\x61\xac\x4e\x04\
-\xc8\xce\x7a\xc6\x32\x03\x79\x2c\xde\x6e\xbb\x12\xca\x0f\x17\xb3\
-\x50\xc6\xd2\x6c\xdb\xf5\xaf\x88\x77\xf0\x0f\x80\x4f\x79\xbf\x06\
-\x20\x1e\x1d\xec\x75\xcd\x4f\x92\xbc\x81\x2d\x32\x7e\x76\xdc\x32\
-\x03\x79\xcb\x4d\x46\x6d\x1f\x81\xd8\x00\x90\x21\xc9\x32\xfe\xfd\
-\x4b\xb6\xd8\xde\xfa\x4a\xbb\x65\xd0\x00\xb4\x96\x79\x5d\x73\x27\
-\xe1\x92\x1a\xd3\xfa\xe4\x39\x49\x46\xfb\x98\x06\xc8\xe6\x56\x68\
-\x32\x94\x63\xfc\xfb\xd7\xd5\xc2\x03\x30\x7c\xca\xf3\x06\x40\xba\
-\x9a\xf3\xbc\xae\xb9\x53\xfd\x70\xee\x1a\xcb\xfa\xe4\x3d\x4d\xb4\
-\x1b\xef\x3a\xb1\x3d\x8d\x8d\x32\x5c\x96\x75\x03\xd0\x1c\xe0\x59\
-\x00\xfe\xe4\x69\x03\xa0\x2b\xbf\x9d\x8d\x58\xa3\xed\x2f\x42\x20\
-\x8f\x57\x00\x67\x18\x49\xb4\xdb\xee\x83\xca\x2a\x31\x2d\x4f\x19\
-\x2e\x52\x04\x38\x11\xbb\xfa\xea\x02\xce\x30\xde\x0a\xe8\x43\xde\
-\xce\x00\xc4\x5b\x8e\x85\x26\x3c\x2d\xf9\x19\x4e\xee\x52\xdb\x00\
-\xe4\xb9\xae\x56\xdb\x8b\xa7\x42\x05\xa6\xe5\x29\xd3\x09\x10\xce\
-\xb7\x8d\xe0\xe0\x10\xdb\x00\xb4\x2b\xde\x36\x00\x6e\xfb\xb1\x9e\
-\xd6\xfb\x34\x27\x0c\x94\xb6\xac\x32\xcd\x40\x9e\xd2\x45\xd7\x0e\
-\xb5\x6d\x3a\x05\x08\xe5\x1a\xd6\x27\x02\x10\x32\x6e\x00\x12\x9d\
-\xc3\x6c\x03\xd0\xae\x78\xdc\x00\x74\xda\xee\xc7\xce\x2a\xed\x94\
-\x31\x73\x6d\x4f\x21\x22\x6f\x65\xbb\xc3\x4c\xeb\x07\xb2\xbb\x0f\
-\x63\x21\xb2\x14\x34\x5d\x7a\x05\xb8\x71\x9e\x05\xe0\x43\xde\x36\
-\x00\x89\x0e\xd3\x5f\x02\x0d\x15\xb4\x58\xd6\x27\x03\x5d\x31\xdb\
-\x4d\xd0\x61\x4e\xff\x93\x0f\x84\x8c\x1b\x00\x4d\xda\xee\xfe\xa2\
-\x5d\xf2\x76\x11\xa0\xdb\x65\xbb\x1d\x2b\x98\x57\x6f\x5a\x9f\xbc\
-\xe7\xaa\xed\x07\x8f\xf5\xd4\x2b\x11\xe0\x83\x06\x20\xce\x3f\x08\
-\x3e\xe4\x6d\x03\x90\x8c\x99\x1e\x08\xe1\x84\x22\x5b\x2c\xeb\x93\
-\x05\xb5\x6d\x3a\xf9\xfe\x9f\xfc\xc0\xfa\x15\x80\xba\x6c\x00\x7c\
-\xc8\xd3\x06\x40\x12\x9d\xb6\xbf\x85\x4e\xd6\x06\xd3\xfa\xe4\x3d\
-\x8d\x17\x9b\xd6\x37\xbf\x89\x8d\x08\x40\xd0\xf6\x28\x0c\x75\x93\
-\xc6\x1d\x08\xed\x8a\xc7\x8b\x00\x3b\xb2\x3d\xad\xf7\x69\x81\x08\
-\xaf\x01\xce\x34\x9a\xb4\x7d\x09\x2f\x21\xd3\xf2\x44\x00\x00\xb1\
-\xdd\x09\xab\x6e\x82\x0d\x80\x0f\x79\xbd\x08\xd0\xf8\x71\x28\xf4\
-\x9e\x6d\x7d\xf2\x9c\xaa\xed\xef\x5c\xc0\xf6\x83\x97\x08\x00\xe0\
-\x18\x37\xa2\x9a\x34\x3c\x89\x88\x76\xc7\xe3\x83\x80\x5a\x6d\xf7\
-\x43\x29\xaa\x4c\xeb\x93\x01\xd7\xb6\x01\x10\xbe\x02\x20\x1f\x10\
-\xef\x2f\x7e\xdd\xa9\xbc\xc5\xcd\xb3\xb4\x57\x9e\xfd\x50\xf4\x85\
-\x2b\xfb\x20\x19\xf3\xaa\xdc\xae\x49\xb0\xda\x36\x00\x79\x4e\x61\
-\xfb\xe8\x63\xfd\xe4\x45\x04\xd8\x9f\x45\xa1\x2e\xa7\xc2\x7c\xc8\
-\xbb\xae\xcc\x0d\xd8\x1e\x04\xe1\x84\x21\x15\x73\x9a\x4c\x33\x90\
-\xf7\x5c\xd7\xf6\x93\xcf\xe1\xe7\x1e\xf9\x80\x63\x3d\xf9\x6a\xfc\
-\xe7\x90\x76\xc9\xbb\x1f\x4a\x57\xc2\xf6\x4e\xe8\x40\x8e\x0b\xec\
-\x30\x8d\x75\x61\xdb\xb7\x00\x00\x20\x00\x49\x44\x41\x54\x40\x3d\
-\x43\x57\x5e\x39\x10\x08\x8c\x44\xac\xa3\x1f\x54\xfa\x00\x5a\x04\
-\x8d\x95\x42\x93\x7d\xf0\x51\x53\xab\xc9\x30\xd4\xcd\xd7\xce\xad\
-\xe3\x4d\xc3\xb6\x7e\x00\x54\x3f\xe2\x71\x51\xd9\x79\xd5\xb7\x93\
-\x05\x04\x42\xdd\xff\x5d\x30\xbb\x7b\x67\x42\x30\xaf\xfb\x7c\x78\
-\xcb\x4b\x62\xc8\x3b\xd6\x33\x51\xaa\xec\x84\x7d\xc8\xbb\x06\xc0\
-\x11\xdb\x7d\x28\xa1\xec\xb8\x69\x7d\xda\x2b\xd5\x59\x0e\x56\x6c\
-\x38\x0e\xb1\x8e\x63\xa1\xf1\x23\x10\x6f\x1f\xe9\x26\xa3\x83\x90\
-\x68\x2f\x91\x44\x34\x17\xc9\xf6\x30\xe2\x6d\x01\x5d\xe7\xf5\x80\
-\x7a\x10\x1a\xdf\xe9\xfe\xf2\xab\x40\xa4\xfb\xb2\xa2\x70\x01\x10\
-\x2e\x06\xb2\xca\x3e\xfc\xea\x03\x64\x95\x03\x39\x03\x78\x98\x51\
-\x3a\x30\x5e\x03\x00\xa8\x75\x00\xda\x05\xef\x1a\x80\x84\xf1\x36\
-\x10\x27\xcc\x06\xc0\x47\x74\xe9\x95\xe3\x90\xe8\x38\x0f\x5d\xad\
-\x13\xdd\xae\x96\x91\x92\x68\x2a\x77\xef\xfd\x63\x8e\xb8\x3b\xaf\
-\x13\x11\xa3\x7c\x19\x23\x19\x03\x92\x75\x40\x67\xdd\xee\xff\x37\
-\xa1\x7c\x20\x77\x20\x90\x33\x08\xc8\x1d\x04\xe4\x1f\x02\xe4\x8f\
-\xe8\x9e\x4d\x20\xa2\x94\xe5\x5d\x03\xa0\xae\xe9\x0c\x80\x4a\xc0\
-\xb5\xac\x9f\xc9\xb4\x6a\x66\x16\xaa\xe3\x57\xa0\xab\xe1\x1c\xed\
-\xd8\x71\x14\x3a\xb6\x96\xeb\x86\x47\x3e\x9e\x12\x94\x4f\xfd\x95\
-\x7c\x26\xde\x0a\x34\xbd\xd7\xfd\xf5\x31\x01\x72\xfa\x03\x05\x87\
-\x00\x45\xa3\x81\xc2\xc3\x81\xbc\xc1\xe0\x4f\x91\x28\x75\x78\xd7\
-\x00\x04\xd5\xb4\x01\x10\x71\x92\x96\xf5\x33\x8d\x2e\xbb\x62\x06\
-\x3a\x1a\xbe\xa2\x1d\x5b\x8f\xd3\x95\x4f\xf6\x41\x32\xc6\x91\x21\
-\xad\x28\xd0\xbe\xb9\xfb\x6b\xeb\xb2\xee\xff\x2a\x5c\x00\x14\x1d\
-\x0e\x94\x1c\x05\x94\x1e\x03\x44\x6c\x4f\x61\x26\xa2\x3d\xf3\xf0\
-\x15\x80\x6d\x03\x00\x36\x00\xbd\x4a\x2b\xa7\x06\xa1\xfd\x6e\x74\
-\x3b\xb6\x5d\x29\x6d\xd5\x63\xb4\xea\x51\xee\x7f\xcb\x34\x5d\x2d\
-\xc0\xf6\x55\xdd\x5f\x10\x20\x7f\x18\x50\x7a\x2c\x50\x3e\x01\xc8\
-\x1b\x66\x1c\x8e\x88\x3e\xcd\xc3\x57\x00\xb0\x7d\x05\x80\x00\x1b\
-\x80\x5e\xa0\x8b\x2e\xba\x20\x19\xdb\xfa\x6d\x77\xdb\xfa\xe3\xa4\
-\xeb\x95\x00\x1f\xf3\xa9\x9b\x02\xad\x55\xdd\x5f\x55\x0f\x02\x79\
-\x43\x80\xbe\x93\x80\xbe\x27\x01\xd9\x7d\xad\xc3\x11\x11\xbc\x6c\
-\x00\x90\xcc\xf2\xae\xd6\x2e\x70\x06\xa0\xc7\xe8\xd2\xeb\xfb\xa3\
-\x73\xf3\xff\x6a\xf3\xda\x2f\x69\xed\xbc\x2c\x2e\xef\xa5\xbd\x6a\
-\xdb\x08\xb4\xdd\x07\xac\xff\x07\x50\x3c\x16\x18\x34\x1d\x28\x3b\
-\xce\xfc\x8c\x7a\xa2\x4c\xe6\xe1\x0c\x80\x18\x2f\xc2\x73\xba\x6c\
-\xeb\xa7\x3e\x5d\x7c\x65\x85\xb6\x6f\xba\x45\x37\x3d\x7a\x04\x12\
-\x1d\x7c\xd8\xa7\x03\xa0\x40\xe3\x9b\xdd\x5f\xe1\x12\x60\xd0\x17\
-\x80\x41\x67\xd8\xdf\x57\x4f\x94\x81\xbc\x6b\x00\x02\x81\xed\x9e\
-\xd5\xda\x05\x09\x66\xb5\x5a\xd6\x4f\x65\xba\xec\x8a\x19\x6e\xf3\
-\x07\xb7\x68\xcd\xe3\xc3\xa1\x9c\x48\xa1\x1e\xd2\xd5\x00\x7c\x70\
-\x3f\x50\xfd\x28\x30\x70\x3a\x30\xf4\xec\xee\xb3\x08\x88\xc8\x13\
-\xde\x35\x00\x91\x9c\x17\x3d\xab\xb5\x0b\x12\xcc\xda\x60\x59\x3f\
-\x15\xe9\xe2\x2b\x2b\xb4\x65\xdd\x9d\xba\xe1\xb1\xc1\xa2\x6a\x1d\
-\x87\xd2\x55\xb2\x13\xd8\xf8\x18\xb0\x69\x1e\x30\xe8\x74\x60\xf8\
-\x05\x40\x30\xd7\x3a\x15\x51\xda\xf3\xae\x01\x88\x55\xbd\x88\x50\
-\xae\x22\x1e\xb5\x99\x3a\x0e\xe5\x2d\x35\xa9\x9b\x82\x74\xc9\x15\
-\xc3\xb5\xa3\x76\xae\xd6\x3c\x71\x0c\x34\x61\x1d\x87\x32\x85\x1b\
-\x07\x36\x3e\x0e\x6c\x79\x0e\x18\x76\x7e\x77\x33\x60\x7d\x84\x2d\
-\x51\x1a\xf3\x6c\xfd\x96\x54\x2c\x4e\x68\xee\xb0\x2d\x5e\xd5\xdb\
-\x89\x13\x06\x22\xf9\x7f\x37\xa9\x9d\x42\x54\x67\x39\xba\xf0\x4b\
-\xb7\xeb\xe6\x85\xeb\xb1\xfd\x25\x0e\xfe\x64\x23\xde\x06\xac\x9d\
-\x03\xbc\xf0\x1d\xa0\x71\xb5\x75\x1a\xa2\xb4\xe5\xe9\x02\x6e\x27\
-\x77\xc0\xc3\x5e\xd6\xfb\x88\x16\x8e\xda\x24\x13\x6f\x6f\xb0\xa8\
-\x9d\x2a\x74\xe5\xd5\x53\xf4\xb1\xc7\xb7\xeb\xe6\x45\xd7\x20\xde\
-\xc6\x05\x7e\x64\xaf\xbd\x16\x78\xf5\xc7\xc0\x3b\xb7\x00\xf1\x16\
-\xeb\x34\x44\x69\xc7\xdb\x1d\x5c\xd9\xc5\xb3\x10\x2a\xf0\x7c\x37\
-\x80\x93\x37\xf4\x8f\x5e\xd7\x4c\x25\xba\x60\xc6\xfd\xfa\xc1\xe3\
-\x8b\xd1\xb2\x96\x47\xb7\x91\xcf\x28\xb0\x65\x09\xb0\xea\x3b\xdd\
-\x3b\x07\x88\xa8\xc7\x78\xda\x00\xc8\xc4\xdb\x1b\xa4\xcf\x51\xf3\
-\xbd\xac\x89\xfc\xa1\xad\x52\x71\xff\x2f\x3d\xad\x99\x22\x74\xd1\
-\x55\x87\xb8\x4f\x4c\xa8\xd5\x2d\x8b\x2f\x82\xcb\x5d\x92\xe4\x63\
-\x5d\x0d\xc0\x6b\x3f\x01\xd6\xdd\x0d\xbe\x9a\x22\xea\x19\xde\x9f\
-\xe1\x92\x28\xba\x14\xd9\x7d\xbd\x19\x6d\x44\x20\xc5\xe3\x6e\xf0\
-\xa4\x56\x8a\xd1\xca\xcb\x2e\xd7\xfa\xc5\xef\xa3\x71\xf5\x00\xeb\
-\x2c\x44\xfb\x44\x15\xa8\x7e\x04\x78\xe5\x47\x40\xac\xd1\x3a\x0d\
-\x51\xca\xf3\xbc\x01\x90\x33\xee\x6d\x91\xb2\xe3\x2e\x57\x27\xd2\
-\xfb\xb5\xca\x4e\x7c\x46\xa6\xde\x77\x77\xaf\x17\x4a\x31\xba\xf0\
-\xfc\xdf\xe8\xe6\xa7\xef\x46\xac\x81\xc7\xb0\x51\xea\x69\x7e\x1f\
-\x78\xe9\xdf\x81\x96\x75\xd6\x49\x88\x52\x9a\xc9\x29\xae\x32\xf5\
-\xbe\xb9\xce\xc0\x29\xbf\xe9\xd5\xab\x43\x4b\xc6\x6e\xc0\xf4\xe3\
-\xcf\xe8\xbd\x02\xa9\x29\xf1\xf4\xf4\x4a\xdd\xfc\xec\x77\x91\xe4\
-\x94\x3f\xa5\xb0\xd8\x0e\xe0\xd5\x9b\x3f\xbc\x78\x88\x88\x0e\x84\
-\xd9\x31\xee\x52\xf1\xf0\xf7\xa4\xff\x94\x07\x7a\xe3\x2c\x70\x2d\
-\x1c\xbd\x4d\x4a\x46\x1f\x23\x32\xcb\xf8\xf8\x61\xff\x50\x9d\xe5\
-\xb8\xf3\x2a\xde\x70\xb6\xaf\x9c\x0a\xf0\x50\x1f\x4a\x03\xc9\x2e\
-\xe0\xed\xdf\x74\x9f\x1b\x40\x44\xfb\xcd\xf4\x1e\x17\x39\xf5\x89\
-\x8b\x65\xd0\x69\xff\x81\x60\x6e\x8f\x8d\x48\xda\x67\xfc\x1b\x4e\
-\x41\xce\x20\x6e\xfb\xfb\x17\x5d\x7d\x41\x58\xe7\x2d\x7a\x17\xf5\
-\x2f\x8f\xb3\xce\x42\xd4\xa3\xd4\x05\xde\xf9\x53\xf7\x01\x42\x44\
-\xb4\x5f\xcc\x2f\x72\x93\x8a\xfb\x7f\x29\x03\xbe\x70\x32\x0a\x47\
-\x1f\xdc\x21\x41\x91\x92\xa4\x0c\xfc\xc2\x2f\x02\x67\x56\x1e\x25\
-\x15\x8b\xb9\x4c\xf8\x43\x5a\x39\x35\xe8\xae\xaf\x7d\x1f\x3b\x5e\
-\x1f\x65\x9d\x85\xa8\x77\x68\xf7\xc1\x41\x35\x4f\x58\x07\x21\x4a\
-\x29\xe6\x0d\x00\x00\xc8\xd4\xbb\x2a\x9d\x2f\xbe\x38\x40\x06\x9f\
-\xf9\x55\x14\x1e\xd2\xb8\x5f\x6b\x03\xb2\x4a\x13\xd2\x77\xf2\x63\
-\x52\x3e\xbd\x9f\x9c\xfc\xf0\x7f\xf6\x5e\xca\xd4\xe4\x76\xe0\x75\
-\x69\x7a\x6b\x98\x75\x0e\xa2\x5e\xb7\x66\x0e\x5f\x07\x10\xed\x07\
-\xef\xee\x02\xd8\x07\x52\x71\xff\x6d\x00\x6e\xd3\x25\x57\x4d\x46\
-\xac\xe1\x9b\xda\x55\x77\x1c\x3a\x1a\xca\x10\x6f\x09\x23\xd1\x2e\
-\x08\x84\x15\xa1\x9c\x24\xc2\xa5\xcd\x6e\xa4\xec\xdd\x40\xa4\xe4\
-\x1f\xa8\x38\xec\x36\xbe\xeb\xdf\xb5\xc4\xfc\x2f\xac\x90\xba\xe7\
-\xc7\x58\xe7\x20\xf2\x86\x02\xef\xfe\x19\x08\xe4\x02\xe5\xc7\x5b\
-\x87\x21\xf2\x3d\x5f\x35\x00\x1f\x91\x29\x77\x2e\x05\xb0\x87\xcb\
-\x7b\x36\x7a\x96\x25\x55\xe9\xc2\x73\xff\xa2\x9b\x17\x4c\xb4\xce\
-\x41\xe4\x29\x75\x81\xd5\xbf\x07\xb2\x7e\x06\x14\x8c\xb4\x4e\x43\
-\xe4\x6b\xbe\x78\x05\x40\x3d\x4b\x17\x5f\x76\x9d\x6e\x5d\x7c\xbd\
-\x75\x0e\x22\x13\x6e\x0c\x78\xe3\x17\xdd\x5b\x05\x89\x68\xb7\xd8\
-\x00\xa4\x19\x7d\xee\xaa\x63\x74\xcb\x92\xdb\xe0\xc6\xad\xa3\x10\
-\xd9\xe9\x6a\x00\xde\xfa\x2d\x8f\x0d\x26\xda\x03\x36\x00\x69\x44\
-\x2b\xa7\x06\xb5\xf9\xcd\x67\x11\x6f\xe6\xcf\x95\xa8\xf9\x3d\xe0\
-\x83\x07\xac\x53\x10\xf9\x16\x07\x8a\x74\x12\xcb\x7e\x12\xad\xeb\
-\x4a\xac\x63\x10\xf9\x46\xf5\x3f\x79\x8b\x20\xd1\x6e\xb0\x01\x48\
-\x13\xba\xf8\xd2\x2b\xb4\x6e\xd5\x74\xeb\x1c\x44\xbe\xa2\x0a\xac\
-\xfe\x03\x90\x88\x5a\x27\x21\xf2\x1d\x36\x00\x69\x40\xab\x66\x66\
-\xb9\x3b\x5e\xfd\x0b\xdf\x77\x12\xed\x42\x6c\x47\xf7\x35\xc2\x44\
-\xb4\x13\x36\x00\xe9\x60\x6d\xdd\x43\x12\xad\xcd\xb6\x8e\x41\xe4\
-\x5b\xb5\x0b\x80\xc6\xb7\xac\x53\x10\xf9\x8a\x2f\xcf\x01\xa0\x7d\
-\xa7\x95\x57\x4e\x72\x6b\xe7\x9d\xd9\x8b\xf7\x2a\xfa\x53\x30\x47\
-\x11\xcc\x49\x22\x98\xdd\x05\x27\xab\x43\x03\x91\x0e\x00\x10\x71\
-\xba\x20\xc1\x18\x00\xa8\x88\x2b\x12\x6a\xb5\x0d\xea\x3d\xd5\x78\
-\xbe\xa8\x76\x37\xf7\x9a\x88\xa8\xba\x61\x00\x90\x64\x57\x0e\x92\
-\xed\x59\x48\x76\x86\x91\x88\x06\x90\xe8\xc8\xa0\x5f\x1b\x05\xde\
-\x9f\x0d\x1c\xff\x3b\x40\xf8\xb1\x47\x04\xb0\x01\x48\x79\x1a\x5d\
-\x77\xaf\xb8\x31\xeb\x18\x3d\x4a\x9d\x08\x24\xbb\xac\x03\xe1\xc2\
-\x46\x84\x72\xb6\x48\x20\x7b\x3d\x9c\xec\x77\x10\xca\x7a\x19\x91\
-\xec\xb5\x68\x5f\xfb\x01\xef\x7b\x38\x78\xba\xfa\x82\x30\xb6\xe7\
-\x8e\x80\xba\x87\x01\x1d\x47\x23\xd1\x79\x84\x1b\x6f\x1b\x21\xc9\
-\x68\x3f\x74\x35\x17\xa1\xb3\x3e\x0b\x6e\x1a\x5d\x1b\x1d\xad\x05\
-\x6a\x9e\x06\x86\x9c\x65\x9d\x84\xc8\x17\xd8\x00\xa4\x30\x5d\x74\
-\xf9\xd5\x5a\xfb\xf8\x10\xeb\x1c\x07\x45\x1c\x20\xab\x6f\x0c\xd9\
-\x65\xb5\x12\x2e\x7e\x03\xc1\xfc\x85\x22\x89\xbb\xa4\x62\x6e\x9b\
-\x75\xb4\x74\x27\x63\xe6\x76\x01\x78\xef\xc3\xaf\xc7\x3e\xfd\xf7\
-\xb5\x6a\x66\x16\xaa\xdc\xe9\x70\xdb\xce\xd0\xd8\x8e\x93\xd0\xbe\
-\x65\x04\x3a\xb7\x46\xa0\x29\x7c\x9d\x74\xd5\x03\x40\xff\xa9\x40\
-\x28\xcf\x3a\x09\x91\x39\x36\x00\x29\x4c\x5b\xde\xfe\x1d\x90\x82\
-\x1f\xc6\xc1\x6c\xd5\xfc\x91\x35\x4e\x4e\xbf\x7f\x22\x3b\xef\x37\
-\x32\xf1\xae\x5a\x60\x8d\x75\x2a\xfa\x14\x19\x3e\xa7\x13\xdd\x8d\
-\xc1\xc7\xcd\x81\xbe\x70\xdd\x28\xb4\xd6\x7d\x5f\xdb\x37\x9f\x81\
-\x96\xf5\xfd\x52\x6e\x86\x20\x11\x05\xaa\x1f\x01\x46\x5e\x61\x9d\
-\x84\xc8\x1c\x1b\x80\x14\xa5\x95\x17\xde\xac\x35\xf3\x0b\xad\x73\
-\xec\x33\x27\x04\x14\x8d\x59\x2b\x39\x03\xe7\x40\x92\xff\xe7\xf0\
-\x09\x3f\x25\xc9\xf1\x7f\x5d\x03\xe0\x5a\x00\xd0\x15\x5f\x29\x47\
-\x57\xdd\xf7\xb4\xad\xf6\x52\x34\xbd\x33\x20\x65\x66\x06\x6a\xe6\
-\x01\x43\x66\x00\xe1\x22\xeb\x24\x44\xa6\xd8\x00\xa4\x28\x6d\x7a\
-\xff\x26\xeb\x0c\xfb\x24\x98\xad\x5a\x38\xe6\x4d\x27\x7b\xc8\xb5\
-\x32\xed\xce\x57\xac\xe3\x50\xcf\x91\x13\x6f\xdb\x0e\xe0\x7b\x00\
-\xbe\xa7\x2b\xaf\x9e\xe2\x36\x6e\xb8\x05\x8d\x6f\x1d\xe9\xfb\x35\
-\x29\x6e\x0c\xa8\x79\x12\x38\xe4\x72\xeb\x24\x44\xa6\xd8\x00\xa4\
-\x20\xad\xbc\xf8\x2b\x5a\xf3\x94\xbf\x9f\xfe\x43\x05\xae\x94\x1e\
-\xf5\x10\x82\x03\x6f\x70\x2a\x66\xd7\x5b\xc7\xa1\xde\x25\x13\xef\
-\x58\x02\xe0\x28\x5d\x32\xf3\xd0\x64\xfb\xd6\xbf\xca\x8e\x97\xa7\
-\xf8\xba\x11\xd8\x34\x1f\x18\x7a\x0e\x10\xcc\xb5\x4e\x42\x64\x86\
-\x0d\x40\x0a\xd2\xd6\xf5\xb3\xac\x33\xec\x96\x38\x40\xe9\xf8\x97\
-\xa5\x70\xe0\x97\xba\xdf\xed\x53\x26\x91\x29\x73\xd6\x02\x98\xaa\
-\x8b\x67\x1e\xab\x2d\x6b\x1e\x46\xd3\x5b\x83\xad\x33\xed\x52\xa2\
-\xa3\xbb\x09\x18\x76\xbe\x75\x12\x22\x33\x3c\x08\x28\xc5\xe8\xca\
-\xab\xa7\xa0\xf9\xfd\xbe\xd6\x39\x76\x29\xbb\x6f\x97\x0c\x3a\xe3\
-\x3a\xe7\xf4\x45\xc7\x72\xf0\xcf\x6c\x32\x75\xce\x4b\xce\xd9\x2b\
-\x87\xc8\x80\xe9\xbf\x45\x28\xcf\xb5\xce\xb3\x4b\x9b\x9e\x05\x34\
-\x69\x9d\x82\xc8\x0c\x1b\x80\x14\xa3\x2d\x35\xbf\xf4\xe5\x62\xab\
-\xa2\xcf\x6d\x93\x92\x29\xa3\xa4\xe2\x1f\x7f\xb3\x8e\x42\xfe\x21\
-\xa7\x3c\x74\x93\xf4\x9f\x3e\x41\x73\x87\xf8\xef\x30\xfe\x58\x3d\
-\x50\xff\xb2\x75\x0a\x22\x33\x6c\x00\x52\x88\xce\xbb\xac\x00\x8d\
-\xef\x1c\x6b\x9d\xe3\x33\xca\x8f\x7b\x51\x66\x9c\x39\x40\x4e\xbe\
-\xbd\xda\x3a\x0a\xf9\x8f\x4c\x9d\xf3\x92\xd3\x7f\xc2\x10\x14\x8d\
-\xde\x6a\x9d\xe5\x33\x6a\x9f\xb1\x4e\x40\x64\x86\x0d\x40\x2a\x09\
-\xb7\xff\x14\xf1\x56\x5f\xfd\xcc\xa4\xfc\xc4\x85\xce\x69\x8b\x8e\
-\x17\x99\xe5\xcf\x69\x5e\xf2\x05\x99\x78\x7b\x83\x8c\x3d\x7c\x38\
-\x4a\xc6\x6e\xb0\xce\xb2\x93\x86\x37\x80\x8e\x3a\xeb\x14\x44\x26\
-\x7c\x35\x98\xd0\x9e\xb9\xd1\xda\x8b\xad\x33\x7c\x92\x5b\x76\xc2\
-\x4a\x39\xed\xe9\x53\xad\x73\x50\x6a\x90\xe1\x73\x3a\x65\xf8\xc0\
-\xc3\x50\x34\xc6\x3f\xeb\x43\x54\x81\x6d\x4b\xad\x53\x10\x99\x60\
-\x03\x90\x22\x74\xc9\x15\xc3\xa5\x75\x9d\x6f\x16\xff\x69\xd1\xd8\
-\x0d\xc1\xd3\x9f\x3d\xd1\x3a\x07\xa5\x16\x19\x33\xb7\x4b\x4a\xc7\
-\x8c\x43\xde\xe0\x76\xeb\x2c\x1f\xdb\xba\xdc\x3a\x01\x91\x09\x36\
-\x00\xa9\xa2\xab\xe5\x47\x70\xe3\xd6\x29\xba\xe5\x0c\xec\x70\xf2\
-\x8f\xf0\xdf\x5a\x04\x4a\x09\x32\xf1\xf6\x06\xe9\x77\xfc\xa9\xbe\
-\xd9\x1d\x10\xad\xee\xfe\x22\xca\x30\x6c\x00\x52\x84\x1b\xdd\x34\
-\xc3\x3a\x03\x00\xc0\x09\x43\x4a\x8e\xbb\x44\x78\xb8\x0f\x1d\x04\
-\x99\x78\xc7\x4a\x29\x9f\x70\x8b\x75\x8e\x8f\x6d\x7b\xde\x3a\x01\
-\x91\xe7\xd8\x00\xa4\x00\x5d\xf1\x95\x72\x69\xab\x2a\xb5\xce\x01\
-\x00\x52\x3e\x61\x9e\x4c\xbb\xeb\x33\x37\xc7\x11\xed\x2f\x39\xf9\
-\x91\xef\x68\xf1\x11\x9b\xac\x73\x00\x00\x76\x70\x3b\x20\x65\x1e\
-\x36\x00\xa9\xa0\xb3\xee\xdb\xbe\x98\xfe\xcf\x2a\x8f\x23\x94\x73\
-\x91\x75\x0c\x4a\x1f\x4e\xee\xa8\x2f\xa9\x13\xb1\x8e\x01\xb4\x54\
-\x01\xb1\x1d\xd6\x29\x88\x3c\xc5\x06\x20\x05\x68\x67\xfd\x97\xac\
-\x33\x00\x80\x94\x1d\xfd\x2b\xe1\x2d\x7e\xd4\x83\x64\xda\x9d\xaf\
-\x68\xe9\x31\x3e\x58\x86\xaf\xc0\x8e\xd7\xac\x43\x10\x79\x8a\x0d\
-\x40\x2a\x68\xdb\x70\xa8\x75\x04\xe4\xf4\x8f\x61\xea\x98\x1f\x5b\
-\xc7\xa0\xf4\x13\x28\x1e\x72\x1d\x02\x61\xeb\x18\xc0\x8e\xd7\xad\
-\x13\x10\x79\x8a\x0d\x80\xcf\xe9\xca\xab\xa7\x20\xd6\x10\xb0\xce\
-\x21\x45\x87\xdf\xcb\xc3\x7e\xa8\x37\xc8\xf1\x7f\x5d\xa3\xc5\x63\
-\x57\x5b\xe7\x40\xd3\x6a\x00\x3e\x3c\x66\x9b\xa8\x97\xb0\x01\xf0\
-\xbb\xf6\xc6\x2b\xac\x23\x20\x54\xe0\x22\x50\xf4\x5d\xeb\x18\x94\
-\xbe\x9c\x9c\x41\xdf\x86\x88\x6d\x88\xae\x66\xa0\x7d\xb3\x6d\x06\
-\x22\x0f\xb1\x01\xf0\x39\xed\xdc\x31\xd9\x3a\x83\x14\x8f\x7d\x4e\
-\x2a\xe6\x34\x59\xe7\xa0\xf4\x25\x53\xef\x59\x80\xc2\xcf\xd9\xdf\
-\x15\xd0\x68\x3f\x11\x41\xe4\x15\x36\x00\x3e\xa7\xd1\xcd\xc3\xac\
-\x33\x20\xbb\xef\xcf\xac\x23\x50\xfa\x93\xdc\x41\xf7\x5b\x67\x40\
-\xf3\x3b\xd6\x09\x88\x3c\xc3\x06\xc0\xc7\x74\xd1\xb5\x43\x25\x56\
-\x17\x32\xcd\x90\x3b\xb0\x43\xa6\xdc\xe9\x83\x55\xda\x94\xf6\x72\
-\x07\xff\x02\x8e\xf1\x62\xc0\x96\x0f\x6c\xeb\x13\x79\x88\x0d\x80\
-\x9f\x39\xad\xe7\x5b\x2f\x4a\x72\x72\x86\xf1\x88\x34\xf2\x84\x4c\
-\xb8\x65\x1b\x0a\x46\x6c\x33\x0d\xd1\x5e\x0b\x24\x3a\x4c\x23\x10\
-\x79\x85\x0d\x80\x9f\xc5\xa3\x15\xd6\x11\x90\x5b\xfc\x07\xeb\x08\
-\x94\x39\x24\x7b\xc0\x3c\xd3\x00\xaa\x40\xdb\x06\xd3\x08\x44\x5e\
-\x61\x03\xe0\x63\x1a\x6b\x3c\xc2\x34\x40\x56\x69\x42\x26\xff\xe3\
-\x51\xd3\x0c\x94\x59\x82\xc5\xbf\x02\x8c\x77\x03\xb4\xf2\x35\x00\
-\x65\x06\x36\x00\x7e\x16\xdb\x61\x7a\xfd\xaf\xe6\x0c\xa8\xb1\xac\
-\x4f\x99\x47\x2a\xe6\xbc\x87\xec\xf2\x2e\xd3\x10\x51\x7f\x5c\x4f\
-\xd0\xa3\xdc\xa4\x69\x79\x81\xd8\x06\xa0\x5d\x62\x03\xe0\x53\x5a\
-\x39\x35\x88\xce\xfa\x2c\xcb\x0c\x4e\x56\x1f\xde\x90\x42\x9e\xd3\
-\xec\xbe\xb5\xa6\x01\xda\xd3\xb0\x01\xd0\x84\x6d\x7d\x61\x03\xe0\
-\x47\x6c\x00\xfc\x2a\x32\xfc\x44\xb8\xb6\x0f\x42\x08\xe5\x3f\x65\
-\x1b\x80\x32\x91\x13\xee\xf3\x8a\x69\x80\xa8\x6d\xff\xd1\x2b\xd4\
-\x7a\xfc\x75\xac\x03\xd0\x2e\xb0\x01\xf0\xab\xce\x0e\xdb\x03\x80\
-\x9c\x10\x10\xc5\x23\xa6\x19\x28\x33\x05\x73\xe6\x9b\xd6\xef\x6a\
-\x02\xe2\x69\x76\xe7\x95\xf9\x0c\x00\x1b\x00\x3f\x62\x03\xe0\x57\
-\x89\xe8\x51\xa6\xf5\x73\x06\xb4\xc9\x19\xf7\xb6\x98\x66\xa0\xcc\
-\xd4\x19\x78\x08\x12\xb4\xcd\xd0\xb1\xc5\xb6\x7e\x4f\x33\x5e\x03\
-\xa0\x00\xef\x11\xf1\x21\x36\x00\x3e\xa5\x6e\x74\xa8\x69\x80\x70\
-\x71\x9a\x7d\x02\x52\xaa\x90\x33\xee\x6d\x41\x56\xa9\xed\xfb\xaf\
-\xce\xed\xa6\xe5\x7b\x9c\xf1\x0c\x80\x04\x02\x3c\x5c\xc1\x87\xd8\
-\x00\xf8\x55\xbc\xc3\x74\x07\x80\x04\x72\xb9\x03\x80\xcc\x68\xb8\
-\xb0\xd9\x34\x40\x67\xbd\x69\xf9\x1e\xe7\x1a\xbf\x02\x40\xb0\xdd\
-\x38\x00\xed\x02\x1b\x00\x9f\xd2\xae\x96\x62\xd3\x00\xe1\x9c\xf7\
-\x4d\xeb\x53\x46\x93\x50\xbe\xed\x0c\x54\xba\x35\x00\x09\xdb\xf1\
-\x57\x9c\x40\x9a\x2d\xaa\x48\x0f\x6c\x00\x7c\x4a\xba\x9a\xb3\x4d\
-\x03\x38\x91\x37\x4c\xeb\x53\x46\x93\x40\x4e\x95\x69\x80\xb4\x6b\
-\x00\x8c\xc7\x5f\x71\x5a\x6d\x03\xd0\xae\xb0\x01\xf0\x21\x5d\x7d\
-\x41\x18\x89\x16\xdb\x9f\x4d\x20\xc4\x3b\x00\xc8\x4e\x38\xe7\x6d\
-\xd3\xfa\xb1\x06\xd3\xf2\x3d\x2e\x1e\xb5\xad\x2f\x21\x36\x00\x3e\
-\xc4\x06\xc0\x8f\xb6\xe7\x8e\x80\x1a\x5e\x02\x14\x08\x03\x27\x8d\
-\xb0\xfd\x00\xa6\xcc\xe6\x84\x5e\x35\xad\x1f\x4f\xb3\x0d\x30\x71\
-\xeb\xf1\x37\x98\x66\xab\x2a\xd3\x03\x1b\x00\x3f\x52\xf7\x30\xd3\
-\xfa\xa1\x82\x84\xc8\x2c\x6e\xdb\x21\x3b\xc1\xc0\x1a\xd3\xfa\xe9\
-\xd6\x00\x58\xbf\x02\x08\x84\xaa\x6d\x03\xd0\xae\xb0\x01\xf0\x23\
-\xa7\xcb\x76\x0b\x60\x20\xcb\xf8\x08\x42\xca\x78\x0d\xd9\x1f\x98\
-\x5e\x0a\x94\xe8\x80\xf9\x49\x9c\x3d\xc9\x7a\x06\xc0\x09\xdb\xae\
-\xe9\xa0\x5d\x62\x03\xe0\x47\x6e\x7c\x90\x69\x7d\x27\xab\xd3\xb4\
-\x3e\x65\x3c\x99\x31\xbb\x1d\xc1\x88\xe1\x7b\x30\xd8\x0f\x9a\x3d\
-\x46\x81\x2e\xe3\x7f\x97\x78\x7c\x9d\x6d\x00\xda\x15\x36\x00\x7e\
-\x94\x4c\x94\x5a\x96\xd7\x60\x16\xf7\xec\x92\xbd\x40\x8e\xed\xf1\
-\x75\xd6\x0b\xe7\x7a\x4a\x57\x23\xe0\xc6\xec\xea\x4b\x00\x08\x6c\
-\xde\x68\x17\x80\x76\x87\x0d\x80\x1f\xa9\x5b\x68\x5a\xdf\x09\xa7\
-\xd9\x0b\x50\x4a\x45\x1a\xcc\x8e\x9b\x06\xb0\x1c\x34\x7b\x52\xfb\
-\x36\xdb\xfa\xe1\xc2\xa4\x54\x2c\xb6\x3e\x89\x88\x76\x81\x0d\x80\
-\x1f\x69\x57\xbe\x69\x79\x27\xd2\x64\x59\x9f\x08\x00\xc4\xc9\xb6\
-\x3d\x3e\x36\x99\x26\xa7\xd7\x76\x1a\x37\x00\x91\x82\x34\x99\x4a\
-\x49\x3f\x6c\x00\x7c\x28\xe9\x6a\xae\x65\xfd\x00\x4f\xed\x22\x3f\
-\x08\x46\x6c\xd7\xa2\x24\xd2\x63\x29\x8c\x76\xd8\x36\x00\x1a\xc8\
-\xe7\x03\x85\x4f\xb1\x01\xf0\x21\x71\xe3\xa6\x0d\x00\x44\xd2\x64\
-\xee\x93\x52\x9a\x1a\x5f\x21\x9b\x4c\x8f\x3f\x06\xd2\x61\xbb\x05\
-\x5f\x42\x39\xbc\x58\xcc\xa7\xd8\x00\xf8\x90\xc0\x0d\xdb\x26\x08\
-\xd8\xbe\x7b\x25\x02\xa0\x8e\xd8\xbe\x37\x4e\x97\x35\x00\x51\xdb\
-\xf5\x77\x12\xcc\xe1\x02\x40\x9f\x62\x03\xe0\x4b\x6e\xc0\x38\x40\
-\x9a\x7c\xf2\x51\x2a\x13\x38\xc6\x0d\x80\xed\x04\x44\x8f\x70\xbb\
-\x80\x56\xe3\x33\x78\x02\x39\xaf\xd8\x06\xa0\xdd\x61\x03\xe0\x43\
-\x0a\x35\x6e\x00\x02\x69\x74\x02\x0a\xa5\x2c\xc7\x31\x9e\x89\x4a\
-\x83\xc3\x30\x5b\xab\x00\x35\x5e\x80\xaf\xa1\xc5\xb6\x01\x68\x77\
-\xd8\x00\xf8\x51\xd2\x78\x06\xc0\x71\x38\x03\x40\x3e\x60\x3c\x03\
-\xa0\x69\xd0\x00\xb4\xd8\x9e\xbf\xa3\x4e\x04\xa8\x38\xe4\x25\xd3\
-\x10\xb4\x5b\x6c\x00\x7c\x48\x1c\xe3\x9f\x8b\x80\x33\x00\x64\x4e\
-\xc5\x78\x0d\x80\xa6\xc1\x2b\x80\x96\xb5\xa6\xe5\x25\xbb\xac\x9d\
-\xf7\x8a\xf8\x17\x1b\x00\x1f\x52\x55\xe3\x9f\x8b\x72\x11\x20\x99\
-\x13\x31\x7e\x05\x90\x0e\x0d\x40\xf3\x7b\xb6\xf5\x23\x25\x5b\x6d\
-\x03\xd0\x9e\xb0\x01\x20\x22\x7f\x52\xb1\xbd\x0b\x20\xd5\xb5\x6d\
-\x00\xac\xb7\x00\x86\x8b\xdf\x30\x0d\x40\x7b\xc4\x06\x80\x88\x28\
-\x0d\x69\xdd\x0b\xd6\x11\x80\x60\xfe\x42\xeb\x08\xb4\x7b\x6c\x00\
-\x88\x88\xd2\x90\xd4\xbd\x68\x1c\x40\x80\x60\xfe\x23\xb6\x21\x68\
-\x4f\xd8\x00\x10\x11\xa5\x9b\x8e\xba\xee\x2d\x80\x96\xb2\xfb\xc6\
-\x64\xf2\x6c\x9e\x02\xe8\x63\x6c\x00\x88\x88\xd2\xcd\xd6\x4a\xeb\
-\x04\x40\xf6\x80\x0f\xac\x23\xd0\x9e\xb1\x01\x20\x22\x4a\x27\x6e\
-\x1c\xa8\x7d\xc6\x3a\x05\x24\xab\xcf\x62\xeb\x0c\xb4\x67\x6c\x00\
-\x88\x88\xd2\xc9\xd6\xa5\x40\xac\xd1\x3a\x05\x10\x29\xb8\xcb\x3a\
-\x02\xed\x19\x1b\x00\x22\xa2\xb4\xa1\xc0\xc6\x27\xad\x43\x00\x91\
-\xb2\xb8\x4c\x9a\xb3\xca\x3a\x06\xed\x19\x1b\x00\x22\xa2\x74\x51\
-\xff\x0a\x10\x35\xbe\xfc\x07\x00\xf2\x87\xbc\x6f\x1d\x81\xf6\x8e\
-\x0d\x00\x11\x51\x3a\xd0\x04\xb0\xf6\x4e\xeb\x14\x00\x00\x89\x94\
-\x3e\x64\x9d\x81\xf6\x8e\x0d\x00\x11\x51\x3a\xa8\x7e\x1c\x68\xaf\
-\xb5\x4e\x01\x38\x61\x20\x2f\xe7\x8f\xd6\x31\x68\xef\xd8\x00\x10\
-\x11\xa5\xba\x68\x0d\x50\xf5\xa0\x75\x0a\x00\x80\xe6\x0f\xaf\x93\
-\xe3\xef\xda\x61\x9d\x83\xf6\x8e\x0d\x00\x11\x51\x2a\x73\x63\xc0\
-\xea\x5b\x00\xd7\x1f\x97\x78\x3a\xb9\x43\x78\xfa\x5f\x8a\x60\x03\
-\x40\x44\x94\xb2\x14\x78\xef\x56\xa0\xd5\x27\x67\xee\x38\x61\x20\
-\x50\xf2\x33\xeb\x18\xb4\x6f\xd8\x00\x10\x11\xa5\xaa\xf5\xf7\x01\
-\x5b\x96\x5a\xa7\xf8\x98\x16\x8e\xda\x24\x15\x7f\xdb\x64\x9d\x83\
-\xf6\x0d\x1b\x00\x22\xa2\x54\xb4\xe1\x9f\xc0\x86\x87\xad\x53\xec\
-\xc4\xc9\x19\x70\xaf\x75\x06\xda\x77\x41\xeb\x00\x44\x44\xb4\x3f\
-\x14\x58\x77\x37\x50\xfd\xa8\x75\x90\x9d\x85\x8a\x5c\xb4\xf7\xf9\
-\xa9\x75\x0c\xda\x77\x6c\x00\x88\x88\x52\x45\xa2\x03\x78\xf7\xff\
-\x80\xed\x2f\x58\x27\xf9\x0c\xb7\xf8\xf0\x15\xc1\xd3\x66\xb7\x5b\
-\xe7\xa0\x7d\xc7\x06\x80\x88\x28\x15\x34\xbd\x07\xbc\xf3\x7f\x40\
-\xc7\x56\xeb\x24\x9f\x25\x0e\x02\x79\xfd\xff\xdd\x3a\x06\xed\x1f\
-\x36\x00\x44\x44\x7e\x96\x88\x02\x1f\xdc\x0f\x6c\x9a\x0f\xa8\x6b\
-\x9d\x66\x97\xb4\x70\xf4\x66\x87\x67\xff\xa7\x1c\x36\x00\x44\x44\
-\x7e\x94\xec\x04\x6a\x17\x02\xd5\x0f\x03\x5d\xcd\xd6\x69\xf6\xc8\
-\x29\x1e\x79\x33\xc0\xf1\x3f\xd5\xb0\x01\x20\x22\xf2\x93\xae\x66\
-\xe8\xa6\xa7\x21\x9b\x9e\x02\xe2\x6d\xd6\x69\xf6\xae\xe0\xd0\x1d\
-\x72\xd2\x3d\x77\x58\xc7\xa0\xfd\xc7\x06\x80\x88\xc8\x9a\xdb\x05\
-\xec\x78\x1d\xa8\x7b\x1e\xd8\xf6\x3c\xc4\x27\xa7\xfa\xed\x0b\x29\
-\x18\xf5\xdf\xc0\xab\xd6\x31\xe8\x00\xb0\x01\x20\x22\xb2\x90\x88\
-\x02\x0d\x6f\x00\xdb\x57\x01\xf5\x2f\x77\x4f\xf9\xa7\x18\x2d\x3c\
-\xb4\xd1\x99\x76\xff\xef\xac\x73\xd0\x81\x61\x03\x40\x44\xd4\xdb\
-\xd4\x05\xa2\x9b\x80\xb6\x0f\xba\x57\xf3\x37\xbd\x0b\xb4\x6f\x02\
-\x54\xad\x93\x1d\x38\x11\x38\x05\xa3\xbf\xc1\xa7\xff\xd4\xc5\x06\
-\x80\x88\xe8\x60\xb9\x71\x20\xd1\x0a\xc4\x5b\x81\xce\x1d\x40\xfb\
-\x56\xa0\x63\x0b\xd0\xbe\x05\xe8\xd8\xd6\xfd\xa5\x09\xeb\x94\x3d\
-\x4a\x8b\xc6\x54\x39\x15\xf7\xde\x63\x9d\x83\x0e\x1c\x1b\x00\x22\
-\xa2\x5d\xa9\x7f\x0d\x88\x35\x75\xdf\xb6\x07\x00\xf1\x28\x00\xed\
-\x7e\x5f\xef\xc6\xbb\x07\xfb\x8f\xbe\x52\x70\xfa\xfe\xa0\x04\xb3\
-\xd4\xc9\x1d\x79\x09\xf0\xbc\x75\x12\x3a\x08\x6c\x00\x88\x88\x76\
-\xa5\xe9\xed\xee\x2f\xfa\x0c\x29\x3d\xfe\x51\x99\x76\xb7\xff\x8e\
-\x23\xa4\xfd\xc2\xcb\x80\x88\x88\x68\xdf\xe5\x0e\x8e\x62\x60\xf6\
-\xc5\xd6\x31\xe8\xe0\xb1\x01\x20\x22\xa2\x7d\xe3\x84\x20\x7d\x8e\
-\xba\x5a\xc6\xcc\x4d\x9d\x7d\x8a\xb4\x5b\x6c\x00\x88\x88\x68\x9f\
-\x48\xe9\x09\x8f\xcb\xd4\xfb\xe6\x5a\xe7\xa0\x9e\xc1\x06\x80\x88\
-\x88\xf6\xae\xe0\xd0\x1d\x98\x7e\xec\x39\xd6\x31\xa8\xe7\xb0\x01\
-\x20\x22\xa2\x3d\x8b\x14\x27\xa5\xe4\x88\x69\x22\xb3\xfc\x79\x1b\
-\x11\x1d\x10\x36\x00\x44\x44\xb4\x7b\x4e\x18\x52\x3a\xf9\x3a\x99\
-\x7c\xd7\x9b\xd6\x51\xa8\x67\xb1\x01\x20\x22\xa2\xdd\x92\xbe\x93\
-\xee\x90\x93\x79\xd9\x4f\x3a\xe2\x39\x00\x44\x44\xb4\x4b\x6e\xd9\
-\x89\x4b\x82\xa7\x3e\x76\x8d\x75\x0e\x3f\x52\xbd\x20\x80\xc5\x59\
-\x5f\x49\xc6\xea\x2f\x76\xba\xb6\x1f\x8e\x8e\xfa\x42\x24\xa2\x0e\
-\x92\x5d\x82\x60\x8e\x22\x5c\xd8\xa5\x59\x7d\xea\x9c\x70\xe9\x2a\
-\x64\x95\xfd\x5e\x26\xdf\xbe\xc2\x3a\xf3\xa7\xb1\x01\x20\x22\xa2\
-\xcf\x2a\x1d\xff\x66\xf0\xf4\xa7\xa7\x5a\xc7\xf0\x1b\xad\xba\xa3\
-\x08\x1b\x9e\x9e\xad\x0f\xbd\x7c\x0e\x3a\xb6\x07\x77\x39\x8d\x9e\
-\x88\x0a\x12\xd1\x88\xb4\x6f\x1e\xa4\xc0\xf9\x10\x39\xdf\x7d\xe2\
-\xb8\x06\xe9\x73\xdc\x4f\x65\xe2\x1f\x6f\xf1\x3a\xf3\xee\xf0\x15\
-\x00\x11\x11\xed\x44\x4b\xc6\x55\x49\xb6\x1e\x63\x9d\xc3\x6f\x74\
-\xc9\xd5\xff\x4f\x5f\xfd\x55\x9d\xd6\xcc\xbb\x00\x1d\xdb\xf7\xfd\
-\x01\x5a\x15\x68\x7c\xb7\x44\xd7\xdd\xf5\x7b\xf7\xa9\x29\x5b\x75\
-\xf9\xf5\x93\x7a\x31\xe6\x3e\x63\x03\x40\x44\x44\x1f\xd3\x92\x23\
-\xd6\x3b\x87\x15\x8c\x96\x8a\xc5\xe9\x75\x7b\xd1\x41\xd0\xaa\x3b\
-\xb2\xdc\xe7\xce\x7f\x49\x37\x3e\xfc\x43\x44\x37\x1d\xc4\xcc\xb9\
-\x02\x3b\x5e\xed\xab\x35\x4f\x2e\xd5\xca\x4b\x6f\xea\xb9\x84\x07\
-\x86\x0d\x00\x11\x11\x01\x00\xb4\xf4\xd8\xd7\x9c\x33\xa7\x8f\x92\
-\x43\xe7\xc7\xac\xb3\xf8\x85\xbe\xfc\xfd\x42\x77\xf5\x1d\x1b\xb0\
-\xe9\x99\xf1\x3d\x76\x7d\x73\xbc\x55\xb4\xf6\xe9\x5f\xeb\x73\x17\
-\xcf\xe9\x99\x6f\x78\x60\xd8\x00\x10\x11\x65\x3a\x11\x48\xdf\x49\
-\xcf\x06\xce\x78\xee\x68\xee\xf5\xff\x17\xd5\xca\xa0\xd6\xbf\xfa\
-\x96\x34\xbc\xd6\xb7\xc7\xbf\xb9\x1b\x87\xd6\x3e\x7d\x95\x2e\xbd\
-\xea\x27\x3d\xfe\xbd\xf7\x11\x1b\x00\x22\xa2\x0c\xa6\x4e\x04\x32\
-\xe0\xd4\x5f\xca\xf4\xf9\xd3\xad\xb3\xf8\x8d\x56\xfe\xe9\x69\x6c\
-\x5f\x35\xb8\xf7\x0a\x24\xe1\xd6\xcc\xff\xb1\x2e\xbb\xf6\x82\x5e\
-\xab\xb1\x07\x6c\x00\x88\x88\x32\x55\x56\x69\xc2\x19\x78\xca\xc5\
-\x72\xf2\xc3\xff\x61\x1d\xc5\x6f\x74\xc5\x0d\x17\xa3\x76\xe1\xc9\
-\xbd\x5d\x47\x92\x1d\x70\xb7\xad\xbc\x4b\x57\x5f\x10\xee\xed\x5a\
-\x9f\xc6\x06\x80\x88\x28\x13\x15\x8d\xad\x91\xbe\x53\x47\x48\xc5\
-\xfd\x0f\x58\x47\xf1\x1b\x55\x15\x6d\x78\xe3\x56\x68\xd2\x93\x7a\
-\xd2\xbe\x29\x0b\x9b\xa3\x7f\xf5\xa4\xd8\x27\xb0\x01\x20\x22\xca\
-\x20\xea\x44\x20\xfd\x4e\xbe\xd3\x39\x7b\xe5\x10\x99\x72\x47\x8d\
-\x75\x1e\x5f\x5a\x7e\xed\xb7\xd1\xf8\x46\x91\x97\x25\xb5\x61\xf5\
-\x65\xba\xfc\xdf\xf3\xbd\xac\xc9\x06\x80\x88\x28\x53\xe4\x1f\xd2\
-\xe4\x0c\x3a\xed\x0b\xf2\x85\x47\x67\x5a\x47\xf1\x33\x6d\x5e\xf3\
-\x6d\xcf\x8b\xc6\x1a\x02\xe8\xaa\xf9\x91\x97\x25\xd9\x00\x10\x11\
-\xa5\xbb\x50\xbe\x2b\x03\x4e\xf9\x8b\x73\xce\xeb\xc5\x32\xf5\x9e\
-\x05\xd6\x71\xfc\x4c\x5f\xb8\xa1\x0f\x9a\xde\x1d\x64\x52\xbb\xbd\
-\xe6\x22\x2f\xeb\xf1\x28\x60\x22\xa2\x74\xe5\x84\x81\xd2\xcf\xbf\
-\x20\xa1\xa1\x17\xc9\xc9\xb7\x57\x5b\xc7\x49\x09\x1d\x0d\xd7\xc0\
-\xed\xb2\xa9\xdd\xb6\x61\x90\xaa\x8a\x88\xf4\xd0\x81\x03\x7b\xc6\
-\x06\x80\x88\x28\xdd\x88\x03\x2d\x3e\xa2\xca\x29\x19\x75\xb9\x4c\
-\xbc\x63\xa5\x75\x9c\x94\x12\x6b\x9b\x6c\x56\xbb\xab\xd9\xc1\xf2\
-\xeb\x8e\x06\xf0\x8a\x17\xe5\xd8\x00\x10\x11\xa5\x0b\x09\x02\xc5\
-\x47\xac\x95\xbc\xa1\x37\x38\x53\xef\x59\x00\xf8\xee\x02\x3a\xdf\
-\xd3\x64\xdb\x30\xdb\x00\xed\x27\x80\x0d\x00\x11\x11\xed\x93\x60\
-\xae\x6a\xf1\xe1\xaf\x39\x85\x43\x6f\xec\x7e\xe2\x5f\x66\x9d\x28\
-\x65\x69\x22\x96\x27\x96\x01\x92\x89\x9e\x3f\x75\x70\x37\xd8\x00\
-\x10\x11\xa5\xaa\xdc\x41\xed\x92\x7f\xd8\x5c\x84\xca\x6f\x72\x2a\
-\x66\xd7\x5b\xc7\x49\x0f\xae\xe7\x07\xf2\xec\x5c\x3e\x19\xf2\xaa\
-\x14\x1b\x00\x22\xa2\x54\x12\x2e\x4e\x6a\xfe\x21\x6f\x3b\x79\x83\
-\x7f\x25\x53\xee\xba\x0f\x78\xd7\x3a\x51\x7a\xd1\xa4\xed\xb8\xa8\
-\xc1\x76\xaf\x4a\xb1\x01\x20\x22\xf2\xbb\xec\xbe\x5d\xc8\x1b\xfa\
-\xa6\x84\x4b\xef\x82\xb3\xed\x56\xa7\xa2\x92\x57\xf5\xf6\x12\x41\
-\x32\x60\x1a\x20\xa0\x6c\x00\x88\x88\x32\x56\x30\x5b\x91\x37\x74\
-\xbb\x44\xca\x57\x21\x52\xfc\xa7\xee\xbd\xfb\xeb\xac\x53\x65\x06\
-\xd7\xb5\x6d\x00\x34\xc0\x06\x80\x88\x28\x63\x64\x95\x26\x34\xbb\
-\xdf\x56\x27\x54\xf2\x2a\x22\x45\x73\x51\xde\xf5\xa0\x8c\x99\x6b\
-\xb4\x19\x3d\xc3\xa9\xf1\x0c\x80\xf0\x15\x00\x11\x51\xfa\x09\x66\
-\xab\x46\xca\xda\x25\x52\xb2\x59\xc2\x05\x6b\x11\xcc\x5d\x8e\x40\
-\xce\x43\x32\x65\xce\x5a\xa0\xca\x3a\x1d\x01\x50\x75\x03\xa6\xbb\
-\x00\xdc\x64\xd4\xab\x52\x6c\x00\x88\xc8\x9f\x44\x4d\x3f\x87\xf7\
-\x5b\x20\x0c\x84\x72\x13\x08\x16\x74\x22\x90\xdd\xae\xa1\xdc\x3a\
-\xc7\xc9\xde\x84\x60\xce\x3a\x04\x42\x6f\x23\x12\x7e\x41\x26\xde\
-\xf5\x1a\xb0\xdd\x3a\x29\xed\x81\xb8\x31\xdb\x71\x31\x10\x6c\xf3\
-\xaa\x14\x1b\x00\x5f\x12\xd7\xb8\xbe\x67\xdb\x50\x88\x76\xcf\x35\
-\xfd\x7c\xd2\xc2\xc3\xea\x9c\xec\xb2\x97\x21\xa1\x06\x08\x3e\x3c\
-\x9a\x35\xd8\x0e\x38\xad\x70\x9c\xed\x90\x40\x03\x02\xa8\x47\x32\
-\x54\x8f\x70\xce\x1a\x39\xf1\xb6\xed\xc0\x0e\xcb\xc8\xd4\x13\x12\
-\x1d\xc6\xe3\xa2\xc3\x06\x20\xa3\x29\x6c\x1b\x00\x85\xed\x3e\x58\
-\x22\x00\x70\xd5\xb4\x11\x75\x22\x7d\x9f\x97\x2f\x3c\xf5\x45\xcb\
-\x0c\x64\x20\xd1\x6e\x7b\x49\x5e\x18\x4d\x5e\x95\xe2\x6d\x80\x7e\
-\x14\x70\x92\xa6\xf5\x5d\x37\x62\x5a\x9f\x08\x00\xd4\xb5\x9d\x89\
-\x0a\x06\x62\xa6\xf5\xc9\x73\xfa\xe2\xf7\xfa\x41\x2d\x77\x58\x0a\
-\xd0\x9a\xfc\xc0\xab\x6a\x6c\x00\x7c\x48\x20\xb6\x0d\x00\x92\x9c\
-\x01\x20\x7b\x6a\xfb\x0a\x00\x0a\xae\xc2\xcf\x34\xd1\xcd\xc3\x4c\
-\xeb\x87\xb2\x55\xa6\xdf\xed\xd9\x22\x40\x36\x00\xbe\x64\x3c\x03\
-\x00\x70\x06\x80\xcc\xa9\xf1\x1a\x00\xa8\xc3\xc3\x76\x32\x8d\xab\
-\x83\x4d\xeb\x07\x72\x3d\xfd\x9d\x63\x03\xe0\x43\x0a\xc7\x78\xea\
-\xd1\xbb\xb3\xa8\x89\x76\x47\xa0\xb6\xfb\xb1\x1d\xe9\x34\xad\x4f\
-\xde\xd3\xe4\x68\xd3\xfa\xa1\x1c\x4f\x67\x9d\xd8\x00\xf8\x90\x3a\
-\x21\xcf\x0e\x82\xd8\x75\x00\xe5\x0c\x00\xd9\xb3\x7e\x05\x00\xa7\
-\xc5\xb6\x3e\x79\x4e\x62\x23\x4d\xeb\x07\xb2\x3c\xfd\xec\x67\x03\
-\xe0\x43\x01\x47\x3c\x7b\x07\xb4\x2b\x49\x37\x9e\x6f\x59\x9f\x08\
-\x00\x90\x8c\x65\x9b\xd6\x0f\x84\xb8\xa7\x2f\xc3\x68\xa2\x63\xa8\
-\x69\x80\x40\xb6\xa7\x4d\x27\x1b\x00\x3f\x92\x70\xab\x65\x79\x47\
-\xe3\x85\x96\xf5\x89\x00\x00\xc9\xce\x2c\xdb\x00\xc2\x06\x20\xc3\
-\x68\xa2\xa3\xbf\x69\x80\x40\xc4\xb3\x2d\x80\x00\x1b\x00\x7f\x12\
-\xa7\xd9\xb2\xbc\x26\xbb\x0a\x2c\xeb\x13\x01\x00\x12\xed\xb6\x6b\
-\x51\x02\xa8\x37\xad\x4f\x9e\x93\x78\xb4\xc4\xb4\xbe\x84\x1b\xbc\
-\xac\xc7\x06\xc0\x8f\x24\x68\xfa\xc1\x23\x89\xce\x1c\xcb\xfa\x44\
-\x00\x80\x64\x87\xed\x22\xc0\x60\x16\xcf\xec\xcd\x34\xf1\x66\xdb\
-\xd7\x9f\x81\xac\x6a\x2f\xcb\xb1\x01\xf0\x23\x09\xd6\x98\xd6\x77\
-\xad\xa7\x5e\x29\xd3\xe9\x13\xd7\xe7\x20\xd1\x69\x7b\x17\x40\x2c\
-\xb4\xc6\xb4\x3e\x79\x4a\x57\x7e\x3b\x1b\x9d\x3b\x6c\xcf\x40\x09\
-\x67\xbd\xe1\x65\x39\x36\x00\x7e\x14\x0a\x79\x76\x12\xd4\x2e\x25\
-\x3b\x79\x10\x10\xd9\x2a\xe9\x18\x81\x8f\x8e\xdf\xb7\x10\x08\x43\
-\x2a\x66\xf3\x15\x40\x26\x49\x34\x4d\xb6\x3d\x05\x10\x00\xb2\x5f\
-\xf4\xb2\x1a\x1b\x00\x3f\x4a\x06\xd7\x5b\x96\xd7\xae\x56\xde\x11\
-\x41\xb6\x62\x72\x88\x69\xfd\x50\x81\xf5\x48\x40\x5e\x8b\x47\x27\
-\x99\xd6\x77\x42\x40\x4e\xe0\x35\x4f\x4b\x7a\x59\x8c\xf6\x51\x79\
-\xf4\x03\x88\xdd\xec\xa7\xb8\x31\xe8\x8a\x2b\x8e\x30\x0b\x40\xa4\
-\xed\xe3\x4d\xeb\x07\x72\x78\x0f\x40\xa6\x49\xb6\x1f\x69\x5a\x3f\
-\x52\x12\x97\xf1\xb3\xe3\x5e\x96\x64\x03\xe0\x43\x32\x66\x6e\x97\
-\x06\x0b\x6d\x6f\x04\xec\x4a\x4c\x30\xad\x4f\x99\x2d\xd9\x39\xc6\
-\xb4\x7e\x28\xc7\xb3\x2b\x59\xc9\x1f\x34\xde\x76\xa8\x69\x80\x70\
-\xa1\xe7\x07\x4f\xb1\x01\xf0\x29\x89\x14\xda\x9e\x06\xe8\xc6\x6c\
-\xbb\x61\xca\x68\x6e\x3c\x3a\xc2\xb2\xbe\x06\x73\xf9\xfe\x3f\xd3\
-\x74\xd6\xdb\xde\x03\x10\xca\xf7\x7c\xd7\x09\x1b\x00\xbf\x0a\xe7\
-\x79\x7a\x20\xc4\x67\xc4\xdb\x3f\x67\x5a\x9f\x32\x9a\x24\xdb\xfa\
-\x59\xd6\x77\x9c\xec\x4d\x96\xf5\xc9\x5b\x5a\x39\x2b\x0b\x9d\x5b\
-\x72\x2d\x33\x48\x30\x77\xa3\xd7\x35\xd9\x00\xf8\x55\x30\x67\x9b\
-\x65\x79\x4d\x46\x87\x58\xd6\xa7\x0c\x17\x6b\x2e\x32\xad\x1f\xcc\
-\x59\x67\x5a\x9f\xbc\x15\x58\x77\x26\x92\xc6\xb7\x3f\x07\xb2\xdf\
-\xf2\xba\x24\x1b\x00\x9f\x12\x27\xc7\xf3\x6e\x70\x27\xb1\x26\xdb\
-\x23\x31\x29\x63\xe9\x13\xd7\xe7\x20\xb6\xc3\xf6\x42\xaa\x40\xe8\
-\x6d\xd3\xfa\xe4\xad\x78\xfb\x69\xd6\x11\x10\x29\x7a\xd6\xeb\x92\
-\x6c\x00\xfc\x2a\xe0\xed\x81\x10\x9f\xd1\xbe\x39\x5f\x9f\xb8\x9e\
-\x27\x02\x92\xf7\xf2\xa2\xe7\xc2\x35\x7e\x1a\x8b\x84\x5f\xb0\x0d\
-\x40\x5e\xd2\xce\xa6\x63\x4d\x03\x38\x11\x20\xcb\x59\xec\x79\x59\
-\xaf\x0b\xd2\x3e\x0a\xe4\x2c\x35\xad\xef\x76\x01\x05\x9d\x5f\x32\
-\xcd\x40\x99\x29\xde\x7c\xa6\x69\xfd\x60\xb6\xca\xc4\xbb\x3c\xdd\
-\x8f\x4d\xc6\xba\xea\x6c\x17\x9d\x66\xf7\x8f\x7a\xbd\x05\x10\x60\
-\x03\xe0\x5f\x65\x1d\x2b\xe0\x18\x1f\xc8\x17\x6b\x98\x61\x1b\x80\
-\x32\x91\xdb\xd5\x6c\x7b\x06\x40\x56\xb9\xe9\x75\xdc\xe4\x2d\x7d\
-\xe1\xca\x3e\x88\xd6\x9a\xde\x01\x20\x39\x7d\x4c\x8e\x7f\x67\x03\
-\xe0\x53\x32\x66\x6e\x17\xb2\xfa\x98\x1e\x46\x62\xfe\x41\x4c\x19\
-\x49\x3a\xb6\x99\x6e\xc7\xd2\x70\xf1\x56\xcb\xfa\xe4\xb1\x8e\xf8\
-\x55\x70\x3d\x7f\xf8\xde\x89\x84\x0a\x4c\xd6\x9c\xb0\x01\xf0\xb3\
-\x70\xa9\xe9\x6d\x64\xd2\xb1\x85\x3b\x01\xc8\x53\xba\xe8\xda\xa1\
-\xe8\xdc\x6a\xba\x00\xd0\x09\x17\xf0\x12\xa0\x4c\x12\x6b\x3c\xcb\
-\x3a\x02\x02\xb9\x2b\x2c\xca\xb2\x01\xf0\x31\xc9\x2a\xb4\x5d\x89\
-\xdc\xb1\x2d\xac\xcb\x66\xda\xaf\x8e\xa5\x0c\xd2\xf8\x7d\xa8\xe1\
-\x25\x40\x00\x10\xcc\x5d\x6e\x1b\x80\xbc\xa4\x1d\x75\xc6\x87\x9e\
-\x09\x10\x29\x7e\xd2\xa2\x32\x1b\x00\x3f\x0b\xe6\x2f\xb6\x8e\x80\
-\x8e\xba\x1b\xad\x23\x50\xe6\xd0\x8e\xcd\xc6\xeb\x4e\x04\x08\xe4\
-\x3c\x64\x9b\x81\xbc\xa2\x2f\x5f\x9f\xa3\x6d\xd5\x25\xa6\x21\xb2\
-\xfa\x24\x64\xe2\x9f\x4d\xce\x9d\x60\x03\xe0\x67\x81\xc8\x5c\xc0\
-\xf6\x4a\x74\x8d\x56\x9f\x64\x1a\x80\x32\x86\x56\xce\x2c\x42\xcb\
-\xfa\x81\xa6\x21\x22\xa5\x71\x99\x32\x67\xad\x69\x06\xf2\x4e\x6b\
-\xdb\x75\xe2\x1a\xdf\xfb\x94\x3b\xc0\xec\xd4\x49\x36\x00\x3e\x26\
-\x53\xee\xae\x42\xa4\xd4\x76\x75\x4a\xdb\xc6\x7c\xad\xbc\xf4\x28\
-\xd3\x0c\x94\x19\xdc\xb6\xef\x22\xd1\x69\xda\xf1\x6a\x4e\x5f\xd3\
-\x13\x38\xc9\x5b\xda\x55\x7f\xb1\x75\x06\x09\xf7\x79\xd1\xaa\x36\
-\x1b\x00\xbf\xcb\xed\x6f\xb2\x3d\xe4\x63\xaa\x40\xbc\xe5\xc7\xa6\
-\x19\x28\x23\x68\xc7\xe6\xcb\xad\x33\x38\x91\x62\xee\xff\xcf\x20\
-\xda\x56\x63\xff\x70\x93\x5d\xfc\xb0\x55\x69\x36\x00\x3e\x27\x59\
-\x7d\xcc\x17\x24\x69\xd3\xea\x19\x5a\x35\x33\xcb\x3a\x07\xa5\x2f\
-\x7d\xee\xaa\x63\xd0\xf8\xee\x30\xeb\x1c\x08\x15\x3f\x68\x1d\x81\
-\xbc\xa1\x2b\xbf\xf2\x79\x89\xd6\xda\x7e\xae\x05\x73\x15\x59\x91\
-\x47\xac\xca\xb3\x01\xf0\xbb\x60\xc1\x3d\xd6\x11\xd0\x59\x1f\xc4\
-\xfa\xb6\xff\x67\x1d\x83\xd2\x97\x76\xd5\xfe\x09\x9a\xb0\x0d\x11\
-\xcc\x56\x94\x77\xb1\x01\xc8\x14\xed\xdb\xbe\x09\x18\xef\x38\xc9\
-\x1b\x5c\x6f\x71\x02\xe0\x47\xd8\x00\xf8\x9c\x4c\xbd\x67\x81\x86\
-\x8a\x5c\xeb\x1c\x6e\xf3\x7b\x5f\xb6\xce\x40\xe9\x49\x57\x7d\xb3\
-\x2f\x1a\xde\x3e\xce\x3a\x07\xf2\x86\x6e\x97\x31\x73\x8d\x2f\x21\
-\x20\xaf\xb8\x1d\x5b\xa6\x5b\x67\x90\xac\xf2\x37\x2d\xeb\xb3\x01\
-\x48\x05\xf9\xc3\x3e\xb0\x8e\x20\xd1\xea\x3c\x5d\x72\xf1\x0d\xd6\
-\x39\x28\x0d\xb5\xae\xbf\x0d\x89\xa8\xed\x76\x17\x00\x12\x29\x5f\
-\x65\x9d\x81\xbc\xa1\x2f\x7f\xab\xbf\x34\xaf\xed\x67\x9d\x03\xe1\
-\x92\xa7\x2c\xcb\xb3\x01\x48\x01\x4e\x76\xe9\x13\xd6\x19\x00\x40\
-\x77\xbc\xfd\x0b\xd5\x59\xfc\x9d\xa1\x1e\xa3\x4b\xae\x18\xae\xf5\
-\xaf\x7c\xd1\x3a\x07\x00\x20\xab\xf4\xcf\xd6\x11\xc8\x23\xcd\x35\
-\x3f\x30\xbf\x71\xd2\x09\x03\x05\x45\xa6\xaf\x78\xf9\x61\x9e\x0a\
-\x82\x45\xbf\x83\x04\xad\x53\x00\x6d\xd5\x79\x58\xf4\xfa\x6c\xeb\
-\x18\x94\x3e\x34\x5a\xfb\x18\xe2\x6d\xe6\x4f\xff\xc8\xee\xdb\x25\
-\x53\xee\xf4\xfc\x3e\x76\xb2\xe1\xb6\x6f\x3e\xd7\x3a\x03\xf2\x47\
-\xec\x90\xa3\xff\x50\x67\x19\x81\x0d\x40\x0a\x90\x29\x77\xd4\x20\
-\x7f\x58\xa3\x75\x0e\x00\xd0\xed\xab\xae\xd1\xe7\xae\x3a\xc6\x3a\
-\x07\xa5\x3e\x5d\x74\xd1\x8d\xd8\xf1\xf2\x58\xeb\x1c\x00\x80\xbc\
-\xa1\xa6\xef\x62\xc9\x3b\xba\xea\x07\x7d\xa5\x65\xcd\x00\xeb\x1c\
-\x92\x3b\x70\x99\x75\x06\x36\x00\x29\x42\x72\x07\x2c\xb0\xce\x00\
-\x00\x48\x44\x45\x5b\xde\x7a\x46\x57\x5f\x60\x7c\x57\x31\xa5\xb2\
-\xee\xa9\xff\x97\x7e\x6b\x7e\xee\xff\x87\x24\x5c\x7a\x97\x75\x06\
-\xf2\x48\xfb\x9a\x1f\x22\xe9\x83\xb5\x9e\x59\xa5\x7f\xb5\x8e\xc0\
-\x06\x20\x55\x04\xcb\xfe\x0b\x12\xb0\x4e\xd1\xad\x65\x6d\x9f\xe4\
-\xc6\xe6\x4a\xeb\x18\x94\x9a\xb4\x72\x6a\x50\x9b\xde\x5b\x85\x58\
-\x5d\xc8\x3a\x0b\x00\x20\x52\x92\x84\xb3\xed\x56\xeb\x18\xe4\x0d\
-\xb7\x75\xc3\xa5\xd6\x19\x90\x55\x96\x90\x49\x7f\x9b\x67\x1d\x83\
-\x0d\x40\x8a\x90\x8a\x39\xef\xa1\xe0\x90\x7a\xeb\x1c\x1f\x71\xea\
-\x56\x4d\xd4\x85\x67\xdf\x69\x9d\x83\x52\x8f\xdb\xe9\xbc\x80\xe6\
-\xf7\xca\xad\x73\x7c\xc4\x2d\x18\xf5\x92\x54\x2c\x36\x3e\x84\x80\
-\xbc\xa0\x95\xd7\x8c\x97\x96\xb5\x7d\xac\x73\xa0\x60\xd8\x7b\xd6\
-\x11\x00\x36\x00\x29\x45\xb2\x87\x3c\x6a\x9d\xe1\x5f\x14\xba\x65\
-\xc9\x95\xba\xf0\xfc\xdf\x58\x27\xa1\xd4\x91\x78\x7a\x7a\xa5\xd4\
-\xbd\x74\xb4\x75\x8e\x4f\x0a\xe4\x94\xfd\xda\x3a\x03\x79\xa4\x6b\
-\xdb\xcf\xa1\xe6\xc7\xaa\x40\xb2\xfb\xf9\xe2\xb3\x9c\x0d\x40\x2a\
-\xc9\xed\xfb\x43\x04\x73\xfc\xf1\xd2\x14\x00\xd4\x85\x6e\x59\xf0\
-\x5d\x5d\xf0\xc5\xbf\x5b\x47\x21\x7f\x53\x9d\xe5\xb8\xf3\x4f\x7e\
-\xc9\xd9\xbe\x72\xaa\x75\x96\x9d\xe4\x0d\x6e\x97\x29\xf7\xfd\xd3\
-\x3a\x06\xf5\x3e\xd5\x59\x8e\xb6\xbc\x3f\xd5\x3a\x07\x9c\x30\x10\
-\x19\xf6\x47\xeb\x18\x00\x1b\x80\x94\x22\x27\xde\xb6\x5d\x0b\x0f\
-\xf7\xd7\x6a\x65\x75\xa1\x5b\x2a\xaf\x4e\xcc\x3f\x65\x25\x17\x06\
-\xd2\xae\xe8\xaa\x6f\xf6\x75\x9f\x7c\xa6\x1a\x75\x2f\x8e\xb7\xce\
-\xf2\x69\x92\x37\x6a\xae\x75\x06\xf2\xc8\x92\xb5\x37\xa0\x63\x9b\
-\xfd\xba\x93\x82\x43\xea\x64\xc2\xcf\x7d\x71\xeb\x24\x1b\x80\x14\
-\xe3\xe4\x0f\xfc\x21\x60\xbf\x6d\x7a\x67\x0a\xa7\xee\x85\x13\x74\
-\xed\xfa\xcd\xdc\x22\x48\x9f\xa4\x8b\x2f\xbd\x40\x37\xcd\xaf\x96\
-\xc6\xb7\x07\x59\x67\xf9\x8c\x60\xae\x22\x54\x7e\x93\x75\x0c\xf2\
-\x86\xdb\xba\xe1\x7b\xd6\x19\x00\x40\x72\x87\x3d\x66\x9d\xe1\x23\
-\x7e\x1b\x49\x68\x1f\xb8\x8f\x7e\xbe\x01\x2d\xeb\x8a\xad\xe3\x1b\
-\x78\x4e\x00\x00\x18\xb5\x49\x44\x41\x54\x73\xec\x52\x30\x57\xa5\
-\x7c\xc2\x1d\x38\xf9\xa8\xeb\x44\x66\xd9\xbf\x6c\x23\x13\x3a\xef\
-\xb2\x02\xc8\x8e\x47\xb4\xfe\x85\x69\xe6\x97\xfc\xec\x86\x96\x1d\
-\xfb\x6a\xe0\xf4\xe7\xd8\xb0\x66\x00\x7d\xfe\xfa\xa3\x75\xdd\xdc\
-\x57\xcc\x7f\x17\x9d\x30\x64\xd8\xe5\x43\x65\xd2\x2d\x1b\x6d\x83\
-\x74\xe3\x0c\x40\x0a\x92\x82\x43\xfd\xbb\x68\x29\x11\x15\xdd\xbc\
-\xe8\x1a\xf7\x9f\x73\x5b\x78\x77\x40\xe6\xd1\xca\xa9\x41\xad\x3c\
-\xef\xd7\xda\xf6\x7c\xbd\xd6\xad\xf0\xed\xe0\x0f\x09\xc2\x29\x1c\
-\x7a\xa3\x75\x0c\xf2\x86\x36\x6f\xfa\xbd\x2f\x7e\x17\x0b\x47\x6d\
-\xf5\xcb\xe0\x0f\x70\x06\x20\x65\xb9\x0f\x1f\xde\x86\x68\x4d\xae\
-\x75\x8e\xbd\xca\x1d\xd4\x2e\x85\xa3\xef\xc1\x21\x05\xdf\x94\xe1\
-\x73\x3a\xad\xe3\x50\xef\xd0\x79\x97\x15\x20\xdc\xf1\x6b\x6d\x7c\
-\xfb\x2a\x74\x6c\x89\x58\xe7\xd9\xab\x3e\x47\xad\x71\xce\x5c\x76\
-\x98\x75\x0c\xea\x7d\xba\xfc\x9a\x7c\xdd\xf4\x6c\x13\xba\x9a\xcd\
-\x1f\x78\x65\xf0\xf4\x3f\x49\xc5\x43\x5f\xb7\xce\xf1\x11\xf3\xff\
-\x43\xe8\xc0\x48\xc9\xe8\xd4\x38\xb8\x24\xba\x29\x47\x37\x2f\xb8\
-\x5e\x5f\x5a\xd2\xaa\x0b\xce\x7a\x84\x6b\x04\xd2\x8b\x3e\x77\xd9\
-\xc9\x89\xf9\xa7\x2d\xd6\xe6\xca\x46\xdd\xbc\xe0\xfa\x94\x18\xfc\
-\xc5\x81\xe4\x0e\xf5\xcd\x87\x30\xf5\xb2\x58\xcb\xaf\xfc\x30\xf8\
-\x23\x10\x01\x02\xa3\xfe\xdb\x3a\xc6\x27\x71\x06\x20\x45\x69\xe5\
-\xd4\xa0\xdb\xb0\xb5\x45\xa2\xb5\xd9\xd6\x59\xf6\x8f\x00\x79\x43\
-\xda\x24\x6f\xf0\x32\x44\xca\x7f\xcf\x0b\x58\x52\x8f\x2e\xbe\xe4\
-\x92\x64\x67\xc3\x57\x9d\xb6\x0d\xc7\xa2\x7d\x73\x96\x75\x9e\xfd\
-\xa5\x25\xe3\xaa\x02\x67\xad\x18\x61\x9d\x83\x7a\x9f\xea\x05\x01\
-\x7d\xf8\xed\x36\xb4\x6f\xb2\xff\x3d\x2d\x1e\x57\xeb\xcc\x58\xe1\
-\xab\xc5\xb0\x3e\xb8\x62\x8e\x0e\x84\x54\x2c\x4e\xe8\x73\x17\xce\
-\xd2\x68\xed\x2f\xad\xb3\xec\x1f\x05\xda\xaa\xf3\xb4\xad\xfa\x74\
-\x00\xa7\xbb\x73\x47\x76\x21\xbb\x6f\x8d\x44\x8a\x5e\x41\xb8\x68\
-\x1e\x5a\x72\xe7\xca\x8c\xd9\xed\xd6\x29\xa9\x9b\xae\xbc\xb6\x04\
-\xb1\xe8\x85\xe8\x6a\x3d\xcd\xed\x6a\xfc\xbc\x74\x6c\x1a\xa0\x1b\
-\x9f\x0c\xda\x3f\x4e\x1d\x20\x27\x0c\xa7\x64\xd4\xe5\xc0\x0a\xeb\
-\x24\xe4\x85\xa5\xa1\x59\xbe\x18\xfc\x01\x48\xee\xc0\x07\xad\x33\
-\x7c\x1a\x67\x00\x52\x5c\xf2\xd1\x63\xea\xa4\x65\x4d\xa9\x75\x8e\
-\x1e\xe3\x84\x80\x9c\x01\x6d\x1a\x29\xda\xe6\x04\x72\x37\x22\x90\
-\xf3\x3e\x82\x59\xaf\x03\xf2\x82\x54\xdc\xf7\xba\x75\xbc\x74\xa4\
-\x3a\xcb\x41\x65\xd5\xe7\x11\x88\x4d\x40\x2c\x76\x54\xd2\x6d\x1f\
-\x25\x5d\xad\x43\x24\xde\x58\x8e\xf6\xad\x39\xbe\x58\x3c\xd5\x53\
-\xca\x8f\x7f\xc1\x39\x6d\xe1\x04\xeb\x18\xe4\x0d\xf7\x91\x71\xad\
-\x68\xad\xca\xb3\xce\x81\x70\xbe\xca\xc8\x2b\x8a\x65\xfc\x2f\x9b\
-\xad\xa3\x7c\x12\x1b\x80\x14\xa7\x4b\x2f\xf9\x92\x56\x3f\xfd\x48\
-\x5a\x7d\x48\xef\x8e\x13\x06\xc2\xb9\x09\x04\x72\xe3\x08\x46\x3a\
-\x21\x59\xed\x08\x44\x5a\x11\x08\x35\x8b\x13\x6a\x00\x00\xa8\xd3\
-\x85\x40\xa0\xb5\xfb\x3f\x4b\x1c\x8e\xd3\x64\x19\xd9\x84\xeb\x16\
-\x41\xb4\xfb\xc0\x93\x64\x32\x1f\xe2\x86\xe1\xc2\x51\xc4\x8b\x34\
-\x19\x2f\x42\x32\x96\x2f\xc9\xce\x1c\x24\x3b\x23\x48\x76\x84\x11\
-\x6f\x0b\xc0\xf5\xc1\xed\x68\xbd\x2d\x94\xef\xca\x80\xe9\xc3\x64\
-\xca\x1d\x35\xd6\x51\xa8\xf7\xe9\xe2\xcb\xbf\xa3\x1b\x1f\xfb\xad\
-\x75\x0e\x00\xd0\xf2\x09\xaf\x07\x4e\x5b\xf0\x79\xeb\x1c\x9f\xc6\
-\x57\x00\x29\x4e\x26\xff\xe3\xd1\xc4\xfc\x53\x57\x39\x75\xab\xd2\
-\xff\xa9\xc6\xed\x02\x3a\xbb\x82\x40\x63\x10\x40\x36\x80\x8f\xcf\
-\x42\xf0\xcf\xf9\xc8\xfe\x96\xc9\x1d\xbf\x94\x1e\x3f\x9b\x83\x7f\
-\xe6\xd0\x96\x77\x7f\x68\x9d\xa1\x9b\xc0\x89\x0c\xf9\x89\x75\x8a\
-\x5d\x49\xd9\x57\x79\xf4\x2f\x81\xc2\x21\x67\x22\xab\x2c\x6e\x9d\
-\x83\xc8\xb7\x0a\x46\x36\xe2\x94\x23\x79\x2e\x45\x86\xd0\xa5\x97\
-\x7e\x1d\x4d\x6b\x4a\xac\x73\x00\x00\xf2\x87\xb7\x4a\xc5\xed\xbe\
-\xb8\xfc\xe7\xd3\xd8\x00\xa4\x01\x99\x78\x7b\x83\x94\x8e\xbf\x39\
-\xb3\x9f\xef\x88\x76\x4d\x9d\x08\xa4\x70\xec\xd9\x3c\x99\x32\x33\
-\xa8\xaa\x68\xc3\xea\x9f\x5b\xe7\xf8\x88\x14\x1e\xea\xdb\xfb\x26\
-\xd8\x00\xa4\x09\x99\xf6\xe0\xaf\xb4\x6c\xfc\xab\xd6\x39\x88\xfc\
-\xc6\x29\x9f\x74\xa7\x54\xdc\xb5\xdc\x3a\x07\x79\x64\xe9\x65\x3f\
-\x45\xcb\x07\xf9\xd6\x31\x00\x00\xc1\x6c\x45\x9f\x23\xfe\xd3\x3a\
-\xc6\xee\xb0\x01\x48\x23\x8e\xf6\xaf\xd0\xdc\x81\x1d\xd6\x39\x88\
-\x7c\xa3\x64\xcc\x26\xf9\xc2\xa3\x33\xad\x63\x90\x37\x54\x67\x05\
-\xb5\xfe\x35\xff\x5c\xf0\x54\x74\xc4\x3b\x72\xe4\xac\xed\xd6\x31\
-\x76\x87\x0d\x40\x1a\x91\x33\xee\x6d\x71\x8a\x8f\x3e\x1f\xc1\x2c\
-\xae\x89\x23\xca\x2a\x4d\x48\xf6\x98\x49\xd6\x31\xc8\x43\x8b\xdf\
-\xf9\x03\xa2\xfe\xd8\xf7\x0f\x08\xa4\x60\xd8\x4f\xad\x53\xec\x09\
-\x1b\x80\x34\x23\xd3\xee\x9b\x27\xe5\x53\x7e\x01\xe1\x7a\x00\xca\
-\x60\x4e\x18\x52\x7e\xc2\x35\x72\xf2\xed\xd5\xd6\x51\xc8\x1b\xfa\
-\xc6\x4d\xe5\xba\xfd\x85\xeb\xac\x73\x7c\xac\xe8\xb0\x1d\x32\xe9\
-\xef\xbe\x3b\xfc\xe7\x93\xd8\x00\xa4\x21\x39\xe5\xa1\x1f\x48\xd9\
-\xc4\x85\xd6\x39\x88\x6c\x08\xa4\xff\x94\xdf\xcb\xd4\xfb\xee\xb6\
-\x4e\x42\xde\x49\x6e\x7d\xfb\x11\xc4\x1a\x02\xd6\x39\x3e\x22\x05\
-\xa3\x7c\x71\x06\xc1\x9e\xf0\x31\x31\x4d\xa9\xce\x72\xf4\xa9\x05\
-\x6b\xd1\xf0\x26\xcf\x3c\xa7\x8c\x22\x7d\x27\x3d\x2b\xd3\xe7\x4f\
-\xb7\xce\x41\xde\xd1\x95\x5f\x9d\xa2\x1f\x3c\xb8\xd8\x37\x07\x5a\
-\xe5\x0e\xea\x94\x73\xdf\xc9\x11\x11\x5f\xbf\x8e\xe5\x0c\x40\x9a\
-\x12\x99\xe5\xca\xf0\x01\xa3\x51\x34\xa6\xd6\x3a\x0b\x91\x67\x4a\
-\xc7\xbf\xc9\xc1\x3f\xf3\xb8\x3b\x5e\xbf\xdf\x37\x83\x3f\x00\x29\
-\x1e\x77\x97\xdf\x07\x7f\x80\x0d\x40\x5a\x93\x31\x73\xbb\x24\xff\
-\x73\x47\xa0\xf0\x90\x46\xeb\x2c\x44\xbd\xae\xcf\x51\x6b\xe4\xf4\
-\x29\xbe\x3b\x6e\x95\x7a\x97\x56\x5e\x7a\xb3\x34\xbe\xdd\xcf\x3a\
-\xc7\xc7\x22\x25\x49\x48\x9f\xef\x5a\xc7\xd8\x17\x6c\x00\xd2\x9c\
-\x54\xcc\x69\x92\xe2\xe3\xc6\xb0\x09\xa0\x74\xa6\x25\xe3\xaa\x64\
-\x58\xbf\xb1\x3c\xec\x27\xb3\xe8\x1b\x37\x95\x6b\xfd\x0b\xff\x65\
-\x9d\xe3\x93\xa4\xf8\xc8\x67\xa5\xe2\xcf\x6d\xd6\x39\xf6\x05\x1b\
-\x80\x0c\x20\x93\x67\x6f\x91\x82\xa3\x46\x68\xe1\xe8\x6d\xd6\x59\
-\x88\x7a\x5c\xe9\xf8\x37\x9d\xdc\xd0\x28\x19\x33\xd7\x3f\x73\xc0\
-\xe4\x09\x77\xcb\x9b\xf3\xd0\xb1\xdd\x3f\x77\xda\x84\x72\x15\xb9\
-\x83\xbf\x6a\x1d\x63\x5f\xb1\x01\xc8\x10\x52\x31\xa7\xc9\x71\x8e\
-\x1a\xa1\x25\xe3\xaa\xac\xb3\x10\xf5\x14\xb7\xec\xc4\x25\xce\x19\
-\x95\x47\x4a\xc5\xe2\x0c\xb8\x0e\x93\x3e\x49\x17\x5f\x71\x85\xd4\
-\xbd\x78\x8c\x75\x8e\x4f\x92\x3e\x47\x2f\x95\x13\xff\x94\x32\x5b\
-\x4f\xd9\x00\x64\x10\x99\x31\xbb\xdd\x39\xf3\xd4\x91\xd2\x7f\xd2\
-\x33\x3c\x27\x80\x52\x9a\x13\x82\x0c\xa8\x98\x1d\x3c\xfd\xe9\xa9\
-\xd6\x51\xc8\x7b\x5a\x39\x2b\x4b\x1b\x5e\xfd\x0b\x34\x69\x1d\xe5\
-\x5f\x42\x79\x8a\xdc\xe1\x57\x59\xc7\xd8\x1f\x6c\x00\x32\x8c\xc8\
-\x2c\x57\x4e\x9d\x7f\x9a\x0c\xf8\xc2\x2c\x04\xb3\x7d\xbf\x4a\x95\
-\xe8\x33\xc2\x45\x49\x19\xf0\x85\x6b\xe5\x94\xc7\xbf\x6c\x1d\x85\
-\x8c\x24\x5e\x9a\x8f\xb6\x8d\xd9\xd6\x31\x76\xd2\x67\xfc\xc2\x54\
-\x7a\xfa\x07\xd8\x00\x64\x2c\x39\xf9\xa1\x9f\x48\xbf\x53\xce\xe2\
-\xdd\x01\x94\x52\x0a\x0f\xdd\x21\x03\x2a\x8e\x96\x69\xf7\xff\xdd\
-\x3a\x0a\xd9\xd0\xa5\xd7\xcc\xd4\xad\x2b\xa7\x5a\xe7\xd8\x49\xb8\
-\xd0\x95\xd0\x31\x57\x5a\xc7\xd8\x5f\x9c\x07\xce\x70\xfa\xc4\xf5\
-\x39\xc9\xe0\xc6\x79\x4e\xfd\xca\x29\x50\x4e\x08\x90\x4f\x49\x10\
-\x6e\xe9\xf1\x4b\x02\x59\x9d\xa7\xf0\x7d\x7f\xe6\xd2\x17\x6e\xe8\
-\xe3\xd6\x2c\xda\x2c\xed\xb5\x61\xeb\x2c\x9f\x24\x03\x4e\x7e\x52\
-\x4e\x79\x74\x86\x75\x8e\xfd\xe5\x9f\xd5\x93\x64\x42\x66\xcc\x6e\
-\x07\x30\x55\x2b\x2f\xbc\x49\xeb\x5e\xfe\x39\x3a\xeb\x42\xd6\x99\
-\x88\x76\x92\x3b\x38\x2a\x7d\x8e\xba\x3a\x38\xf5\x3e\xdf\xde\xab\
-\x4e\xde\xd0\xc6\xf7\x17\xfb\x6d\xf0\x47\xb8\xd8\x45\xd1\x21\x57\
-\x5b\xc7\x38\x10\x7c\x05\x40\x00\x00\xa9\xf8\xff\xed\xdd\x79\x7c\
-\x54\xe5\xb9\x07\xf0\xe7\x39\x33\x93\xc9\x4c\x92\x49\x98\x2c\x90\
-\x0d\x22\xbb\xa5\x80\x17\xc3\x16\x22\x21\x20\x9b\x0b\xa1\x28\x7c\
-\xa4\x17\xc5\x2a\xa0\x72\xa5\x57\x3f\x5a\xbd\xad\xbd\x9f\x46\x6d\
-\xad\x55\xb8\x56\x45\xab\xb6\x2c\xe2\x0e\x88\xec\x60\x54\x12\x20\
-\x01\x59\xc4\xb2\x28\xb8\xb0\x24\x21\x10\x12\xc8\x3e\x09\xc9\x64\
-\xe6\xb9\x7f\x08\x56\x11\x68\x12\x66\xf2\x9e\x33\xf3\xfb\xfe\x0b\
-\x9c\xf3\x63\xb6\xf7\x39\xef\xfb\x9c\xf7\x2c\x9d\xcb\x49\x99\x9d\
-\xbc\xb1\x83\xb7\x13\xa3\x2e\x04\x1d\x30\x59\x85\x3b\x65\x7c\xc0\
-\xbd\xfb\x38\x19\x83\x7f\xd0\x93\xbc\xdb\x1f\xa7\xb2\x9d\x3f\x57\
-\x9d\xe3\x42\x1c\x9d\xfa\x01\xa7\xce\x3b\xad\x3a\x47\x5b\x60\x09\
-\x00\x7e\x42\x36\xdd\x91\x25\x75\x5f\xfc\x9d\xaa\xbe\x8e\x55\x9d\
-\x05\x82\x10\x33\x49\xe4\xcf\x8f\x69\xe1\xdd\x6e\xe3\x91\x6f\xec\
-\x50\x1d\x07\xd4\x93\x82\xbb\x86\x4a\xf1\xc6\x02\x6a\xaa\xd5\xd7\
-\x98\x65\x4f\x68\xe2\x1e\x37\x3b\xb9\xff\x5c\x97\xea\x28\x6d\xa1\
-\xaf\x17\x13\x74\x45\x72\xa7\xde\x23\x95\x07\x9e\xa5\xba\x63\x11\
-\xaa\xb3\x40\x90\x88\xe8\x5e\xc1\xce\xbe\x73\x38\x63\xc9\xdb\xaa\
-\xa3\x80\x3e\xc8\xb6\x07\x6d\x52\x96\x5b\x4a\x35\x87\x1d\xaa\xb3\
-\x5c\x88\x93\xb3\x1e\xe7\xcc\x37\xb3\x55\xe7\x68\x2b\x14\x00\x70\
-\x59\x92\x3b\xc2\x4c\xde\xe8\x27\xa5\xea\xd0\x1c\x72\x15\x85\xa9\
-\xce\x03\x01\xca\xd1\xb3\x82\x1d\x3d\xfe\xc8\x23\xdf\x7d\x4e\x75\
-\x14\xd0\x17\xcf\xc6\xb1\x7b\xb8\x6c\x9b\xee\x9e\xf1\x20\x51\x3f\
-\x3b\x6d\x9a\xb0\xc3\xd0\xb3\xa4\x28\x00\xa0\xc5\x24\xf7\xb6\x47\
-\xa5\xea\xab\x47\xa8\xf6\xb0\x93\x08\x77\x0c\xc0\x15\x62\x8d\x24\
-\xf2\xea\x13\x5a\x64\xb7\xdf\x71\xc6\x5b\xaf\xab\x8e\x03\xfa\x23\
-\x79\x53\x9f\x91\xa2\x75\xbf\xd1\xdd\xef\x0d\x9b\x89\xbb\x4e\xbe\
-\x89\x87\xbd\xb6\x4e\x75\x94\x2b\x81\x02\x00\x5a\x4d\xf2\xa6\x8d\
-\x96\x86\x53\x4f\x50\xd5\x81\xc1\xe4\xae\xc3\x67\x08\x5a\xc7\x12\
-\xe9\xa5\xa8\xab\x77\x72\x68\xfc\x6f\x38\x73\x49\xbe\xea\x38\xa0\
-\x4f\xb2\x65\xd6\x44\x29\x59\xb5\x82\xdc\xf5\xba\xfb\x8d\x91\xb8\
-\xb4\xcf\x4d\xe3\x3e\x1c\xa0\x3a\xc7\x95\xd2\xdd\x0b\x0b\xc6\x21\
-\xb9\xb3\x62\xa8\xb9\xfc\x49\x69\x28\xba\x85\xaa\x0f\xc7\xea\x6a\
-\x5b\x4e\xd0\x17\x2d\x84\xc8\xd1\xa3\x84\xc3\x12\xdf\xa4\xfa\xe8\
-\x27\xce\xdd\x7e\x0a\x70\x51\xb2\xeb\xbf\x7b\xc9\xb1\xb5\x07\x74\
-\xf5\xa0\x9f\x73\xc4\xe2\x10\xad\xfb\x94\xee\x3c\xf0\xb9\x23\xaa\
-\xb3\x5c\x29\x14\x00\xe0\x13\xb2\x63\x66\x4f\xaa\x29\x7d\x42\xea\
-\x8e\x8f\xa6\xba\x63\x4e\x12\xec\xd5\x12\xf4\xb4\x10\xa2\x88\xae\
-\x65\x6c\x4b\x5a\x4d\xe1\x11\xd9\x9c\xb6\xa4\x44\x75\x24\xd0\x3f\
-\xc9\x9d\x1d\x2e\xd5\x3b\x8e\x53\xcd\xd7\x91\xaa\xb3\x5c\x0c\x27\
-\x8e\x7e\x97\x47\xad\x98\xaa\x3a\x87\x2f\xa0\x00\x00\x9f\x93\x6d\
-\x77\x24\x52\xa3\xeb\x01\x71\x95\x65\x91\xab\xb0\x2b\x35\x56\x9a\
-\x54\x67\x82\x76\x62\x8d\x75\x4b\x44\xe7\xaf\x35\x6b\xdc\x72\xb2\
-\x45\xbc\xc0\x69\x0b\x2a\x54\x47\x02\x63\xf1\x6e\x18\x75\x88\xca\
-\x77\xf6\x52\x9d\xe3\xa2\x1c\xdd\x6a\x39\x6b\xa2\x93\x39\x3b\x20\
-\xae\x70\x50\x00\x80\xdf\x49\xde\x1d\x99\xd4\x5c\x33\xcd\xdb\x78\
-\x3a\x83\x5d\x27\x3b\x7f\xb7\xdb\xa0\xce\x9a\x7a\xa0\xf5\x98\x89\
-\x6c\x1d\x1b\xc9\x96\x70\x84\x43\x9c\x9b\xc9\x12\xb9\x90\x47\x2c\
-\xde\xa5\x3a\x16\x18\x97\xe4\x64\x6d\x94\xd2\x4d\x63\x55\xe7\xb8\
-\x28\x2d\x84\x38\x65\x52\x16\xa7\xff\x7d\xb5\xea\x28\xbe\x82\x02\
-\x00\xda\x9d\x7c\x72\x77\x17\x62\xd7\x24\x6a\xae\xc9\x94\xa6\xaa\
-\xbe\xd4\x58\xd9\x91\x1a\xca\x6c\xe4\x6d\x52\x1d\x0d\x2e\x41\x34\
-\x2b\xb1\x2d\xb6\x9e\xac\xce\x52\x0e\xe9\xb0\x97\xac\xe1\x9f\x10\
-\x3b\x56\xf0\xf0\xd7\x4e\xaa\xce\x06\x81\x41\xf2\x6e\x7b\x4d\x8a\
-\xd7\xcf\xd4\xed\x33\x49\x3a\x65\x6c\xd6\xc6\xac\x1d\xa1\x3a\x86\
-\x2f\xa1\x00\x00\x5d\x90\xdc\x11\x66\xa2\xce\x43\x48\x9a\x86\x53\
-\x73\xfd\x7f\x88\xc7\x95\x42\xee\x86\x8e\xe4\xa9\x89\xa2\xc6\x6a\
-\x3b\xb9\x6b\x4c\x24\x5e\xd5\x31\x03\x17\x6b\x44\x96\x48\x0f\x85\
-\x46\xba\xc4\x14\x51\xc5\x16\x5b\x29\x9b\xc3\x0a\xc9\x64\xff\x8c\
-\x2c\xa1\x9b\x69\x58\xca\x4e\xe6\x6c\xbc\x01\xe0\x17\xb2\xf9\x97\
-\xbf\x97\xa2\x0d\x4f\xea\xb6\x77\x28\x2c\xb1\x91\x3b\x4e\x88\xe5\
-\xf4\x67\x6a\x55\x47\xf1\x25\x14\x00\x60\x18\xb2\x63\x66\x4f\x72\
-\xb9\xba\x13\x49\x0a\x79\xdd\x49\x44\xcd\x1d\x49\x3c\x61\x24\xcd\
-\x0e\x8f\xc7\xe3\x60\x6a\xb6\xb1\xd7\xf3\xfd\x33\xc2\xc5\xeb\x0e\
-\x23\x92\x20\x7c\xde\x05\x7b\x59\xb3\xfc\x6b\x6b\x52\x93\xa9\xde\
-\x2b\xe6\xb3\x26\x93\xa9\x86\xd8\x5c\x43\x6c\x72\x11\x99\x4f\x91\
-\xc9\x5c\x44\xe6\xd0\x63\xe4\xa5\xc3\x9c\xb1\xf8\x1b\x85\x81\x21\
-\x88\xc9\xe6\x5f\x4d\x97\x92\x75\x8b\xa8\xb9\x41\x9f\xe3\x11\x6b\
-\xc4\x9d\xb3\xee\xe5\x8c\x25\xaf\xaa\x8e\xe2\x6b\xfa\x7c\xc1\x01\
-\x00\x20\xe0\x49\xc1\x8c\x2c\x29\xda\xb8\x82\xdc\xd5\xfa\x2d\xd4\
-\x63\x07\xef\xd3\xc6\x7f\xdc\x5f\x75\x0c\x7f\xd0\xef\x8b\x0e\x00\
-\x00\x01\x4b\xf2\x67\x8e\x97\xe2\x1c\x7d\x0f\xfe\xb6\xb8\x66\x0e\
-\x1b\x34\x4e\x75\x0c\x7f\xd1\xef\x0b\x0f\x00\x00\x01\x49\xb6\xde\
-\x3f\x42\x4e\x7c\xb4\x86\x9a\x2a\xf5\x3b\x06\xb1\x89\x38\x2e\xfd\
-\x01\x1e\xfe\x54\xc0\x36\xba\x62\x09\x00\x00\x00\xda\x8d\xe4\xcd\
-\xb8\xce\x7b\xea\x93\x5c\x6e\x3c\xad\xeb\xfd\x41\x38\x3e\x23\x8f\
-\x47\xaf\xcd\x54\x9d\xc3\x9f\x74\xb7\xcd\x22\x00\x80\x51\x89\xe4\
-\x9a\xa9\xd8\x1d\x47\x56\x2d\x94\x1a\x9a\x1b\xa8\x4b\x4d\x19\xf3\
-\x14\xec\x91\x7d\x8e\xe4\xdf\x33\x5a\x4e\x7c\xb4\x5e\xef\x83\x3f\
-\x39\xba\xd5\x92\x39\x75\x3c\xd1\x5a\xd5\x49\xfc\x0a\x33\x00\x00\
-\x00\x6d\x24\xc5\xdb\x6c\x54\x9e\x33\x93\x2a\xf7\x4f\xf7\x9e\xad\
-\xe8\x41\x4d\x67\x22\xb8\xfe\x04\x91\xa7\x91\xc8\x64\x25\xb1\xc6\
-\x10\xdb\xe2\x6a\xc8\x96\x70\x88\xa3\x7b\x2e\x26\xfb\x90\x85\xdc\
-\xe3\x86\x46\xd5\xb9\x55\x90\xfc\x19\x93\xe4\x78\xce\x32\x5d\x4f\
-\xfb\x13\x11\x59\xec\xc2\x89\x93\x32\x79\xf8\xdf\x36\xab\x8e\xe2\
-\x6f\x28\x00\x00\x00\x5a\x49\xbe\x7a\x35\x46\x4e\x6c\x5e\x22\x95\
-\xfb\xc6\x70\x5d\x61\x8b\xaf\x66\xc5\xd1\xcb\x4d\xb1\xa9\xef\x6b\
-\x3d\xa7\xcd\xe2\xd8\xf4\x80\xba\xa7\xfc\x72\x64\xeb\x8c\x5f\x49\
-\xc9\xfa\x05\xd4\x54\xab\xfb\x31\x87\x93\x6f\x78\x95\x33\xdf\xbb\
-\x57\x75\x8e\xf6\xa0\xfb\x37\x03\x00\x40\x4f\xa4\x60\xd6\x1f\xbd\
-\xa5\xdb\xfe\x87\x5d\x2d\x1f\xf8\x7f\xc2\xd1\xd3\xcd\x89\xe3\x1e\
-\xe1\x81\x7f\xfa\xab\x0f\xa3\xe9\x92\xe4\x4d\x7f\x50\x4e\x6c\x9c\
-\x47\xcd\xfa\x7b\xac\xef\x4f\x44\x0f\x28\xd4\x6e\xdc\x9c\xa2\x3a\
-\x46\x7b\xd1\xff\x1b\x02\x00\xa0\x03\xb2\xf7\xe1\x30\x29\x3d\xb0\
-\x83\x4e\x15\xf4\xf1\xc9\x01\x35\x2b\x51\x97\x5f\xe4\xb2\xed\x9e\
-\xb1\x9c\x9a\xea\xf6\xc9\x31\x75\x46\xf2\xa6\xbe\x20\xc7\x73\xe6\
-\x18\x62\x9b\xef\xb0\xc4\x46\x8e\x9d\x74\x55\x20\x77\xfd\x5f\x08\
-\x05\x00\x00\xc0\xbf\x21\x9f\x66\x3b\xa4\x3c\xe7\x1b\xaa\xdc\x1f\
-\xe7\xeb\x63\x73\xf2\x0d\x87\x28\xee\x96\xfe\xdc\x67\x8a\x01\x46\
-\xc9\x96\x11\x11\xa6\x8f\x27\x6e\x90\xd2\xdc\xb1\xba\xdd\xdb\xff\
-\x87\xcc\x76\xe1\x2e\x37\xdd\xcc\xc3\x16\xac\x53\x1d\xa5\x3d\xe1\
-\x2e\x00\x00\x80\xcb\x10\x99\x6c\x92\xf5\x9f\x1c\xf0\xc7\xe0\x4f\
-\x44\x24\xc5\xeb\x7b\x13\x9b\xb7\x8b\x48\x2a\x33\x1b\x60\xb4\xbc\
-\x3c\xd9\xf6\xa0\x4d\x36\x8e\xde\x43\xe5\x3b\x7a\xab\xce\xd2\x32\
-\x4c\x9c\x70\xfd\xdc\x60\x1b\xfc\x89\xb0\x11\x10\x00\xc0\xe5\x7d\
-\x74\x76\x0d\x9d\xf9\x67\xb2\x5f\xcf\x51\xbc\x76\x00\xed\xf8\xf5\
-\x8b\x7e\x3d\x47\x3b\x90\xed\x0f\xa4\x78\x4f\x17\x14\x1b\x67\xf0\
-\x27\xa2\x8e\xe9\x3b\x78\xc4\x5b\x8f\xa8\x8e\xa1\x02\x0a\x00\x00\
-\x80\x4b\x90\xad\x77\xde\x2c\x65\xdb\xc6\xfb\xff\x44\x5e\x92\xe2\
-\x75\xb3\x65\xff\x5f\xfb\xf9\xfd\x5c\x7e\x22\x05\x33\xb2\xe4\xf8\
-\xfa\xaf\xb9\xea\x60\xb4\xea\x2c\x2d\x16\xd5\xbb\x82\x93\x06\x0d\
-\x57\x1d\x43\x15\x14\x00\x00\x00\x97\x20\x15\x7b\x5f\x6f\xb7\x06\
-\xb6\x86\x72\xf6\x96\x6d\x79\xbb\x7d\x4e\xe6\x5b\x92\x3b\xed\x69\
-\x29\x5a\xf3\x01\x35\x9c\xb4\xa8\xce\xd2\x62\xd6\x68\x0f\x47\x0f\
-\xcd\xe0\x3e\xd9\x01\xd3\x7b\xd1\x5a\x28\x00\x00\x00\x2e\x42\x36\
-\xdd\x32\x9f\xaa\xbf\xed\xd0\x9e\xe7\xe4\x53\xdb\xfa\xc8\xc1\x17\
-\xfb\xb6\xe7\x39\xaf\x84\x48\xb6\x59\x72\x6e\xcc\x97\xe3\xab\x1f\
-\x25\xb7\x01\x6e\xf3\x3b\xcf\x6c\x13\x4e\xce\xbc\x9d\x87\xbd\x70\
-\x40\x75\x14\x95\x50\x00\x00\x00\x5c\x40\xf2\xef\x4a\x90\xf2\x5d\
-\xed\xbf\x19\x4c\xb3\x8b\xa8\xe2\xc0\x93\xed\x7e\xde\x36\x90\xad\
-\x73\xfa\x7b\xd7\x6c\x38\x25\xa5\x5b\x86\x19\xa2\xd3\xff\x3c\x36\
-\x13\xc7\x8f\x7b\x82\xd3\x16\xbd\xa3\x3a\x8a\x6a\x28\x00\x00\x00\
-\x2e\xe0\xad\x2d\x5a\x4d\x8d\x95\x4a\xf6\xab\x97\xea\x43\xd7\xab\
-\x38\x6f\x6b\xc8\xe6\xdb\x1f\x93\x92\x55\x7b\xb8\xea\x4b\xa7\xea\
-\x2c\xad\xc5\x09\x19\xcb\x38\x73\x49\xb6\xea\x1c\x7a\x60\x9c\x29\
-\x1b\x00\x80\x76\x20\x5b\xee\xc8\x92\xc2\x35\x2b\x49\x9a\xd5\x04\
-\x30\x85\x10\x0f\x5e\xd0\x99\xbb\x4f\x2c\x56\x13\xe0\xd2\x64\xef\
-\xc3\x61\x9e\xd2\x2f\xf2\xb4\xb2\x82\x54\x43\x5d\xf5\x9f\x17\x97\
-\xbe\x4b\x1b\xb7\x61\x90\xea\x18\x7a\x81\x19\x00\x00\x80\x73\x44\
-\x84\xa5\x62\xff\x62\x65\x83\x3f\x11\x91\xa7\x89\xa8\xf6\xcb\x91\
-\xea\x02\x5c\x9c\xe4\xcf\x9c\xe0\x3d\x9c\x53\xa6\x9d\xca\x37\xe4\
-\xe0\x2f\x1d\xfa\x95\xf0\xd8\xc1\x69\xaa\x73\xe8\x09\x36\x02\x02\
-\x00\x38\x2f\x77\xf2\x7c\xaa\xf9\x36\x4a\x75\x0c\x3a\x5b\xa2\x9b\
-\xdb\x01\x45\x5e\xb5\x50\xee\x47\xef\x4a\xe1\x07\x93\xd8\x63\xd0\
-\x07\x19\x46\x74\xad\xd3\xe2\xae\xe9\xcf\x9c\xad\xb0\xb2\xd3\x1f\
-\x14\x00\x00\x00\x74\xae\xf1\xaf\xe4\xe3\x7b\x54\xe7\x20\x22\xa2\
-\xb3\xd5\x09\xaa\x23\x10\x11\xc9\xf6\xfb\xc6\xcb\xca\xbf\x2d\xa5\
-\xda\xc3\xe1\xaa\xb3\xb4\x59\x58\x62\x23\x27\x8d\x48\xe5\x81\xcf\
-\x9f\x51\x1d\x45\x6f\x50\x00\x00\x00\xd0\x77\x8d\x7f\xac\xa8\xf1\
-\xef\x27\x44\xed\x1c\xbb\x7c\x91\x1d\x4e\x27\x3f\x5f\x26\x47\x96\
-\x8d\x23\xa3\x5e\xf5\x13\x11\xd9\x3a\xb9\x39\x79\xe4\x10\x1e\xf8\
-\xfc\x57\xaa\xa3\xe8\x11\x7a\x00\x00\x20\xe8\x49\xfe\xf4\x09\x7c\
-\xfa\xb3\x6b\x55\xe7\xf8\x9e\xd9\x5c\xaa\xea\xd4\xb2\x65\xe6\xbd\
-\xde\x43\xcb\xca\xe5\xc4\x26\x63\x0f\xfe\x56\xa7\x87\x93\x47\x8f\
-\xe5\x41\x2f\xff\x53\x75\x14\xbd\xc2\x0c\x00\x00\x04\x35\x11\x61\
-\x59\x35\xe0\x75\xa5\x8d\x7f\x17\x0a\xb1\xef\x6f\xef\x53\xca\xb6\
-\xfb\xfb\x7a\x2b\x0f\xac\x92\x63\xef\x5d\xc5\x64\xbc\x26\xbf\x1f\
-\x09\xe9\xe0\xe5\x2e\x37\xde\xc0\x43\x5e\xce\x55\x1d\x45\xcf\x50\
-\x00\x00\x40\x70\xcb\xbd\xf5\x45\x5d\x34\xfe\x9d\xa7\x59\x89\xe2\
-\xfb\xae\x6c\xaf\xd3\xc9\xa7\xd9\x0e\x72\xed\x7b\x53\x0a\xdf\xbf\
-\x89\xdd\x75\xc6\xbf\x35\x3c\x24\x42\x38\x69\xcc\x64\x1e\xf2\x72\
-\x8e\xea\x28\x7a\x67\xfc\x37\x1b\x00\xa0\x8d\xce\x35\xfe\x15\xa9\
-\xda\xf4\xe7\xa2\xa2\xae\xae\xd4\x26\xec\xf4\xfb\x06\x3b\x22\xd9\
-\x1a\x6d\xf9\x6a\x9e\xb7\x6c\xf7\xfd\xdc\x50\x1a\x18\x17\x83\x96\
-\x30\xe1\x84\x1b\xee\xe4\x8c\x85\x4b\x54\x47\x31\x82\xc0\x78\xd3\
-\x01\x00\xda\x40\x57\x8d\x7f\xe7\xb0\x3d\x29\x87\x68\xa7\x5f\xcf\
-\x21\x5b\xee\xba\xd7\xbb\x72\xe5\xb3\x5c\x7b\x38\x3c\x60\xae\x02\
-\x43\x22\x84\xe3\xc7\x61\xf0\x6f\x05\x14\x00\x00\x10\x94\x24\xf7\
-\xce\x89\x72\x7c\x95\x7e\x1a\xff\x88\x88\x2c\x76\x21\x7b\x97\x87\
-\xfc\x75\x78\xc9\xbf\x7b\xba\x54\x1e\x7c\x46\x8e\x2d\x8f\x33\xfc\
-\x3a\xff\x0f\x59\x3a\x78\x39\x69\xcc\x64\x4e\xff\xc7\x0a\xd5\x51\
-\x8c\x04\x05\x00\x00\x04\x25\xa9\xd9\xbb\x50\x57\x8d\x7f\x44\x44\
-\xce\x01\x5b\x38\xed\xb9\x12\x5f\x1f\x56\xf2\xef\xfd\x4f\xa9\x39\
-\xf8\xb4\x1c\x5d\x96\x64\xc4\x5d\xfc\x2e\xcb\x1a\xed\xe1\xf8\x31\
-\x59\x9c\xfe\xda\x3a\xd5\x51\x8c\x06\x05\x00\x00\x04\x1d\xd9\x74\
-\xcb\x7c\x39\x9e\xd3\xae\x8f\xfa\xfd\xb7\x42\xa2\x3c\x1c\xdd\x6b\
-\x2a\xd1\x06\x9f\x1d\x52\x0a\x66\xce\xf6\x56\x7c\xf1\x07\x39\xf2\
-\x76\x1c\x05\xd2\x15\xff\x79\xb6\x4e\x6e\x4e\x1a\x95\xc9\x43\x5f\
-\x29\x50\x1d\xc5\x88\x02\x66\xf9\x07\x00\xa0\x25\x64\xcb\xac\x78\
-\x39\xb9\xb1\x58\x57\x8d\x7f\x44\xc4\x49\x63\x5e\xe2\x91\xef\xdf\
-\x7f\xa5\xc7\x91\xdd\xb3\x2c\xe4\xaa\x7b\xd4\x5b\x73\xf4\x21\xae\
-\x3c\xa0\x9f\xbb\x1b\x7c\x4c\x6c\xf1\x4d\x5a\x7c\xfa\x30\x4e\x5f\
-\xb8\x5b\x75\x16\xa3\xc2\x0c\x00\x00\x04\x15\xaf\xeb\xc8\x1a\xbd\
-\x35\xfe\x91\xa3\x7b\x15\x65\x2e\x9f\x73\x25\xd7\x64\x92\x9f\x9d\
-\x40\x67\xf7\xbf\xe0\x3d\x9a\x9b\xc5\x0d\xa5\xe6\x40\xbe\xba\x93\
-\x88\x6e\x75\x5a\x52\x46\x2a\x76\xf8\xbb\x32\x28\x00\x00\x20\x68\
-\x48\xfe\xf4\x09\x72\x74\xb5\xbe\x1a\xff\xd8\x44\xec\xec\x33\x83\
-\x99\xdb\x34\x47\x2f\x05\x33\x6e\x95\xba\x92\xc7\xa4\xf8\xd5\xfe\
-\xe4\xae\xe3\x40\x1e\xf8\x89\x88\xc8\xd9\xaf\x54\x4b\x1e\xda\x9f\
-\xfb\xcf\x2d\x53\x1d\xc5\xe8\x02\xfe\xb3\x02\x00\x40\xf4\xfd\x8e\
-\x7f\x15\xba\xda\xf4\x87\x88\x28\x76\xf0\x6e\x6d\xfc\xc7\x03\x5b\
-\xf3\x4f\xe4\xd3\x47\x92\xa8\xfe\xc8\x33\x52\xf5\xf5\x44\xaa\x3b\
-\x6a\xf3\x57\x34\xdd\x89\x4b\xdf\xc5\x63\x07\xa7\xe1\xa9\x7e\xbe\
-\x81\x19\x00\x00\x08\x0e\x7a\x79\xd4\xef\x0f\x59\x22\xbd\x6c\x4f\
-\x9e\xd4\x92\xbf\x2a\x7b\x9f\x0d\xa3\xaa\xcf\x1f\x94\xba\xe2\x19\
-\x72\x78\x51\x17\xf2\x9c\xf5\x77\x3a\xfd\x60\x13\x51\xe2\x98\x75\
-\xda\xc8\xa5\x37\xf9\xb2\x49\x32\xd8\x61\x06\x00\x00\x02\x9e\x2e\
-\x77\xfc\x23\x22\x4e\x1c\x3d\x9f\x47\xad\x98\x73\xa9\x3f\x97\xbd\
-\xcf\x86\x51\xf5\x97\xff\x25\x75\x45\x77\x53\xf5\xc1\x1e\xe4\xae\
-\x0d\xbe\xdf\x6c\xb3\x4d\x38\x7e\xdc\x13\x9c\xb9\x24\x5b\x75\x94\
-\x40\x13\x7c\x1f\x26\x00\x08\x3a\xde\x0d\xa3\x77\x53\xf9\xa7\xba\
-\x5a\xfb\x17\x47\xf7\x2a\x2d\x6b\x8f\xf3\xc2\xb5\x7f\xd9\xf3\x58\
-\x17\xaa\x3e\xfc\xb0\xd4\x97\xde\x4c\xb5\xdf\x74\xa6\xa6\x9a\xa0\
-\xfd\x9d\x96\xd0\x18\x8f\x96\x34\xe2\x76\x4e\x5b\xf4\x8e\xea\x2c\
-\x81\x08\x4b\x00\x00\x10\xd0\x74\xb9\xe3\x1f\x9b\x49\x8b\xe9\x37\
-\x9d\x99\x45\x24\xd7\x4c\x05\x4b\xa7\xd0\xd9\xb2\xa9\x52\x5f\x3c\
-\x4c\xbe\x7c\xa5\x03\x79\x9b\x54\x27\x54\x2f\xaa\x77\x85\x16\x9f\
-\x96\x86\x4e\x7f\xff\x09\xda\xca\x12\x00\x02\x9f\x6e\x1b\xff\x9c\
-\xfd\x4e\xb2\x3d\x7e\xab\xb7\xfe\x54\x3a\xd7\x1d\x8b\xa7\xa6\x2a\
-\xfc\x16\x7f\x8f\xc9\x1b\x97\xbe\xd3\x94\x3c\xe8\x3a\xee\x93\x8d\
-\x4a\xc8\x8f\xf0\xa1\x03\x80\x80\x25\x9b\x6e\x7d\x49\x8e\x7f\x38\
-\x5b\x75\x0e\x68\x19\x31\xd9\x48\x4b\x1c\xf5\x22\x8f\x78\xe7\xd7\
-\xaa\xb3\x04\x03\x14\x00\x00\x10\x90\xf4\xba\xe3\x1f\x5c\x82\xbd\
-\x53\x13\xc7\xa5\x4f\xe1\xe1\x8b\x56\xa9\x8e\x12\x2c\xd0\x03\x00\
-\x00\x01\x49\x5c\x47\xd7\x60\xf0\x37\x88\xe8\x6b\x0a\x39\xe2\xba\
-\xa1\x3c\xfc\xa9\x93\xaa\xa3\x04\x13\xcc\x00\x00\x40\xc0\x39\xb7\
-\xe3\xdf\x2a\xdd\x3d\xed\x0f\x7e\xe4\xbb\x29\xff\xeb\xdf\xe0\x11\
-\x6f\xdf\xa1\x3a\x4b\x30\xd2\x54\x07\x00\x00\xf0\x25\x11\x61\x39\
-\xb3\x6f\x31\x06\x7f\x7d\x93\xb0\x14\x97\x96\x7c\xf3\xf5\x18\xfc\
-\xd5\xc1\x12\x00\x00\x04\x96\xdc\xc9\xf3\xa9\xfa\x5b\x7d\x3d\xea\
-\x17\xfe\x85\x4d\x44\x1d\xaf\xdb\xa1\x85\x77\xcf\xe4\xb4\xe7\x1a\
-\x54\xc7\x09\x66\x58\x02\x00\x80\x80\x81\xc6\x3f\x9d\x0b\x8d\x69\
-\xe6\x8e\x69\x0f\x70\xc6\x5b\x2f\xa9\x8e\x02\x98\x01\x00\x80\x00\
-\x82\xc6\x3f\x9d\x62\x26\x71\xa6\x7e\xa3\xc5\x5e\x33\x8a\x07\xfd\
-\x5f\xb1\xea\x38\xf0\x1d\xcc\x00\x00\x40\x40\x40\xe3\x9f\x4e\xd9\
-\x13\x9b\x38\x6e\xe8\x43\x3c\x7c\xd1\x7c\xd5\x51\xe0\xc7\x50\x00\
-\x00\x80\xe1\x89\x08\xcb\xea\x01\x67\xb0\xf6\xaf\x23\x6c\x26\x89\
-\x1d\xf8\x99\x96\x30\x60\x34\xf7\x7b\xba\x52\x75\x1c\xf8\x29\x2c\
-\x01\x00\x80\xf1\xa1\xf1\x4f\x5f\x1c\x5d\x5d\x1c\x3b\xf0\x4e\x6d\
-\xd8\x3f\x96\x13\xe5\xa8\x4e\x03\x97\x80\x19\x00\x00\x30\x34\xd9\
-\x7a\x5f\x07\x39\xb1\xbe\x9c\x1a\x2b\xb0\xf6\xaf\x98\x58\x1c\xa2\
-\xc5\x0d\x7e\x8f\x46\xf6\xbb\x9d\x39\x1b\x6b\x31\x3a\x87\x19\x00\
-\x00\x30\xb6\x86\xe2\xc5\x18\xfc\x15\x63\x33\x49\xec\x90\x2f\xb5\
-\xd8\xde\x59\x7c\xed\x73\xdf\x12\xad\x50\x9d\x08\x5a\x00\x33\x00\
-\x00\x60\x58\x22\xd9\x9a\x2c\x5b\xd2\x48\x67\xcb\x71\x31\xa3\x88\
-\x44\xf6\xa8\xd4\x3a\xf4\xbb\x8b\x87\x2f\x5e\xa9\x3a\x0b\xb4\x0e\
-\xbe\x34\x00\x60\x5c\x5b\x0e\xdd\x87\xc1\x5f\x11\x7b\x42\x13\x47\
-\x0f\x79\x56\xcb\x7c\xfd\xf7\x44\x7b\x54\xa7\x81\x36\xc0\x17\x07\
-\x00\x0c\x4b\xea\x2b\xa6\xaa\xce\x10\x74\x42\x3a\x78\x39\x3a\xf5\
-\x03\x8a\xeb\x3a\x9d\xfb\xcf\x75\xa9\x8e\x03\x6d\x87\x02\x00\x00\
-\x8c\xab\xf1\xf4\xcf\x54\x47\x08\x1a\x96\x08\xe1\x98\x01\x9f\x50\
-\xa7\x6e\xd3\xb8\xef\xf3\xa7\x54\xc7\x81\x2b\x87\x02\x00\x00\x8c\
-\xab\xf1\x8c\x43\x75\x84\x80\x67\x09\x17\xea\xd0\x6f\x33\x3b\x3a\
-\x4e\xe3\xb4\x25\x25\xaa\xe3\x80\xef\xa0\x00\x00\x00\xe3\x6a\x76\
-\xa1\xfb\xdf\x5f\x2c\x76\xa1\x98\xd4\x7c\xb6\x75\x9f\xc6\xe9\xcf\
-\x17\xa9\x8e\x03\xbe\x87\x02\x00\x00\x0c\x49\x44\x58\xde\xc4\xde\
-\x3f\x3e\x67\x75\x7a\xd8\xd9\xef\x43\xb2\x75\xbd\x0f\x03\x7f\x60\
-\xc3\x6d\x80\x00\x60\x58\xde\x77\x3a\x7a\xc9\x5d\x8f\xdf\x31\x5f\
-\x08\x4b\x6e\x64\x67\xdf\xe5\x64\xbb\x7a\x36\x0f\xc9\xae\x51\x1d\
-\x07\xfc\x0f\x33\x00\x00\x60\x5c\xe6\x28\x37\xb9\xeb\x43\x54\xc7\
-\x30\x2e\x26\x8a\xea\x55\xc1\x8e\x5e\xf3\x28\xe3\x8d\x3f\x33\xb3\
-\xa8\x4e\x04\xed\x07\x95\x33\x00\x18\x96\x67\xcd\xb0\x22\xae\xdc\
-\x97\xac\x3a\x87\xe1\x58\xec\x22\x91\x7d\x0e\x6a\x8e\x94\xc7\x39\
-\x7d\xe1\x52\xd5\x71\x40\x0d\xcc\x00\x00\x80\x61\x69\xb6\xb8\xdd\
-\x52\x49\x28\x00\x5a\x2a\xa2\x6b\x2d\x47\xf6\x58\x46\xd1\x29\xbf\
-\xd5\xfa\xcf\x2d\x53\x1d\x07\xd4\x42\x01\x00\x00\xc6\x65\x4f\x7a\
-\x9a\x58\xfb\x05\x89\x57\x75\x12\xfd\xb2\xd8\x85\x1c\xbd\x0f\xb1\
-\xe3\xaa\x3f\xf0\x75\x8b\x97\x11\xed\x55\x9d\x08\x74\x02\x4b\x00\
-\x00\x60\x68\xde\xd5\x83\x2a\xa8\xea\x20\x6e\x07\xf8\x21\x53\x08\
-\x91\xa3\x77\x09\x87\x25\x2e\x25\xc7\x55\x8f\x73\xea\x5f\xaa\x55\
-\x47\x02\xfd\xc1\x0c\x00\x00\x18\x1a\x77\xb8\xe6\x4f\x52\x75\x70\
-\xae\xea\x1c\xca\x69\x21\x44\x91\x3d\x2a\x38\x2c\x69\x15\x49\xcc\
-\xff\xf2\xa8\x57\xb0\x69\x0f\x5c\x16\x66\x00\x00\xc0\xd0\x44\x84\
-\x65\x5d\x7a\x19\x55\xec\x8b\x51\x9d\xa5\xdd\x69\x21\x44\x8e\x6e\
-\xe5\x1c\x96\xb2\x8a\xac\xf1\x4f\xe2\xbe\x7d\x68\x0d\x14\x00\x00\
-\x60\x78\xb2\x6d\xce\x20\x29\x5c\xfe\x29\xb9\xeb\x02\xff\x37\x2d\
-\x34\xd6\x23\x61\x29\x47\xb4\xd0\xc8\xb5\x44\x1d\xe7\xe1\x4a\x1f\
-\xda\x2a\xf0\xbf\x2c\x00\x10\x14\x24\x6f\xfa\x53\x52\xbc\xea\xb7\
-\x24\x1e\xd5\x51\x7c\x4b\x0b\x21\x8a\x48\xa9\x62\x5b\xdc\x76\xb2\
-\x38\xdf\xa6\x11\x6f\xbe\x85\xfb\xf5\xc1\x17\x50\x00\x00\x40\xc0\
-\x90\xbc\xdb\xde\x93\xe2\x0d\x53\x0c\x7d\x57\x80\xc5\x2e\x62\xef\
-\x7c\x46\xb3\xc5\xed\xa5\x10\xe7\x3a\x0a\x8f\x7b\x83\x53\xe7\x9d\
-\x56\x1d\x0b\x02\x0f\x0a\x00\x00\x08\x28\x92\x37\xed\x25\x39\xbe\
-\x61\x36\x79\x9b\x54\x47\x69\x99\xd0\x98\x66\xb1\x27\x94\x68\xd6\
-\xe8\x1d\x64\x71\x2e\xa7\xf0\x90\x95\x9c\xfa\x9a\x5b\x75\x2c\x08\
-\x7c\x28\x00\x00\x20\xe0\x48\xc1\xcc\xdb\xbc\xa5\xdb\x17\xb1\xab\
-\x30\x54\x75\x96\xef\xb1\x99\x28\x34\xb6\x91\x6c\xb1\x25\x1c\x1a\
-\xf3\x05\x59\xc2\x76\x92\xd9\xb6\x92\x87\x2d\x38\xa0\x3a\x1a\x04\
-\x27\x14\x00\x00\x10\x90\xe4\xd0\x5f\x22\xa8\x64\xd7\x02\x39\xb3\
-\x7b\x12\x9d\x3d\xd3\x3e\x8f\x0d\xd6\x2c\x44\x56\xa7\x9b\x42\x22\
-\x6b\xc4\x1c\x51\xae\x85\xd8\x0a\x49\x0b\x3b\x40\xa6\xa8\x0f\x29\
-\x5c\xcb\xc3\x95\x3d\xe8\x09\x0a\x00\x00\x08\x68\x92\xff\x48\x04\
-\x79\x4a\x7e\x27\x75\x85\xbf\xa4\xda\xa2\x24\x6a\xaa\xd4\x5a\x7d\
-\x10\xb3\x4d\xc4\x1c\xe1\x21\x93\xad\x91\xcc\xa1\xf5\x6c\x0a\xad\
-\x25\xb3\xb5\x8a\xd9\x5a\x41\x66\xeb\x51\x32\xd9\xf7\x93\xd9\xb2\
-\x8b\x86\xa5\xec\x66\xce\x6e\xf6\xc3\x7f\x03\xc0\xe7\x50\x00\x00\
-\x40\x50\x91\x82\xd9\x03\xa9\xa9\xfa\x5a\x92\xe6\x78\x92\xa6\x08\
-\x62\xeb\x69\x22\x6f\x33\x99\xb9\x9e\x3c\xe6\x2a\x22\x22\xb2\x58\
-\x4b\x48\x13\x2f\x35\x4a\x35\x91\xfd\x5b\xce\x7c\xb9\x4e\x71\x6c\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x80\x00\xf3\xff\x3b\xe7\xb1\xcf\xf4\
-\x44\x6e\x80\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x0f\xbb\x49\x44\x41\x54\x78\xda\xe5\x9b\x7b\xb0\x5d\x75\
+\x75\xc7\x3f\x6b\xfd\xf6\x3e\xe7\xdc\x47\x72\xf3\x0e\x41\x02\x21\
+\x80\x08\x81\x02\xc2\xe0\x83\xaa\x41\x04\x9f\xb5\xda\x36\x47\x83\
+\x09\xad\x2f\xd2\xd1\xd1\xa9\xd3\x16\x1d\xdb\x72\x73\x55\x1c\xa9\
+\x6d\x47\xa7\x8e\x1d\xa8\xf5\x41\x42\x12\x6e\xb4\xed\xa0\xed\x0c\
+\xc6\x08\x8a\xa3\x58\x8c\x1a\x35\x50\xca\x2b\x06\x49\xc8\xfb\x75\
+\xef\xb9\xe7\x9c\xbd\x7f\x6b\xf5\x8f\x7d\xce\xe5\xde\x9b\x1b\x72\
+\x6f\x12\x6d\xa8\x7b\xe6\xcc\xe4\x71\xce\x9e\xbd\xbe\xbf\xf5\xf8\
+\xae\xef\x5a\x1b\x7e\xcb\x2f\x39\x59\x37\x72\x47\x00\x61\x25\xca\
+\x62\xe0\x3e\x60\x11\xce\x16\x04\x30\xe9\xc3\xfe\xdf\x01\xe0\x20\
+\xf4\xa3\x00\x52\x25\xfe\x56\x79\x80\xf7\x13\x46\x1a\xed\x77\xbf\
+\xa9\x93\xc6\xe6\x0b\xf1\xe6\xc5\xe4\xf1\x85\x58\x9c\x6b\xc2\x14\
+\x4d\xc3\x1e\xe2\xcc\x5b\x65\xe9\x23\x5b\xbd\x17\x3d\xd5\x3c\x41\
+\x8e\xc3\xd5\x55\xa4\x30\xc2\xfb\xfb\x03\xf2\xa1\xeb\x88\xf5\xaa\
+\x59\x7e\xb5\xc2\x59\x94\xbd\xb8\xab\x03\xd1\xa1\x53\xb0\x03\xc9\
+\x83\x3a\x78\xf6\x55\x6c\xdf\x14\x4f\x35\x00\x92\x49\x9f\xba\x10\
+\x1d\x97\x78\xd7\xbc\x1b\x88\x2b\xfe\x8c\x60\x97\x92\x18\xda\x04\
+\xcb\x30\xb2\x96\x81\x2d\x10\xb4\x69\x8e\xe7\x17\x32\x9d\x4e\x59\
+\xc1\x41\x77\x44\x04\x7f\x5e\x01\xe0\x8e\xb0\x12\x91\x2a\xb1\xb9\
+\xee\xac\x97\xc2\xcc\xbf\x0f\x49\xfe\x72\x32\xc7\x86\x88\x40\x0e\
+\x04\x4d\x49\x88\xa8\xfb\xf0\xef\x22\x1d\x9a\x50\x2b\xad\x97\xea\
+\xa6\x83\x6d\x00\x4f\x25\x0f\xd0\x09\x66\x77\xa4\x4f\xcc\xd7\xcd\
+\xbd\x29\xe5\xc0\xfd\x68\xf6\x72\x1b\xf0\xdc\x1a\x64\x2a\x04\xed\
+\xa2\xac\x1d\x9a\x98\x85\x5f\x99\x4b\x5d\x04\x1c\x4c\x53\xc4\xea\
+\x72\xb8\x91\xf4\x7c\x04\x80\x2d\xa7\xce\xc9\x4f\x08\x80\xb6\xf1\
+\xac\xef\x57\x5f\x3b\xf3\xcb\x94\xeb\xb7\x5a\x33\x06\x1b\x22\x07\
+\x54\x3b\x49\x2d\x68\x6e\x79\xf9\x5f\x73\xeb\x7e\xa3\x26\x3d\x1f\
+\xd0\xb2\x88\x81\xe1\x18\x1d\xa2\xee\xa5\x8f\x75\x2e\x7d\xfc\x29\
+\xef\x25\x39\x15\x4b\xa1\x1c\xb3\xae\xaf\xef\x17\xe2\xfb\xd6\x53\
+\x69\xbe\xd5\x0e\x7b\x86\xa3\x1a\x3c\x50\x0e\x60\xc9\xd7\x48\xa6\
+\x7c\x5c\xfe\x70\xeb\x66\x00\x5f\x35\xed\x9b\x54\xe2\x6b\xac\x46\
+\x53\x2b\xa4\xd6\x0c\x0f\xeb\x05\xd5\xcb\x78\xe2\x76\xa3\x8a\x15\
+\x8e\x71\x6a\x5d\x47\xcf\x01\x2b\x09\xd2\x27\x79\xbc\xf3\x7d\x77\
+\x68\xe7\x08\xe3\xcb\x04\xf3\xe4\x80\x7a\xc7\xfb\xe5\x6d\xcf\xac\
+\x81\xbd\xf8\x6d\xa4\x4c\x5f\x62\x34\x36\x24\x94\x44\xb4\x6e\x65\
+\xd2\x80\xc6\xae\x0f\xca\x15\xb7\x67\xde\x4f\x18\x69\xbc\x83\xd0\
+\x8b\xb0\x08\x69\x11\xa5\x63\x5f\x8b\x70\x96\xe0\x80\x9f\xcc\x24\
+\x2a\xcf\x55\xe3\x7d\xf5\xdc\x9b\xe8\x1a\xba\xd5\x0e\x7b\x86\xa1\
+\xda\x41\xc0\x92\xc7\xf0\x19\x6f\x91\xeb\x1f\xdf\xe2\xfd\x84\xe1\
+\xb8\xee\xc3\x59\x35\xef\x32\x92\xda\x97\x08\xcc\x8d\xf5\xf4\x73\
+\xc9\x0d\x7b\x3e\x31\xb2\xf6\x7b\x2f\x0a\xa8\xf4\x91\x9f\x10\x01\
+\xeb\x45\x59\x54\x24\xe5\x93\x0e\x40\xdb\xf8\xe6\x9a\xf9\x57\xa4\
+\x72\xe8\x01\xcb\x0d\x22\x68\x85\x60\x9e\x3c\xa1\xcc\x58\x2c\x4b\
+\x1f\x7f\xca\x6f\x23\x95\x15\x64\x47\x3e\x5c\xaf\x72\xd9\xba\x2e\
+\x79\xcb\x23\x87\x47\x96\xbc\x91\xc4\xc9\xef\xed\x4d\x38\xb4\x7a\
+\x01\x43\x03\xf3\xa3\x85\xd9\x88\x94\x83\xc7\x71\x4f\x35\x1a\x12\
+\x42\x12\x21\xdf\xdf\x94\xd2\xce\x52\x77\xcf\x93\xf2\xa6\x9f\xef\
+\x1f\x09\xc6\x89\xe4\x16\x19\x1f\xdd\x25\x62\x8d\x6f\x3d\xa0\xe5\
+\xfc\x0a\x1b\x22\x27\x41\x55\x75\x00\xe6\xbc\x54\x96\x3e\xfa\xb0\
+\xdf\x4b\x22\x57\x1f\x79\x8a\xa3\x4e\x7b\xa4\xc1\x2d\x20\x7c\xdd\
+\x82\x4b\xd0\x81\xf7\x58\x96\x5f\x87\xf9\x42\x2d\x79\x42\x90\x63\
+\xd3\x31\x07\xcc\x21\x13\x40\x76\x11\xf4\xbf\xd0\xca\x6a\xa9\xee\
+\xb8\x0b\xfc\x84\x40\x90\x31\x06\x24\xd2\x47\xee\x6b\x4e\x5b\x46\
+\xa5\xb6\x8a\xc3\x9e\x1b\x88\x76\x69\x88\x43\x9d\xd7\x27\xcb\x77\
+\xac\xfd\xd1\x6d\xa4\x57\x8c\x73\xf2\xa3\xe2\xdb\x41\x04\x6f\xc7\
+\xba\xf4\x89\xc5\xb5\x33\x3f\x09\xd9\x5f\x6a\xc9\x13\x9a\x0e\xb9\
+\x60\x2e\x06\x38\xc7\x8a\xe9\x76\x29\xc6\x83\x04\x87\x12\xa0\x8a\
+\x65\xe1\x7e\x6d\x4e\x7f\x97\xdc\xf0\xf8\x63\xc7\x0b\x82\x1c\x91\
+\xf9\xef\xeb\x0d\xf6\xd4\x67\x37\x6b\x29\x5e\x60\x0d\x32\xed\xa2\
+\x64\x43\xe9\xd7\xc3\xf2\x7d\x6f\x6e\x03\x34\xb9\x7e\x41\x62\x5c\
+\x35\xe3\x4b\x3a\x35\xff\x13\x3b\x10\x1d\xd1\x88\x88\x12\x9b\x22\
+\x9e\x0b\x6e\x4c\xac\x38\x28\x68\xc0\xa5\xe4\x88\x1a\x1e\x5d\xbb\
+\x24\xb1\x2c\x6c\xd7\x74\xf6\x2b\xf8\xa3\x47\x9f\x2c\xc0\x9e\x1c\
+\x08\x72\x44\xe2\x5b\x3b\xef\x3a\x92\xda\x3d\x56\xb3\x88\xa0\x9a\
+\x6a\x4e\xe8\xb9\x94\xea\xb6\x87\x29\x5c\xd9\x26\x6e\x3c\x31\x5f\
+\x3d\xe7\xbd\xa1\xbb\x71\xbb\x1d\x8c\x4d\x24\xa4\x62\x4d\xc1\x9a\
+\xd0\x39\xaf\xf8\xa4\x53\x41\x12\x90\xe7\x88\x03\x8f\x90\xd7\xa0\
+\xbe\x07\x06\x9f\x82\xd8\x84\xb4\x0b\x37\xcb\xb4\x8b\x94\xa1\xf4\
+\x07\x94\xaf\x79\x05\x5b\xd6\xfb\x64\x01\x38\xa2\x0c\x5a\xde\x58\
+\xa6\x25\x77\x15\x32\x3a\xa9\x58\x2d\xf9\x46\x58\xba\xed\xa1\xc9\
+\xd0\x58\x07\xa1\x8a\x79\xff\x85\xdd\xd6\xd8\xbe\x92\x21\x33\x24\
+\x24\x62\x0d\xa1\x32\x1b\xce\x7f\x2f\xcc\xbc\x0c\xd2\x29\xc7\x36\
+\x7e\x14\x08\xf5\x02\x80\x27\xd6\xc0\x33\xdf\x45\x92\x8e\xd4\x06\
+\x3d\xd7\xee\xf8\x32\x1a\xf7\xbf\x55\xfa\xf8\xea\x64\xbd\x54\xdb\
+\x0f\x2c\x55\xa2\xf7\x2f\xe9\x80\xf8\x6a\x1a\x2e\xe6\x24\xb8\x62\
+\x69\xf2\x45\xf7\x49\xd4\x6b\x80\x7e\x54\xc0\x89\xfb\xae\xd3\x0e\
+\x3b\xdd\x9a\xb8\x78\xae\x24\x5d\x70\xf9\x2d\x70\xc6\xeb\x21\x74\
+\x80\x35\x21\x1f\x84\x6c\xe0\xd8\x9f\x7c\xa8\x00\xaa\xe7\x3c\x78\
+\xf1\xc7\xe1\xb4\x57\x40\x36\x08\xa2\x82\x99\x13\x9b\xef\x02\xe0\
+\xa1\xc9\x71\x04\x6d\x3f\x30\x00\xf9\x03\x8b\x34\xf0\x02\xcb\x30\
+\x4d\x48\x6c\x88\x3d\x49\xc7\x39\xdf\x11\xc1\x59\x39\x89\x9a\xdb\
+\x06\xcb\x9a\xd7\x22\x38\x1a\x9c\xbc\x06\x2f\x78\x2d\x4c\x7b\x11\
+\xd4\x77\x01\x56\x44\xa0\xe8\xc4\x3f\x50\x18\xed\x39\x2c\xbc\x1e\
+\x42\x19\x30\xa5\x89\x18\xf1\x4a\xef\xbf\xbc\x47\xd6\x13\x87\x29\
+\xfc\x84\x01\x68\x3d\x70\xb4\xe6\x25\xad\x7e\x3e\xa3\x04\x48\xd8\
+\x24\x6f\xf9\xfe\x61\xef\x45\x27\xc9\xbe\xcc\x71\x31\xf3\x8b\x88\
+\x2e\xb8\x0b\x1a\x60\xe6\x25\x45\xfc\x4a\x38\x81\xee\x25\x81\xd8\
+\x80\xee\x33\xa1\x6b\x3e\x62\x4d\x21\x8a\xab\x32\x93\x7c\xc7\xc2\
+\xa2\x77\x39\x76\x93\x37\x1a\x80\xc5\xc5\x5f\x82\xc4\xf3\x5a\xd8\
+\x39\x41\x50\xd5\x9f\xb7\xfe\xff\x98\x4d\x93\xf7\x13\xbc\x97\xa4\
+\x5d\x8e\x04\x75\xb0\x39\x85\xdf\x98\x10\x2a\x50\x99\xd3\x0a\xb8\
+\xd0\x02\xa1\x75\x50\x6e\x45\x8c\xfb\x04\xf3\x97\x1b\xc5\xfd\x66\
+\x81\x45\x0c\x31\x52\x07\xb7\x79\xc7\xd7\x0b\xdc\x37\x9c\x68\xe6\
+\x0c\x9f\xb3\x43\x74\xd9\x3a\x51\x91\x04\xda\x21\x22\xb8\xdf\xac\
+\xdc\xb7\x69\x86\x3d\xfd\xbd\x29\x05\x7b\x77\x21\xa4\x85\x1b\xc7\
+\xa1\x22\xf6\x91\x02\x04\x2d\x41\xd2\x59\xfc\xd9\x9a\x45\xac\xc3\
+\xb3\x2e\x7f\xd4\xfa\x15\x8a\xdf\x61\x05\xf3\x08\x02\x31\x99\x36\
+\x2a\x04\x27\x0c\xc0\xa2\x96\xd9\x42\x0f\xee\x11\xc7\x11\x89\x01\
+\x06\x47\x01\x34\x1e\xf3\xab\x12\xbd\xff\x55\xdd\xe8\x23\xaf\xb5\
+\x66\x7e\x8d\x12\x17\xd9\xea\xcf\x9c\x86\xc8\x14\xcc\xe6\xba\x81\
+\x88\x08\x16\xe1\xc7\x37\x8f\x36\xac\x6d\x44\x65\x0e\x4c\x3d\x17\
+\x66\x5d\x0e\x3d\x2f\x2a\x4e\x38\xd6\x27\x06\xc2\xa8\x07\xca\xf5\
+\xf8\x3c\xa0\x85\x98\xa1\xfb\xb5\x22\x81\x41\xab\x10\x90\x5c\xca\
+\x3b\x46\x01\x74\x04\xdb\x13\xf3\x75\x73\x57\x98\xfd\xec\x23\xaa\
+\x71\x81\x96\x0b\x1d\x50\xa5\x38\x18\x2f\xbe\xeb\xc3\xbf\x1a\xda\
+\x75\x04\xe9\x11\x37\xc1\xb7\xc0\xf6\x8d\x90\x74\xc0\xac\x2b\xe0\
+\x85\xef\x81\xa9\xe7\x40\x76\xf8\xc4\xf2\xc5\x24\x78\x80\xb9\x23\
+\xac\xef\xba\xc5\x0e\x0d\x5c\xa0\x9d\xf1\x85\x0c\xa4\x77\x25\xa7\
+\x9f\xb3\xd1\x7b\x7f\xa5\xa3\xd4\xdf\x61\x29\xdc\xcd\xd7\xcc\xfe\
+\x22\x95\xa1\x77\x6a\xcd\xb0\x41\xf2\x56\x18\x08\x90\x88\xa0\x22\
+\xce\x28\xa6\x1f\x92\x11\xdc\xcb\x01\xc1\x1c\x07\x89\x14\x1c\x2b\
+\xb0\xf3\x7b\xb0\x6f\x33\x5c\x7a\x33\xcc\x79\x49\x51\x02\x7f\x8d\
+\x20\x24\x85\xdc\x85\xd1\x07\xb0\xed\x49\x90\xab\x7c\xc3\x8b\x7b\
+\xe4\xda\x4d\x07\xe1\x3b\xe3\xd7\xf8\x2a\xd1\x57\xcf\xb9\x85\xa9\
+\xcd\x77\xda\x01\xcb\x30\x51\x0d\x24\x74\x4a\x82\x09\x34\x1c\x33\
+\x31\x47\xec\xa8\xb5\x43\x00\xf7\xa0\x29\x42\xc9\x13\xa2\x61\x75\
+\x4c\xd2\x1e\x25\x0e\xc1\x4f\x3f\x06\x2f\xfd\x47\xe8\x3e\x6b\x62\
+\xe1\x70\x32\x04\x91\xa2\x6b\x73\x97\x6b\x37\x1d\x1c\xaf\xb9\x68\
+\x49\xe2\xd1\xd7\xcf\x5f\x44\x7e\xe8\x23\x76\xc0\x23\x2e\x41\x4b\
+\xa8\xb9\x0e\x6a\x23\xbd\x03\x4f\x36\x36\x55\x9f\x28\x55\x2a\x03\
+\xf5\xac\xc3\x2a\xa9\x8e\x0f\x81\x9a\x34\x06\xf7\x27\x65\x98\x49\
+\x33\xbf\x08\xcf\xaa\x5a\x89\xd7\xd0\xc8\xcc\x43\x87\x92\x1d\x84\
+\xff\xf9\x42\x41\x9c\x7e\x53\x8a\xd0\x70\xef\x7e\x34\xce\xbf\x12\
+\x05\xcc\x1a\x43\xef\xd7\x0e\x57\x9a\x34\x35\x25\x31\xc2\x0e\x0d\
+\xd3\x5e\x2f\x6f\x2f\xa4\xb1\xe3\xb8\xbe\x0f\x72\xbb\xaf\x9d\xf5\
+\x61\xca\x8d\x4f\xf9\x50\x6e\x92\x74\x2b\x7b\x7e\x04\x07\xff\x1b\
+\x7a\xce\x6f\x31\x41\xfd\xf5\x02\x30\x16\x88\xb1\x89\x4f\xfa\xc8\
+\xfd\x47\x37\xa6\xf6\x70\xff\x75\x34\x1d\x04\xa1\x24\xea\x43\x95\
+\x9b\xe4\xfa\xad\x9b\xfd\xb3\x94\x99\x47\xce\x12\x9c\x95\x13\x7c\
+\x82\x45\x08\xb3\x11\x76\xbb\x4b\x75\xf7\xad\x71\xf5\xf4\xd7\x69\
+\x47\xbe\xd8\xea\x1a\x25\xaf\x05\xf6\x6c\x82\xe9\x17\x03\xb5\xff\
+\xe3\xc1\x48\x2f\x42\x1f\xce\x23\xdf\x5a\x80\xfb\x02\x32\x5c\x95\
+\x94\x21\xdd\x17\x66\x9e\x79\xb7\xf7\x3e\xa3\x7c\x90\xe6\xf1\xea\
+\x75\x7e\x1b\xa9\xf7\xe2\x50\x5a\x4d\x12\x17\x17\x7e\x18\xe0\xd0\
+\x63\x05\x49\x1a\xb7\xb4\x9f\xb8\x34\x38\x71\x9f\x5a\xd4\x7a\x02\
+\x19\x9c\xaf\x65\x0f\x06\x39\x29\x18\x3c\x26\x6f\x78\xf0\x10\x7d\
+\x27\x28\x56\x4e\x6f\x4d\x90\x93\x64\x0b\x0d\x00\x0f\x48\x80\xfa\
+\xee\x82\xfa\x1e\xe1\xfe\x0e\x96\x17\xc0\xb4\x24\x95\x88\x36\x7f\
+\x7d\x00\xb4\xd9\x55\x08\xb3\x08\x6d\xda\x00\xaa\x61\x2f\xf8\xb3\
+\x0d\xd5\xf1\x5e\x6d\x71\xd5\x7d\x9f\x65\xe2\x2a\x88\x8b\x3a\xf9\
+\xe0\xb3\xcc\x71\x44\x8c\x62\x39\x64\x87\xda\xc0\x08\xd1\x09\x1a\
+\x77\x8f\xc7\x5b\x4e\x0e\x00\xcf\xaa\x94\xa5\xe1\xe1\x27\x60\x2e\
+\xd9\x49\x0d\xca\x72\x67\x44\x24\x8e\xd2\x01\x3c\xb6\x34\x83\x16\
+\xb5\x42\x0b\x92\x54\xdb\x81\x4b\xe2\x2a\xa6\xd6\x90\x88\x76\x3f\
+\x35\xd9\x09\xd4\x89\xa7\x55\xb1\x93\x3b\xec\xb0\x0e\x1f\x37\x05\
+\xbb\x17\x14\xd9\x32\x28\xf5\xc0\xde\x1f\x43\x6d\x07\x84\x92\x93\
+\x00\x22\x5b\xd9\x7f\xcd\x2f\x5b\xbc\xe6\x37\x08\xc0\x6f\x62\x78\
+\xa5\xa5\xa2\xfb\x4b\xbb\xa1\x32\x1b\x0e\x3c\x04\x8f\x7c\xa1\xf8\
+\x77\x77\xa3\x24\x20\xc9\x3d\xb2\xe2\xf6\xcc\x7b\x49\xc6\xcb\x8e\
+\x47\xd3\x08\x92\x53\xde\x78\x8f\x50\xdb\x5e\x78\xc0\xd0\x2e\xd8\
+\xf7\x53\x78\xfa\x9b\x90\x0f\xe2\x5a\x76\x15\x83\x86\x9a\x6a\xc7\
+\xe7\x5b\x5c\xa5\xc5\x6a\xc7\x34\x6d\xed\x9d\x86\x31\xe3\xf9\x53\
+\x18\x00\x2b\xc4\x8f\xc6\x7e\xf8\xe1\x87\x0a\xd7\x8f\x75\xb0\x08\
+\x49\x27\xae\x65\x53\x8f\x39\xd3\x42\x89\x03\xa5\x4f\xca\x0d\x4f\
+\x6d\x39\x9a\x6e\x29\x7d\x98\x6f\xb8\xbc\x47\xae\xfd\xf1\x41\x11\
+\xf7\xe7\x59\x08\x38\x1e\x33\x77\xc4\x3c\x74\x45\x2f\xf5\xe4\x8e\
+\x46\x4d\x4c\xe9\x09\x25\x1b\x48\xbf\xc4\xf2\x5d\x7f\xed\xfd\x04\
+\xaa\x63\xa8\x7b\x2f\xea\xf7\xbe\x2a\xf1\x3b\xe7\x7c\x8e\x03\x8f\
+\x3d\xe6\x6b\xa7\x7f\x6f\xe8\x8e\x33\xcf\x76\x47\x5a\x63\xba\xe7\
+\x03\x00\xa0\xa9\x88\x96\x50\xad\x58\xd0\x4e\x4b\xb4\x4b\x02\x9a\
+\x3c\x49\xbd\xfc\xa7\xe1\xfa\xbd\xef\x02\x61\xec\xf4\xd9\xfb\x09\
+\xd2\x87\xe5\x3b\x1f\xbf\x86\xee\xe6\xfb\xad\x16\x67\x32\x25\xbf\
+\xaa\xa2\x83\x1f\x6d\x85\x80\x3e\x0f\x72\x00\x38\x62\x9e\xeb\x4e\
+\x55\x3f\x64\xa2\x3b\x35\x86\x5f\x90\x26\xdf\x46\xcf\xbf\x47\xaa\
+\xdf\x19\x18\x19\xdf\xe3\xf1\x96\x24\x6f\xcc\x23\x7a\x04\x69\x52\
+\xf7\x12\x6e\x33\x46\x72\x85\xc9\x03\x20\x89\x8d\x1a\xa9\xb8\x9c\
+\x5c\x10\xad\xa6\x8e\x6b\x4b\x47\x15\x8b\xfa\x8c\x4e\xfb\xdd\xdf\
+\xe1\xf7\xbe\xbe\x37\x88\x3e\xab\xaf\xf0\xcc\x11\x9b\x6a\xa3\xae\
+\xc5\xd0\x4a\x86\x5d\xb8\x07\x04\x41\x24\x98\x70\x70\x14\x40\x93\
+\xa0\xc2\x0e\x90\xe7\xd9\xc1\x24\xf8\x88\x89\x9e\x75\x4d\x96\x7c\
+\x3c\xe7\x95\xd7\x3b\x55\x5d\x3d\x62\xa2\x28\xe6\x87\xe5\xcd\xff\
+\xb1\x07\x64\x78\xbc\xde\xda\x15\xb0\x89\x0c\x6a\x4c\xfc\x6c\x95\
+\x11\x15\x55\xc3\xce\x91\x00\x4d\xfa\xf4\x92\x4a\xd8\x4e\x53\x00\
+\x4f\x88\x80\xf9\x02\xbf\xed\xc6\x54\x57\xdc\x7e\xa2\x8c\x50\xbd\
+\x17\x72\xcb\xce\x4e\x2a\x82\x0f\x7a\x4e\xa0\x44\xae\xbb\x1c\x13\
+\x7a\xa5\x3d\xf7\x9b\x98\x74\x7c\x5f\xeb\x7b\x1e\x2f\xa6\x98\xbc\
+\xb7\x0e\x2c\x3c\x3a\x52\xe7\x9c\x78\x12\x5c\xd2\xbe\xe1\xbc\x27\
+\x2c\xb2\x4f\x13\xd4\x32\x8c\xc4\xcf\x62\xca\x3d\x17\x19\xc8\x2f\
+\xfa\x29\xf9\xf1\xed\x1e\x0a\x33\x8a\xa4\xa5\x9e\xbf\x0e\x71\x10\
+\x8c\x20\x0e\xf2\x0b\x41\x7c\x32\xcf\xea\x5e\x0c\x49\xfd\x3f\xaf\
+\x9c\x8a\xd9\x8b\x69\x02\x4e\x4a\x43\x20\x29\x6f\x3e\xae\x1c\x20\
+\x82\xfb\x12\x82\x54\x37\x1d\xf4\x55\x33\x7e\x48\xc9\x5e\xc7\x10\
+\x99\x26\x56\xb6\xe6\xe1\x4f\x04\xe4\x8d\x54\xbd\xd9\x2e\x3f\xc3\
+\xdd\xe3\xb1\x1a\xa0\x67\xbb\xc8\x46\x63\xf5\xc2\x8b\x55\xf7\x2e\
+\xb3\x9a\x3b\x4e\x82\x23\x2a\xa5\x0d\x93\x6d\x70\x58\x49\x70\x27\
+\xb2\xee\x97\xaf\xd4\x0e\x66\x59\x8d\x5c\x53\x12\xcb\x79\x5a\x93\
+\xd3\x1f\x82\x6d\xb4\x4b\xe6\xe4\x42\xe0\xc2\x76\x47\x58\xfa\x22\
+\x1a\x5f\x8f\x5b\xb0\x3a\xa6\x95\xfc\x0d\x71\xcd\xf4\xbb\x35\xed\
+\xb8\x85\x59\xe7\x6e\x96\xab\xbf\x5b\x9f\x78\xaf\x2e\xf8\xdd\xe7\
+\xcd\xa2\x76\xe8\x0d\x66\xfb\x6e\x05\xeb\xc6\xc9\xb5\x84\x5a\x4d\
+\xb6\xeb\xdc\x39\xf7\x38\xcf\xc8\xd8\x1a\x7f\xac\x7c\x25\x82\xc7\
+\x55\xd9\xbb\x35\x35\x54\xc8\x29\x4b\xc0\x92\x8d\x52\x7d\x60\x68\
+\x64\xf2\x9c\xbc\xbb\xb6\x36\x48\x68\x6c\xbc\x9f\x8e\xec\x65\x36\
+\x48\x86\x10\xb4\x03\x25\x53\x2c\xca\x56\x90\x6d\x88\x0e\xe0\x92\
+\xa1\x36\x2e\xc9\x43\x54\xc0\xcb\x10\x67\x00\x0b\xb5\x6c\x33\x69\
+\x3a\x96\x63\x2a\x9e\x33\x35\x94\x18\x2c\xbf\x57\xde\xb1\xeb\x0b\
+\xcf\x99\xed\xc7\x19\xd4\x50\xc5\x9a\x6b\xe6\x5f\x58\x92\x43\x3f\
+\xb1\xcc\x12\x1c\xd3\x0e\x0d\xd0\x79\x9d\x54\x77\x6c\x18\x79\xbf\
+\xe3\x2b\x61\xd5\xf5\xc6\x57\xcf\x5b\x66\xd9\xee\xfb\xb5\x2b\x9e\
+\x6e\x83\xe4\x56\x23\x47\x2c\xd1\x84\x05\x24\x2c\x98\x30\xb4\x06\
+\x64\x60\x43\x64\x2d\x45\x32\xa1\x47\x4b\x76\x28\xfd\x72\x58\xbe\
+\x7b\x52\xc6\x03\x30\x1b\x11\xf0\x18\x07\x3f\x45\xc5\x52\x9a\x34\
+\xb5\x4c\x6a\x75\xd9\xa2\xf3\x6f\xbc\xd7\xbd\x4f\x46\x56\x8f\xe3\
+\xda\x16\x6f\x2b\xc6\x7e\xc7\x39\xe7\x52\xde\xff\x2f\x24\xf1\x95\
+\x98\x41\xa3\x35\xaa\x83\x88\x60\xcf\x19\x05\x45\x7b\x2f\x80\x8a\
+\x90\x48\x0a\x94\x04\x32\xc9\xcc\xd3\xbf\x0b\x4b\xf7\x7e\xd4\x7b\
+\x5d\xe9\xc3\x05\xdc\x1d\x69\x0d\x19\x8e\x7a\xd7\xf6\xee\x52\xbe\
+\x7a\xde\xf5\xa1\x52\xbb\xd3\x06\x2d\x2a\x38\xdd\x9a\x50\xef\x5c\
+\x26\xef\xd8\x71\xe7\xd8\xfd\x81\xe3\x5f\x97\x1f\x96\xcd\x05\xbf\
+\x6b\x5e\x15\xaf\x2f\x27\xda\x95\xe0\x73\x48\x1d\x74\x82\xcb\x4f\
+\xd1\x21\x93\x0c\x95\x27\xd0\x64\x03\x61\xca\x3f\xcb\x92\x27\x7f\
+\x36\x6a\xc3\x6c\xe4\x86\xfa\x51\x76\x81\xda\xc6\xfb\xaa\x73\x2f\
+\x24\xd9\xfd\x03\x33\xeb\x26\xc7\xb4\x83\xc4\x9a\xc9\x83\x5a\x7a\
+\xcd\xcb\xc6\xdb\x20\x39\xb1\x17\x26\xc6\x3c\x8c\xdf\x7b\xc9\x34\
+\xf6\x1c\x38\x9b\xbc\x71\x1a\x24\xd3\x63\xcc\x43\xd0\xf1\x4f\x2c\
+\x0a\x12\x24\xd4\x09\xf9\x6e\x4a\xdd\xbf\x62\xea\xb2\xad\x72\x75\
+\x5f\x3e\xcc\xe3\xc7\x6e\x98\x6d\x78\x4d\x0f\xc9\x55\x83\xed\xef\
+\x8c\x15\x54\x65\x05\x59\xed\x2b\x0b\xcf\xec\x28\xed\xbf\x17\xc9\
+\x17\x5a\x9d\x48\x00\x4d\x14\x42\xcf\x4b\xa4\xba\x6d\xd3\x78\xe1\
+\x74\x52\x5e\x99\x69\x2f\x4c\x9e\xe8\x2e\x70\x4b\xcc\xb0\x91\x8b\
+\x95\xd2\x87\xe5\xab\x4e\xbb\x39\x94\x1b\x1f\x00\xdd\x05\x33\xde\
+\x49\xf5\xd1\x07\xe9\x47\xd9\x82\xb7\x17\x26\x7d\xdd\xc2\x8b\x60\
+\xff\xbf\x23\xf9\x39\x36\x44\x44\x31\x9d\xa2\x29\x03\x95\x9b\x64\
+\xf9\xce\x4f\x1f\x2d\x97\x9c\xb4\x77\x86\x46\xa8\x2e\xc2\xfa\x49\
+\xae\xc0\xb6\xf9\xc0\xd8\x6e\xae\x4a\xf4\x35\x2f\x78\x35\x95\x81\
+\x8d\x0c\x44\x98\x2a\xd8\x60\xe5\x7e\x4d\x17\x5f\xcd\xfe\xf5\x5a\
+\x2c\x6a\x0a\xf9\xba\xd3\xde\x11\x18\xfa\x1c\xc4\x69\xd6\x28\xf2\
+\x8f\x4e\x91\xd4\x06\x4b\x77\x84\x65\x7b\xff\xd8\x7b\xfd\xa8\x7b\
+\x43\x27\x15\x80\x93\xd7\x01\xb6\x06\xb0\x0b\x6f\x54\x7b\xb8\xff\
+\x27\x5a\x8a\x17\x58\x9d\x4c\x3b\x29\x51\x4f\x36\xca\xf2\xfd\xd7\
+\x16\x20\x9d\x75\x29\x36\xf0\x37\x84\xfc\x0f\x68\x44\x2c\x4a\x44\
+\xbc\x38\xf9\x5a\xfa\x6f\xa4\xff\xb4\x04\xaa\xb4\xfa\x06\x7f\xfe\
+\x00\xd0\xca\xd4\xf9\xea\xd9\x7f\x11\x3a\x1b\x9f\xb6\xc3\x9e\xa3\
+\xa8\x96\x34\xcb\x65\xda\xd2\x44\xf2\x3a\x79\xfd\xdd\x58\xfe\xfb\
+\x94\x2c\xb1\x5a\xab\x47\x10\x0f\x3a\x45\x85\x7a\xe9\x2b\x84\xcf\
+\xbf\x9b\x25\x55\x3b\xda\xa4\xeb\x94\x05\x60\xb8\xc4\x7e\xed\xdc\
+\x33\xac\xbe\xfb\x21\xc5\xba\x2c\x82\x0a\x6a\x2e\x75\x54\xf7\x68\
+\xc9\xcf\x40\x0d\x6a\x60\x4e\x06\x88\x76\x90\x60\x9a\x43\xe5\xaf\
+\xe4\xed\xbb\xfe\xd6\xdd\xe5\x58\xc6\x9f\x9a\x82\x48\xab\x87\xb0\
+\xda\x81\x5b\xb5\xd3\xa7\xd8\x61\xa2\x28\xc1\x1d\x54\xbc\x82\xc6\
+\x33\x5a\x2f\x6c\x44\x20\xd1\x32\x29\xa9\x40\x96\x7c\x1f\xa6\xfc\
+\xb9\xbc\xfd\x97\x0f\xb4\xda\xe6\x09\x4d\xaa\x4e\x29\x0f\x18\x2e\
+\x79\xfd\x0b\x7b\xac\xb1\xe7\x69\x15\x2f\x59\x2c\x08\xd0\x08\x53\
+\x54\x53\x94\x12\x60\x8a\x45\xfd\xa9\x6b\xf9\x33\xe1\x6d\x3b\xee\
+\x10\xc4\x27\xcb\x1c\x4f\x29\x0f\x10\xc1\xbd\x17\x65\xff\xf4\x9a\
+\x76\xed\xdf\xc2\xb4\x78\xa5\xd6\x9c\xe1\x8d\x72\x07\x1a\x82\xb9\
+\x6e\xd3\x5c\xbf\x4d\xda\x71\x97\xf2\x0f\x1b\xa4\x5a\x8d\xc5\x72\
+\x56\xb1\xbf\x30\x49\xe1\xfd\xd4\xcc\x01\x43\x6b\xcf\x5f\x50\x09\
+\x7b\x3f\x4c\x6e\x33\xcd\x7c\x00\x0d\x3b\x3d\x84\x47\x83\x96\x7e\
+\xc6\xd9\x97\x3c\x24\x57\x7c\xa3\x36\xb6\x64\x1e\xe7\xe4\xe1\xf9\
+\x79\x79\x3f\xc5\xe2\xd0\x09\xbe\x8b\x74\xca\x02\x30\x4a\xff\xdb\
+\x82\x0c\xbf\x90\xbd\x12\xe3\x24\xbf\x37\xf4\x5b\x7d\xfd\x2f\x28\
+\x7d\x21\xfe\x6c\x3d\x07\x33\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -1471,7 +299,7 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x94\xc3\xee\x38\x7b\
+\x00\x00\x01\xa1\x52\xf4\xe2\xa0\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
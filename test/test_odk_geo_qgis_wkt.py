@@ -0,0 +1,71 @@
+# coding=utf-8
+"""Plugin start-up test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN = 'odk_geo_qgis_wkt_startup'
+
+# Qt and QGIS modules the plugin class and resources.py import, stubbed
+STUBBED = ('qgis', 'qgis.core', 'qgis.PyQt', 'qgis.PyQt.QtCore', 'qgis.PyQt.QtGui', 'qgis.PyQt.QtWidgets',
+           'PyQt5', 'PyQt5.QtCore')
+
+
+class ODKGeoQgisWktStartupTest(unittest.TestCase):
+    """Test QGIS start-up loads neither the dialog nor the Qt resources."""
+
+    def setUp(self):
+        """Runs before each test."""
+        modules = {name: mock.MagicMock() for name in STUBBED}
+        # No translation file for the stubbed locale
+        modules['qgis.PyQt.QtCore'].QSettings.return_value.value.return_value = 'xx_XX'
+        patcher = mock.patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in [name for name in sys.modules if name == PLUGIN or name.startswith(PLUGIN + '.')]:
+            del sys.modules[name]
+
+    def load_plugin(self):
+        spec = importlib.util.spec_from_file_location(
+            PLUGIN, os.path.join(PLUGIN_DIR, '__init__.py'), submodule_search_locations=[PLUGIN_DIR])
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PLUGIN] = package
+        spec.loader.exec_module(package)
+        return package
+
+    def test_deferred_imports(self):
+        """Test classFactory and initGui leave the dialog and resources to the first run."""
+        plugin = self.load_plugin().classFactory(mock.MagicMock())
+        plugin.initGui()
+        self.assertNotIn(PLUGIN + '.odk_geo_qgis_wkt_dialog', sys.modules)
+        self.assertNotIn(PLUGIN + '.resources', sys.modules)
+
+        dialog = types.ModuleType(PLUGIN + '.odk_geo_qgis_wkt_dialog')
+        dialog.ODKGeo_QgisWktDialog = mock.MagicMock()
+        dialog.ODKGeo_QgisWktDialog.return_value.exec_.return_value = 0
+        sys.modules[dialog.__name__] = dialog
+        plugin.run()
+        self.assertIn(PLUGIN + '.resources', sys.modules)
+        dialog.ODKGeo_QgisWktDialog.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKGeoQgisWktStartupTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,86 @@
+# coding=utf-8
+"""Area of interest test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely.geometry import Polygon, box
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.aoi import AreaOfInterest
+from odkwkt.engine import parse_column
+
+# Traces as ODK writes them, "lat lon altitude accuracy"
+INSIDE = '0.5 0.5 0 0;5.0 5.0 0 0'
+# Crosses the area without a vertex in it
+CROSSING = '0.5 -1.0 0 0;0.5 2.0 0 0'
+# Its bounding box meets the area, the trace does not
+BESIDE = '1.5 0.9 0 0;0.9 1.5 0 0'
+OUTSIDE = '5.0 5.0 0 0;6.0 6.0 0 0'
+
+
+class ODKWktAoiTest(unittest.TestCase):
+    """Test leaving the cells outside an area of interest out of the conversion."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line'])
+        for key, line in (('a', INSIDE), ('b', CROSSING), ('c', BESIDE), ('d', OUTSIDE), ('e', '0.5 0.5 0 0')):
+            sheet.append([key, line])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_select(self):
+        """Test cells are kept by their vertices or geometry, and dropped by their bounding box."""
+        area = AreaOfInterest(box(0, 0, 1, 1))
+        parsed = parse_column([(2, INSIDE), (3, CROSSING), (4, BESIDE), (5, OUTSIDE)])
+        self.assertEqual(list(area.select(parsed, 'trace').rows), [2, 3])
+        # Points only have their first vertex
+        self.assertEqual(list(area.select(parsed, 'point').rows), [2])
+        # Two vertices cannot form a polygon, so the cells near the area are kept for building to report
+        self.assertEqual(list(area.select(parsed, 'shape').rows), [2, 3, 4])
+
+        triangle = AreaOfInterest(Polygon([(0, 0), (1, 0), (0, 1)]))
+        points = parse_column([(2, '0.2 0.2 0 0'), (3, '0.9 0.9 0 0')])
+        self.assertEqual(list(triangle.select(points, 'point').rows), [2])
+        self.assertEqual(len(area.select(parse_column([]), 'trace')), 0)
+
+    def test_aoi_conversion(self):
+        """Test rows outside the area get no result, and are left out of sidecar files."""
+        output_path = os.path.join(self.work_dir, 'lines.csv')
+        options = ConversionOptions(output_path=output_path, aoi_bbox=(0, 0, 1, 1), tolerant=True)
+        result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+        self.assertEqual(result.converted, {'line_wkt': 2})
+        # The single vertex trace lies in the area, and still fails
+        self.assertEqual([error.row for error in result.errors], [6])
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            self.assertEqual([record['KEY'] for record in csv.DictReader(handle)], ['a', 'b'])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktAoiTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,122 @@
+# coding=utf-8
+"""Memory budget test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.budget import MemoryBudget, SpilledStrings
+from odkwkt.engine import iter_chunks
+from odkwkt.readers import ZipXmlReader
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+LINE_WKT = 'LINESTRING (20 10, 20.5 10.5)'
+
+INLINE_CELL = re.compile(r'<c r="([A-Z]+\d+)"([^>]*) t="inlineStr"><is><t>([^<]*)</t></is></c>')
+
+
+def share_strings(file_path):
+    """Moves the inline strings openpyxl writes into a shared strings table, like Excel does."""
+    with zipfile.ZipFile(file_path) as archive:
+        parts = {info.filename: archive.read(info) for info in archive.infolist()}
+    strings = []
+
+    def shared(match):
+        strings.append(match.group(3))
+        return f'<c r="{match.group(1)}"{match.group(2)} t="s"><v>{len(strings) - 1}</v></c>'
+
+    sheet = 'xl/worksheets/sheet1.xml'
+    parts[sheet] = INLINE_CELL.sub(shared, parts[sheet].decode('utf-8')).encode('utf-8')
+    parts['xl/sharedStrings.xml'] = (
+        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        + ''.join(f'<si><t>{text}</t></si>' for text in strings) + '</sst>').encode('utf-8')
+    parts['xl/_rels/workbook.xml.rels'] = parts['xl/_rels/workbook.xml.rels'].replace(
+        b'</Relationships>',
+        b'<Relationship Id="rIdShared" Target="sharedStrings.xml" Type="http://schemas.openxmlformats.org'
+        b'/officeDocument/2006/relationships/sharedStrings"/></Relationships>')
+    parts['[Content_Types].xml'] = parts['[Content_Types].xml'].replace(
+        b'</Types>',
+        b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+        b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>')
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+
+class ODKWktBudgetTest(unittest.TestCase):
+    """Test conversions within a memory budget."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line', 'note'])
+        for index in range(20):
+            sheet.append([f'uuid:{index}', TRACE if index % 3 else None, f'note ünicode {index}'])
+        workbook.save(self.file_path)
+        share_strings(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_chunks_by_size(self):
+        """Test chunks end once their rows reach the byte limit."""
+        rows = [['x' * 100]] * 10
+        chunks = list(iter_chunks(rows, 1000, max_bytes=300))
+        self.assertEqual([(start, len(chunk)) for start, chunk in chunks], [(2, 2), (4, 2), (6, 2), (8, 2), (10, 2)])
+        self.assertEqual(len(list(iter_chunks(rows, 1000))), 1)
+        with self.assertRaises(ValueError):
+            MemoryBudget(0)
+
+    def test_spilled_shared_strings(self):
+        """Test shared strings spilled to disk read the same as in memory."""
+        expected = list(ZipXmlReader(self.file_path).iter_rows('data'))
+        reader = ZipXmlReader(self.file_path, max_string_bytes=100)
+        try:
+            self.assertIsInstance(reader._shared_strings, SpilledStrings)
+            self.assertEqual(list(reader.iter_rows('data')), expected)
+        finally:
+            reader.close()
+
+        strings = SpilledStrings(['', 'a', 'ü'])
+        self.assertEqual([strings[index] for index in range(-1, 3)], ['ü', '', 'a', 'ü'])
+        strings.close()
+
+    def test_budget_conversion(self):
+        """Test a tiny budget converts in small chunks without the openpyxl model."""
+        options = ConversionOptions(writer='openpyxl', memory_budget=0.01, checkpoint_rows=1000)
+        with mock.patch('odkwkt.outputs.InPlaceOutput.__init__', side_effect=AssertionError):
+            result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+        self.assertEqual(result.converted, {'line_wkt': 13})
+        sheet = load_workbook(self.file_path)['data']
+        self.assertEqual(sheet['D1'].value, 'line_wkt')
+        self.assertEqual(sheet['D3'].value, LINE_WKT)
+        self.assertEqual(sheet['C21'].value, 'note ünicode 19')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktBudgetTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
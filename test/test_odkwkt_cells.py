@@ -0,0 +1,119 @@
+# coding=utf-8
+"""Spatial key columns test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.cells import cell_key_column, geohashes, grid_cells
+from odkwkt.engine import parse_column
+
+try:
+    import pyproj
+except ImportError:
+    pyproj = None
+
+# An L: three vertices, whose bounding box centre (0.5, 0.5) differs from its centroid
+TRACE = '0.0 0.0 0 0;0.0 1.0 0 0;1.0 1.0 0 0'
+# In Vienna, about 1.1 km by 1.1 km
+SHAPE = '48.20 16.37 0 0;48.20 16.385 0 0;48.21 16.385 0 0;48.21 16.37 0 0;48.20 16.37 0 0'
+
+
+class ODKWktCellsTest(unittest.TestCase):
+    """Test geohash and grid cell columns computed from the coordinate arrays."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['point', 'shape'])
+        sheet.append(['42.6 -5.6 0 0', SHAPE])
+        sheet.append(['57.64911 10.40744 0 0', None])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_keys(self):
+        """Test geohashes match the reference encoding and grid cells count from the origin."""
+        self.assertEqual(geohashes([-5.6, 10.40744, 180.0], [42.6, 57.64911, 90.0], 11).tolist(),
+                         ['ezs42e44yx9', 'u4pruydqqvj', 'zzzzzzzzzzz'])
+        self.assertEqual(geohashes([-5.6], [42.6], 5).tolist(), ['ezs42'])
+        self.assertEqual(grid_cells([16.375, -0.001, 2500.0], [48.205, 0.5, -1.0], 0.01).tolist(),
+                         ['1637_4820', '-1_50', '250000_-100'])
+
+    def test_non_finite_anchors(self):
+        """Test NaN and infinite anchor points get an empty key instead of an edge cell."""
+        nan, inf = float('nan'), float('inf')
+        self.assertEqual(geohashes([nan, inf, -5.6], [0.0, 0.0, 42.6], 5).tolist(), ['', '', 'ezs42'])
+        self.assertEqual(grid_cells([nan, -inf, 1e300, 0.015], [0.0, 0.0, 0.0, 0.0], 0.01).tolist(),
+                         ['', '', '', '1_0'])
+        # The centroid of a trace this long overflows
+        parsed = parse_column([(2, '1e308 1e308 0 0;-1e308 -1e308 0 0'), (3, TRACE)])
+        keys = cell_key_column(parsed, 'trace', ('geohash', 'grid'), grid_size=0.5)
+        self.assertEqual(keys['geohash'][0], (2, None))
+        self.assertEqual(keys['grid_cell'], [(2, None), (3, '1_0')])
+
+    def test_anchors(self):
+        """Test the keys of a trace follow its centroid, or the centre of its bounding box."""
+        parsed = parse_column([(2, TRACE)])
+        by_centroid = cell_key_column(parsed, 'trace', ('grid',), 'centroid', grid_size=0.5)
+        by_bbox = cell_key_column(parsed, 'trace', ('grid',), 'bbox', grid_size=0.5)
+        # The centroid of the L is (0.75, 0.25)
+        self.assertEqual(by_centroid, {'grid_cell': [(2, '1_0')]})
+        self.assertEqual(by_bbox, {'grid_cell': [(2, '1_1')]})
+        self.assertEqual(cell_key_column(parsed, 'trace', ()), {})
+        self.assertRaises(ValueError, ConversionOptions, cell_keys=('h3',))
+        self.assertRaises(ValueError, ConversionOptions, cell_keys=('geohash',), geohash_precision=13)
+        self.assertRaises(ValueError, ConversionOptions, cell_keys=('grid',), cell_anchor='vertex')
+
+    def test_cell_key_conversion(self):
+        """Test the key columns follow each result column in the workbook."""
+        output_path = os.path.join(self.work_dir, 'keys.xlsx')
+        convert_workbook(self.file_path, 'data', [
+            ColumnSpec('point', 'point_wkt', 'point'),
+            ColumnSpec('shape', 'shape_wkt', 'shape'),
+        ], ConversionOptions(output_path=output_path, cell_keys=('geohash', 'grid'), geohash_precision=5))
+        sheet = load_workbook(output_path)['data']
+        headers = [cell.value for cell in sheet[1]]
+        self.assertEqual(headers[4:], ['point_wkt geohash', 'point_wkt grid_cell',
+                                       'shape_wkt geohash', 'shape_wkt grid_cell'])
+        self.assertEqual([cell.value for cell in sheet[2]][4:], ['ezs42', '-560_4260', 'u2edh', '1637_4820'])
+        self.assertEqual([cell.value for cell in sheet[3]][4:6], ['u4pru', '1040_5764'])
+
+    @unittest.skipIf(pyproj is None, 'pyproj is not installed')
+    def test_projected_grid(self):
+        """Test geohashes stay geographic while the grid counts 1 km squares of a projected CRS."""
+        output_path = os.path.join(self.work_dir, 'keys.xlsx')
+        convert_workbook(self.file_path, 'data', [ColumnSpec('shape', 'shape_wkt', 'shape')],
+                         ConversionOptions(output_path=output_path, cell_keys=('geohash', 'grid'),
+                                           target_crs='EPSG:32633'))
+        row = [cell.value for cell in load_workbook(output_path)['data'][2]]
+        self.assertEqual(row[3], 'u2edhxm')
+        # 1 km squares: about 102 km east of the central meridian (false easting 500 km), 5340 km north
+        self.assertEqual(row[4], '602_5340')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktCellsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,98 @@
+# coding=utf-8
+"""Reprojection test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely import wkb, wkt
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+
+try:
+    import pyproj
+except ImportError:
+    pyproj = None
+
+# Vienna, in UTM zone 33N
+TRACE = '48.2 16.37 0 0;48.3 16.4 0 0'
+UTM_33N = 'EPSG:32633'
+
+
+@unittest.skipIf(pyproj is None, 'pyproj is not installed')
+class ODKWktCrsTest(unittest.TestCase):
+    """Test reprojecting coordinates to a target CRS during the conversion."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line'])
+        sheet.append(['a', TRACE])
+        sheet.append(['b', '95.0 16.0 0 0;48.3 16.4 0 0'])
+        workbook.save(self.file_path)
+        transformer = pyproj.Transformer.from_crs('EPSG:4326', UTM_33N, always_xy=True)
+        self.expected = [transformer.transform(16.37, 48.2), transformer.transform(16.4, 48.3)]
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def convert(self, output_name, columns, **options):
+        output_path = os.path.join(self.work_dir, output_name)
+        options = ConversionOptions(output_path=output_path, target_crs=UTM_33N, tolerant=True,
+                                    error_column='errors', **options)
+        return convert_workbook(self.file_path, 'data', columns, options), output_path
+
+    def test_reprojected_columns(self):
+        """Test results are in the target CRS and points outside it are reported."""
+        result, output_path = self.convert('lines.csv', [
+            ColumnSpec('line', 'line_wkt'),
+            ColumnSpec('line', 'line_ewkb', encoding='ewkb_hex'),
+        ])
+        self.assertEqual(result.converted, {'line_wkt': 1, 'line_ewkb': 1})
+        self.assertEqual([(error.row, error.token) for error in result.errors], [(3, '95.0 16.0')] * 2)
+        self.assertIn('UTM zone 33N', result.errors[0].reason)
+
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            record = next(csv.DictReader(handle))
+        line = wkt.loads(record['line_wkt'])
+        for coordinate, expected in zip(line.coords, self.expected):
+            self.assertAlmostEqual(coordinate[0], expected[0], places=6)
+            self.assertAlmostEqual(coordinate[1], expected[1], places=6)
+        ewkb = wkb.loads(record['line_ewkb'], hex=True)
+        self.assertTrue(ewkb.equals(line))
+        self.assertEqual(bytes.fromhex(record['line_ewkb'])[5:9], (32633).to_bytes(4, 'little'))
+
+    def test_geopackage_srs(self):
+        """Test GeoPackage layers declare the target CRS."""
+        _, output_path = self.convert('lines.gpkg', [ColumnSpec('line', 'line_wkt')])
+        with sqlite3.connect(output_path) as connection:
+            self.assertEqual(connection.execute('SELECT srs_id FROM gpkg_geometry_columns').fetchall(), [(32633,)])
+            self.assertEqual(connection.execute(
+                'SELECT organization, organization_coordsys_id FROM gpkg_spatial_ref_sys WHERE srs_id = 32633'
+            ).fetchall(), [('EPSG', 32633)])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktCrsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
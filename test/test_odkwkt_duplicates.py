@@ -0,0 +1,98 @@
+# coding=utf-8
+"""Duplicate submission test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openpyxl import Workbook
+from shapely.geometry import LineString, Point, Polygon
+
+from odkwkt import ColumnSpec, ConversionOptions, Duplicate, convert_workbook, find_duplicates
+
+SITE = '10.0 20.0 0 0;10.0 20.001 0 0;10.001 20.001 0 0;10.001 20.0 0 0;10.0 20.0 0 0'
+# The same site walked again, starting at another corner
+SITE_AGAIN = '10.001 20.001 0 0;10.001 20.0 0 0;10.0 20.0 0 0;10.0 20.001 0 0;10.001 20.001 0 0'
+# Slightly shifted, about 10 cm
+SITE_SHIFTED = '10.000001 20.0 0 0;10.000001 20.001 0 0;10.001001 20.001 0 0;10.001001 20.0 0 0;10.000001 20.0 0 0'
+OTHER_SITE = '11.0 20.0 0 0;11.0 20.001 0 0;11.001 20.001 0 0;11.001 20.0 0 0;11.0 20.0 0 0'
+
+
+class ODKWktDuplicatesTest(unittest.TestCase):
+    """Test finding rows that record the same site twice."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'shape'])
+        for key, shape in (('a', SITE), ('b', OTHER_SITE), ('c', SITE_AGAIN), ('d', SITE_SHIFTED)):
+            sheet.append([key, shape])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_find_duplicates(self):
+        """Test each test finds its duplicates, and a pair is only reported once."""
+        square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        shapes = [(2, square), (3, Polygon([(0, 0), (1, 0), (1, 0.95), (0, 0.95)])),
+                  (4, Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])), (5, Polygon([(0, 0), (1, 0), (1, 0.5)]))]
+        duplicates = find_duplicates(shapes, 'shape', 'shape')
+        self.assertEqual([(d.row, d.duplicate_of, d.test) for d in duplicates],
+                         [(3, 2, 'overlap'), (4, 2, 'identical'), (4, 3, 'overlap')])
+        self.assertAlmostEqual(duplicates[0].value, 0.95)
+
+        lines = [(2, LineString([(0, 0), (1, 1)])), (3, LineString([(0, 0), (1, 1.000001)])),
+                 (4, LineString([(0, 0), (1, 0)]))]
+        self.assertEqual([(d.row, d.duplicate_of, d.test) for d in find_duplicates(lines, 'trace')],
+                         [(3, 2, 'hausdorff')])
+
+        points = [(3, Point(5, 5)), (2, Point(5.000001, 5)), (4, Point(6, 5))]
+        (duplicate,) = find_duplicates(points, 'point', 'point')
+        self.assertEqual(duplicate, Duplicate(3, 2, 'point', 'centroid', duplicate.value))
+        self.assertAlmostEqual(duplicate.value, 1e-6)
+        self.assertEqual(find_duplicates(points[:1], 'point'), [])
+
+    def test_duplicates_report(self):
+        """Test a conversion reports duplicates once per ODK column, also of resumed chunks."""
+        output_path = os.path.join(self.work_dir, 'out.csv')
+        report_path = os.path.join(self.work_dir, 'duplicates.csv')
+        options = ConversionOptions(output_path=output_path, duplicates=True, duplicate_report=report_path,
+                                    checkpoint_rows=2)
+        columns = [ColumnSpec('shape', 'shape_wkt', 'shape'), ColumnSpec('shape', 'shape_wkb', 'shape', 'wkb_hex')]
+        with mock.patch('odkwkt.sidecar.SidecarOutput.close', side_effect=OSError('disk full')):
+            self.assertRaises(OSError, convert_workbook, self.file_path, 'data', columns, options)
+        result = convert_workbook(self.file_path, 'data', columns, options)
+        self.assertEqual(result.resumed_chunks, 2)
+        self.assertEqual([(d.row, d.duplicate_of, d.column, d.test) for d in result.duplicates], [
+            (4, 2, 'shape', 'identical'), (5, 2, 'shape', 'overlap'), (5, 4, 'shape', 'overlap')])
+
+        with open(report_path, newline='', encoding='utf-8') as handle:
+            records = list(csv.DictReader(handle))
+        self.assertEqual([(record['row'], record['duplicate_of'], record['test']) for record in records],
+                         [('4', '2', 'identical'), ('5', '2', 'overlap'), ('5', '4', 'overlap')])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktDuplicatesTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,112 @@
+# coding=utf-8
+"""Result encoding test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import shapely
+from openpyxl import Workbook, load_workbook
+from shapely import wkb
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook, parse_coordinates
+from odkwkt.encodings import encode_column, load_geometry
+from odkwkt.engine import build_geometries
+
+POINT = '10.123456789012345 20.5 0 0'
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+OPEN_SHAPE = '10.0 20.0 0 0;10.5 20.5 0 0;10.0 21.0 0 0'
+
+
+class ODKWktEncodingsTest(unittest.TestCase):
+    """Test hex WKB and EWKB result columns."""
+
+    def expected(self, geometry, srid=None):
+        if srid is not None:
+            geometry = shapely.set_srid(geometry, srid)
+        return shapely.to_wkb(geometry, hex=True, byte_order=1, include_srid=srid is not None)
+
+    def test_matches_shapely(self):
+        """Test packed WKB and EWKB equal Shapely's for every geometry kind."""
+        for kind, value in (('point', POINT), ('trace', TRACE), ('shape', OPEN_SHAPE)):
+            parsed = [(2, parse_coordinates(value)), (3, parse_coordinates(OPEN_SHAPE))]
+            geometries = build_geometries(parsed, kind)
+            for encoding, srid in (('wkb_hex', None), ('ewkb_hex', 4326)):
+                encoded = encode_column(parsed, kind, encoding)
+                self.assertEqual([row for row, _ in encoded], [2, 3])
+                for (_, text), (_, geometry) in zip(encoded, geometries):
+                    self.assertEqual(text, self.expected(geometry, srid))
+                    self.assertTrue(load_geometry(text, encoding).equals(geometry))
+
+    def test_full_precision(self):
+        """Test WKB keeps coordinates WKT would round."""
+        (_, text), = encode_column([(2, parse_coordinates(POINT))], 'point', 'wkb_hex')
+        self.assertEqual(wkb.loads(text, hex=True).y, 10.123456789012345)
+
+    def test_geojson_precision(self):
+        """Test rounded GeoJSON coordinates are written without trailing zeros."""
+        parsed = [(2, parse_coordinates(POINT)), (3, parse_coordinates(OPEN_SHAPE))]
+        self.assertEqual(encode_column(parsed[:1], 'point', 'geojson', precision=6),
+                         [(2, '{"type":"Point","coordinates":[20.5,10.123457]}')])
+        (_, text), = encode_column(parsed[1:], 'shape', 'geojson', precision=3)
+        self.assertEqual(text, '{"type":"Polygon","coordinates":[[[20.0,10.0],[20.5,10.5],[21.0,10.0],[20.0,10.0]]]}')
+
+    def test_convert_columns(self):
+        """Test per-column encodings in a workbook and a GeoPackage sidecar."""
+        work_dir = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(work_dir, 'odk.xlsx')
+            workbook = Workbook()
+            workbook.active.title = 'data'
+            workbook.active.append(['line', 'shape'])
+            workbook.active.append([TRACE, OPEN_SHAPE])
+            workbook.active.append(['bad', None])
+            workbook.save(file_path)
+            columns = [ColumnSpec('line', 'line_wkb', 'trace', 'ewkb_hex'),
+                       ColumnSpec('shape', 'shape_wkt', 'shape')]
+
+            result = convert_workbook(file_path, 'data', columns, ConversionOptions(tolerant=True))
+            self.assertEqual(result.converted, {'line_wkb': 1, 'shape_wkt': 1})
+            sheet = load_workbook(file_path)['data']
+            line = wkb.loads(sheet['C2'].value, hex=True)
+            self.assertEqual(shapely.get_srid(line), 4326)
+            self.assertEqual(line.wkt, 'LINESTRING (20 10, 20.5 10.5)')
+            self.assertTrue(sheet['D2'].value.startswith('POLYGON'))
+            self.assertIsNone(sheet['C3'].value)
+
+            output_path = os.path.join(work_dir, 'out.gpkg')
+            convert_workbook(file_path, 'data', columns, ConversionOptions(output_path=output_path, tolerant=True))
+            connection = sqlite3.connect(output_path)
+            try:
+                blob, = connection.execute('SELECT geom FROM line_wkb').fetchone()
+            finally:
+                connection.close()
+            # Header (8 bytes) and XY envelope (32 bytes), then plain WKB without the SRID
+            self.assertEqual(wkb.loads(blob[40:]).wkt, 'LINESTRING (20 10, 20.5 10.5)')
+            self.assertEqual(blob[41:45], b'\x02\x00\x00\x00')
+        finally:
+            shutil.rmtree(work_dir)
+
+    def test_unknown_encoding(self):
+        """Test unknown encodings are refused."""
+        with self.assertRaises(ValueError):
+            ColumnSpec('line', 'line_wkb', 'trace', 'kml')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktEncodingsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
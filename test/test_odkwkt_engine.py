@@ -0,0 +1,193 @@
+# coding=utf-8
+"""Conversion engine test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import (
+    ColumnSpec,
+    ConversionOptions,
+    CoordinateBatch,
+    CoordinateError,
+    convert_workbook,
+    flip_coordinates,
+    parse_coordinates,
+    read_error_rows,
+)
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+SHAPE = '10.0 20.0 0 0;10.0 21.0 0 0;11.0 21.0 0 0;10.0 20.0 0 0'
+
+
+def make_workbook(file_path, rows):
+    """Writes a one-sheet workbook with the given rows (first row is the header)."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = 'data'
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file_path)
+
+
+class ODKWktEngineTest(unittest.TestCase):
+    """Test the QGIS independent conversion engine."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_flip_coordinates(self):
+        """Test lat/lon pairs are swapped and altitude/accuracy dropped."""
+        self.assertEqual(flip_coordinates('10.5 20.25 100 5'), (20.25, 10.5))
+        self.assertEqual(parse_coordinates(TRACE), [(20.0, 10.0), (20.5, 10.5)])
+        with self.assertRaises(ValueError):
+            flip_coordinates('10.5')
+        with self.assertRaises(CoordinateError) as context:
+            parse_coordinates('10 20;10 x')
+        self.assertEqual(context.exception.token, '10 x')
+
+    def test_coordinate_batch(self):
+        """Test cells parse into one flat array and a failed cell leaves no trace."""
+        batch = CoordinateBatch()
+        batch.append(2, TRACE)
+        with self.assertRaises(CoordinateError):
+            batch.append(3, '10 20;10 x')
+        batch.append(4, SHAPE)
+        self.assertEqual(list(batch.rows), [2, 4])
+        self.assertEqual(list(batch.offsets), [0, 2, 6])
+        self.assertEqual(len(batch.values), 12)
+        self.assertEqual([(row, coords.tolist()) for row, coords in batch.select({4})],
+                         [(4, [list(coordinate) for coordinate in parse_coordinates(SHAPE)])])
+
+        single = CoordinateBatch(single_precision=True)
+        single.append(2, '10.123456789 20.987654321')
+        (_, coords), = single
+        self.assertEqual(single.values.itemsize, 4)
+        self.assertAlmostEqual(coords[0][0], 20.987654321, places=5)
+
+    def test_convert_workbook(self):
+        """Test WKT columns are appended and the workbook saved in place."""
+        make_workbook(self.file_path, [
+            ['KEY', 'line', 'poly'],
+            ['a', TRACE, SHAPE],
+            ['b', None, SHAPE],
+        ])
+        result = convert_workbook(self.file_path, 'data', [
+            ColumnSpec('line', 'line_wkt', 'trace'),
+            ColumnSpec('poly', 'poly_wkt', 'shape'),
+        ])
+        self.assertEqual(result.converted, {'line_wkt': 1, 'poly_wkt': 2})
+        self.assertEqual(result.errors, [])
+
+        sheet = load_workbook(self.file_path)['data']
+        rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+        self.assertEqual(rows[0], ['KEY', 'line', 'poly', 'line_wkt', 'poly_wkt'])
+        self.assertEqual(rows[1][3], 'LINESTRING (20 10, 20.5 10.5)')
+        self.assertEqual(rows[2][3], None)
+        self.assertEqual(rows[2][4], 'POLYGON ((20 10, 21 10, 21 11, 20 10))')
+
+    def test_convert_workbook_existing_column(self):
+        """Test an existing result column is overwritten rather than duplicated."""
+        make_workbook(self.file_path, [
+            ['line', 'line_wkt'],
+            [TRACE, 'stale'],
+        ])
+        convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt', 'trace')])
+        sheet = load_workbook(self.file_path)['data']
+        self.assertEqual(sheet.max_column, 2)
+        self.assertEqual(sheet.cell(row=2, column=2).value, 'LINESTRING (20 10, 20.5 10.5)')
+
+    def test_missing_source_column(self):
+        """Test a missing ODK column is reported before anything is written."""
+        make_workbook(self.file_path, [['KEY'], ['a']])
+        with self.assertRaises(KeyError):
+            convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')])
+
+    def test_strict_conversion_names_row(self):
+        """Test a malformed cell aborts a strict conversion with its row number."""
+        make_workbook(self.file_path, [['line'], [TRACE], ['10 20;oops']])
+        with self.assertRaisesRegex(ValueError, "Row 3, column 'line'"):
+            convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')])
+
+    def test_tolerant_conversion(self):
+        """Test failed rows are reported and can be re-run on their own."""
+        make_workbook(self.file_path, [
+            ['line', 'poly'],
+            [TRACE, SHAPE],
+            ['10 20;oops 1', SHAPE],
+            [TRACE, '10 20;10 21'],
+        ])
+        report = os.path.join(self.work_dir, 'errors.csv')
+        columns = [ColumnSpec('line', 'line_wkt', 'trace'), ColumnSpec('poly', 'poly_wkt', 'shape')]
+        options = ConversionOptions(tolerant=True, error_column='errors', error_report=report)
+        result = convert_workbook(self.file_path, 'data', columns, options)
+
+        self.assertEqual(result.converted, {'line_wkt': 2, 'poly_wkt': 2})
+        self.assertEqual([(error.row, error.column) for error in result.errors],
+                         [(3, 'line'), (4, 'poly')])
+        self.assertEqual(result.errors[0].token, 'oops 1')
+        self.assertEqual(read_error_rows(report), {3, 4})
+
+        sheet = load_workbook(self.file_path)['data']
+        self.assertEqual(sheet.cell(row=1, column=5).value, 'errors')
+        self.assertIsNone(sheet.cell(row=2, column=5).value)
+        self.assertIn('oops 1', sheet.cell(row=3, column=5).value)
+
+        # Fix the bad cells and re-run only the failed rows
+        workbook = load_workbook(self.file_path)
+        workbook['data']['A3'] = TRACE
+        workbook['data']['B4'] = SHAPE
+        workbook.save(self.file_path)
+        options = ConversionOptions(tolerant=True, error_column='errors', rows=read_error_rows(report))
+        result = convert_workbook(self.file_path, 'data', columns, options)
+        self.assertEqual(result.converted, {'line_wkt': 2, 'poly_wkt': 2})
+        self.assertEqual(result.errors, [])
+        sheet = load_workbook(self.file_path)['data']
+        self.assertIsNone(sheet.cell(row=3, column=5).value)
+        self.assertEqual(sheet.cell(row=3, column=3).value, 'LINESTRING (20 10, 20.5 10.5)')
+
+    def test_import_is_lazy(self):
+        """Test importing the engine does not load openpyxl or Shapely."""
+        code = ("import sys, odkwkt; "
+                "print(sorted(m for m in ('openpyxl', 'shapely') if m in sys.modules))")
+        output = subprocess.check_output(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(output.decode().strip(), '[]')
+
+
+    def test_invalid_options_exit_with_usage(self):
+        """Test the command line reports invalid options as usage errors."""
+        output = subprocess.run(
+            [sys.executable, '-m', 'odkwkt', self.file_path, '--sheet', 'data', '--trace', 'line', '--simplify', '0'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), capture_output=True)
+        self.assertEqual(output.returncode, 2)
+        self.assertIn(b'Simplification tolerance must be positive', output.stderr)
+        self.assertNotIn(b'Traceback', output.stderr)
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktEngineTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,114 @@
+# coding=utf-8
+"""Newline-delimited GeoJSON output test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+
+TRACE = '10.123456789 20.0 0 0;10.5 20.5 0 0'
+SHAPE = '10.0 20.0 0 0;10.5 20.5 0 0;10.0 21.0 0 0'
+
+
+class ODKWktGeoJSONTest(unittest.TestCase):
+    """Test streaming features to newline-delimited GeoJSON."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['name', 'line', 'shape', 'when', 'KEY'])
+        sheet.append(['a', TRACE, SHAPE, datetime.date(2024, 5, 1), 'uuid:a'])
+        sheet.append(['b', None, None, None, 'uuid:b'])
+        sheet.append(['c', 'bad', SHAPE, None, 'uuid:c'])
+        workbook.save(self.file_path)
+        self.columns = [ColumnSpec('line', 'line_wkt'), ColumnSpec('shape', 'shape_wkt', 'shape')]
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def convert(self, columns, **options):
+        output_path = os.path.join(self.work_dir, 'out.geojsonl')
+        options = ConversionOptions(output_path=output_path, tolerant=True, checkpoint_rows=2, **options)
+        convert_workbook(self.file_path, 'data', columns, options)
+        with open(output_path, encoding='utf-8') as handle:
+            return [json.loads(line) for line in handle]
+
+    def test_features(self):
+        """Test one feature per converted row, keyed on KEY, with rounded coordinates."""
+        features = self.convert(self.columns[:1], error_column='errors')
+        self.assertEqual([feature['id'] for feature in features], ['uuid:a', 'uuid:c'])
+        first = features[0]
+        self.assertEqual(first['type'], 'Feature')
+        self.assertEqual(first['geometry'], {'type': 'LineString', 'coordinates': [[20.0, 10.123457], [20.5, 10.5]]})
+        # Unconverted ODK columns are plain properties, the key is only the id
+        self.assertEqual(first['properties'], {'name': 'a', 'shape': SHAPE, 'when': '2024-05-01T00:00:00'})
+        self.assertIsNone(features[1]['geometry'])
+        self.assertIn('bad', features[1]['properties']['errors'])
+        with open(os.path.join(self.work_dir, 'out.geojsonl'), encoding='utf-8') as handle:
+            self.assertNotIn(': ', handle.readline())
+
+    def test_target_crs_rejected(self):
+        """Test GeoJSON output refuses a target CRS, as RFC 7946 is longitude/latitude only."""
+        with self.assertRaises(ValueError):
+            ConversionOptions(output_path=os.path.join(self.work_dir, 'out.geojsonl'), target_crs='EPSG:32633')
+
+    def test_non_finite_coordinates(self):
+        """Test NaN and infinite coordinates are row errors, never invalid JSON."""
+        workbook = Workbook()
+        workbook.active.title = 'data'
+        for row in (['line'], ['nan 1 0 0;1 1 0 0'], ['1 inf 0 0;1 1 0 0'], [TRACE]):
+            workbook.active.append(row)
+        workbook.save(self.file_path)
+        output_path = os.path.join(self.work_dir, 'out.geojsonl')
+        result = convert_workbook(self.file_path, 'data', self.columns[:1],
+                                  ConversionOptions(output_path=output_path, tolerant=True, error_column='errors'))
+        self.assertEqual(sorted(error.row for error in result.errors), [2, 3])
+        with open(output_path, encoding='utf-8') as handle:
+            text = handle.read()
+        self.assertNotIn('NaN', text)
+        self.assertNotIn('Infinity', text)
+        features = [json.loads(line, parse_constant=self.fail) for line in text.splitlines()]
+        self.assertEqual([feature['geometry'] is None for feature in features], [True, True, False])
+        self.assertEqual(features[2]['geometry']['coordinates'][0], [20.0, 10.123457])
+        # Rounded coordinates carry no trailing zeros
+        self.assertIn('[20.0,10.123457]', text)
+
+    def test_collection_and_properties(self):
+        """Test several geometries per row, selected properties and full precision."""
+        features = self.convert(self.columns, properties=('name',), key_column='name', precision=12)
+        self.assertEqual([feature['id'] for feature in features], ['a', 'c'])
+        geometry = features[0]['geometry']
+        self.assertEqual(geometry['type'], 'GeometryCollection')
+        line, polygon = geometry['geometries']
+        self.assertEqual(line['coordinates'][0], [20.0, 10.123456789])
+        self.assertEqual(polygon['coordinates'], [[[20.0, 10.0], [20.5, 10.5], [21.0, 10.0], [20.0, 10.0]]])
+        self.assertEqual(features[0]['properties'], {'name': 'a'})
+        self.assertEqual(features[1]['geometry']['type'], 'Polygon')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktGeoJSONTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,130 @@
+# coding=utf-8
+"""GeoParquet output test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openpyxl import Workbook
+from shapely import wkb
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+LINE_WKT = 'LINESTRING (20 10, 20.5 10.5)'
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class ODKWktGeoParquetTest(unittest.TestCase):
+    """Test exporting converted sheets to GeoParquet."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        self.output_path = os.path.join(self.work_dir, 'odk.parquet')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line', 'count', 'when', 'ok'])
+        sheet.append(['uuid:a', TRACE, 3, datetime.datetime(2024, 5, 1), True])
+        sheet.append(['uuid:b', None, 4, None, False])
+        sheet.append(['uuid:c', '10.0 22.0 0 0;11.0 22.0 0 0', 2.5, datetime.datetime(2024, 5, 2), None])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_geoparquet(self):
+        """Test typed attributes, WKB geometries and the geo metadata."""
+        options = ConversionOptions(output_path=self.output_path, checkpoint_rows=2)
+        convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+
+        parquet = pyarrow.parquet.ParquetFile(self.output_path)
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read()
+        self.assertEqual(table.column_names, ['row', 'KEY', 'line', 'count', 'when', 'ok', 'line_wkt'])
+        self.assertEqual(table.column('row').to_pylist(), [2, 3, 4])
+        # Integers of the first chunk, widened by a float later on
+        self.assertEqual(str(table.schema.field('count').type), 'double')
+        self.assertEqual(table.column('count').to_pylist(), [3.0, 4.0, 2.5])
+        self.assertEqual(str(table.schema.field('when').type), 'timestamp[us]')
+        self.assertEqual(table.column('ok').to_pylist(), [True, False, None])
+
+        geometries = table.column('line_wkt').to_pylist()
+        self.assertEqual(wkb.loads(geometries[0]).wkt, LINE_WKT)
+        self.assertIsNone(geometries[1])
+
+        geo = json.loads(pyarrow.parquet.read_schema(self.output_path).metadata[b'geo'])
+        self.assertEqual(geo['primary_column'], 'line_wkt')
+        self.assertEqual(geo['columns']['line_wkt']['encoding'], 'WKB')
+        self.assertEqual(geo['columns']['line_wkt']['geometry_types'], ['LineString'])
+        self.assertEqual(geo['columns']['line_wkt']['bbox'], [20.0, 10.0, 22.0, 11.0])
+
+    def test_resumed_geometries(self):
+        """Test chunks resumed from the journal write the same WKB geometries."""
+        options = ConversionOptions(output_path=self.output_path, checkpoint_rows=1)
+        with mock.patch('odkwkt.geoparquet.GeoParquetOutput.close', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+        result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+        self.assertEqual(result.resumed_chunks, 3)
+
+        geometries = pyarrow.parquet.read_table(self.output_path).column('line_wkt').to_pylist()
+        self.assertEqual(wkb.loads(geometries[0]).wkt, LINE_WKT)
+        self.assertIsNone(geometries[1])
+        self.assertEqual(wkb.loads(geometries[2]).wkt, 'LINESTRING (22 10, 22 11)')
+
+    def test_widened_to_text(self):
+        """Test that values of another kind in a later chunk turn the column to text, losing none."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['line', 'count', 'when'])
+        sheet.append([TRACE, 3, datetime.datetime(2024, 5, 1)])
+        sheet.append([TRACE, 4, datetime.datetime(2024, 5, 2)])
+        sheet.append([TRACE, 4.5, 'unknown'])
+        sheet.append([TRACE, 'n/a', None])
+        sheet.append([TRACE, 5, datetime.datetime(2024, 5, 3)])
+        workbook.save(self.file_path)
+
+        options = ConversionOptions(output_path=self.output_path, checkpoint_rows=2)
+        convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+
+        parquet = pyarrow.parquet.ParquetFile(self.output_path)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        table = parquet.read()
+        self.assertEqual(str(table.schema.field('count').type), 'string')
+        self.assertEqual(table.column('count').to_pylist(), ['3', '4', '4.5', 'n/a', '5'])
+        self.assertEqual(str(table.schema.field('when').type), 'string')
+        self.assertEqual(table.column('when').to_pylist(),
+                         ['2024-05-01 00:00:00', '2024-05-02 00:00:00', 'unknown', None, '2024-05-03 00:00:00'])
+        self.assertEqual(len([name for name in os.listdir(self.work_dir) if name.endswith('.tmp')]), 0)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktGeoParquetTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
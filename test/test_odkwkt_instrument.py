@@ -0,0 +1,93 @@
+# coding=utf-8
+"""Pipeline instrumentation test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from odkwkt import StageTimer, profiled
+
+
+class ODKWktInstrumentTest(unittest.TestCase):
+    """Test stage timings and profiling hooks."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_stage_accumulates(self):
+        """Test re-entering a stage adds to the same record."""
+        timer = StageTimer()
+        for _ in range(2):
+            with timer.stage('parse') as stats:
+                stats.rows += 3
+                stats.vertices += 10
+        with timer.stage('save'):
+            pass
+        timings = timer.as_dict()
+        self.assertEqual([stage['name'] for stage in timings['stages']], ['parse', 'save'])
+        self.assertEqual(timings['stages'][0]['calls'], 2)
+        self.assertEqual(timings['stages'][0]['rows'], 6)
+        self.assertEqual(timings['stages'][0]['vertices'], 20)
+        self.assertEqual(len(timer.report()), 2)
+
+    def test_elapsed_of_merged_timers(self):
+        """Test the elapsed time of overlapping worker stages is not their sum."""
+        timer = StageTimer()
+        workers = [StageTimer() for _ in range(4)]
+
+        def work(worker):
+            with worker.stage('parse'):
+                time.sleep(0.2)
+
+        with timer.stage('load'):
+            threads = [threading.Thread(target=work, args=(worker,)) for worker in workers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        for worker in workers:
+            timer.merge(worker)
+        timings = timer.as_dict()
+        self.assertGreaterEqual(timings['total_wall_s'], 1.0)
+        self.assertGreaterEqual(timings['elapsed_wall_s'], 0.2)
+        self.assertLess(timings['elapsed_wall_s'], timings['total_wall_s'] - 0.4)
+        self.assertEqual(StageTimer().as_dict()['elapsed_wall_s'], 0.0)
+
+    def test_profiled_saves_next_to_output(self):
+        """Test the profile files are written next to the output path."""
+        output = os.path.join(self.work_dir, 'odk.xlsx')
+        for profiler, suffix in (('cprofile', '.prof'), ('tracemalloc', '.tracemalloc')):
+            with profiled(profiler, output) as profile_path:
+                sum(range(1000))
+            self.assertEqual(profile_path, output + suffix)
+            self.assertTrue(os.path.exists(profile_path))
+        with profiled(None, output) as profile_path:
+            self.assertIsNone(profile_path)
+        with self.assertRaises(ValueError):
+            with profiled('perf', output):
+                pass
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktInstrumentTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,140 @@
+# coding=utf-8
+"""Reference layer join test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import sqlite3
+import struct
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely.geometry import Point, box
+
+from odkwkt import ColumnSpec, ConversionOptions, ReferenceLayer, convert_workbook
+
+# Two regions as ODK geoshapes, "lat lon altitude accuracy"
+WEST = '0.0 0.0 0 0;1.0 0.0 0 0;1.0 1.0 0 0;0.0 1.0 0 0;0.0 0.0 0 0'
+EAST = '0.0 1.0 0 0;1.0 1.0 0 0;1.0 2.0 0 0;0.0 2.0 0 0;0.0 1.0 0 0'
+SITE = '0.2 1.2 0 0;0.8 1.2 0 0;0.8 1.8 0 0;0.2 1.8 0 0;0.2 1.2 0 0'
+
+
+def write_shapefile(base, rings, names, deleted=()):
+    """Writes a polygon shapefile with one clockwise ring and a NAME attribute per feature."""
+    records = b''
+    for number, ring in enumerate(rings, start=1):
+        content = struct.pack('<i4d2ii', 5, 0, 0, 0, 0, 1, len(ring), 0)
+        content += b''.join(struct.pack('<2d', x, y) for x, y in ring)
+        records += struct.pack('>2i', number, len(content) // 2) + content
+    header = struct.pack('>7i', 9994, 0, 0, 0, 0, 0, (100 + len(records)) // 2)
+    header += struct.pack('<2i8d', 1000, 5, 0, 0, 0, 0, 0, 0, 0, 0)
+    with open(base + '.shp', 'wb') as handle:
+        handle.write(header + records)
+    with open(base + '.dbf', 'wb') as handle:
+        handle.write(struct.pack('<4BIHH20x', 3, 126, 1, 1, len(names), 65, 11))
+        handle.write(struct.pack('<11sc4xBB14x', b'NAME', b'C', 10, 0))
+        handle.write(b'\r')
+        for index, name in enumerate(names):
+            handle.write((b'*' if index in deleted else b' ') + name.encode('utf-8').ljust(10))
+        handle.write(b'\x1a')
+    with open(base + '.prj', 'w', encoding='utf-8') as handle:
+        handle.write('GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137.0,298.257223563]],'
+                     'PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]]')
+
+
+class ODKWktJoinsTest(unittest.TestCase):
+    """Test joining converted geometries to the polygons of a reference layer."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sites = workbook.active
+        sites.title = 'sites'
+        sites.append(['KEY', 'point', 'shape'])
+        sites.append(['a', '0.5 0.5 0 0', SITE])
+        sites.append(['b', '5.0 5.0 0 0', None])
+        regions = workbook.create_sheet('regions')
+        regions.append(['region', 'shape'])
+        regions.append(['West', WEST])
+        regions.append(['East', EAST])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_join(self):
+        """Test geometries get the attributes of the first polygon holding them."""
+        layer = ReferenceLayer([box(0, 0, 1, 1), box(1, 0, 2, 1), box(0, 0, 2, 1)], {'name': str, 'code': int},
+                               [('West', 1), ('East', None), ('Both', 3)])
+        joined = layer.join_first([(2, Point(0.5, 0.5)), (3, box(1.2, 0.2, 1.8, 0.8)), (4, Point(9, 9))])
+        self.assertEqual(joined, {'name': [(2, 'West'), (3, 'East')], 'code': [(2, 1)]})
+        self.assertEqual(layer.join_first([]), {})
+
+    def test_shapefile(self):
+        """Test shapefile rings, attributes and CRS are read."""
+        base = os.path.join(self.work_dir, 'regions')
+        write_shapefile(base, [
+            [(0, 0), (0, 1), (1, 1), (1, 0), (0, 0)],
+            [(1, 0), (1, 1), (2, 1), (2, 0), (1, 0)],
+        ], ['West', 'East'])
+        layer = ReferenceLayer.open(base + '.shp', crs='EPSG:4326')
+        self.assertEqual(layer.fields, {'NAME': str})
+        self.assertEqual(layer.records, [('West',), ('East',)])
+        self.assertEqual(layer.polygons[1].area, 1.0)
+        self.assertEqual(layer.join_first([(2, Point(1.5, 0.5))]), {'NAME': [(2, 'East')]})
+
+    def test_shapefile_deleted_records(self):
+        """Test features whose .dbf record is flagged deleted are left out."""
+        base = os.path.join(self.work_dir, 'regions')
+        write_shapefile(base, [
+            [(0, 0), (0, 1), (1, 1), (1, 0), (0, 0)],
+            [(1, 0), (1, 1), (2, 1), (2, 0), (1, 0)],
+        ], ['West', 'East'], deleted={0})
+        layer = ReferenceLayer.open(base + '.shp')
+        self.assertEqual(layer.records, [('East',)])
+        self.assertEqual(layer.join_first([(2, Point(0.5, 0.5)), (3, Point(1.5, 0.5))]), {'NAME': [(3, 'East')]})
+
+    def test_joined_conversion(self):
+        """Test a conversion adds the attributes of a GeoPackage layer after each result column."""
+        reference_path = os.path.join(self.work_dir, 'regions.gpkg')
+        convert_workbook(self.file_path, 'regions', [ColumnSpec('shape', 'regions', 'shape')],
+                         ConversionOptions(output_path=reference_path, key_column='region'))
+        self.assertRaises(KeyError, ReferenceLayer.open, reference_path, ('population',))
+        connection = sqlite3.connect(reference_path)
+        connection.execute('ALTER TABLE regions ADD COLUMN code BLOB')
+        connection.execute("UPDATE regions SET code = x'00ff' WHERE region = 'West'")
+        connection.commit()
+        connection.close()
+
+        output_path = os.path.join(self.work_dir, 'sites.csv')
+        convert_workbook(self.file_path, 'sites', [
+            ColumnSpec('point', 'point_wkt', 'point'),
+            ColumnSpec('shape', 'shape_wkt', 'shape'),
+        ], ConversionOptions(output_path=output_path, join_layer=reference_path))
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            records = {record['KEY']: record for record in csv.DictReader(handle)}
+        self.assertEqual((records['a']['point_wkt region'], records['a']['shape_wkt region']), ('West', 'East'))
+        self.assertEqual(records['b']['point_wkt region'], '')
+        # BLOB attributes are joined as hex text
+        self.assertEqual(records['a']['point_wkt code'], '00FF')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktJoinsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,110 @@
+# coding=utf-8
+"""Checkpoint journal test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.journal import Journal, journal_path
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+
+
+class ODKWktJournalTest(unittest.TestCase):
+    """Test checkpointed, resumable conversions."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['line'])
+        for _ in range(5):
+            sheet.append([TRACE])
+        workbook.save(self.file_path)
+        self.columns = [ColumnSpec('line', 'line_wkt')]
+        self.options = ConversionOptions(checkpoint_rows=2)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_resume_after_interruption(self):
+        """Test an interrupted run keeps its journal and the next run resumes from it."""
+        with mock.patch('odkwkt.outputs.ColumnAppendOutput.close', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                convert_workbook(self.file_path, 'data', self.columns, self.options)
+        self.assertTrue(os.path.exists(journal_path(self.file_path)))
+
+        result = convert_workbook(self.file_path, 'data', self.columns, self.options)
+        self.assertEqual(result.resumed_chunks, 3)
+        self.assertEqual(result.converted, {'line_wkt': 5})
+        self.assertFalse(os.path.exists(journal_path(self.file_path)))
+
+        sheet = load_workbook(self.file_path)['data']
+        self.assertEqual([sheet.cell(row=row, column=2).value for row in range(2, 7)],
+                         ['LINESTRING (20 10, 20.5 10.5)'] * 5)
+
+    def test_torn_line_is_dropped(self):
+        """Test a chunk whose journal line was cut off is converted again."""
+        header = {'version': 1}
+        journal = Journal.open(os.path.join(self.work_dir, 'j'), header)
+        journal.record(2, 3, {'a': [[2, 'x']]}, [])
+        journal.record(4, 5, {'a': [[4, 'y']]}, [])
+        journal.close()
+        with open(journal.file_path, 'rb+') as handle:
+            handle.truncate(os.path.getsize(journal.file_path) - 5)
+
+        journal = Journal.open(journal.file_path, header)
+        self.assertIsNotNone(journal.completed(2))
+        self.assertIsNone(journal.completed(4))
+        journal.record(4, 5, {'a': [[4, 'y']]}, [])
+        journal.close()
+        journal = Journal.open(journal.file_path, header)
+        journal.close()
+        self.assertEqual(sorted(journal.chunks), [2, 4])
+
+    def test_binary_results(self):
+        """Test WKB bytes results are journaled as hex and come back as bytes."""
+        header = {'version': 1}
+        journal = Journal.open(os.path.join(self.work_dir, 'j'), header)
+        journal.record(2, 3, {'a': [[2, b'\x01\x02'], [3, None]], 'b': [[2, 'x']]}, [])
+        journal.close()
+
+        journal = Journal.open(journal.file_path, header)
+        results, _, _ = journal.completed(2)
+        journal.close()
+        self.assertEqual(results, {'a': [[2, b'\x01\x02'], [3, None]], 'b': [[2, 'x']]})
+
+    def test_other_conversion_is_not_resumed(self):
+        """Test a journal of a different conversion is discarded."""
+        journal = Journal.open(os.path.join(self.work_dir, 'j'), {'sheet': 'a'})
+        journal.record(2, 3, {}, [])
+        journal.close()
+        journal = Journal.open(journal.file_path, {'sheet': 'b'})
+        journal.close()
+        self.assertEqual(journal.chunks, {})
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktJournalTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
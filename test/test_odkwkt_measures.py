@@ -0,0 +1,166 @@
+# coding=utf-8
+"""Derived measure test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.engine import parse_column
+from odkwkt.measures import MEASURES, measure_column, measure_fields
+
+try:
+    import pyproj
+except ImportError:
+    pyproj = None
+
+# One degree east along the equator, then one degree north along a meridian
+TRACE = '0.0 0.0 0 0;0.0 1.0 0 0;1.0 1.0 0 0'
+# About 1.1 km by 1.1 km, near Vienna
+SHAPE = '48.20 16.37 0 0;48.20 16.385 0 0;48.21 16.385 0 0;48.21 16.37 0 0;48.20 16.37 0 0'
+
+
+class ODKWktMeasuresTest(unittest.TestCase):
+    """Test measure columns computed from the coordinate arrays."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line', 'shape'])
+        sheet.append(['a', TRACE, SHAPE])
+        sheet.append(['b', '0.0 0.0 0 0', None])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_measure_fields(self):
+        """Test measures only apply to the kinds they make sense for."""
+        self.assertEqual(measure_fields('point', MEASURES), [
+            ('vertices', 'vertices'), ('centroid', 'centroid_x'), ('centroid', 'centroid_y')])
+        self.assertEqual([name for _, name in measure_fields('trace', ('area', 'length'))], ['length_m'])
+        self.assertRaises(ValueError, measure_fields, 'shape', ('volume',))
+        self.assertRaises(ValueError, ConversionOptions, measures=('volume',))
+
+    def test_measure_column(self):
+        """Test the measures of a trace against the WGS 84 meridian and equator arcs."""
+        parsed = parse_column([(2, TRACE), (3, SHAPE)])
+        measured = measure_column(parsed, 'trace', MEASURES)
+        self.assertEqual(set(measured), {'length_m', 'vertices', 'xmin', 'ymin', 'xmax', 'ymax',
+                                         'centroid_x', 'centroid_y'})
+        self.assertEqual(measured['vertices'], [(2, 3), (3, 5)])
+        self.assertAlmostEqual(measured['length_m'][0][1], 110574.389 + 111319.491, delta=1)
+        self.assertEqual([value for _, value in measured['xmax']], [1.0, 16.385])
+        centroid = measured['centroid_x'][0][1], measured['centroid_y'][0][1]
+        self.assertEqual(centroid, (0.75, 0.25))
+        self.assertEqual(measure_column(parse_column([]), 'shape', MEASURES), {})
+
+    @unittest.skipIf(pyproj is None, 'pyproj is not installed')
+    def test_geodesic_area(self):
+        """Test areas and perimeters agree with the exact geodesic ones to the documented 1e-6."""
+        # A field, and polygons about 10 km across in the north, the far south and on the equator
+        shapes = [
+            SHAPE,
+            '48.20 16.30 0 0;48.20 16.43 0 0;48.29 16.43 0 0;48.29 16.30 0 0;48.20 16.30 0 0',
+            '-60.0 -70.0 0 0;-60.05 -69.85 0 0;-59.96 -69.9 0 0;-60.0 -70.0 0 0',
+            '0.0 0.0 0 0;0.0 0.09 0 0;0.09 0.045 0 0;0.0 0.0 0 0',
+        ]
+        geod = pyproj.Geod(ellps='WGS84')
+        for text in shapes:
+            shape = measure_column(parse_column([(2, text)]), 'shape', ('area', 'perimeter'))
+            lat, lon = zip(*[[float(value) for value in vertex.split()[:2]] for vertex in text.split(';')])
+            area, perimeter = geod.polygon_area_perimeter(lon, lat)
+            self.assertLess(abs(shape['area_m2'][0][1] / abs(area) - 1), 1e-6)
+            self.assertLess(abs(shape['perimeter_m'][0][1] / perimeter - 1), 1e-6)
+
+    def test_measure_columns(self):
+        """Test measure columns are added after the results and written as numbers."""
+        output_path = os.path.join(self.work_dir, 'out.xlsx')
+        options = ConversionOptions(output_path=output_path, tolerant=True,
+                                    measures=('length', 'area', 'vertices'))
+        result = convert_workbook(self.file_path, 'data', [
+            ColumnSpec('line', 'line_wkt'),
+            ColumnSpec('shape', 'shape_wkt', 'shape'),
+        ], options)
+        self.assertEqual(result.converted, {'line_wkt': 1, 'shape_wkt': 1})
+
+        sheet = load_workbook(output_path)['data']
+        rows = list(sheet.values)
+        self.assertEqual(rows[0], ('KEY', 'line', 'shape', 'line_wkt', 'shape_wkt', 'line_wkt length_m',
+                                   'line_wkt vertices', 'shape_wkt area_m2', 'shape_wkt vertices'))
+        self.assertAlmostEqual(rows[1][5], 110574.389 + 111319.491, delta=1)
+        self.assertEqual(rows[1][6], 3)
+        self.assertAlmostEqual(rows[1][7], 1.2e6, delta=0.1e6)
+        # The single vertex trace of row 3 fails, and gets no measures either
+        self.assertEqual(rows[2][3:], (None,) * 6)
+
+    def test_non_finite_measures(self):
+        """Test NaN coordinates fail their row and overflowing measures stay empty, the workbook intact."""
+        workbook = load_workbook(self.file_path)
+        sheet = workbook['data']
+        sheet.append(['c', 'nan 1 0 0;2 2 0 0', None])
+        # Finite latitudes whose distance overflows to infinity
+        sheet.append(['d', '1e308 0 0 0;-1e308 0 0 0', None])
+        workbook.save(self.file_path)
+        result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')],
+                                  ConversionOptions(tolerant=True, measures=('length', 'bbox')))
+        errors = {error.row: error for error in result.errors}
+        self.assertEqual(sorted(errors), [3, 4])
+        self.assertEqual((errors[4].token, errors[4].reason), ('nan 1 0 0', 'coordinates must be finite numbers'))
+
+        # Saved in place with the xmlappend writer, which must still be readable
+        rows = list(load_workbook(self.file_path)['data'].values)
+        self.assertEqual(rows[0][4:], ('line_wkt length_m', 'line_wkt xmin', 'line_wkt ymin', 'line_wkt xmax',
+                                       'line_wkt ymax'))
+        self.assertEqual(rows[3][3:], (None,) * 6)
+        self.assertIsNotNone(rows[4][3])
+        self.assertEqual(rows[4][4:], (None, 0.0, -1e308, 0.0, 1e308))
+
+    def test_sidecar_measures(self):
+        """Test sidecar files receive the measure columns, typed in GeoPackages."""
+        columns = [ColumnSpec('shape', 'shape_wkt', 'shape')]
+        csv_path = os.path.join(self.work_dir, 'shapes.csv')
+        convert_workbook(self.file_path, 'data', columns,
+                         ConversionOptions(output_path=csv_path, measures=('vertices', 'bbox')))
+        with open(csv_path, newline='', encoding='utf-8') as handle:
+            records = list(csv.DictReader(handle))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['shape_wkt vertices'], '5')
+        self.assertEqual(records[0]['shape_wkt ymax'], '48.21')
+
+        gpkg_path = os.path.join(self.work_dir, 'shapes.gpkg')
+        convert_workbook(self.file_path, 'data', columns,
+                         ConversionOptions(output_path=gpkg_path, measures=('vertices', 'bbox')))
+        with sqlite3.connect(gpkg_path) as connection:
+            table = connection.execute('SELECT table_name FROM gpkg_contents').fetchone()[0]
+            types = {row[1]: row[2] for row in connection.execute(f'PRAGMA table_info("{table}")')}
+            values = connection.execute(f'SELECT "shape_wkt vertices", "shape_wkt xmin" FROM "{table}"')
+            self.assertEqual(values.fetchall(), [(5, 16.37)])
+        self.assertEqual((types['shape_wkt vertices'], types['shape_wkt xmin']), ('INTEGER', 'REAL'))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktMeasuresTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,122 @@
+# coding=utf-8
+"""Spatial ordering test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+from openpyxl import Workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.ordering import curve_keys, curve_order
+from odkwkt.sidecar import SidecarOutput
+
+# Points as ODK writes them, "lat lon altitude accuracy", in submission order
+POINTS = {
+    'a': '9.0 9.0 0 0',
+    'b': '0.0 0.0 0 0',
+    'c': '9.0 0.0 0 0',
+    'd': '0.0 9.0 0 0',
+}
+# Order of the four corners along the Hilbert curve: (0, 0), (0, 9), (9, 9), (9, 0) as (lon, lat)
+HILBERT_KEYS = ['b', 'c', 'a', 'd']
+
+
+class ODKWktOrderingTest(unittest.TestCase):
+    """Test writing the rows of sidecar and GeoJSON outputs along a space-filling curve."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'point'])
+        for key, point in POINTS.items():
+            sheet.append([key, point])
+        sheet.append(['e', 'not a point'])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_curve_keys(self):
+        """Test consecutive Hilbert keys are neighbouring cells, and Z-order interleaves the bits."""
+        x, y = (values.ravel() for values in numpy.meshgrid(numpy.arange(8), numpy.arange(8)))
+        keys = curve_keys(x, y, (0, 0, 7, 7), 'hilbert', bits=3)
+        self.assertEqual(sorted(keys.tolist()), list(range(64)))
+        path = numpy.argsort(keys)
+        self.assertTrue((numpy.abs(numpy.diff(x[path])) + numpy.abs(numpy.diff(y[path])) == 1).all())
+        self.assertEqual(curve_keys([0, 1, 0, 1], [0, 0, 1, 1], (0, 0, 1, 1), 'zorder', 1).tolist(), [0, 1, 2, 3])
+        # Features without a centre come last
+        self.assertEqual(curve_order([1, float('nan'), 0], [1, 0, 0]).tolist(), [2, 0, 1])
+        self.assertRaises(ValueError, ConversionOptions, order='rtree')
+
+    def test_ordered_outputs(self):
+        """Test CSV, GeoPackage and GeoJSON rows follow the curve and keep their row number."""
+        columns = [ColumnSpec('point', 'point_wkt', 'point')]
+        output_path = os.path.join(self.work_dir, 'points.csv')
+        convert_workbook(self.file_path, 'data', columns,
+                         ConversionOptions(output_path=output_path, order='hilbert', tolerant=True))
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            records = list(csv.DictReader(handle))
+        self.assertEqual([record['KEY'] for record in records], HILBERT_KEYS)
+        self.assertEqual([record['row'] for record in records], ['3', '4', '2', '5'])
+
+        output_path = os.path.join(self.work_dir, 'points.gpkg')
+        convert_workbook(self.file_path, 'data', columns,
+                         ConversionOptions(output_path=output_path, order='zorder', tolerant=True))
+        with sqlite3.connect(output_path) as connection:
+            features = connection.execute('SELECT fid, KEY, row FROM point_wkt ORDER BY fid').fetchall()
+        # Z-order steps along the longitude first
+        self.assertEqual(features, [(1, 'b', 3), (2, 'd', 5), (3, 'c', 4), (4, 'a', 2)])
+
+        output_path = os.path.join(self.work_dir, 'points.geojsonl')
+        convert_workbook(self.file_path, 'data', columns,
+                         ConversionOptions(output_path=output_path, order='hilbert', tolerant=True))
+        with open(output_path, encoding='utf-8') as handle:
+            features = [json.loads(line) for line in handle]
+        self.assertEqual([feature['id'] for feature in features], HILBERT_KEYS)
+        # No spool is left behind
+        self.assertEqual(sorted(os.listdir(self.work_dir)),
+                         ['odk.xlsx', 'points.csv', 'points.geojsonl', 'points.gpkg'])
+
+        self.assertRaises(ValueError, convert_workbook, self.file_path, 'data', columns,
+                          ConversionOptions(output_path=os.path.join(self.work_dir, 'points.xlsx'), order='hilbert'))
+
+    def test_resumed_order(self):
+        """Test the centres of journaled chunks order the rows of a resumed conversion."""
+        output_path = os.path.join(self.work_dir, 'points.csv')
+        columns = [ColumnSpec('point', 'point_wkt', 'point')]
+        options = ConversionOptions(output_path=output_path, order='hilbert', tolerant=True, checkpoint_rows=2)
+        with mock.patch.object(SidecarOutput, 'close', side_effect=OSError('disk full')):
+            self.assertRaises(OSError, convert_workbook, self.file_path, 'data', columns, options)
+        result = convert_workbook(self.file_path, 'data', columns, options)
+        self.assertEqual(result.resumed_chunks, 3)
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            self.assertEqual([record['KEY'] for record in csv.DictReader(handle)], HILBERT_KEYS)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktOrderingTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,130 @@
+# coding=utf-8
+"""Conversion output test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+
+
+def digest(file_path):
+    with open(file_path, 'rb') as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+class ODKWktOutputsTest(unittest.TestCase):
+    """Test writing conversions to a new file."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        self.output_path = os.path.join(self.work_dir, 'out.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line', 'note'])
+        sheet.append(['a', TRACE, 1])
+        sheet.append(['b', None, 2])
+        sheet.append(['c', 'bad', 3])
+        workbook.create_sheet('repeat').append(['parent', 'value'])
+        workbook['repeat'].append(['a', 42])
+        workbook.save(self.file_path)
+        self.columns = [ColumnSpec('line', 'line_wkt')]
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_new_output_leaves_input_untouched(self):
+        """Test converting to a new file copies every sheet and keeps the input as is."""
+        before = digest(self.file_path)
+        options = ConversionOptions(output_path=self.output_path, tolerant=True, error_column='errors')
+        result = convert_workbook(self.file_path, 'data', self.columns, options)
+
+        self.assertEqual(digest(self.file_path), before)
+        self.assertEqual(result.converted, {'line_wkt': 1})
+        workbook = load_workbook(self.output_path)
+        self.assertEqual(workbook.sheetnames, ['data', 'repeat'])
+        rows = [list(row) for row in workbook['data'].iter_rows(values_only=True)]
+        self.assertEqual(rows[0], ['KEY', 'line', 'note', 'line_wkt', 'errors'])
+        self.assertEqual(rows[1][:4], ['a', TRACE, 1, 'LINESTRING (20 10, 20.5 10.5)'])
+        self.assertEqual(rows[2], ['b', None, 2, None, None])
+        self.assertIn('bad', rows[3][4])
+        self.assertEqual(list(workbook['repeat'].iter_rows(values_only=True)),
+                         [('parent', 'value'), ('a', 42)])
+        self.assertEqual(sorted(os.listdir(self.work_dir)), ['odk.xlsx', 'out.xlsx'])
+
+    def test_failed_save_keeps_previous_output(self):
+        """Test an interrupted save neither replaces the output nor leaves temporary files."""
+        failures = (('openpyxl', 'openpyxl.Workbook.save'),
+                    ('xmlappend', 'odkwkt.outputs._SheetRewriter.close'))
+        for writer, target in failures:
+            with open(self.output_path, 'wb') as handle:
+                handle.write(b'previous')
+            options = ConversionOptions(output_path=self.output_path, tolerant=True, writer=writer)
+            with mock.patch(target, side_effect=OSError('disk full')):
+                with self.assertRaises(OSError):
+                    convert_workbook(self.file_path, 'data', self.columns, options)
+            with open(self.output_path, 'rb') as handle:
+                self.assertEqual(handle.read(), b'previous')
+            self.assertEqual(sorted(os.listdir(self.work_dir)), ['odk.xlsx', 'out.xlsx'])
+
+    def test_column_append_keeps_workbook_parts(self):
+        """Test the xmlappend writer only changes the converted sheet, keeping its formatting."""
+        workbook = load_workbook(self.file_path)
+        sheet = workbook['data']
+        sheet['A1'].font = Font(bold=True)
+        sheet.append(['d', TRACE, 'stale'])
+        sheet.merge_cells('B6:C6')
+        workbook.save(self.file_path)
+        # A previous result column is overwritten in place
+        self.columns = [ColumnSpec('line', 'line_wkt'), ColumnSpec('line', 'note')]
+
+        options = ConversionOptions(output_path=self.output_path, tolerant=True)
+        convert_workbook(self.file_path, 'data', self.columns, options)
+
+        with zipfile.ZipFile(self.file_path) as source, zipfile.ZipFile(self.output_path) as output:
+            self.assertEqual(source.namelist(), output.namelist())
+            for name in source.namelist():
+                if name != 'xl/worksheets/sheet1.xml':
+                    self.assertEqual(source.read(name), output.read(name), name)
+        workbook = load_workbook(self.output_path)
+        sheet = workbook['data']
+        self.assertTrue(sheet['A1'].font.bold)
+        self.assertEqual([str(cells) for cells in sheet.merged_cells.ranges], ['B6:C6'])
+        rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+        self.assertEqual(rows[0], ['KEY', 'line', 'note', 'line_wkt'])
+        self.assertEqual(rows[1][2:4], ['LINESTRING (20 10, 20.5 10.5)'] * 2)
+        self.assertEqual(rows[2][2:4], [2, None])
+        self.assertEqual(rows[4], ['d', TRACE] + ['LINESTRING (20 10, 20.5 10.5)'] * 2)
+        read_only = load_workbook(self.output_path, read_only=True)
+        self.assertEqual(read_only['data'].max_column, 4)
+        read_only.close()
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktOutputsTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,115 @@
+# coding=utf-8
+"""Threaded pipeline test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from openpyxl import Workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, StageTimer, convert_workbook
+from odkwkt.engine import iter_chunks
+from odkwkt.pipeline import pipelined
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+
+
+class ODKWktPipelineTest(unittest.TestCase):
+    """Test reading, converting and writing on separate threads."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line'])
+        for index in range(50):
+            sheet.append([f'uuid:{index}', 'bad' if index == 17 else TRACE])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def convert(self, threads):
+        output_path = os.path.join(self.work_dir, f'out_{threads}.csv')
+        timer = StageTimer()
+        options = ConversionOptions(output_path=output_path, tolerant=True, error_column='errors',
+                                    checkpoint_rows=4, threads=threads)
+        result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options, timer)
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            return result, list(csv.reader(handle)), timer
+
+    def test_same_output(self):
+        """Test a threaded conversion writes the same rows, errors and counts as a sequential one."""
+        expected, expected_rows, _ = self.convert(0)
+        result, rows, timer = self.convert(3)
+        self.assertEqual(rows, expected_rows)
+        self.assertEqual(result.converted, {'line_wkt': 49})
+        self.assertEqual([error.row for error in result.errors], [19])
+        self.assertEqual(timer.stages['read'].rows, 50)
+        self.assertEqual(timer.stages['parse'].rows, 49)
+        stages = list(timer.stages)
+        self.assertLess(stages.index('read'), stages.index('parse'))
+
+    def test_order_and_bound(self):
+        """Test chunks come back in order with only a few chunks in flight."""
+        in_flight = []
+        lock = threading.Lock()
+        active = [0]
+
+        def convert(start, chunk, timer):
+            with lock:
+                active[0] += 1
+                in_flight.append(active[0])
+            with timer.stage('parse'):
+                value = sum(chunk)
+            with lock:
+                active[0] -= 1
+            return value
+
+        rows = list(range(1000))
+        timer = StageTimer()
+        chunks = list(pipelined(iter_chunks(iter(rows), 10), convert, 2, timer))
+        self.assertEqual([start for start, _, _ in chunks], list(range(2, 1002, 10)))
+        self.assertEqual(sum(value for _, _, value in chunks), sum(rows))
+        self.assertLessEqual(max(in_flight), 2)
+        self.assertEqual(timer.stages['parse'].calls, 100)
+
+    def test_failures_propagate(self):
+        """Test errors of the reader and of the workers reach the caller."""
+        def failing_rows():
+            yield 1
+            raise OSError('disk gone')
+
+        with self.assertRaisesRegex(OSError, 'disk gone'):
+            list(pipelined(iter_chunks(failing_rows(), 1), lambda start, chunk, timer: chunk, 2, StageTimer()))
+
+        def failing_convert(start, chunk, timer):
+            raise ValueError(f'row {start}')
+
+        with self.assertRaisesRegex(ValueError, 'row 2'):
+            list(pipelined(iter_chunks(iter(range(100)), 5), failing_convert, 2, StageTimer()))
+        self.assertEqual([thread.name for thread in threading.enumerate() if thread.name.startswith('odkwkt')], [])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktPipelineTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
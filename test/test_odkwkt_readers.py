@@ -0,0 +1,134 @@
+# coding=utf-8
+"""Workbook reader test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from openpyxl import Workbook, load_workbook
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.readers import OpenpyxlReader, ZipXmlReader, column_index, column_letters
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+
+
+class ODKWktReadersTest(unittest.TestCase):
+    """Test the streaming zip/XML reader against openpyxl."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'line', 'count', 'ratio', 'ok', 'when'])
+        sheet.append(['a', TRACE, 3, 0.5, True, datetime.datetime(2024, 5, 1, 12, 30)])
+        sheet.append(['b', None, -7, 1e-9, False, None])
+        # Row 4 is left empty, row 5 has a gap before a far column
+        sheet['A5'] = 'c'
+        sheet['AB5'] = 'far'
+        workbook.create_sheet('repeat').append(['parent', 'value'])
+        workbook['repeat'].append(['a', 42])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def rows(self, reader, sheet_name, **kwargs):
+        """Returns the rows of a sheet with trailing empty cells dropped."""
+        try:
+            rows = []
+            for row in reader.iter_rows(sheet_name, **kwargs):
+                row = list(row)
+                while row and row[-1] is None:
+                    row.pop()
+                rows.append(row)
+            return rows
+        finally:
+            reader.close()
+
+    def test_column_letters(self):
+        """Test converting between column letters and indexes."""
+        for index in (0, 25, 26, 27, 701, 702, 16383):
+            self.assertEqual(column_index(column_letters(index)), index)
+        self.assertEqual(column_letters(27), 'AB')
+
+    def test_values_match_openpyxl(self):
+        """Test shared strings, numbers, booleans, dates and gaps read like openpyxl."""
+        for sheet_name in ('data', 'repeat'):
+            expected = self.rows(OpenpyxlReader(self.file_path), sheet_name)
+            self.assertEqual(self.rows(ZipXmlReader(self.file_path), sheet_name), expected)
+        self.assertEqual(ZipXmlReader(self.file_path).sheetnames, ['data', 'repeat'])
+
+    def test_selected_columns(self):
+        """Test only the requested columns are decoded, at their own positions."""
+        rows = self.rows(ZipXmlReader(self.file_path), 'data', min_row=2, columns=[1, 27])
+        self.assertEqual(rows, [[None, TRACE], [], [], [None] * 27 + ['far']])
+
+    def test_inline_strings(self):
+        """Test write-only workbooks, which use inline strings, read like openpyxl."""
+        inline_path = os.path.join(self.work_dir, 'inline.xlsx')
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('data')
+        sheet.append(['KEY', 'line'])
+        sheet.append(['a', TRACE])
+        workbook.save(inline_path)
+        self.assertEqual(self.rows(ZipXmlReader(inline_path), 'data'),
+                         self.rows(OpenpyxlReader(inline_path), 'data'))
+
+    def test_unnumbered_rows_and_iso_dates(self):
+        """Test rows without an r attribute keep their number and t="d" cells read as datetimes."""
+        sheet_xml = (
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            '<row><c t="inlineStr"><is><t>KEY</t></is></c><c t="inlineStr"><is><t>when</t></is></c></row>'
+            '<row><c t="inlineStr"><is><t>a</t></is></c><c t="d"><v>2024-05-01T12:30:00</v></c></row>'
+            '</sheetData></worksheet>')
+        file_path = os.path.join(self.work_dir, 'unnumbered.xlsx')
+        with zipfile.ZipFile(self.file_path) as source, zipfile.ZipFile(file_path, 'w') as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == 'xl/worksheets/sheet1.xml':
+                    data = sheet_xml.encode('utf-8')
+                target.writestr(item, data)
+        self.assertEqual(self.rows(ZipXmlReader(file_path), 'data'),
+                         [['KEY', 'when'], ['a', datetime.datetime(2024, 5, 1, 12, 30)]])
+        self.assertEqual(self.rows(ZipXmlReader(file_path), 'data', min_row=2),
+                         [['a', datetime.datetime(2024, 5, 1, 12, 30)]])
+
+    def test_convert_with_zipxml(self):
+        """Test a conversion to a new file through the zip/XML reader."""
+        output_path = os.path.join(self.work_dir, 'out.xlsx')
+        options = ConversionOptions(output_path=output_path, reader='zipxml')
+        result = convert_workbook(self.file_path, 'data', [ColumnSpec('line', 'line_wkt')], options)
+        self.assertEqual(result.converted, {'line_wkt': 1})
+
+        workbook = load_workbook(output_path)
+        # Appended after the last used column of the sheet, like openpyxl does
+        self.assertEqual(workbook['data']['AC1'].value, 'line_wkt')
+        self.assertEqual(workbook['data']['AC2'].value, 'LINESTRING (20 10, 20.5 10.5)')
+        self.assertEqual(workbook['data']['F2'].value, datetime.datetime(2024, 5, 1, 12, 30))
+        self.assertEqual(workbook['data']['AB5'].value, 'far')
+        self.assertEqual(workbook['repeat']['B2'].value, 42)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktReadersTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,157 @@
+# coding=utf-8
+"""Sidecar output test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import hashlib
+import os
+import shutil
+import sqlite3
+import struct
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely import wkb
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+TRACE = '10.0 20.0 0 0;10.5 20.5 0 0'
+SHAPE = '10.0 20.0 0 0;10.5 20.5 0 0;10.0 21.0 0 0;10.0 20.0 0 0'
+LINE_WKT = 'LINESTRING (20 10, 20.5 10.5)'
+
+
+class ODKWktSidecarTest(unittest.TestCase):
+    """Test writing only the key and WKT columns."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['name', 'line', 'shape', 'KEY'])
+        sheet.append(['a', TRACE, SHAPE, 'uuid:a'])
+        sheet.append(['b', None, None, 'uuid:b'])
+        sheet.append(['c', 'bad', None, 'uuid:c'])
+        workbook.save(self.file_path)
+        with open(self.file_path, 'rb') as handle:
+            self.digest = hashlib.sha256(handle.read()).hexdigest()
+        self.columns = [ColumnSpec('line', 'line_wkt'), ColumnSpec('shape', 'shape_wkt', 'shape')]
+
+    def tearDown(self):
+        """Runs after each test."""
+        with open(self.file_path, 'rb') as handle:
+            self.assertEqual(hashlib.sha256(handle.read()).hexdigest(), self.digest)
+        shutil.rmtree(self.work_dir)
+
+    def convert(self, name, **options):
+        output_path = os.path.join(self.work_dir, name)
+        options = ConversionOptions(output_path=output_path, tolerant=True, **options)
+        result = convert_workbook(self.file_path, 'data', self.columns, options)
+        self.assertEqual(result.converted, {'line_wkt': 1, 'shape_wkt': 1})
+        return output_path
+
+    def test_csv(self):
+        """Test a CSV sidecar keyed on the ODK KEY column, with the row errors."""
+        output_path = self.convert('wkt.csv', error_column='errors')
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            rows = list(csv.reader(handle))
+        self.assertEqual(rows[0], ['KEY', 'line_wkt', 'shape_wkt', 'errors'])
+        self.assertEqual(rows[1][:2], ['uuid:a', LINE_WKT])
+        self.assertTrue(rows[1][2].startswith('POLYGON'))
+        self.assertEqual(rows[2][:3], ['uuid:c', '', ''])
+        self.assertIn('bad', rows[2][3])
+        self.assertEqual(len(rows), 3)
+
+    def test_csv_row_numbers(self):
+        """Test a CSV sidecar keyed on the row number when the sheet has no KEY column."""
+        file_path = os.path.join(self.work_dir, 'no_key.xlsx')
+        output_path = os.path.join(self.work_dir, 'wkt.csv')
+        workbook = Workbook()
+        workbook.active.title = 'data'
+        for row in (['line'], [None], [TRACE]):
+            workbook.active.append(row)
+        workbook.save(file_path)
+        convert_workbook(file_path, 'data', [ColumnSpec('line', 'line_wkt')],
+                         ConversionOptions(output_path=output_path))
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            self.assertEqual(list(csv.reader(handle)), [['row', 'line_wkt'], ['3', LINE_WKT]])
+
+    def test_geopackage(self):
+        """Test a GeoPackage sidecar has one EPSG:4326 layer per converted column."""
+        output_path = self.convert('wkt.gpkg', key_column='name')
+        connection = sqlite3.connect(output_path)
+        try:
+            self.assertEqual(connection.execute('PRAGMA application_id').fetchone()[0], 0x47504B47)
+            layers = connection.execute(
+                'SELECT table_name, geometry_type_name, srs_id FROM gpkg_geometry_columns ORDER BY table_name')
+            self.assertEqual(layers.fetchall(), [('line_wkt', 'LINESTRING', 4326), ('shape_wkt', 'POLYGON', 4326)])
+            extent = connection.execute("SELECT min_x, min_y, max_x, max_y FROM gpkg_contents "
+                                        "WHERE table_name = 'line_wkt'").fetchone()
+            self.assertEqual(extent, (20.0, 10.0, 20.5, 10.5))
+            (name, blob), = connection.execute('SELECT name, geom FROM line_wkt').fetchall()
+        finally:
+            connection.close()
+        self.assertEqual(name, 'a')
+        self.assertEqual(blob[:2], b'GP')
+        flags = blob[3]
+        self.assertEqual(struct.unpack('<i', blob[4:8])[0], 4326)
+        envelope_size = {0: 0, 1: 32}[(flags >> 1) & 0b111]
+        self.assertEqual(wkb.loads(blob[8 + envelope_size:]).wkt, LINE_WKT)
+
+    def test_geopackage_validated(self):
+        """Test validated traces and shapes get GEOMETRY layers, as repairs may change their type."""
+        output_path = self.convert('wkt.gpkg', validate=True)
+        connection = sqlite3.connect(output_path)
+        try:
+            layers = connection.execute(
+                'SELECT table_name, geometry_type_name FROM gpkg_geometry_columns ORDER BY table_name')
+            self.assertEqual(layers.fetchall(), [('line_wkt', 'GEOMETRY'), ('shape_wkt', 'GEOMETRY')])
+            blob, = connection.execute('SELECT geom FROM shape_wkt').fetchone()
+        finally:
+            connection.close()
+        self.assertEqual(struct.unpack('<4d', blob[8:40]), (20.0, 21.0, 10.0, 10.5))
+        self.assertEqual(wkb.loads(blob[40:]).geom_type, 'Polygon')
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet(self):
+        """Test a Parquet sidecar holds the key and result columns only."""
+        output_path = self.convert('wkt.sidecar.parquet', error_column='errors')
+        table = pyarrow.parquet.read_table(output_path)
+        self.assertEqual(table.column_names, ['KEY', 'line_wkt', 'shape_wkt', 'errors'])
+        self.assertEqual(table.column('KEY').to_pylist(), ['uuid:a', 'uuid:c'])
+        self.assertEqual(table.column('line_wkt').to_pylist(), [LINE_WKT, None])
+        self.assertIn('bad', table.column('errors')[1].as_py())
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_ordered(self):
+        """Test a Parquet sidecar written along a curve keeps the row number."""
+        output_path = self.convert('wkt.sidecar.parquet', order='zorder')
+        table = pyarrow.parquet.read_table(output_path)
+        self.assertEqual(table.column_names, ['KEY', 'row', 'line_wkt', 'shape_wkt'])
+        self.assertEqual(str(table.schema.field('row').type), 'int64')
+        self.assertEqual(table.column('row').to_pylist(), [2])
+        self.assertEqual(len(os.listdir(self.work_dir)), 2)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktSidecarTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
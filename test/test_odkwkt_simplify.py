@@ -0,0 +1,94 @@
+# coding=utf-8
+"""Simplified geometry columns test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely import wkb, wkt
+from shapely.geometry import LineString, Polygon
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.simplify import simplified_fields, simplify_column
+
+# A trace along the equator that wiggles by 0.0005 and 0.005 degrees, "lat lon altitude accuracy"
+TRACE = '0.0 0.0 0 0;0.0005 0.01 0 0;0.0 0.02 0 0;0.005 0.03 0 0;0.0 0.04 0 0'
+
+
+class ODKWktSimplifyTest(unittest.TestCase):
+    """Test simplified copies of the converted traces and shapes."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'point', 'line'])
+        sheet.append(['a', '0.0 0.0 0 0', TRACE])
+        sheet.append(['b', '1.0 1.0 0 0', None])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_simplify(self):
+        """Test each tolerance drops the wiggles below it and keeps the vertices of the finer ones."""
+        line = LineString([(0, 0), (0.01, 0.0005), (0.02, 0), (0.03, 0.005), (0.04, 0)])
+        columns = simplify_column([(2, line)], 'trace', (0.001, 0.0001, 0.01))
+        self.assertEqual(list(columns), ['simplified_0.0001', 'simplified_0.001', 'simplified_0.01'])
+        vertices = [len(wkt.loads(columns[name][0][1]).coords) for name in columns]
+        # 0.001 drops the small wiggle only; the vertex before the large one is 0.003 off its chord
+        self.assertEqual(vertices, [5, 4, 2])
+
+        # Shapes stay valid polygons
+        square = Polygon([(0, 0), (0.5, 0.001), (1, 0), (1, 1), (0, 1)])
+        columns = simplify_column([(3, square)], 'shape', (0.01,), 'wkb_hex')
+        simplified = wkb.loads(columns['simplified_0.01'][0][1], hex=True)
+        self.assertTrue(simplified.is_valid)
+        self.assertEqual(len(simplified.exterior.coords), 5)
+
+        self.assertEqual(simplify_column([(2, line)], 'point', (0.01,)), {})
+        self.assertEqual(simplified_fields('trace', ()), [])
+        self.assertRaises(ValueError, ConversionOptions, simplify=(0.0,))
+        # Both would be named simplified_0.001
+        self.assertRaises(ValueError, ConversionOptions, simplify=(0.001, 0.0010000001))
+
+    def test_simplified_conversion(self):
+        """Test the simplified columns follow the trace column only, in its encoding."""
+        output_path = os.path.join(self.work_dir, 'lines.csv')
+        convert_workbook(self.file_path, 'data', [
+            ColumnSpec('point', 'point_wkb', 'point', 'wkb_hex'),
+            ColumnSpec('line', 'line_wkb', 'trace', 'wkb_hex'),
+        ], ConversionOptions(output_path=output_path, simplify=(0.001, 0.01)))
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            reader = csv.DictReader(handle)
+            records = list(reader)
+        self.assertEqual(reader.fieldnames, ['KEY', 'point_wkb', 'line_wkb', 'line_wkb simplified_0.001',
+                                             'line_wkb simplified_0.01'])
+        self.assertEqual(len(wkb.loads(records[0]['line_wkb'], hex=True).coords), 5)
+        self.assertEqual(len(wkb.loads(records[0]['line_wkb simplified_0.001'], hex=True).coords), 4)
+        self.assertEqual(len(wkb.loads(records[0]['line_wkb simplified_0.01'], hex=True).coords), 2)
+        self.assertEqual(records[1]['line_wkb simplified_0.01'], '')
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktSimplifyTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,111 @@
+# coding=utf-8
+"""Geometry validity test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'junaid.abdul.jabbar@gmail.com'
+__date__ = '2026-10-19'
+__copyright__ = 'Copyright 2025, Junaid Abdul Jabbar'
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from openpyxl import Workbook
+from shapely import wkb, wkt
+from shapely.geometry import LineString, Polygon
+
+from odkwkt import ColumnSpec, ConversionOptions, convert_workbook
+from odkwkt.validity import validate_geometries
+
+# Rings as ODK writes them, "lat lon altitude accuracy"
+CLOCKWISE = '10.0 20.0 0 0;11.0 20.0 0 0;11.0 21.0 0 0;10.0 20.0 0 0'
+BOW_TIE = '10.0 20.0 0 0;11.0 21.0 0 0;10.0 21.0 0 0;11.0 20.0 0 0;10.0 20.0 0 0'
+COLLAPSED = '10.0 20.0 0 0;11.0 20.0 0 0;10.0 20.0 0 0;10.0 20.0 0 0'
+
+
+class ODKWktValidityTest(unittest.TestCase):
+    """Test bulk validity checks and repairs."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.work_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.work_dir, 'odk.xlsx')
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'data'
+        sheet.append(['KEY', 'shape'])
+        for key, shape in (('a', CLOCKWISE), ('b', BOW_TIE), ('c', COLLAPSED)):
+            sheet.append([key, shape])
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        shutil.rmtree(self.work_dir)
+
+    def test_validate_geometries(self):
+        """Test invalid geometries are repaired, collapsed ones failed and rings oriented."""
+        geometries = [
+            (2, Polygon([(0, 0), (1, 0), (1, 1), (0, 0)])),
+            (3, Polygon([(0, 0), (0, 1), (1, 1), (0, 0)])),
+            (4, Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])),
+            (5, Polygon([(0, 0), (0, 1), (0, 0), (0, 0)])),
+        ]
+        errors = []
+        repaired, repairs = validate_geometries(geometries, 'shape', 'poly', errors)
+        self.assertEqual([row for row, _ in repaired], [2, 3, 4])
+        self.assertTrue(repaired[0][1].equals_exact(geometries[0][1], 0))
+        self.assertTrue(repaired[1][1].exterior.is_ccw)
+        self.assertTrue(repaired[1][1].equals(geometries[1][1]))
+        self.assertEqual(repaired[2][1].geom_type, 'MultiPolygon')
+        self.assertEqual(repaired[2][1].area, 0.5)
+        self.assertEqual([(repair.row, repair.column, repair.token) for repair in repairs], [(4, 'poly', '0.5 0.5')])
+        self.assertEqual(repairs[0].reason, 'Self-intersection')
+        self.assertEqual([(error.row, error.column, error.token) for error in errors], [(5, 'poly', '0 0')])
+        self.assertIn('collapses', errors[0].reason)
+
+        self.assertRaises(ValueError, validate_geometries, [(2, LineString([(0, 0), (0, 0)]))], 'trace')
+        self.assertEqual(validate_geometries([], 'shape'), ([], []))
+
+    def test_validated_conversion(self):
+        """Test a conversion writes repaired geometries and why they were repaired."""
+        output_path = os.path.join(self.work_dir, 'shapes.csv')
+        columns = [
+            ColumnSpec('shape', 'shape_wkt', 'shape'),
+            ColumnSpec('shape', 'shape_wkb', 'shape', 'wkb_hex'),
+        ]
+        options = ConversionOptions(output_path=output_path, validate=True, validity_column='repairs')
+        # The collapsed shape fails the strict conversion like a malformed cell
+        self.assertRaises(ValueError, convert_workbook, self.file_path, 'data', columns, options)
+
+        options = ConversionOptions(output_path=output_path, validate=True, validity_column='repairs',
+                                    tolerant=True, error_column='errors')
+        result = convert_workbook(self.file_path, 'data', columns, options)
+        self.assertEqual(result.converted, {'shape_wkt': 2, 'shape_wkb': 2})
+        self.assertEqual(result.repair_summary(), {'Self-intersection': 2})
+        self.assertEqual([error.row for error in result.errors], [4, 4])
+
+        with open(output_path, newline='', encoding='utf-8') as handle:
+            records = {record['KEY']: record for record in csv.DictReader(handle)}
+        self.assertEqual(records['a']['shape_wkt'], 'POLYGON ((20 10, 21 11, 20 11, 20 10))')
+        self.assertEqual(records['a']['repairs'], '')
+        bow_tie = wkt.loads(records['b']['shape_wkt'])
+        self.assertEqual(bow_tie.geom_type, 'MultiPolygon')
+        self.assertTrue(wkb.loads(records['b']['shape_wkb'], hex=True).equals(bow_tie))
+        self.assertIn("shape: Self-intersection ('20.5 10.5')", records['b']['repairs'])
+        self.assertEqual(records['c']['shape_wkt'], '')
+        self.assertEqual(records['c']['repairs'], '')
+        self.assertIn('Too few points', records['c']['errors'])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(ODKWktValidityTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)